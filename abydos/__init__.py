@@ -19,8 +19,9 @@
 Abydos NLP/IR library by Christopher C. Little
 
 
-There are nine major packages that make up Abydos:
+There are ten major packages that make up Abydos:
 
+    - :py:mod:`.blocking` for record blocking (candidate pair) classes
     - :py:mod:`.compression` for string compression classes
     - :py:mod:`.corpus` for document corpus classes
     - :py:mod:`.distance` for string distance measure & metric classes
@@ -32,8 +33,8 @@ There are nine major packages that make up Abydos:
     - :py:mod:`.tokenizer` for tokenizer classes
 
 Classes with each package have consistent method names, as discussed below.
-A tenth package, :py:mod:`.util`, contains functions not intended for end-user
-use.
+An eleventh package, :py:mod:`.util`, contains functions not intended for
+end-user use.
 
 ----
 
@@ -43,6 +44,7 @@ __version__ = '0.6.0'
 
 __all__ = [
     '__version__',
+    'blocking',
     'compression',
     'corpus',
     'distance',
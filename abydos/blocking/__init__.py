@@ -0,0 +1,58 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.blocking.
+
+The blocking package implements blocking (or indexing) methods for record
+linkage :cite:`Christen:2012`, which find pairs of records that are candidates
+for comparison so that a distance measure need not be applied to every pair:
+
+    - Standard blocking (:py:class:`.KeyBlocker`)
+    - Sorted neighborhood (:py:class:`.SortedNeighborhood`)
+
+Each blocker computes keys from each record using any phonetic algorithm,
+fingerprinter, or function. Passing several of these performs multi-pass
+blocking, in which a pair is a candidate if it is a candidate in any pass.
+
+Each blocker has an ``insert`` method to add a record (with an optional id)
+and an ``extend`` method to add several, a ``candidate_pairs`` method that
+lazily yields each candidate pair of record ids once, and a ``matches`` method
+that yields each candidate pair with its similarity by a distance measure:
+
+>>> from abydos.distance import Jaccard
+>>> from abydos.phonetic import Soundex
+>>> blocker = KeyBlocker(Soundex())
+>>> blocker.extend(['Niall', 'Neil', 'Nigel', 'Colin', 'Collin'])
+>>> for id_a, id_b, sim in blocker.matches(Jaccard(), min_sim=0.2):
+...     print(id_a, id_b, round(sim, 12))
+Niall Neil 0.222222222222
+Colin Collin 0.857142857143
+
+----
+
+"""
+
+from ._blocker import _Blocker
+from ._key_blocker import KeyBlocker
+from ._sorted_neighborhood import SortedNeighborhood
+
+__all__ = ['_Blocker', 'KeyBlocker', 'SortedNeighborhood']
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
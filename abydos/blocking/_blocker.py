@@ -0,0 +1,270 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.blocking._blocker.
+
+_Blocker base class
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..distance import _Distance
+
+__all__ = ['_Blocker']
+
+
+KeyFunction = Callable[[str], Union[str, Iterable[str]]]
+
+
+def _key_function(key: Any) -> KeyFunction:
+    """Return a function computing blocking keys from a key source.
+
+    Parameters
+    ----------
+    key : _Phonetic, _Fingerprint, or callable
+        A phonetic algorithm, a fingerprinter, or a function of one string
+
+    Returns
+    -------
+    callable
+        The encode or fingerprint method of key, or key itself
+
+    Raises
+    ------
+    TypeError
+        key is not a phonetic algorithm, fingerprinter, or callable
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if hasattr(key, 'encode'):
+        return key.encode  # type: ignore
+    if hasattr(key, 'fingerprint'):
+        return key.fingerprint  # type: ignore
+    if callable(key):
+        return key  # type: ignore
+    raise TypeError(
+        '{!r} is not a phonetic algorithm, fingerprinter, or function.'.format(
+            key
+        )
+    )
+
+
+class _Blocker:
+    """Abstract blocking index class.
+
+    A blocking index holds records (strings), each identified by a record id,
+    and yields pairs of record ids that are candidates for comparison, so
+    that only those pairs, rather than all pairs, need be compared by a
+    distance measure. Candidates are found by computing keys from each record
+    using one or more phonetic algorithms, fingerprinters, or functions. Each
+    key source defines a separate pass, and a pair that is a candidate in
+    more than one pass is yielded only once.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, keys: Union[Any, Sequence[Any]]) -> None:
+        """Initialize _Blocker instance.
+
+        Parameters
+        ----------
+        keys : _Phonetic, _Fingerprint, callable, or a sequence of these
+            The source of the keys for each pass: a phonetic algorithm, whose
+            encode method is used, a fingerprinter, whose fingerprint method
+            is used, or a function taking a record & returning a key.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(keys, (list, tuple)):
+            self._key_funcs = [_key_function(key) for key in keys]
+        else:
+            self._key_funcs = [_key_function(keys)]
+        self._records = []  # type: List[str]
+        self._ids = []  # type: List[Hashable]
+        self._keys = []  # type: List[Tuple[Tuple[str, ...], ...]]
+        self._positions = {}  # type: Dict[Hashable, int]
+
+    def __len__(self) -> int:
+        """Return the number of records in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._records)
+
+    def __contains__(self, record_id: object) -> bool:
+        """Return True if a record with this id is in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return record_id in self._positions
+
+    def _record_keys(self, record: str) -> Tuple[Tuple[str, ...], ...]:
+        """Return the keys of a record in each pass.
+
+        Empty keys are discarded, and multiple keys from one pass are sorted.
+
+        .. versionadded:: 0.6.0
+
+        """
+        pass_keys = []
+        for key_func in self._key_funcs:
+            keys = key_func(record)
+            if isinstance(keys, str):
+                pass_keys.append((keys,) if keys else ())
+            else:
+                pass_keys.append(tuple(sorted(set(keys) - {''})))
+        return tuple(pass_keys)
+
+    def insert(self, record: str, record_id: Optional[Hashable] = None) -> int:
+        """Add a record to the index.
+
+        Parameters
+        ----------
+        record : str
+            The record to add
+        record_id : Hashable
+            The id identifying the record in candidate pairs. If None, the
+            record itself is used as its id.
+
+        Returns
+        -------
+        int
+            The position of the record in the index
+
+        Raises
+        ------
+        KeyError
+            The record id is already in the index
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if record_id is None:
+            record_id = record
+        if record_id in self._positions:
+            raise KeyError(
+                'Record id {!r} is already in the index.'.format(record_id)
+            )
+        position = len(self._records)
+        keys = self._record_keys(record)
+        self._records.append(record)
+        self._ids.append(record_id)
+        self._keys.append(keys)
+        self._positions[record_id] = position
+        self._index(position, keys)
+        return position
+
+    def _index(self, position: int, keys: Tuple[Tuple[str, ...], ...]) -> None:
+        """Index a newly inserted record.
+
+        By default, this does nothing.
+
+        Parameters
+        ----------
+        position : int
+            The position of the record
+        keys : tuple
+            The record's keys in each pass
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+    def extend(self, records: Iterable[str]) -> None:
+        """Add records to the index, each identified by itself.
+
+        Parameters
+        ----------
+        records : Iterable[str]
+            The records to add; repeated records are added once
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for record in records:
+            if record not in self._positions:
+                self.insert(record)
+
+    def candidate_pairs(self) -> Iterator[Tuple[Hashable, Hashable]]:
+        """Yield each pair of candidate records once.
+
+        Yields
+        ------
+        tuple
+            A pair of record ids
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return iter(())
+
+    def matches(
+        self, measure: _Distance, min_sim: float = 0.0
+    ) -> Iterator[Tuple[Hashable, Hashable, float]]:
+        """Yield the similarity of each pair of candidate records.
+
+        Parameters
+        ----------
+        measure : _Distance
+            The similarity measure to apply to each candidate pair
+        min_sim : float
+            The minimum similarity of pairs to yield
+
+        Yields
+        ------
+        tuple
+            A pair of record ids & their similarity
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        records = self._records
+        positions = self._positions
+        for id_a, id_b in self.candidate_pairs():
+            sim = measure.sim(
+                records[positions[id_a]], records[positions[id_b]]
+            )
+            if sim >= min_sim:
+                yield id_a, id_b, sim
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
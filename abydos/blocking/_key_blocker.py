@@ -0,0 +1,221 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.blocking._key_blocker.
+
+Standard (key-based) blocking
+"""
+
+from collections import defaultdict
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ._blocker import _Blocker
+
+__all__ = ['KeyBlocker']
+
+
+class KeyBlocker(_Blocker):
+    """Standard blocking.
+
+    Standard blocking :cite:`Christen:2012` files each record in a block for
+    each key it has and makes candidates of every pair of records sharing a
+    block. With multiple passes, a pair is a candidate if the records share a
+    block in any pass. Records with an empty key are not blocked in that
+    pass. A key function may return several keys (e.g. the alternative codes
+    of a Beider-Morse encoding, split on spaces), in which case the record is
+    filed in each of their blocks.
+
+    Records are blocked as they are inserted, and candidate pairs are
+    generated lazily, without storing the pairs already yielded.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        keys: Union[Any, Sequence[Any]],
+        max_block_size: Optional[int] = None,
+    ) -> None:
+        """Initialize KeyBlocker instance.
+
+        Parameters
+        ----------
+        keys : _Phonetic, _Fingerprint, callable, or a sequence of these
+            The source of the keys for each pass: a phonetic algorithm, whose
+            encode method is used, a fingerprinter, whose fingerprint method
+            is used, or a function taking a record & returning a key or keys.
+        max_block_size : int or None
+            If set, blocks containing more than this many records are skipped
+            when generating candidates, since very large blocks (such as the
+            block of a common surname) contribute many pairs that are
+            unlikely to be informative
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> blocker = KeyBlocker(Soundex())
+        >>> blocker.extend(['Niall', 'Neil', 'Colin', 'Nigel', 'Collin'])
+        >>> list(blocker.candidate_pairs())
+        [('Niall', 'Neil'), ('Colin', 'Collin')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(KeyBlocker, self).__init__(keys)
+        self._max_block_size = max_block_size
+        self._blocks = [
+            defaultdict(list) for _ in self._key_funcs
+        ]  # type: List[DefaultDict[str, List[int]]]
+
+    def _index(self, position: int, keys: Tuple[Tuple[str, ...], ...]) -> None:
+        """Add a newly inserted record to its blocks.
+
+        .. versionadded:: 0.6.0
+
+        """
+        for blocks, pass_keys in zip(self._blocks, keys):
+            for key in pass_keys:
+                blocks[key].append(position)
+
+    def _eligible(self, pass_num: int, key: str) -> bool:
+        """Return True if a block is small enough to generate candidates.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            self._max_block_size is None
+            or len(self._blocks[pass_num][key]) <= self._max_block_size
+        )
+
+    def _yielded_before(
+        self,
+        pos_a: int,
+        pos_b: int,
+        pass_num: int,
+        key: str,
+        block_order: Dict[str, int],
+    ) -> bool:
+        """Return True if a pair was a candidate in an earlier block.
+
+        Blocks are visited pass by pass, and within each pass in the order of
+        their keys' first appearance, so a pair has already been yielded if
+        the records share an eligible block in an earlier pass or an
+        eligible block with an earlier key in this pass.
+
+        .. versionadded:: 0.6.0
+
+        """
+        keys_a = self._keys[pos_a]
+        keys_b = self._keys[pos_b]
+        for earlier in range(pass_num + 1):
+            if earlier == pass_num and len(keys_a[earlier]) == 1:
+                break
+            for shared in set(keys_a[earlier]).intersection(keys_b[earlier]):
+                if (
+                    earlier == pass_num
+                    and block_order[shared] >= block_order[key]
+                ):
+                    continue
+                if self._eligible(earlier, shared):
+                    return True
+        return False
+
+    def blocks(self, pass_num: int = 0) -> Dict[str, List[Hashable]]:
+        """Return the blocks of a pass.
+
+        Parameters
+        ----------
+        pass_num : int
+            The index of the pass
+
+        Returns
+        -------
+        dict
+            A dict mapping each key to the ids of the records in its block
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> blocker = KeyBlocker(Soundex())
+        >>> blocker.extend(['Niall', 'Neil', 'Colin'])
+        >>> blocker.blocks()
+        {'N400': ['Niall', 'Neil'], 'C450': ['Colin']}
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {
+            key: [self._ids[pos] for pos in members]
+            for key, members in self._blocks[pass_num].items()
+        }
+
+    def candidate_pairs(self) -> Iterator[Tuple[Hashable, Hashable]]:
+        """Yield each pair of records sharing a block once.
+
+        Pairs are yielded pass by pass and block by block, with the record
+        inserted first as the first member of the pair.
+
+        Yields
+        ------
+        tuple
+            A pair of record ids
+
+        Examples
+        --------
+        >>> from abydos.fingerprint import SkeletonKey
+        >>> from abydos.phonetic import Soundex
+        >>> blocker = KeyBlocker([Soundex(), SkeletonKey()])
+        >>> blocker.extend(['Niall', 'Nial', 'Neil', 'Colin', 'Cloin'])
+        >>> list(blocker.candidate_pairs())
+        [('Niall', 'Nial'), ('Niall', 'Neil'), ('Nial', 'Neil'),
+         ('Colin', 'Cloin')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ids = self._ids
+        for pass_num, blocks in enumerate(self._blocks):
+            block_order = {key: order for order, key in enumerate(blocks)}
+            for key, members in blocks.items():
+                if len(members) < 2 or not self._eligible(pass_num, key):
+                    continue
+                for i, pos_a in enumerate(members):
+                    for pos_b in members[i + 1 :]:
+                        if not self._yielded_before(
+                            pos_a, pos_b, pass_num, key, block_order
+                        ):
+                            yield ids[pos_a], ids[pos_b]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
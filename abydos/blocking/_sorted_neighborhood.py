@@ -0,0 +1,203 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.blocking._sorted_neighborhood.
+
+Sorted neighborhood blocking
+"""
+
+from typing import (
+    Any,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ._blocker import _Blocker
+
+__all__ = ['SortedNeighborhood']
+
+
+class SortedNeighborhood(_Blocker):
+    """Sorted neighborhood blocking.
+
+    The sorted neighborhood method :cite:`Hernandez:1995` sorts the records by
+    their keys and slides a window of fixed size over the sorted records,
+    making candidates of every pair of records within the window. Unlike
+    standard blocking, records whose keys differ but sort near each other
+    (e.g. Soundex codes that differ only in their final digit) become
+    candidates, and the number of candidates grows linearly with the number
+    of records, no matter how the keys are distributed.
+
+    With multiple passes (the multi-pass approach of :cite:`Hernandez:1995`),
+    a pair is a candidate if it falls within the window in any pass. Records
+    with an empty key are left out of that pass. If a key function returns
+    several keys, the record is sorted by the least of them. Ties between
+    keys are broken by insertion order.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, keys: Union[Any, Sequence[Any]], window: int = 3
+    ) -> None:
+        """Initialize SortedNeighborhood instance.
+
+        Parameters
+        ----------
+        keys : _Phonetic, _Fingerprint, callable, or a sequence of these
+            The source of the keys for each pass: a phonetic algorithm, whose
+            encode method is used, a fingerprinter, whose fingerprint method
+            is used, or a function taking a record & returning a key or keys.
+        window : int
+            The size of the sliding window, so that each record is paired with
+            the window - 1 records that follow it in sorted order
+
+        Raises
+        ------
+        ValueError
+            The window is smaller than 2
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> blocker = SortedNeighborhood(Soundex(), window=2)
+        >>> blocker.extend(['Niall', 'Colin', 'Neil', 'Nigel', 'Collin'])
+        >>> list(blocker.candidate_pairs())
+        [('Colin', 'Collin'), ('Collin', 'Nigel'), ('Nigel', 'Niall'),
+         ('Niall', 'Neil')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if window < 2:
+            raise ValueError('The window must be at least 2.')
+        super(SortedNeighborhood, self).__init__(keys)
+        self._window = window
+        self._orders = None  # type: Optional[List[List[int]]]
+
+    def _index(self, position: int, keys: Tuple[Tuple[str, ...], ...]) -> None:
+        """Invalidate the sorted orders when a record is inserted.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._orders = None
+
+    def sorted_order(self, pass_num: int = 0) -> List[Hashable]:
+        """Return the ids of the records in sorted order for a pass.
+
+        Parameters
+        ----------
+        pass_num : int
+            The index of the pass
+
+        Returns
+        -------
+        list
+            The ids of the records with a key in this pass, sorted by key
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> blocker = SortedNeighborhood(Soundex())
+        >>> blocker.extend(['Niall', 'Colin', 'Neil', 'Nigel'])
+        >>> blocker.sorted_order()
+        ['Colin', 'Nigel', 'Niall', 'Neil']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [self._ids[pos] for pos in self._sorted_orders()[pass_num]]
+
+    def _sorted_orders(self) -> List[List[int]]:
+        """Return the record positions in sorted order for each pass.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._orders is None:
+            self._orders = []
+            for pass_num in range(len(self._key_funcs)):
+                keyed = [
+                    (keys[pass_num][0], pos)
+                    for pos, keys in enumerate(self._keys)
+                    if keys[pass_num]
+                ]
+                keyed.sort()
+                self._orders.append([pos for _, pos in keyed])
+        return self._orders
+
+    def candidate_pairs(self) -> Iterator[Tuple[Hashable, Hashable]]:
+        """Yield each pair of records within the window once.
+
+        Pairs are yielded pass by pass, in sorted order, with the record
+        earlier in the sorted order first.
+
+        Yields
+        ------
+        tuple
+            A pair of record ids
+
+        Examples
+        --------
+        >>> from abydos.fingerprint import SkeletonKey
+        >>> from abydos.phonetic import Soundex
+        >>> blocker = SortedNeighborhood([Soundex(), SkeletonKey()], 2)
+        >>> blocker.extend(['Niall', 'Colin', 'Neil', 'Cloin'])
+        >>> list(blocker.candidate_pairs())
+        [('Colin', 'Cloin'), ('Cloin', 'Niall'), ('Niall', 'Neil'),
+         ('Cloin', 'Neil')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ids = self._ids
+        window = self._window
+        orders = self._sorted_orders()
+        # The rank of each record in each pass's sorted order, or -1 if the
+        # record has no key in that pass
+        ranks = []  # type: List[List[int]]
+        for order in orders:
+            rank = [-1] * len(ids)
+            for i, pos in enumerate(order):
+                rank[pos] = i
+            ranks.append(rank)
+
+        for pass_num, order in enumerate(orders):
+            earlier = ranks[:pass_num]
+            for i, pos_a in enumerate(order):
+                for pos_b in order[i + 1 : i + window]:
+                    if not any(
+                        rank[pos_a] >= 0
+                        and rank[pos_b] >= 0
+                        and abs(rank[pos_a] - rank[pos_b]) < window
+                        for rank in earlier
+                    ):
+                        yield ids[pos_a], ids[pos_b]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
@@ -19,6 +19,11 @@
 Burrows-Wheeler Transform encoder/decoder
 """
 
+from collections import Counter
+from typing import Dict, List, Optional, cast
+
+import numpy as np
+
 __all__ = ['BWT']
 
 
@@ -29,9 +34,19 @@ class BWT:
     together to improve compression.
     Cf. :cite:`Burrows:1994`.
 
+    Since the terminator occurs once in each encoded string, sorting the
+    rotations of a string orders them as its suffixes would be ordered, so
+    long strings are encoded from a suffix array built by prefix doubling
+    :cite:`Manber:1993` and decoded by following the last-to-first mapping
+    of the transform :cite:`Ferragina:2000`.
+
     .. versionadded:: 0.3.6
     """
 
+    # Below this length, sorting the rotations of a word directly is faster
+    # than building its suffix array.
+    _suffix_array_threshold = 1024
+
     def __init__(self, terminator: str = '\0') -> None:
         """Initialize BWT instance.
 
@@ -80,6 +95,8 @@ class BWT:
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Long words are encoded from their suffix arrays
 
         """
         if word:
@@ -91,13 +108,116 @@ class BWT:
                 )
             else:
                 word += self._terminator
-                wordlist = sorted(
-                    word[i:] + word[:i] for i in range(len(word))
-                )
-                return ''.join([w[-1] for w in wordlist])
+                if len(word) < self._suffix_array_threshold:
+                    wordlist = sorted(
+                        word[i:] + word[:i] for i in range(len(word))
+                    )
+                    return ''.join([w[-1] for w in wordlist])
+                return ''.join([word[i - 1] for i in self._suffix_array(word)])
         else:
             return self._terminator
 
+    @staticmethod
+    def _suffix_array(word: str) -> List[int]:
+        """Return the suffix array of a word.
+
+        Suffixes are sorted by prefix doubling: after each round, suffixes
+        are ranked by their first k characters, and the next round sorts them
+        by the pair of ranks of their first k characters & of the k that
+        follow, giving their ranks by their first 2k characters.
+
+        Parameters
+        ----------
+        word : str
+            The word, which may contain any characters
+
+        Returns
+        -------
+        list
+            The start positions of the suffixes of word, in the order that
+            the suffixes sort in
+
+        Examples
+        --------
+        >>> BWT._suffix_array('banana')
+        [5, 3, 1, 0, 4, 2]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        length = len(word)
+        rank = np.fromiter(map(ord, word), dtype=np.int64, count=length)
+        span = 1
+        while True:
+            # Suffixes too short to have a second half rank first, as the
+            # shorter of two strings with a common prefix sorts first.
+            second = np.full(length, -1, dtype=np.int64)
+            second[: length - span] = rank[span:]
+            order = np.lexsort((second, rank))
+            first_sorted = rank[order]
+            second_sorted = second[order]
+            new_rank = np.empty(length, dtype=np.int64)
+            new_rank[order] = np.cumsum(
+                np.concatenate(
+                    (
+                        [0],
+                        (first_sorted[1:] != first_sorted[:-1])
+                        | (second_sorted[1:] != second_sorted[:-1]),
+                    )
+                )
+            )
+            rank = new_rank
+            if rank[order[-1]] == length - 1 or span >= length:
+                return cast(List[int], order.tolist())
+            span *= 2
+
+    def _lf_decode(self, code: str) -> Optional[str]:
+        """Return the word whose transform is code, if there is one.
+
+        The last-to-first mapping takes the position of each character of
+        code to the position of the rotation that begins with it, so the word
+        is recovered backward, from its terminator, in a single pass.
+
+        Parameters
+        ----------
+        code : str
+            The transformed word
+
+        Returns
+        -------
+        str or None
+            The word, or None if code is not the transform of any word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if code.count(self._terminator) != 1:
+            return None
+
+        # first[char] is the position of the first rotation beginning with
+        # char, & lf[i] that of the rotation beginning with code[i].
+        first = {}  # type: Dict[str, int]
+        position = 0
+        for char, count in sorted(Counter(code).items()):
+            first[char] = position
+            position += count
+        lf = [0] * len(code)
+        for i, char in enumerate(code):
+            lf[i] = first[char]
+            first[char] += 1
+
+        start = code.index(self._terminator)
+        row = lf[start]
+        chars = []  # type: List[str]
+        while row != start:
+            chars.append(code[row])
+            row = lf[row]
+        if len(chars) != len(code) - 1:
+            return None
+        return ''.join(reversed(chars))
+
     def decode(self, code: str) -> str:
         r"""Return a word decoded from BWT form.
 
@@ -132,6 +252,8 @@ class BWT:
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Decoded by the last-to-first mapping
 
         """
         if code:
@@ -142,6 +264,11 @@ class BWT:
                     )
                 )
             else:
+                word = self._lf_decode(code)
+                if word is not None:
+                    return word
+                # The code is not the transform of any word, so it is decoded
+                # as before, by repeatedly sorting.
                 wordlist = [''] * len(code)
                 for i in range(len(code)):
                     wordlist = sorted(
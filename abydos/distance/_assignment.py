@@ -0,0 +1,364 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._assignment.
+
+The distance._assignment module defines functions that solve the assignment
+problem, pairing the rows & columns of a matrix of non-negative weights so
+that the total weight of the pairs is (approximately) maximized:
+
+    - _hungarian -- finds an optimal assignment by the Hungarian algorithm of
+      :cite:`Munkres:1957`, as implemented by _munkres, which finds a minimum
+      cost assignment of a square matrix of costs
+    - _greedy -- finds an assignment of at least half the optimal weight by
+      repeatedly pairing the heaviest remaining row & column
+    - _auction -- finds an assignment within n * epsilon of the optimal weight
+      by the auction algorithm of :cite:`Bertsekas:1988`
+
+Each returns a list of (row, column) pairs. Zero-weight pairs may be omitted.
+
+These functions are not intended for use by users.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+__all__ = []  # type: List[str]
+
+
+def _hungarian(weights: np.ndarray) -> List[Tuple[int, int]]:
+    """Return a maximum weight assignment by the Hungarian algorithm.
+
+    The Hungarian algorithm of Munkres :cite:`Munkres:1957` is implemented
+    below in Python & Numpy since it is roughly twice as fast as SciPy's
+    implementation for the small matrices that arise in comparing tokens.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        A matrix of non-negative weights
+
+    Returns
+    -------
+    list
+        The (row, column) pairs of an optimal assignment
+
+    Examples
+    --------
+    >>> weights = np.array([[0.9, 0.8], [0.8, 0.1]])
+    >>> _hungarian(weights)
+    [(0, 1), (1, 0)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # Pre-preliminaries: create the square matrix of costs
+    n = max(weights.shape)
+    costs = np.zeros((n, n), dtype=float)
+    costs[: weights.shape[0], : weights.shape[1]] = weights.max() - weights
+
+    return [
+        (row, col)
+        for row, col in _munkres(costs)
+        if row < weights.shape[0] and col < weights.shape[1]
+    ]
+
+
+def _munkres(costs: np.ndarray) -> List[Tuple[int, int]]:
+    """Return a minimum cost assignment of a square matrix.
+
+    This is the Hungarian algorithm, as described by Munkres
+    :cite:`Munkres:1957`.
+
+    Parameters
+    ----------
+    costs : numpy.ndarray
+        A square matrix of costs
+
+    Returns
+    -------
+    list
+        The (row, column) pairs of an optimal assignment, including every row
+
+    Examples
+    --------
+    >>> costs = np.array([[0.1, 0.2], [0.2, 0.9]])
+    >>> _munkres(costs)
+    [(0, 1), (1, 0)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # Quoted text below is from Munkres (1957), cited above.
+    n = costs.shape[0]
+    arr = np.array(costs, dtype=float)
+
+    starred = np.zeros((n, n), dtype=np.bool_)
+    primed = np.zeros((n, n), dtype=np.bool_)
+    row_covered = np.zeros(n, dtype=np.bool_)
+    col_covered = np.zeros(n, dtype=np.bool_)
+
+    # Preliminaries:
+    # P: "No lines are covered; no zeros are starred or primed."
+    # P: "Consider a row of matrix A; subtract from each element in
+    # this row the smallest element of this row. Do the same for each
+    # row of A."
+    arr -= arr.min(axis=1, keepdims=True)
+    # P: "Then consider each column of the resulting matrix and
+    # subtract from each column its smallest entry."
+    arr -= arr.min(axis=0, keepdims=True)
+
+    # P: "Consider a zero Z of the matrix. If there is no starred zero
+    # in its row and none in its column, star Z. Repeat, considering
+    # each zero in the matrix in turn. Then cover every column
+    # containing a starred zero.
+    row_starred = np.zeros(n, dtype=np.bool_)
+    for row, col in zip(*(arr.T == 0).nonzero()[::-1]):
+        if not (row_starred[row] or col_covered[col]):
+            starred[row, col] = True
+            row_starred[row] = True
+            col_covered[col] = True
+
+    step = 1
+    # This is the simple case where independent assignments are obvious
+    # and found without the rest of the algorithm.
+    if np.count_nonzero(col_covered) == n:
+        step = 4
+
+    while step < 4:
+        if step == 1:
+            # Step 1:
+            # 1: "Choose a non-covered zero and prime it. Consider the
+            # row containing it. If there is no starred zero in this
+            # row, go at once to Step 2. If there is a starred zero Z
+            # in this row, cover this row and uncover the column of Z."
+            # 1: Repeat until all zeros are covered. Go to Step 3."
+            zeros = tuple(zip(*((arr == 0).nonzero())))
+            while step == 1:
+                for row, col in zeros:
+                    if not (col_covered[col] | row_covered[row]):
+                        primed[row, col] = True
+                        z_cols = (starred[row, :]).nonzero()[0]
+                        if not z_cols.size:
+                            step = 2
+                            break
+                        else:
+                            row_covered[row] = True
+                            col_covered[z_cols[0]] = False
+
+                if step != 1:
+                    break
+
+                for row, col in zeros:
+                    if not (col_covered[col] | row_covered[row]):
+                        break
+                else:
+                    step = 3
+
+        if step == 2:
+            # Step 2:
+            # 2: "There is a sequence of alternating starred and primed
+            # zeros, constructed as follows: Let Z_0 denote the
+            # uncovered 0'. [There is only one.] Let Z_1 denote the 0*
+            # in Z_0's column (if any). Let Z_2 denote the 0' in Z_1's
+            # row (we must prove that it exists). Let Z_3 denote the 0*
+            # in Z_2's column (if any). Similarly continue until the
+            # sequence stops at a 0', Z_{2k}, which has no 0* in its
+            # column."
+            z_series = []
+            for row, col in zeros:  # pragma: no branch
+                if primed[row, col] and not (
+                    row_covered[row] | col_covered[col]
+                ):
+                    z_series.append((row, col))
+                    break
+            col = z_series[-1][1]
+            while True:
+                row_content = tuple(
+                    set((arr[:, col] == 0).nonzero()[0])
+                    & set((starred[:, col]).nonzero()[0])
+                )
+                if row_content:
+                    row = row_content[0]
+                    z_series.append((row, col))
+                    col = tuple(
+                        set((arr[row, :] == 0).nonzero()[0])
+                        & set((primed[row, :]).nonzero()[0])
+                    )[0]
+                    z_series.append((row, col))
+                else:
+                    break
+
+            # 2: "Unstar each starred zero of the sequence and star
+            # each primed zero of the sequence. Erase all primes,
+            # uncover every row, and cover every column containing a
+            # 0*."
+            primed[:, :] = False
+            row_covered[:] = False
+            for row, col in z_series:
+                starred[row, col] = not starred[row, col]
+            col_covered[:] = starred.any(axis=0)
+            # 2: "If all columns are covered, the starred zeros form
+            # the desired independent set. Otherwise, return to Step
+            # 1."
+            if np.count_nonzero(col_covered) == n:
+                step = 4
+            else:
+                step = 1
+
+        if step == 3:
+            # Step 3:
+            # 3: "Let h denote the smallest non-covered element of the
+            # matrix; it will be positive. Add h to each covered row;
+            # then subtract h from each uncovered column."
+            h_val = arr[np.ix_(~row_covered, ~col_covered)].min()
+            arr[row_covered, :] += h_val
+            arr[:, ~col_covered] -= h_val
+
+            # 3: "Return to Step 1, without altering any asterisks,
+            # primes, or covered lines."
+            step = 1
+
+    return [(int(row), int(col)) for row, col in zip(*starred.nonzero())]
+
+
+def _greedy(weights: np.ndarray) -> List[Tuple[int, int]]:
+    """Return an assignment found by greedily pairing the heaviest pairs.
+
+    Pairs are considered in descending order of weight, and a pair is chosen
+    if neither its row nor its column has already been chosen. Each chosen
+    pair can exclude at most two pairs of an optimal assignment, neither of
+    which is heavier than it, so the total weight of the assignment is at
+    least half that of an optimal assignment :cite:`Avis:1983`.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        A matrix of non-negative weights
+
+    Returns
+    -------
+    list
+        The (row, column) pairs of the assignment
+
+    Examples
+    --------
+    >>> weights = np.array([[0.9, 0.8], [0.8, 0.1]])
+    >>> _greedy(weights)
+    [(0, 0), (1, 1)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    n_rows, n_cols = weights.shape
+    row_free = np.ones(n_rows, dtype=np.bool_)
+    col_free = np.ones(n_cols, dtype=np.bool_)
+    pairs = []  # type: List[Tuple[int, int]]
+    remaining = min(n_rows, n_cols)
+
+    flat = weights.ravel()
+    for idx in np.argsort(-flat, kind='stable'):
+        if not remaining or flat[idx] <= 0:
+            break
+        row, col = divmod(int(idx), n_cols)
+        if row_free[row] and col_free[col]:
+            row_free[row] = False
+            col_free[col] = False
+            pairs.append((row, col))
+            remaining -= 1
+    return pairs
+
+
+def _auction(
+    weights: np.ndarray, epsilon: float = 0.01
+) -> List[Tuple[int, int]]:
+    r"""Return an assignment found by the auction algorithm.
+
+    In the auction algorithm of Bertsekas :cite:`Bertsekas:1988`, each
+    unassigned row bids for the column offering it the greatest value (its
+    weight less the column's price), raising that column's price by the
+    difference between the best & second best values plus epsilon, and
+    displacing the column's previous owner. On completion, the total weight
+    of the assignment is within :math:`n \cdot \epsilon` of that of an
+    optimal assignment, where n is the lesser dimension of the matrix.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        A matrix of non-negative weights
+    epsilon : float
+        The minimum bid increment, which must be positive
+
+    Returns
+    -------
+    list
+        The (row, column) pairs of the assignment
+
+    Raises
+    ------
+    ValueError
+        epsilon is not positive
+
+    Examples
+    --------
+    >>> weights = np.array([[0.9, 0.8], [0.8, 0.1]])
+    >>> _auction(weights)
+    [(0, 1), (1, 0)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if epsilon <= 0:
+        raise ValueError('epsilon must be positive.')
+
+    transposed = weights.shape[0] > weights.shape[1]
+    if transposed:
+        weights = weights.T
+    n_rows, n_cols = weights.shape
+
+    if n_cols == 1:
+        # With a single column, the heaviest row takes it without bidding.
+        pairs = [(int(np.argmax(weights[:, 0])), 0)] if n_rows else []
+    else:
+        prices = np.zeros(n_cols, dtype=float)
+        owner = np.full(n_cols, -1, dtype=int)
+        unassigned = list(range(n_rows - 1, -1, -1))
+        while unassigned:
+            row = unassigned.pop()
+            values = weights[row] - prices
+            best, second = np.argpartition(-values, 1)[:2]
+            prices[best] += values[best] - values[second] + epsilon
+            if owner[best] >= 0:
+                unassigned.append(owner[best])
+            owner[best] = row
+        pairs = sorted(
+            (int(row), col) for col, row in enumerate(owner) if row >= 0
+        )
+
+    if transposed:
+        pairs = sorted((col, row) for row, col in pairs)
+    return pairs
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
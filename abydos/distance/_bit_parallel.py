@@ -0,0 +1,261 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._bit_parallel.
+
+The distance._bit_parallel module defines bit-parallel implementations of
+unit-cost edit distance and longest common subsequence algorithms, for use by
+the distance classes:
+
+    - _levenshtein_bp -- Levenshtein distance, per :cite:`Myers:1999` &
+      :cite:`Hyyro:2001`
+    - _osa_bp -- Optimal String Alignment distance, per :cite:`Hyyro:2003`
+    - _lcsseq_len_bp -- the length of the longest common subsequence, per
+      :cite:`Hyyro:2004`
+
+Each bit of a bit-vector represents one character of the shorter string. Since
+Python's integers have unlimited precision, strings longer than a machine word
+are handled without dividing the vectors into separate words.
+
+These functions are not intended for use by users.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+__all__ = []  # type: List[str]
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """Return the match bit-vector of each character in pattern.
+
+    Parameters
+    ----------
+    pattern : str
+        The string to build match bit-vectors for
+
+    Returns
+    -------
+    dict
+        A dict mapping each character to an int with bit i set wherever
+        pattern[i] is that character
+
+    Examples
+    --------
+    >>> sorted(_pattern_masks('ATTA').items())
+    [('A', 9), ('T', 6)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    masks = {}  # type: Dict[str, int]
+    bit = 1
+    for char in pattern:
+        masks[char] = masks.get(char, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _shorter_first(src: str, tar: str) -> Tuple[str, str]:
+    """Return src & tar, ordered by length.
+
+    .. versionadded:: 0.6.0
+
+    """
+    if len(tar) < len(src):
+        return tar, src
+    return src, tar
+
+
+def _levenshtein_bp(src: str, tar: str, bound: Optional[float] = None) -> int:
+    """Return the unit-cost Levenshtein distance between two strings.
+
+    Parameters
+    ----------
+    src : str
+        Source string for comparison
+    tar : str
+        Target string for comparison
+    bound : float
+        If set, the computation stops as soon as the distance is known to
+        exceed bound
+
+    Returns
+    -------
+    int
+        The Levenshtein distance between src & tar,
+        or some greater value if that exceeds bound
+
+    Examples
+    --------
+    >>> _levenshtein_bp('Niall', 'Neil')
+    3
+    >>> _levenshtein_bp('aluminum', 'Catalan')
+    7
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    pattern, text = _shorter_first(src, tar)
+    if not pattern:
+        return len(text)
+    if bound is not None and len(text) - len(pattern) > bound:
+        return len(text) - len(pattern)
+
+    masks = _pattern_masks(pattern)
+    mask = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    vp = mask
+    vn = 0
+    score = len(pattern)
+    remaining = len(text)
+
+    for char in text:
+        eq = masks.get(char, 0)
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn
+        hp = vn | ~(d0 | vp)
+        hn = vp & d0
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = (hp << 1) | 1
+        vn = hp & d0 & mask
+        vp = ((hn << 1) | ~(hp | d0)) & mask
+        # The score can fall by at most 1 per remaining character of text.
+        remaining -= 1
+        if bound is not None and score - remaining > bound:
+            return score
+
+    return score
+
+
+def _osa_bp(src: str, tar: str, bound: Optional[float] = None) -> int:
+    """Return the unit-cost Optimal String Alignment distance.
+
+    Parameters
+    ----------
+    src : str
+        Source string for comparison
+    tar : str
+        Target string for comparison
+    bound : float
+        If set, the computation stops as soon as the distance is known to
+        exceed bound
+
+    Returns
+    -------
+    int
+        The Optimal String Alignment distance between src & tar,
+        or some greater value if that exceeds bound
+
+    Examples
+    --------
+    >>> _osa_bp('ATCG', 'TAGC')
+    2
+    >>> _osa_bp('ACTG', 'TAGC')
+    4
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    pattern, text = _shorter_first(src, tar)
+    if not pattern:
+        return len(text)
+    if bound is not None and len(text) - len(pattern) > bound:
+        return len(text) - len(pattern)
+
+    masks = _pattern_masks(pattern)
+    mask = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    vp = mask
+    vn = 0
+    d0 = 0
+    prev_eq = 0
+    score = len(pattern)
+    remaining = len(text)
+
+    for char in text:
+        eq = masks.get(char, 0)
+        # A transposition is possible wherever the previous column had no
+        # diagonal zero and the characters match crosswise.
+        tr = (((~d0) & eq) << 1) & prev_eq
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn | tr
+        hp = vn | ~(d0 | vp)
+        hn = vp & d0
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = (hp << 1) | 1
+        vn = hp & d0 & mask
+        vp = ((hn << 1) | ~(hp | d0)) & mask
+        # The score can fall by at most 1 per remaining character of text.
+        remaining -= 1
+        if bound is not None and score - remaining > bound:
+            return score
+        prev_eq = eq
+
+    return score
+
+
+def _lcsseq_len_bp(src: str, tar: str) -> int:
+    """Return the length of the longest common subsequence of two strings.
+
+    Parameters
+    ----------
+    src : str
+        Source string for comparison
+    tar : str
+        Target string for comparison
+
+    Returns
+    -------
+    int
+        The length of the longest common subsequence of src & tar
+
+    Examples
+    --------
+    >>> _lcsseq_len_bp('Niall', 'Neil')
+    3
+    >>> _lcsseq_len_bp('aluminum', 'Catalan')
+    3
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    pattern, text = _shorter_first(src, tar)
+    if not pattern:
+        return 0
+
+    masks = _pattern_masks(pattern)
+    mask = (1 << len(pattern)) - 1
+    v = mask
+
+    for char in text:
+        u = v & masks.get(char, 0)
+        v = ((v + u) | (v - u)) & mask
+
+    return len(pattern) - bin(v).count('1')
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
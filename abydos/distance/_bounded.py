@@ -0,0 +1,188 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._bounded.
+
+The distance._bounded module defines functions supporting edit distance
+computations that stop once a distance is known to exceed a bound:
+
+    - _diagonal_band -- returns the diagonals of an alignment matrix that an
+      alignment within the bound may pass through, following
+      :cite:`Ukkonen:1985`
+    - _dist_bound -- returns the bound on an absolute distance implied by a
+      maximum distance and/or minimum similarity
+    - _bounded_dist -- normalizes a bounded absolute distance
+
+These functions are not intended for use by users.
+"""
+
+from typing import List, Optional, Tuple
+
+__all__ = []  # type: List[str]
+
+
+def _diagonal_band(
+    src_len: int, tar_len: int, bound: float, ins_cost: float, del_cost: float,
+) -> Optional[Tuple[int, int]]:
+    """Return the range of diagonals that an alignment within bound can use.
+
+    Cell (i, j) of an alignment matrix lies on diagonal j - i. Any alignment
+    passing through that cell must insert or delete enough characters to
+    reach its diagonal from diagonal 0 and then to reach the final diagonal,
+    tar_len - src_len, so the cost of those inserts & deletes is a lower
+    bound on the cost of the alignment.
+
+    Parameters
+    ----------
+    src_len : int
+        The length of the source string
+    tar_len : int
+        The length of the target string
+    bound : float
+        The maximum cost of an alignment of interest
+    ins_cost : float
+        The least cost of an insert
+    del_cost : float
+        The least cost of a delete
+
+    Returns
+    -------
+    tuple or None
+        The least & greatest diagonal whose cells may lie on an alignment
+        costing at most bound, or None if no alignment can cost at most bound
+
+    Examples
+    --------
+    >>> _diagonal_band(5, 7, 4, 1, 1)
+    (-1, 3)
+    >>> _diagonal_band(5, 9, 2, 1, 1) is None
+    True
+
+
+    .. versionadded:: 0.6.0
+
+    """
+
+    def _gap(diag: int) -> float:
+        return diag * ins_cost if diag > 0 else -diag * del_cost
+
+    final = tar_len - src_len
+    diags = [
+        diag
+        for diag in range(-src_len, tar_len + 1)
+        if _gap(diag) + _gap(final - diag) <= bound
+    ]
+    if not diags:
+        return None
+    return diags[0], diags[-1]
+
+
+def _dist_bound(
+    max_dist: Optional[float], min_sim: Optional[float], normalize_term: float
+) -> Optional[float]:
+    """Return the bound on an absolute distance for a normalized distance.
+
+    Parameters
+    ----------
+    max_dist : float or None
+        The maximum absolute distance of interest
+    min_sim : float or None
+        The minimum normalized similarity of interest
+    normalize_term : float
+        The term by which the absolute distance is divided to normalize it
+
+    Returns
+    -------
+    float or None
+        The maximum absolute distance of interest, or None if there is no
+        bound
+
+    Examples
+    --------
+    >>> _dist_bound(3, None, 10)
+    3
+    >>> round(_dist_bound(3, 0.8, 10), 6)
+    2.0
+    >>> _dist_bound(None, None, 10) is None
+    True
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if min_sim is None:
+        return max_dist
+    # The bound is slightly relaxed to allow for rounding error, since
+    # the normalized value is compared with min_sim afterward.
+    sim_bound = (1.0 - min_sim) * normalize_term * (1.0 + 1e-9) + 1e-9
+    if max_dist is None:
+        return sim_bound
+    return min(max_dist, sim_bound)
+
+
+def _bounded_dist(
+    distance: float,
+    bound: Optional[float],
+    min_sim: Optional[float],
+    normalize_term: float,
+) -> float:
+    """Return a normalized distance, or 1.0 if it is out of bounds.
+
+    Parameters
+    ----------
+    distance : float
+        The absolute distance, which may be any value greater than bound if
+        the true distance exceeds bound
+    bound : float or None
+        The bound on the absolute distance, as returned by _dist_bound
+    min_sim : float or None
+        The minimum normalized similarity of interest
+    normalize_term : float
+        The term by which the absolute distance is divided to normalize it
+
+    Returns
+    -------
+    float
+        The normalized distance, or 1.0 if the distance exceeds bound or
+        the similarity is less than min_sim
+
+    Examples
+    --------
+    >>> _bounded_dist(2, 3, None, 10)
+    0.2
+    >>> _bounded_dist(4, 3, None, 10)
+    1.0
+    >>> _bounded_dist(2, 2.0000001, 0.8, 10)
+    0.2
+    >>> _bounded_dist(3, 3, 0.8, 10)
+    1.0
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if bound is not None and distance > bound:
+        return 1.0
+    dist = distance / normalize_term
+    if min_sim is not None and 1.0 - dist < min_sim:
+        return 1.0
+    return dist
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
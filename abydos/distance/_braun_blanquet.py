@@ -19,7 +19,15 @@
 Braun-Blanquet similarity
 """
 
-from typing import Any, Counter as TCounter, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -98,6 +106,23 @@ class BraunBlanquet(_TokenDistance):
             **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Braun-Blanquet similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        return cards._intersection_card() / max(
+            cards._src_card(), cards._tar_card()
+        )
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Braun-Blanquet similarity of two strings.
 
@@ -129,14 +154,7 @@ class BraunBlanquet(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        return self._intersection_card() / max(
-            self._src_card(), self._tar_card()
-        )
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
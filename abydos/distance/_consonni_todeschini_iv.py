@@ -20,7 +20,15 @@ Consonni & Todeschini IV similarity
 """
 
 from math import log1p
-from typing import Any, Counter as TCounter, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -100,6 +108,25 @@ class ConsonniTodeschiniIV(_TokenDistance):
             **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        b = cards._src_only_card()
+        c = cards._tar_only_card()
+
+        return log1p(a) / log1p(a + b + c)
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Consonni & Todeschini IV similarity of two strings.
 
@@ -131,16 +158,7 @@ class ConsonniTodeschiniIV(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        b = self._src_only_card()
-        c = self._tar_only_card()
-
-        return log1p(a) / log1p(a + b + c)
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
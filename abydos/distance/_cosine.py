@@ -20,7 +20,7 @@ Cosine similarity & distance
 """
 
 from math import sqrt
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -97,6 +97,40 @@ class Cosine(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _join_min_overlap(
+        self, src_card: float, tar_card: float, threshold: float
+    ) -> Optional[float]:
+        r"""Return the least crisp overlap with which sim may reach threshold.
+
+        :math:`sim_{cosine}(X, Y) \geq t` if and only if
+        :math:`|X \cap Y| \geq t\sqrt{|X| \cdot |Y|}`.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return threshold * sqrt(src_card * tar_card)
+
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the cosine similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+        if not src or not tar:
+            return 0.0
+
+        cards = tokenize(src, tar)
+
+        num = cards._intersection_card()
+
+        if num:
+            return num / sqrt(cards._src_card() * cards._tar_card())
+        return 0.0
+
     def sim(self, src: str, tar: str) -> float:
         r"""Return the cosine similarity of two strings.
 
@@ -130,18 +164,7 @@ class Cosine(_TokenDistance):
             Encapsulated in class
 
         """
-        if src == tar:
-            return 1.0
-        if not src or not tar:
-            return 0.0
-
-        self._tokenize(src, tar)
-
-        num = self._intersection_card()
-
-        if num:
-            return num / sqrt(self._src_card() * self._tar_card())
-        return 0.0
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
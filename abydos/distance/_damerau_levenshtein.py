@@ -20,11 +20,23 @@ Damerau-Levenshtein distance
 """
 
 from sys import maxsize
-from typing import Any, Callable, List, Tuple, cast
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import numpy as np
+from numpy import full as np_full
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
 
+from ._bounded import _bounded_dist, _diagonal_band, _dist_bound
 from ._distance import _Distance
 
 __all__ = [
@@ -39,12 +51,26 @@ class DamerauLevenshtein(_Distance):
     Damerau-Levenshtein code is based on Java code by Kevin L. Stern
     :cite:`Stern:2014`, under the MIT license:
     https://github.com/KevinStern/software-and-algorithms/blob/master/src/main/java/blogspot/software_and_algorithms/stern_library/string/DamerauLevenshteinAlgorithm.java
+
+    If a maximum distance or minimum similarity is set, only the diagonal band
+    of the distance matrix that can hold a sufficiently close alignment is
+    computed :cite:`Ukkonen:1985`, and computation stops as soon as the bound
+    is known to be exceeded.
     """
 
+    # Below this number of pairs, sim_matrix & dist_matrix compare each pair
+    # separately, rather than all pairs at once.
+    _numpy_threshold = 4
+    # The most alignment matrix cells that are held at once in computing the
+    # pairs of sim_matrix & dist_matrix together
+    _numpy_cells = 1 << 22
+
     def __init__(
         self,
         cost: Tuple[float, float, float, float] = (1, 1, 1, 1),
         normalizer: Callable[[List[float]], float] = max,
+        max_dist: Optional[float] = None,
+        min_sim: Optional[float] = None,
         **kwargs: Any
     ):
         """Initialize Levenshtein instance.
@@ -59,16 +85,26 @@ class DamerauLevenshtein(_Distance):
             A function that takes an list and computes a normalization term
             by which the edit distance is divided (max by default). Another
             good option is the sum function.
+        max_dist : float
+            If set, distances greater than max_dist are not computed exactly:
+            dist_abs returns float('inf') and dist returns 1.0 for them
+        min_sim : float
+            If set, similarities less than min_sim are not computed exactly:
+            sim returns 0.0 (and dist returns 1.0) for them
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_dist & min_sim parameters
 
         """
         super(DamerauLevenshtein, self).__init__(**kwargs)
         self._cost = cost
         self._normalizer = normalizer
+        self._max_dist = max_dist
+        self._min_sim = min_sim
 
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the Damerau-Levenshtein distance between two strings.
@@ -103,10 +139,53 @@ class DamerauLevenshtein(_Distance):
         >>> cmp.dist_abs('ATCG', 'TAGC')
         2
 
+        >>> cmp = DamerauLevenshtein(max_dist=5)
+        >>> cmp.dist_abs('Niall', 'Neil')
+        3
+        >>> cmp.dist_abs('aluminum', 'Catalan')
+        inf
+
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_dist
+
+        """
+        distance = self._bounded_dist_abs(src, tar, self._max_dist)
+        if self._max_dist is not None and distance > self._max_dist:
+            return float('inf')
+        return distance
+
+    def _bounded_dist_abs(
+        self, src: str, tar: str, bound: Optional[float]
+    ) -> float:
+        """Return the Damerau-Levenshtein distance, if it is within a bound.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        bound : float or None
+            The maximum distance of interest
+
+        Returns
+        -------
+        int (may return a float if cost has float values)
+            The Damerau-Levenshtein distance between src & tar, or some
+            greater value if that exceeds bound
+
+        Raises
+        ------
+        ValueError
+            Unsupported cost assignment; the cost of two transpositions must
+            not be less than the cost of an insert plus a delete.
+
+
+        .. versionadded:: 0.6.0
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
@@ -124,8 +203,29 @@ class DamerauLevenshtein(_Distance):
                 + 'must not be less than the cost of an insert plus a delete.'
             )
 
-        d_mat = np_zeros((len(src), len(tar)), dtype=np_int)
-
+        band = (-len(src), len(tar))  # type: Optional[Tuple[int, int]]
+        if bound is None:
+            d_mat = np_zeros((len(src), len(tar)), dtype=np_int)
+        else:
+            # A transposition at the start of either string may also move
+            # the alignment one diagonal, at the cost of the transposition.
+            band = _diagonal_band(
+                len(src),
+                len(tar),
+                bound,
+                min(ins_cost, trans_cost),
+                min(del_cost, trans_cost),
+            )
+            if band is None:
+                return float('inf')
+            # Cells outside the band are filled with a value exceeding bound.
+            d_mat = np_full((len(src), len(tar)), int(bound) + 1, dtype=np_int)
+            # The least cost of reaching a later row by a transposition from
+            # an earlier row (or from before the first row)
+            jump_floor = trans_cost
+        band_lo, band_hi = cast(Tuple[int, int], band)
+
+        d_mat[0, 0] = 0
         if src[0] != tar[0]:
             d_mat[0, 0] = min(sub_cost, ins_cost + del_cost)
 
@@ -147,8 +247,10 @@ class DamerauLevenshtein(_Distance):
             d_mat[0, j] = min(del_distance, ins_distance, match_distance)
 
         for i in range(1, len(src)):
-            max_src_letter_match_index = 0 if src[i] == tar[0] else -1
-            for j in range(1, len(tar)):
+            j_start = max(1, i + band_lo)
+            # The last match of src[i] in tar before the band
+            max_src_letter_match_index = tar.rfind(src[i], 0, j_start)
+            for j in range(j_start, min(len(tar), i + band_hi + 1)):
                 candidate_swap_index = (
                     -1
                     if tar[j] not in src_index_by_character
@@ -186,6 +288,21 @@ class DamerauLevenshtein(_Distance):
                 )
             src_index_by_character[src[i]] = i
 
+            # Any alignment continuing past this row must pass through it (or
+            # the deletion of the whole of src[:i + 1] before it) or
+            # transpose across it, so the computation can stop once all of
+            # these are known to exceed the bound.
+            if bound is not None:
+                jump_floor = min(
+                    jump_floor + del_cost,
+                    min(d_mat[i - 1].min(), i * del_cost) + trans_cost,
+                )
+                if (
+                    min(d_mat[i].min(), (i + 1) * del_cost) > bound
+                    and jump_floor > bound
+                ):
+                    break
+
         return cast(float, d_mat[len(src) - 1, len(tar) - 1])
 
     def dist(self, src: str, tar: str) -> float:
@@ -224,18 +341,211 @@ class DamerauLevenshtein(_Distance):
         >>> cmp.dist('ATCG', 'TAGC')
         0.5
 
+        >>> cmp = DamerauLevenshtein(min_sim=0.5)
+        >>> cmp.dist('ATCG', 'TAGC')
+        0.5
+        >>> cmp.dist('aluminum', 'Catalan')
+        1.0
+
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_dist & min_sim
 
         """
         if src == tar:
             return 0.0
         ins_cost, del_cost = self._cost[:2]
-        return self.dist_abs(src, tar) / (
-            self._normalizer([len(src) * del_cost, len(tar) * ins_cost])
+        normalize_term = self._normalizer(
+            [len(src) * del_cost, len(tar) * ins_cost]
+        )
+        if self._max_dist is None and self._min_sim is None:
+            return self.dist_abs(src, tar) / normalize_term
+
+        bound = _dist_bound(self._max_dist, self._min_sim, normalize_term)
+        return _bounded_dist(
+            self._bounded_dist_abs(src, tar, bound),
+            bound,
+            self._min_sim,
+            normalize_term,
+        )
+
+    def _matrix(
+        self,
+        func: Callable[[str, str], float],
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]],
+        upper: bool,
+    ) -> np.ndarray:
+        """Fill a matrix with the values of func applied to each pair.
+
+        With integral costs, the default normalizer, and no bounds, the
+        distances of all pairs are computed together, one alignment matrix
+        cell at a time across every pair, rather than one pair at a time.
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, _, trans_cost = self._cost
+        srcs = list(srcs)
+        tars_list = srcs if tars is None else list(tars)
+        if (
+            func not in {self.dist, self.sim}
+            or len(srcs) * len(tars_list) < self._numpy_threshold
+            or self._max_dist is not None
+            or self._min_sim is not None
+            or self._normalizer is not max
+            or not all(isinstance(cost, int) for cost in self._cost)
+            or min(ins_cost, del_cost) <= 0
+            or 2 * trans_cost < ins_cost + del_cost
+        ):
+            return super(DamerauLevenshtein, self)._matrix(
+                func, srcs, tars, upper
+            )
+
+        src_lens = np.array([len(src) for src in srcs])
+        tar_lens = np.array([len(tar) for tar in tars_list])
+        dist_abs = np.zeros((len(srcs), len(tars_list)), dtype=np_int)
+        # Rows of srcs are processed in chunks, so that the alignment
+        # matrices of each chunk have at most _numpy_cells cells in all.
+        row_cells = (
+            len(tars_list)
+            * max(1, src_lens.max(initial=0))
+            * max(1, tar_lens.max(initial=0))
+        )
+        step = max(1, self._numpy_cells // row_cells)
+        for start in range(0, len(srcs), step):
+            dist_abs[start : start + step] = self._dist_abs_matrix(
+                srcs[start : start + step], tars_list
+            )
+
+        normalize_term = np.maximum(
+            src_lens[:, None] * del_cost, tar_lens[None, :] * ins_cost
+        )
+        matrix = np.zeros(dist_abs.shape, dtype=float)
+        np.divide(dist_abs, normalize_term, out=matrix, where=dist_abs > 0)
+        if func == self.sim:
+            matrix = 1.0 - matrix
+        if tars is None and upper:
+            matrix[np.tril_indices(len(srcs))] = np.nan
+        return matrix
+
+    def _dist_abs_matrix(
+        self, srcs: Sequence[str], tars: Sequence[str]
+    ) -> np.ndarray:
+        """Return the Damerau-Levenshtein distances of each pair.
+
+        This follows :py:meth:`_bounded_dist_abs` without a bound, computing
+        each cell of the alignment matrices of all pairs at once. Every pair's
+        matrix is as large as that of the longest pair, but the cells beyond
+        a pair's strings are never read in computing its distance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        alphabet = {}  # type: Dict[str, int]
+        src_len = max(1, max(len(src) for src in srcs))
+        tar_len = max(1, max(len(tar) for tar in tars))
+        # Padding differs between src & tar, so that it never matches.
+        src_codes = np.full((src_len, len(srcs)), -1, dtype=np.int64)
+        tar_codes = np.full((tar_len, len(tars)), -2, dtype=np.int64)
+        for col, src in enumerate(srcs):
+            for i, char in enumerate(src):
+                src_codes[i, col] = alphabet.setdefault(char, len(alphabet))
+        for col, tar in enumerate(tars):
+            for j, char in enumerate(tar):
+                tar_codes[j, col] = alphabet.setdefault(char, len(alphabet))
+
+        # match[i, j, p, q] is True if srcs[p][i] == tars[q][j]
+        match = (
+            src_codes[:, None, :, None] == tar_codes[None, :, None, :]
+        )  # type: np.ndarray
+
+        # i_swaps[i, j] is the last index before i in src of tar[j] & j_swaps
+        # [i, j] the last index before j in tar of src[i], or -1 if none.
+        rows = np.arange(src_len)[:, None, None, None]
+        cols = np.arange(tar_len)[None, :, None, None]
+        i_swaps = np.full(match.shape, -1, dtype=np.int64)
+        i_swaps[1:] = np.maximum.accumulate(np.where(match, rows, -1))[:-1]
+        j_swaps = np.full(match.shape, -1, dtype=np.int64)
+        j_swaps[:, 1:] = np.maximum.accumulate(
+            np.where(match, cols, -1), axis=1
+        )[:, :-1]
+
+        src_idx, tar_idx = np.indices((len(srcs), len(tars)))
+        d_mat = np.zeros(match.shape, dtype=np.int64)
+        d_mat[0, 0] = np.where(
+            match[0, 0], 0, min(sub_cost, ins_cost + del_cost)
+        )
+        for i in range(1, src_len):
+            d_mat[i, 0] = np.minimum(
+                np.minimum(
+                    d_mat[i - 1, 0] + del_cost, (i + 1) * del_cost + ins_cost
+                ),
+                i * del_cost + np.where(match[i, 0], 0, sub_cost),
+            )
+        for j in range(1, tar_len):
+            d_mat[0, j] = np.minimum(
+                np.minimum(
+                    (j + 1) * ins_cost + del_cost, d_mat[0, j - 1] + ins_cost
+                ),
+                j * ins_cost + np.where(match[0, j], 0, sub_cost),
+            )
+
+        for i in range(1, src_len):
+            for j in range(1, tar_len):
+                i_swap = i_swaps[i, j]
+                j_swap = j_swaps[i, j]
+                swap_distance = np.where(
+                    (i_swap == 0) & (j_swap == 0),
+                    0,
+                    d_mat[
+                        np.maximum(0, i_swap - 1),
+                        np.maximum(0, j_swap - 1),
+                        src_idx,
+                        tar_idx,
+                    ],
+                ) + (
+                    (i - i_swap - 1) * del_cost
+                    + (j - j_swap - 1) * ins_cost
+                    + trans_cost
+                )
+                d_mat[i, j] = np.minimum(
+                    np.minimum(
+                        d_mat[i - 1, j] + del_cost, d_mat[i, j - 1] + ins_cost
+                    ),
+                    np.minimum(
+                        d_mat[i - 1, j - 1]
+                        + np.where(match[i, j], 0, sub_cost),
+                        np.where(
+                            (i_swap != -1) & (j_swap != -1),
+                            swap_distance,
+                            maxsize,
+                        ),
+                    ),
+                )
+
+        src_lens = np.array([len(src) for src in srcs])
+        tar_lens = np.array([len(tar) for tar in tars])
+        dist_abs = d_mat[
+            np.maximum(0, src_lens - 1)[:, None],
+            np.maximum(0, tar_lens - 1)[None, :],
+            src_idx,
+            tar_idx,
+        ]
+        # Pairs involving an empty string, or of equal strings, are handled
+        # as in _bounded_dist_abs.
+        dist_abs = np.where(
+            src_lens[:, None] == 0, tar_lens[None, :] * ins_cost, dist_abs
+        )
+        dist_abs = np.where(
+            tar_lens[None, :] == 0, src_lens[:, None] * del_cost, dist_abs
         )
+        equal = np.array([[src == tar for tar in tars] for src in srcs])
+        return np.where(equal, 0, dist_abs)
 
 
 if __name__ == '__main__':
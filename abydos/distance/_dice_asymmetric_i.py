@@ -19,7 +19,7 @@
 Dice's Asymmetric I similarity
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -95,6 +95,26 @@ class DiceAsymmetricI(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        ab = cards._src_card()
+
+        if a == 0.0:
+            return 0.0
+        return a / ab
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Dice's Asymmetric I similarity of two strings.
 
@@ -126,17 +146,7 @@ class DiceAsymmetricI(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        ab = self._src_card()
-
-        if a == 0.0:
-            return 0.0
-        return a / ab
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
@@ -20,10 +20,11 @@ Discounted Levenshtein edit distance
 """
 
 from math import log
-from typing import Any, Callable, List, Tuple, Union, cast
+from typing import Any, Callable, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
+from ._bounded import _bounded_dist, _diagonal_band, _dist_bound
 from ._levenshtein import Levenshtein
 
 __all__ = ['DiscountedLevenshtein']
@@ -118,7 +119,11 @@ class DiscountedLevenshtein(Levenshtein):
         return 1 / (discounts + 1) ** 0.2
 
     def _alignment_matrix(
-        self, src: str, tar: str, backtrace: bool = True
+        self,
+        src: str,
+        tar: str,
+        backtrace: bool = True,
+        bound: Optional[float] = None,
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         """Return the Levenshtein alignment matrix.
 
@@ -130,6 +135,9 @@ class DiscountedLevenshtein(Levenshtein):
             Target string for comparison
         backtrace : bool
             Return the backtrace matrix as well
+        bound : float
+            If set, only cells that may lie on an alignment costing at most
+            bound are computed; the others are left as infinity
 
         Returns
         -------
@@ -138,6 +146,8 @@ class DiscountedLevenshtein(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added bound parameter
 
         """
         src_len = len(src)
@@ -175,7 +185,20 @@ class DiscountedLevenshtein(Levenshtein):
         else:
             discount_from = [1, 1]
 
-        d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
+        band = (-src_len, tar_len)  # type: Optional[Tuple[int, int]]
+        if bound is None:
+            d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
+        else:
+            # No edit costs less than the most discounted edit.
+            step_cost = min(
+                self._discount_func(pos)
+                for pos in range(max(src_len, tar_len) + 1)
+            )
+            band = _diagonal_band(
+                src_len, tar_len, bound, step_cost, step_cost
+            )
+            d_mat = np.full((src_len + 1, tar_len + 1), np.inf)
+            d_mat[0, 0] = 0
         if backtrace:
             trace_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.int8)
         for i in range(1, src_len + 1):
@@ -190,9 +213,14 @@ class DiscountedLevenshtein(Levenshtein):
             )
             if backtrace:
                 trace_mat[0, j] = 0
+        if band is None:
+            # No alignment can cost at most bound.
+            return d_mat
+        band_lo, band_hi = band
+
         for i in range(src_len):
             i_extend = self._discount_func(max(0, i - discount_from[0]))
-            for j in range(tar_len):
+            for j in range(max(0, i + band_lo), min(tar_len, i + band_hi + 1)):
                 traces = ((i + 1, j), (i, j + 1), (i, j))
                 cost = min(
                     i_extend, self._discount_func(max(0, j - discount_from[1]))
@@ -220,6 +248,17 @@ class DiscountedLevenshtein(Levenshtein):
                         )
                         if backtrace:
                             trace_mat[i + 1, j + 1] = 2
+
+            # Costs never decrease from one row to the next (or, with
+            # transpositions, the row after next), so the computation can
+            # stop once every cell of the latest rows exceeds the bound.
+            if (
+                bound is not None
+                and d_mat[i + 1].min() > bound
+                and (self._mode != 'osa' or d_mat[i].min() > bound)
+            ):
+                break
+
         if backtrace:
             return d_mat, trace_mat
         return d_mat
@@ -257,8 +296,45 @@ class DiscountedLevenshtein(Levenshtein):
         >>> cmp.dist_abs('ACTG', 'TAGC')
         3.342270622531718
 
+        >>> cmp = DiscountedLevenshtein(max_dist=3)
+        >>> cmp.dist_abs('Niall', 'Neil')
+        2.526064024369237
+        >>> cmp.dist_abs('aluminum', 'Catalan')
+        inf
+
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added max_dist
+
+        """
+        distance = self._bounded_dist_abs(src, tar, self._max_dist)
+        if self._max_dist is not None and distance > self._max_dist:
+            return float('inf')
+        return distance
+
+    def _bounded_dist_abs(
+        self, src: str, tar: str, bound: Optional[float]
+    ) -> float:
+        """Return the discounted Levenshtein distance, if within a bound.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        bound : float or None
+            The maximum distance of interest
+
+        Returns
+        -------
+        float
+            The discounted Levenshtein distance between src & tar, or some
+            greater value if that exceeds bound
+
+
+        .. versionadded:: 0.6.0
 
         """
         src_len = len(src)
@@ -284,8 +360,11 @@ class DiscountedLevenshtein(Levenshtein):
             )
 
         d_mat = cast(
-            np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
+            np.ndarray,
+            self._alignment_matrix(src, tar, backtrace=False, bound=bound),
         )
+        if bound is not None and d_mat[src_len, tar_len] > bound:
+            return cast(float, d_mat[src_len, tar_len])
 
         if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
             return int(d_mat[src_len, tar_len])
@@ -328,6 +407,8 @@ class DiscountedLevenshtein(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added max_dist & min_sim
 
         """
         if src == tar:
@@ -354,7 +435,16 @@ class DiscountedLevenshtein(Levenshtein):
             ]
         )
 
-        return self.dist_abs(src, tar) / normalize_term
+        if self._max_dist is None and self._min_sim is None:
+            return self.dist_abs(src, tar) / normalize_term
+
+        bound = _dist_bound(self._max_dist, self._min_sim, normalize_term)
+        return _bounded_dist(
+            self._bounded_dist_abs(src, tar, bound),
+            bound,
+            self._min_sim,
+            normalize_term,
+        )
 
 
 if __name__ == '__main__':
@@ -18,7 +18,9 @@
 
 The distance._distance module implements abstract class _Distance.
 """
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+import numpy as np
 
 __all__ = ['_Distance']
 
@@ -122,6 +124,137 @@ class _Distance:
         """
         return self.dist(src, tar)
 
+    def sim_matrix(
+        self,
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]] = None,
+        upper: bool = False,
+    ) -> np.ndarray:
+        """Return the matrix of similarities between two collections.
+
+        Parameters
+        ----------
+        srcs : Sequence[str]
+            Source strings for comparison
+        tars : Sequence[str] or None
+            Target strings for comparison. If None, srcs is compared against
+            itself.
+        upper : bool
+            If True and tars is None, only the values above the main diagonal
+            are calculated and the remaining values are set to nan. This
+            halves the number of comparisons when only one direction of each
+            pair is needed.
+
+        Returns
+        -------
+        numpy.ndarray
+            A len(srcs) by len(tars) array, in which the value at [i, j] is
+            the similarity of srcs[i] and tars[j]
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_matrix(['cat', 'hat'], ['Niall', 'hat'])
+        array([[0.2       , 0.66666667],
+               [0.2       , 1.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._matrix(self.sim, srcs, tars, upper)
+
+    def dist_matrix(
+        self,
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]] = None,
+        upper: bool = False,
+    ) -> np.ndarray:
+        """Return the matrix of distances between two collections.
+
+        Parameters
+        ----------
+        srcs : Sequence[str]
+            Source strings for comparison
+        tars : Sequence[str] or None
+            Target strings for comparison. If None, srcs is compared against
+            itself.
+        upper : bool
+            If True and tars is None, only the values above the main diagonal
+            are calculated and the remaining values are set to nan.
+
+        Returns
+        -------
+        numpy.ndarray
+            A len(srcs) by len(tars) array, in which the value at [i, j] is
+            the distance of srcs[i] and tars[j]
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_matrix(['cat', 'hat'], ['Niall', 'hat'])
+        array([[0.8       , 0.33333333],
+               [0.8       , 0.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._matrix(self.dist, srcs, tars, upper)
+
+    def _matrix(
+        self,
+        func: Callable[[str, str], float],
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]],
+        upper: bool,
+    ) -> np.ndarray:
+        """Fill a matrix with the values of func applied to each pair.
+
+        Subclasses that can share work across a batch of comparisons should
+        override :py:meth:`_batch_prepare` & :py:meth:`_batch_clear` rather
+        than this method.
+
+        .. versionadded:: 0.6.0
+
+        """
+        srcs = list(srcs)
+        if tars is None:
+            tars = srcs
+            self._batch_prepare(srcs)
+        else:
+            upper = False
+            tars = list(tars)
+            self._batch_prepare(srcs + tars)
+
+        matrix = np.full((len(srcs), len(tars)), np.nan, dtype=float)
+        try:
+            for i, src in enumerate(srcs):
+                for j in range(i + 1 if upper else 0, len(tars)):
+                    matrix[i, j] = func(src, tars[j])
+        finally:
+            self._batch_clear()
+
+        return matrix
+
+    def _batch_prepare(self, strings: Iterable[str]) -> None:
+        """Prepare for a batch of comparisons among the supplied strings.
+
+        By default, this does nothing.
+
+        .. versionadded:: 0.6.0
+
+        """
+
+    def _batch_clear(self) -> None:
+        """Discard anything stored by :py:meth:`_batch_prepare`.
+
+        .. versionadded:: 0.6.0
+
+        """
+
 
 if __name__ == '__main__':
     import doctest
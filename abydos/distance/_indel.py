@@ -21,6 +21,7 @@ Indel distance
 
 from typing import Any
 
+from ._bounded import _bounded_dist, _dist_bound
 from ._levenshtein import Levenshtein
 
 __all__ = ['Indel']
@@ -84,11 +85,23 @@ class Indel(Levenshtein):
 
 
         .. versionadded:: 0.3.6
+        .. versionchanged:: 0.6.0
+            Added support for max_dist & min_sim
 
         """
         if src == tar:
             return 0.0
-        return self.dist_abs(src, tar) / (len(src) + len(tar))
+        normalize_term = len(src) + len(tar)
+        if self._max_dist is None and self._min_sim is None:
+            return self.dist_abs(src, tar) / normalize_term
+
+        bound = _dist_bound(self._max_dist, self._min_sim, normalize_term)
+        return _bounded_dist(
+            self._bounded_dist_abs(src, tar, bound),
+            bound,
+            self._min_sim,
+            normalize_term,
+        )
 
 
 if __name__ == '__main__':
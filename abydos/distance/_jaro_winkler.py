@@ -23,7 +23,18 @@ The distance._JaroWinkler module implements distance metrics based on
     - Jaro-Winkler distance
 """
 
-from typing import Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
+
+import numpy as np
 
 from ._distance import _Distance
 from ..tokenizer import QGrams
@@ -42,6 +53,11 @@ class JaroWinkler(_Distance):
     :cite:`Winkler:1994`. The above file is a US Government publication and,
     accordingly, in the public domain.
 
+    Matches within the search window are found bit-parallel: the positions of
+    each q-gram in the target are held as the bits of an int, so the first
+    unmatched position within the window is found by masking and isolating
+    the lowest set bit, rather than by scanning the window.
+
     .. versionadded:: 0.3.6
     """
 
@@ -52,6 +68,7 @@ class JaroWinkler(_Distance):
         long_strings: bool = False,
         boost_threshold: float = 0.7,
         scaling_factor: float = 0.1,
+        min_sim: Optional[float] = None,
         **kwargs: Any
     ) -> None:
         """Initialize JaroWinkler instance.
@@ -81,9 +98,18 @@ class JaroWinkler(_Distance):
             A value between 0 and 0.25, indicating by how much to boost scores
             for matching prefixes (defaults to 0.1). (Used in 'winkler' mode
             only.)
+        min_sim : float
+            If set, similarities less than min_sim are not computed exactly:
+            sim returns 0.0 (and dist returns 1.0) for them. Pairs whose
+            similarity cannot reach min_sim, given their lengths and the
+            q-grams they have in common, are not compared.
+        **kwargs
+            Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added min_sim parameter
 
         """
         super(JaroWinkler, self).__init__(**kwargs)
@@ -92,6 +118,7 @@ class JaroWinkler(_Distance):
         self._long_strings = long_strings
         self._boost_threshold = boost_threshold
         self._scaling_factor = scaling_factor
+        self._min_sim = min_sim
 
     def sim(self, src: str, tar: str) -> float:
         """Return the Jaro or Jaro-Winkler similarity of two strings.
@@ -143,6 +170,91 @@ class JaroWinkler(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Matches bit-parallel & added min_sim
+
+        """
+        self._check_params()
+        if src == tar:
+            return 1.0
+        return self._sim_lists(self._tokens(src), self._tokens(tar))
+
+    def sim_many(self, src: str, tars: Iterable[str]) -> List[float]:
+        """Return the similarity of a string to each of a collection.
+
+        The source string is tokenized once, and the set of its q-grams, used
+        to filter candidates by min_sim, is built once.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tars : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        list
+            The Jaro or Jaro-Winkler similarity of src to each target, in order
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> [round(sim, 12) for sim in cmp.sim_many('Niall', ['Neil', 'Nigel'])]
+        [0.805, 0.786666666667]
+        >>> cmp = JaroWinkler(min_sim=0.8)
+        >>> [round(sim, 12) for sim in cmp.sim_many('Niall', ['Neil', 'Nigel'])]
+        [0.805, 0.0]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_params()
+        src_list = self._tokens(src)
+        src_set = None  # type: Optional[Set[str]]
+        if self._min_sim is not None:
+            src_set = set(src_list)
+        return [
+            1.0
+            if src == tar
+            else self._sim_lists(src_list, self._tokens(tar), src_set)
+            for tar in tars
+        ]
+
+    def _matrix(
+        self,
+        func: Callable[[str, str], float],
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]],
+        upper: bool,
+    ) -> np.ndarray:
+        """Fill a matrix with the values of func applied to each pair.
+
+        For sim_matrix & dist_matrix, each row is computed by
+        :py:meth:`sim_many`.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if func not in {self.sim, self.dist}:
+            return super(JaroWinkler, self)._matrix(func, srcs, tars, upper)
+
+        srcs = list(srcs)
+        tars_list = srcs if tars is None else list(tars)
+        upper = upper and tars is None
+        matrix = np.full((len(srcs), len(tars_list)), np.nan, dtype=float)
+        for i, src in enumerate(srcs):
+            start = i + 1 if upper else 0
+            matrix[i, start:] = self.sim_many(src, tars_list[start:])
+        if func == self.dist:
+            matrix = 1.0 - matrix
+        return matrix
+
+    def _check_params(self) -> None:
+        """Raise a ValueError if the Winkler parameters are out of range.
+
+        .. versionadded:: 0.6.0
 
         """
         if self._mode == 'winkler':
@@ -157,70 +269,50 @@ class JaroWinkler(_Distance):
                     + 'scaling_factor must be between 0 and 0.25.'
                 )
 
-        if src == tar:
-            return 1.0
+    def _tokens(self, string: str) -> List[str]:
+        """Return the list of q-grams of a string, once stripped.
 
+        .. versionadded:: 0.6.0
+
+        """
+        if self._qval == 1:
+            return list(string.strip())
         tokenizer = QGrams(self._qval)
-        tokenizer.tokenize(src.strip())
-        src_list = tokenizer.get_list()
-        tokenizer.tokenize(tar.strip())
-        tar_list = tokenizer.get_list()
+        tokenizer.tokenize(string.strip())
+        return tokenizer.get_list()
 
-        lens = len(src_list)
-        lent = len(tar_list)
+    def _boost(
+        self,
+        weight: float,
+        src_list: List[str],
+        tar_list: List[str],
+        num_com: int,
+    ) -> float:
+        """Return the Winkler-boosted weight.
 
-        # If either string is blank - return - added in Version 2
-        if lens == 0 or lent == 0:
-            return 0.0
+        Parameters
+        ----------
+        weight : float
+            The Jaro similarity (or an upper bound of it)
+        src_list : list
+            The source q-grams
+        tar_list : list
+            The target q-grams
+        num_com : int
+            The number of q-grams in common (or an upper bound of it)
 
-        if lens > lent:
-            search_range = lens
-            minv = lent
-        else:
-            search_range = lent
-            minv = lens
-
-        # Zero out the flags
-        src_flag = [0] * search_range
-        tar_flag = [0] * search_range
-        search_range = max(0, search_range // 2 - 1)
-
-        # Looking only within the search range,
-        # count and flag the matched pairs.
-        num_com = 0
-        yl1 = lent - 1
-        for i in range(lens):
-            low_lim = (i - search_range) if (i >= search_range) else 0
-            hi_lim = (i + search_range) if ((i + search_range) <= yl1) else yl1
-            for j in range(low_lim, hi_lim + 1):
-                if (tar_flag[j] == 0) and (tar_list[j] == src_list[i]):
-                    tar_flag[j] = 1
-                    src_flag[i] = 1
-                    num_com += 1
-                    break
+        Returns
+        -------
+        float
+            The Jaro-Winkler similarity (or an upper bound of it)
 
-        # If no characters in common - return
-        if num_com == 0:
-            return 0.0
 
-        # Count the number of transpositions
-        k = n_trans = 0
-        for i in range(lens):
-            if src_flag[i] != 0:
-                j = 0
-                for j in range(k, lent):  # pragma: no branch
-                    if tar_flag[j] != 0:
-                        k = j + 1
-                        break
-                if src_list[i] != tar_list[j]:
-                    n_trans += 1
-        n_trans //= 2
+        .. versionadded:: 0.6.0
 
-        # Main weight computation for Jaro distance
-        weight = (
-            num_com / lens + num_com / lent + (num_com - n_trans) / num_com
-        )
-        weight /= 3.0
+        """
+        lens = len(src_list)
+        lent = len(tar_list)
+        minv = min(lens, lent)
 
         # Continue to boost the weight if the strings are similar
         # This is the Winkler portion of Jaro-Winkler distance
@@ -249,6 +341,145 @@ class JaroWinkler(_Distance):
 
         return weight
 
+    def _upper_bound(
+        self,
+        src_list: List[str],
+        tar_list: List[str],
+        src_set: Optional[Set[str]] = None,
+    ) -> float:
+        """Return an upper bound of the similarity of two q-gram lists.
+
+        The number of matching q-grams is at most the number of target
+        q-grams that occur in the source, and there are no fewer than 0
+        transpositions.
+
+        Parameters
+        ----------
+        src_list : list
+            The source q-grams
+        tar_list : list
+            The target q-grams
+        src_set : set or None
+            The set of the source q-grams, if already built
+
+        Returns
+        -------
+        float
+            A similarity no less than that of the lists
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        lens = len(src_list)
+        lent = len(tar_list)
+        if src_set is None:
+            src_set = set(src_list)
+        num_com = sum(map(src_set.__contains__, tar_list))
+        if not num_com:
+            return 0.0
+        weight = (num_com / lens + num_com / lent + 1.0) / 3.0
+        return self._boost(weight, src_list, tar_list, num_com)
+
+    def _sim_lists(
+        self,
+        src_list: List[str],
+        tar_list: List[str],
+        src_set: Optional[Set[str]] = None,
+    ) -> float:
+        """Return the Jaro or Jaro-Winkler similarity of two q-gram lists.
+
+        Parameters
+        ----------
+        src_list : list
+            The source q-grams
+        tar_list : list
+            The target q-grams
+        src_set : set or None
+            The set of the source q-grams, if already built
+
+        Returns
+        -------
+        float
+            Jaro or Jaro-Winkler similarity
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        lens = len(src_list)
+        lent = len(tar_list)
+
+        # If either string is blank - return - added in Version 2
+        if lens == 0 or lent == 0:
+            return 0.0
+
+        min_sim = self._min_sim
+        if min_sim is not None:
+            # Bound the similarity first by the lengths alone, then by the
+            # q-grams in common.
+            minv = min(lens, lent)
+            bound = (minv / lens + minv / lent + 1.0) / 3.0
+            if (
+                self._boost(bound, src_list, tar_list, minv) < min_sim
+                or self._upper_bound(src_list, tar_list, src_set) < min_sim
+            ):
+                return 0.0
+
+        search_range = max(0, max(lens, lent) // 2 - 1)
+
+        # Bit j of each mask is set where tar_list[j] is the q-gram.
+        masks = {}  # type: Dict[str, int]
+        bit = 1
+        for tok in tar_list:
+            masks[tok] = masks.get(tok, 0) | bit
+            bit <<= 1
+
+        # Looking only within the search range, flag the first unflagged
+        # match in tar of each q-gram of src, which is the lowest set bit of
+        # the unflagged matches within the window.
+        tar_flag = 0
+        src_matched = []
+        window = (1 << (2 * search_range + 1)) - 1
+        for i, tok in enumerate(src_list):
+            low_lim = i - search_range
+            if low_lim >= lent:
+                break
+            if tok in masks:
+                if low_lim > 0:
+                    matches = masks[tok] & (window << low_lim) & ~tar_flag
+                else:
+                    matches = masks[tok] & (window >> -low_lim) & ~tar_flag
+                if matches:
+                    tar_flag |= matches & -matches
+                    src_matched.append(tok)
+        num_com = len(src_matched)
+
+        # If no characters in common - return
+        if num_com == 0:
+            return 0.0
+
+        # Count the number of transpositions, pairing the matched q-grams of
+        # src & tar in order
+        n_trans = 0
+        for tok in src_matched:
+            lowest = tar_flag & -tar_flag
+            if tar_list[lowest.bit_length() - 1] != tok:
+                n_trans += 1
+            tar_flag ^= lowest
+        n_trans //= 2
+
+        # Main weight computation for Jaro distance
+        weight = (
+            num_com / lens + num_com / lent + (num_com - n_trans) / num_com
+        )
+        weight /= 3.0
+
+        weight = self._boost(weight, src_list, tar_list, num_com)
+        if min_sim is not None and weight < min_sim:
+            return 0.0
+        return weight
+
 
 if __name__ == '__main__':
     import doctest
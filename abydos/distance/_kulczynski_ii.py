@@ -19,7 +19,7 @@
 Kulczynski II similarity
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -90,6 +90,28 @@ class KulczynskiII(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Kulczynski II similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        apb = cards._src_card()
+        apc = cards._tar_card()
+
+        if not apb or not apc:
+            return 0.0
+
+        return 0.5 * (a / apb + a / apc)
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Kulczynski II similarity of two strings.
 
@@ -121,19 +143,7 @@ class KulczynskiII(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        apb = self._src_card()
-        apc = self._tar_card()
-
-        if not apb or not apc:
-            return 0.0
-
-        return 0.5 * (a / apb + a / apc)
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
@@ -24,6 +24,7 @@ from typing import Any, Callable, List
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
 
+from ._bit_parallel import _lcsseq_len_bp
 from ._distance import _Distance
 
 __all__ = ['LCSseq']
@@ -164,13 +165,16 @@ class LCSseq(_Distance):
             Encapsulated in class
         .. versionchanged:: 0.4.0
             Added normalization option
+        .. versionchanged:: 0.6.0
+            Computes the LCSseq length by a bit-parallel algorithm
+            :cite:`Hyyro:2004`
 
         """
         if src == tar:
             return 1.0
         elif not src or not tar:
             return 0.0
-        return len(self.lcsseq(src, tar)) / self._normalizer(
+        return _lcsseq_len_bp(src, tar) / self._normalizer(
             [len(src), len(tar)]
         )
 
@@ -24,10 +24,12 @@ based on Levenshtein distance, including:
 """
 
 from sys import float_info
-from typing import Any, Callable, List, Tuple, Union, cast
+from typing import Any, Callable, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
+from ._bit_parallel import _lcsseq_len_bp, _levenshtein_bp, _osa_bp
+from ._bounded import _bounded_dist, _diagonal_band, _dist_bound
 from ._distance import _Distance
 
 __all__ = ['Levenshtein']
@@ -44,7 +46,14 @@ class Levenshtein(_Distance):
 
     The ordinary Levenshtein & Optimal String Alignment distance both
     employ the Wagner-Fischer dynamic programming algorithm
-    :cite:`Wagner:1974`.
+    :cite:`Wagner:1974`. When costs are unit and tapering is disabled, the
+    distances are instead computed by bit-parallel algorithms
+    :cite:`Myers:1999,Hyyro:2003`.
+
+    If a maximum distance or minimum similarity is set, only the diagonal band
+    of the alignment matrix that can hold a sufficiently close alignment is
+    computed :cite:`Ukkonen:1985`, and computation stops as soon as the bound
+    is known to be exceeded.
 
     Levenshtein edit distance ordinarily has unit insertion, deletion, and
     substitution costs.
@@ -60,6 +69,8 @@ class Levenshtein(_Distance):
         cost: Tuple[float, float, float, float] = (1, 1, 1, 1),
         normalizer: Callable[[List[float]], float] = max,
         taper: bool = False,
+        max_dist: Optional[float] = None,
+        min_sim: Optional[float] = None,
         **kwargs: Any
     ) -> None:
         """Initialize Levenshtein instance.
@@ -89,11 +100,19 @@ class Levenshtein(_Distance):
             edits at the start of the string to "just [exceed] twice the
             minimum penalty for replacement or deletion at the end of the
             string".
+        max_dist : float
+            If set, distances greater than max_dist are not computed exactly:
+            dist_abs returns float('inf') and dist returns 1.0 for them
+        min_sim : float
+            If set, similarities less than min_sim are not computed exactly:
+            sim returns 0.0 (and dist returns 1.0) for them
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_dist & min_sim parameters
 
         """
         super(Levenshtein, self).__init__(**kwargs)
@@ -101,6 +120,51 @@ class Levenshtein(_Distance):
         self._cost = cost
         self._normalizer = normalizer
         self._taper_enabled = taper
+        self._max_dist = max_dist
+        self._min_sim = min_sim
+
+    @staticmethod
+    def _indel_bp(src: str, tar: str, bound: Optional[float] = None) -> int:
+        """Return the indel distance, via the LCSseq length.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if bound is not None and abs(len(src) - len(tar)) > bound:
+            return abs(len(src) - len(tar))
+        return len(src) + len(tar) - 2 * _lcsseq_len_bp(src, tar)
+
+    def _bit_parallel(
+        self,
+    ) -> Optional[Callable[[str, str, Optional[float]], int]]:
+        """Return a bit-parallel algorithm for the current parameters.
+
+        Returns
+        -------
+        function or None
+            A function computing the same distance that the alignment matrix
+            would with the current mode, cost, and taper, or None if there is
+            no such function
+
+        .. versionadded:: 0.6.0
+
+        """
+        if (
+            self._taper_enabled
+            or type(self)._alignment_matrix
+            is not Levenshtein._alignment_matrix
+        ):
+            return None
+        if self._mode == 'lev':
+            if tuple(self._cost[:3]) == (1, 1, 1):
+                return _levenshtein_bp
+            if tuple(self._cost[:2]) == (1, 1) and self._cost[2] >= 2:
+                # With no substitution cheaper than an insert & delete, the
+                # distance is the indel distance.
+                return self._indel_bp
+        elif self._mode == 'osa' and tuple(self._cost) == (1, 1, 1, 1):
+            return _osa_bp
+        return None
 
     def _taper(self, pos: int, length: int) -> float:
         return (
@@ -110,7 +174,11 @@ class Levenshtein(_Distance):
         )
 
     def _alignment_matrix(
-        self, src: str, tar: str, backtrace: bool = True
+        self,
+        src: str,
+        tar: str,
+        backtrace: bool = True,
+        bound: Optional[float] = None,
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         """Return the Levenshtein alignment matrix.
 
@@ -122,6 +190,9 @@ class Levenshtein(_Distance):
             Target string for comparison
         backtrace : bool
             Return the backtrace matrix as well
+        bound : float
+            If set, only cells that may lie on an alignment costing at most
+            bound are computed; the others are left as infinity
 
         Returns
         -------
@@ -130,6 +201,8 @@ class Levenshtein(_Distance):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added bound parameter
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
@@ -138,7 +211,12 @@ class Levenshtein(_Distance):
         tar_len = len(tar)
         max_len = max(src_len, tar_len)
 
-        d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
+        band = (-src_len, tar_len)  # type: Optional[Tuple[int, int]]
+        if bound is None:
+            d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
+        else:
+            band = _diagonal_band(src_len, tar_len, bound, ins_cost, del_cost)
+            d_mat = np.full((src_len + 1, tar_len + 1), np.inf)
         if backtrace:
             trace_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.int8)
         for i in range(src_len + 1):
@@ -149,9 +227,13 @@ class Levenshtein(_Distance):
             d_mat[0, j] = j * self._taper(j, max_len) * ins_cost
             if backtrace:
                 trace_mat[0, j] = 0
+        if band is None:
+            # No alignment can cost at most bound.
+            return d_mat
+        band_lo, band_hi = band
 
         for i in range(src_len):
-            for j in range(tar_len):
+            for j in range(max(0, i + band_lo), min(tar_len, i + band_hi + 1)):
                 opts = (
                     d_mat[i + 1, j]
                     + ins_cost * self._taper(1 + max(i, j), max_len),  # ins
@@ -184,6 +266,16 @@ class Levenshtein(_Distance):
                         if backtrace:
                             trace_mat[i + 1, j + 1] = 2
 
+            # Costs never decrease from one row to the next (or, with
+            # transpositions, the row after next), so the computation can
+            # stop once every cell of the latest rows exceeds the bound.
+            if (
+                bound is not None
+                and d_mat[i + 1].min() > bound
+                and (self._mode != 'osa' or d_mat[i].min() > bound)
+            ):
+                break
+
         if backtrace:
             return d_mat, trace_mat
         return d_mat
@@ -298,12 +390,53 @@ class Levenshtein(_Distance):
         >>> cmp.dist_abs('ACTG', 'TAGC')
         4
 
+        >>> cmp = Levenshtein(max_dist=5)
+        >>> cmp.dist_abs('Niall', 'Neil')
+        3
+        >>> cmp.dist_abs('aluminum', 'Catalan')
+        inf
+
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added bit-parallel computation for unit costs & max_dist
 
         """
+        distance = self._bounded_dist_abs(src, tar, self._max_dist)
+        if self._max_dist is not None and distance > self._max_dist:
+            return float('inf')
+        return distance
+
+    def _bounded_dist_abs(
+        self, src: str, tar: str, bound: Optional[float]
+    ) -> float:
+        """Return the Levenshtein distance, if it is within a bound.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        bound : float or None
+            The maximum distance of interest
+
+        Returns
+        -------
+        int (may return a float if cost has float values)
+            The Levenshtein distance between src & tar, or some greater value
+            if that exceeds bound
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        bit_parallel = self._bit_parallel()
+        if bit_parallel is not None:
+            return bit_parallel(src, tar, bound)
+
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
 
         src_len = len(src)
@@ -321,9 +454,17 @@ class Levenshtein(_Distance):
                 del_cost * self._taper(pos, max_len) for pos in range(src_len)
             )
 
-        d_mat = cast(
-            np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
-        )
+        if bound is None:
+            d_mat = cast(
+                np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
+            )
+        else:
+            d_mat = cast(
+                np.ndarray,
+                self._alignment_matrix(src, tar, backtrace=False, bound=bound),
+            )
+            if d_mat[src_len, tar_len] > bound:
+                return cast(float, d_mat[src_len, tar_len])
 
         if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
             return int(d_mat[src_len, tar_len])
@@ -364,10 +505,18 @@ class Levenshtein(_Distance):
         >>> cmp.dist('ATCG', 'TAGC')
         0.75
 
+        >>> cmp = Levenshtein(min_sim=0.5)
+        >>> round(cmp.dist('Niall', 'Neil'), 12)
+        1.0
+        >>> round(cmp.dist('Niall', 'Nigel'), 12)
+        0.4
+
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_dist & min_sim
 
         """
         if src == tar:
@@ -395,7 +544,16 @@ class Levenshtein(_Distance):
                 [src_len * del_cost, tar_len * ins_cost]
             )
 
-        return self.dist_abs(src, tar) / normalize_term
+        if self._max_dist is None and self._min_sim is None:
+            return self.dist_abs(src, tar) / normalize_term
+
+        bound = _dist_bound(self._max_dist, self._min_sim, normalize_term)
+        return _bounded_dist(
+            self._bounded_dist_abs(src, tar, bound),
+            bound,
+            self._min_sim,
+            normalize_term,
+        )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,323 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._lsh_index.
+
+Locality-sensitive hashing index of MinHash signatures
+"""
+
+from collections import defaultdict
+from typing import (
+    DefaultDict,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from ._minhash import MinHash
+
+__all__ = ['LSHIndex']
+
+
+class LSHIndex:
+    r"""Locality-sensitive hashing index of MinHash signatures.
+
+    Banding :cite:`Leskovec:2014` divides each MinHash signature of
+    :math:`b \cdot r` values into b bands of r values and files the record
+    under each band. Two records become candidates if any of their bands are
+    identical, which, for records with Jaccard similarity s, happens with
+    probability :math:`1-(1-s^r)^b`. This rises steeply near
+    :math:`s = (1/b)^{1/r}`, so the bands & rows should be chosen to place
+    that point a little below the similarity of interest.
+
+    Candidates are found without comparing every pair of records, and may
+    optionally be filtered by the similarity estimated from their full
+    signatures.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        bands: int = 16,
+        rows: int = 8,
+        threshold: Optional[float] = None,
+        minhash: Optional[MinHash] = None,
+    ) -> None:
+        """Initialize LSHIndex instance.
+
+        Parameters
+        ----------
+        bands : int
+            The number of bands each signature is divided into
+        rows : int
+            The number of signature values in each band
+        threshold : float or None
+            If set, candidates are only returned if the similarity estimated
+            from their signatures is at least this value
+        minhash : MinHash or None
+            The MinHash instance used to compute signatures of strings, whose
+            k must equal bands * rows. By default, a MinHash instance with
+            the default tokenizer is used.
+
+        Raises
+        ------
+        ValueError
+            The MinHash instance's k is not bands * rows
+
+        Examples
+        --------
+        >>> index = LSHIndex(bands=32, rows=2)
+        >>> index.insert('Niall')
+        >>> index.insert('Nigel')
+        >>> index.insert('Neal')
+        >>> index.insert('Catalan')
+        >>> sorted(index.query('Neil'))
+        ['Neal', 'Niall', 'Nigel']
+        >>> list(index.candidate_pairs())
+        [('Niall', 'Nigel'), ('Niall', 'Neal'), ('Nigel', 'Neal')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if minhash is None:
+            minhash = MinHash(k=bands * rows)
+        elif minhash._k != bands * rows:  # noqa: SF01
+            raise ValueError(
+                'The MinHash instance must have k = bands * rows = {}.'.format(
+                    bands * rows
+                )
+            )
+        self._bands = bands
+        self._rows = rows
+        self._threshold = threshold
+        self._minhash = minhash
+
+        self._keys = []  # type: List[Hashable]
+        self._signatures = []  # type: List[np.ndarray]
+        self._positions = {}  # type: Dict[Hashable, int]
+        self._buckets = [
+            defaultdict(list) for _ in range(bands)
+        ]  # type: List[DefaultDict[bytes, List[int]]]
+
+    def __len__(self) -> int:
+        """Return the number of records in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if a record with this key is in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return key in self._positions
+
+    def _as_signature(self, record: Union[str, np.ndarray]) -> np.ndarray:
+        """Return the signature of a record, computing it if needed.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(record, np.ndarray):
+            if len(record) != self._bands * self._rows:
+                raise ValueError(
+                    'Signatures must have bands * rows = {} values.'.format(
+                        self._bands * self._rows
+                    )
+                )
+            return record
+        return self._minhash.signature(record)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterator[bytes]:
+        """Yield the bucket key of each band of a signature.
+
+        .. versionadded:: 0.6.0
+
+        """
+        for band in range(self._bands):
+            yield signature[
+                band * self._rows : (band + 1) * self._rows
+            ].tobytes()
+
+    def insert(
+        self, record: Union[str, np.ndarray], key: Optional[Hashable] = None,
+    ) -> None:
+        """Add a record to the index.
+
+        Parameters
+        ----------
+        record : str or numpy.ndarray
+            The string to add, or its MinHash signature
+        key : Hashable
+            The key identifying the record, which is returned by queries. If
+            None, the record itself is used as its key, in which case it must
+            be a string.
+
+        Raises
+        ------
+        KeyError
+            The key is already in the index
+        ValueError
+            No key was supplied for a signature
+
+        Examples
+        --------
+        >>> index = LSHIndex(bands=32, rows=2)
+        >>> index.insert('Niall')
+        >>> index.insert(index.signature('Neal'), key=1)
+        >>> len(index), 1 in index
+        (2, True)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if key is None:
+            if isinstance(record, np.ndarray):
+                raise ValueError('A key must be supplied with a signature.')
+            key = record
+        if key in self._positions:
+            raise KeyError('Key {!r} is already in the index.'.format(key))
+
+        signature = self._as_signature(record)
+        position = len(self._keys)
+        self._keys.append(key)
+        self._signatures.append(signature)
+        self._positions[key] = position
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket[band_key].append(position)
+
+    def signature(self, text: str) -> np.ndarray:
+        """Return the MinHash signature of a string.
+
+        Parameters
+        ----------
+        text : str
+            The string to compute a signature of
+
+        Returns
+        -------
+        numpy.ndarray
+            The signature, as computed by the index's MinHash instance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._minhash.signature(text)
+
+    def _accept(self, sig_a: np.ndarray, sig_b: np.ndarray) -> bool:
+        """Return True if a pair of signatures meets the threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            self._threshold is None
+            or self._minhash.sim(sig_a, sig_b) >= self._threshold
+        )
+
+    def query(self, record: Union[str, np.ndarray]) -> List[Hashable]:
+        """Return the keys of the records that are candidates for a record.
+
+        Parameters
+        ----------
+        record : str or numpy.ndarray
+            The string to query, or its MinHash signature
+
+        Returns
+        -------
+        list
+            The keys of the records sharing at least one band with the
+            record (and meeting the threshold, if set), in the order they
+            were inserted
+
+        Examples
+        --------
+        >>> index = LSHIndex(bands=32, rows=2, threshold=0.25)
+        >>> for name in ['Niall', 'Nigel', 'Neal', 'Catalan']:
+        ...     index.insert(name)
+        >>> index.query('Neil')
+        ['Neal']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        signature = self._as_signature(record)
+        positions = set()  # type: Set[int]
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            positions.update(bucket.get(band_key, ()))
+        return [
+            self._keys[pos]
+            for pos in sorted(positions)
+            if self._accept(signature, self._signatures[pos])
+        ]
+
+    def candidate_pairs(self) -> Iterator[Tuple[Hashable, Hashable]]:
+        """Yield each pair of records that share at least one band.
+
+        Each pair is yielded once, with the earlier inserted record first.
+        Pairs are yielded in the order of their first record's insertion,
+        then their second record's.
+
+        Yields
+        ------
+        tuple
+            A pair of keys (meeting the threshold, if set)
+
+        Examples
+        --------
+        >>> index = LSHIndex(bands=32, rows=2, threshold=0.25)
+        >>> for name in ['Niall', 'Nigel', 'Neal', 'Neil']:
+        ...     index.insert(name)
+        >>> list(index.candidate_pairs())
+        [('Niall', 'Nigel'), ('Niall', 'Neal'), ('Neal', 'Neil')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        partners = defaultdict(set)  # type: DefaultDict[int, Set[int]]
+        for bucket in self._buckets:
+            for positions in bucket.values():
+                if len(positions) > 1:
+                    for i, pos_a in enumerate(positions):
+                        partners[pos_a].update(positions[i + 1 :])
+
+        for pos_a in sorted(partners):
+            sig_a = self._signatures[pos_a]
+            for pos_b in sorted(partners[pos_a]):
+                if self._accept(sig_a, self._signatures[pos_b]):
+                    yield self._keys[pos_a], self._keys[pos_b]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
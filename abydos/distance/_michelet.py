@@ -19,7 +19,7 @@
 Michelet similarity
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -93,6 +93,27 @@ class Michelet(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Michelet similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        apb = cards._src_card()
+        apc = cards._tar_card()
+
+        if not a:
+            return 0.0
+        return a * a / (apb * apc)
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Michelet similarity of two strings.
 
@@ -124,18 +145,7 @@ class Michelet(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        apb = self._src_card()
-        apc = self._tar_card()
-
-        if not a:
-            return 0.0
-        return a * a / (apb * apc)
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
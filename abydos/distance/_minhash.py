@@ -19,8 +19,8 @@
 MinHash similarity
 """
 
-from hashlib import sha512
-from typing import Any, Optional, cast
+from hashlib import blake2b
+from typing import Any, Dict, Iterable, Optional, Union, cast
 
 import numpy as np
 
@@ -32,6 +32,20 @@ __all__ = ['MinHash']
 
 _MININT = np.iinfo(np.int64).min
 _MAXINT = np.iinfo(np.int64).max
+_MAXUINT = np.iinfo(np.uint64).max
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Return the SplitMix64 finalization of an array of uint64 values.
+
+    .. versionadded:: 0.6.0
+
+    """
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return cast(np.ndarray, values ^ (values >> np.uint64(31)))
 
 
 class MinHash(_Distance):
@@ -41,7 +55,17 @@ class MinHash(_Distance):
     intersection over the union of two sets. This implementation is based on
     :cite:`Kula:2015`.
 
+    Each token is hashed once to a 64-bit integer, and each of the k hash
+    functions XORs that integer with a random mask before mixing its bits
+    with the SplitMix64 finalizer :cite:`Steele:2014`. The masks are drawn
+    once per instance, so the signature of a string, the minimum of each hash
+    function over its tokens, can be computed in one vectorized operation and
+    reused for any number of comparisons.
+
     .. versionadded:: 0.4.0
+    .. versionchanged:: 0.6.0
+        Tokens are hashed with 64-bit BLAKE2b rather than SHA-512 and the
+        masked hashes are mixed, which removes a bias toward 1.0
     """
 
     def __init__(
@@ -58,7 +82,10 @@ class MinHash(_Distance):
         tokenizer : _Tokenizer
             A tokenizer instance from the :py:mod:`abydos.tokenizer` package
         k : int
-            The number of hash functions to use for similarity estimation
+            The number of hash functions to use for similarity estimation. If
+            0, each comparison uses as many hash functions as the larger of
+            the two token sets has tokens, and :py:meth:`signature` is
+            unavailable.
         seed : int
             A seed value for the random functions
         **kwargs
@@ -88,69 +115,185 @@ class MinHash(_Distance):
             else QGrams(qval=qval, start_stop='$#', skip=0, scaler=None)
         )
 
-    def sim(self, src: str, tar: str) -> float:
+        self._masks = np.empty(0, dtype=np.uint64)
+        self._get_masks(k)
+        self._batch_hashes = {}  # type: Dict[str, np.ndarray]
+
+    def _get_masks(self, k: int) -> np.ndarray:
+        """Return the first k masks, drawing more if needed.
+
+        The masks drawn for a given seed begin with the same values however
+        many are drawn, so masks can be extended without changing any already
+        in use.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(self._masks) < k:
+            self._masks = (
+                np.random.RandomState(seed=self._seed)
+                .randint(
+                    _MININT,
+                    _MAXINT,
+                    max(k, 2 * len(self._masks)),
+                    dtype=np.int64,
+                )
+                .view(np.uint64)
+            )
+        return self._masks[:k]
+
+    def _token_hashes(self, text: str) -> np.ndarray:
+        """Return the 64-bit hash of each distinct token of text.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if text in self._batch_hashes:
+            return self._batch_hashes[text]
+        tokens = self.params['tokenizer'].tokenize(text).get_set()
+        return np.frombuffer(
+            b''.join(
+                blake2b(tok.encode(), digest_size=8).digest() for tok in tokens
+            ),
+            dtype='<u8',
+        )
+
+    def _signature(self, hashes: np.ndarray, k: int) -> np.ndarray:
+        """Return the signature of a set of token hashes.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not len(hashes):
+            return np.full(k, _MAXUINT, dtype=np.uint64).view(np.int64)
+        return cast(
+            np.ndarray,
+            _mix(hashes[:, np.newaxis] ^ self._get_masks(k)[np.newaxis, :])
+            .min(axis=0)
+            .view(np.int64),
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """Return the MinHash signature of a string.
+
+        Parameters
+        ----------
+        text : str
+            The string to compute a signature of
+
+        Returns
+        -------
+        numpy.ndarray
+            The signature, a vector of k int64 values, which may be passed to
+            :py:meth:`sim` & :py:meth:`dist` in place of the string
+
+        Raises
+        ------
+        ValueError
+            Signatures require that k be set
+
+        Examples
+        --------
+        >>> cmp = MinHash(k=64)
+        >>> sig = cmp.signature('Niall')
+        >>> sig.shape, sig.dtype
+        ((64,), dtype('int64'))
+        >>> cmp.sim(sig, cmp.signature('Neil'))
+        0.1875
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._k:
+            raise ValueError('MinHash signatures require k to be set.')
+        return self._signature(self._token_hashes(text), self._k)
+
+    def sim(
+        self, src: Union[str, np.ndarray], tar: Union[str, np.ndarray]
+    ) -> float:
         """Return the MinHash similarity of two strings.
 
         Parameters
         ----------
-        src : str
-            Source string (or QGrams/Counter objects) for comparison
-        tar : str
-            Target string (or QGrams/Counter objects) for comparison
+        src : str or numpy.ndarray
+            Source string (or signature) for comparison
+        tar : str or numpy.ndarray
+            Target string (or signature) for comparison
 
         Returns
         -------
         float
             MinHash similarity
 
+        Raises
+        ------
+        ValueError
+            Signatures must be of the same length, and a string can only be
+            compared with a signature if k is set
+
         Examples
         --------
         >>> cmp = MinHash()
         >>> cmp.sim('cat', 'hat')
         0.75
         >>> cmp.sim('Niall', 'Neil')
-        1.0
+        0.16666666666666666
         >>> cmp.sim('aluminum', 'Catalan')
-        0.5
+        0.0
         >>> cmp.sim('ATCG', 'TAGC')
-        0.6
+        0.0
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Accepts signatures in place of strings, each of which may be
+            compared with a signature or a string
 
         """
+        if isinstance(src, np.ndarray) or isinstance(tar, np.ndarray):
+            # A string compared with a signature is replaced by its own
+            if not isinstance(src, np.ndarray):
+                src = self.signature(src)
+            if not isinstance(tar, np.ndarray):
+                tar = self.signature(tar)
+            if len(src) != len(tar):
+                raise ValueError('Signatures must be of the same length.')
+            return float((src == tar).mean()) if len(src) else 1.0
         if not src and not tar:
             return 1.0
 
-        src_tokens = self.params['tokenizer'].tokenize(src).get_set()
-        tar_tokens = self.params['tokenizer'].tokenize(tar).get_set()
+        hashes_src = self._token_hashes(cast(str, src))
+        hashes_tar = self._token_hashes(cast(str, tar))
 
-        k = self._k if self._k else max(len(src_tokens), len(tar_tokens))
+        k = self._k if self._k else max(len(hashes_src), len(hashes_tar))
+        if not k:
+            return 1.0
 
-        masks = np.random.RandomState(seed=self._seed).randint(
-            _MININT, _MAXINT, k, dtype=np.int64
+        return float(
+            (
+                self._signature(hashes_src, k)
+                == self._signature(hashes_tar, k)
+            ).mean()
         )
 
-        hashes_src = np.full(k, _MAXINT, dtype=np.int64)
-        hashes_tar = np.full(k, _MAXINT, dtype=np.int64)
+    def _batch_prepare(self, strings: Iterable[str]) -> None:
+        """Hash the tokens of each distinct string once for a batch.
 
-        for tok in src_tokens:
-            hashes_src = np.minimum(
-                hashes_src,
-                np.bitwise_xor(
-                    masks, int(sha512(tok.encode()).hexdigest(), 16)
-                ),
-            )
+        .. versionadded:: 0.6.0
 
-        for tok in tar_tokens:
-            hashes_tar = np.minimum(
-                hashes_tar,
-                np.bitwise_xor(
-                    masks, int(sha512(tok.encode()).hexdigest(), 16)
-                ),
-            )
+        """
+        for string in strings:
+            if string not in self._batch_hashes:
+                self._batch_hashes[string] = self._token_hashes(string)
+
+    def _batch_clear(self) -> None:
+        """Discard the token hashes stored for a batch.
 
-        return cast(float, (hashes_src == hashes_tar).sum() / k)
+        .. versionadded:: 0.6.0
+
+        """
+        self._batch_hashes = {}
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@
 Mountford similarity
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -88,6 +88,29 @@ class Mountford(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Mountford similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        b = cards._src_only_card()
+        c = cards._tar_only_card()
+
+        if not b:
+            b = 1
+        if not c:
+            c = 1
+
+        if a:
+            return 2.0 * a / (c * (a + 2.0 * b) + a * b)
+        return 0.0
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Mountford similarity of two strings.
 
@@ -119,20 +142,7 @@ class Mountford(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        b = self._src_only_card()
-        c = self._tar_only_card()
-
-        if not b:
-            b = 1
-        if not c:
-            c = 1
-
-        if a:
-            return 2.0 * a / (c * (a + 2.0 * b) + a * b)
-        return 0.0
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
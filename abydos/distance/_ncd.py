@@ -0,0 +1,288 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._ncd.
+
+Normalized Compression Distance base class
+"""
+
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._distance import _Distance
+from ..util._lru_cache import CacheInfo, _LRUCache
+
+__all__ = ['_NCD']
+
+
+class _NCD(_Distance):
+    r"""Abstract Normalized Compression Distance class.
+
+    Normalized compression distance (NCD) :cite:`Cilibrasi:2005` is
+
+        .. math::
+
+            NCD(x, y) = \frac{C(xy) - min(C(x), C(y))}{max(C(x), C(y))}
+
+    where C is the length of its argument once compressed. Since the
+    compressed length of a string does not depend on what it is compared
+    with, the compressed lengths of single strings are kept in a
+    least-recently-used cache, so that comparing one string with many others
+    compresses it only once.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize _NCD instance.
+
+        Parameters
+        ----------
+        **kwargs
+            Arbitrary keyword arguments
+
+
+        Other Parameters
+        ----------------
+        cache_size : int or None
+            The number of strings whose compressed lengths are kept in a
+            least-recently-used cache (128 by default). If None or 0, no
+            cache is used.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(_NCD, self).__init__(**kwargs)
+        cache_size = self.params.get('cache_size', 128)
+        self._length_cache = (
+            _LRUCache(cache_size) if cache_size else None
+        )  # type: Optional[_LRUCache]
+
+    def _compressed_length(self, string: str) -> int:
+        """Return the length of a compressed string.
+
+        Parameters
+        ----------
+        string : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The length of the compressed string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        raise NotImplementedError
+
+    def _length(self, string: str) -> int:
+        """Return the length of a compressed string, using the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._length_cache is None:
+            return self._compressed_length(string)
+        length = self._length_cache.get(string)
+        if length is None:
+            length = self._compressed_length(string)
+            self._length_cache.set(string, length)
+        return length
+
+    def _concat_lengths(
+        self, prefix: str, suffixes: Sequence[str]
+    ) -> List[int]:
+        """Return the compressed lengths of a prefix joined to each suffix.
+
+        Parameters
+        ----------
+        prefix : str
+            The string preceding each suffix
+        suffixes : Sequence[str]
+            The strings following the prefix
+
+        Returns
+        -------
+        list
+            The length of each of prefix + suffix once compressed
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [
+            self._compressed_length(prefix + suffix) for suffix in suffixes
+        ]
+
+    def _lengths(self, src: str, tar: str) -> Tuple[int, int, int]:
+        """Return the compressed lengths of src, tar, & their concatenation.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        tuple
+            The compressed lengths of src & tar and the lesser of the
+            compressed lengths of src + tar & tar + src
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            self._length(src),
+            self._length(tar),
+            min(
+                self._concat_lengths(src, (tar,))[0],
+                self._concat_lengths(tar, (src,))[0],
+            ),
+        )
+
+    def _ncd(self, src_comp: int, tar_comp: int, concat_comp: int) -> float:
+        """Return the NCD given compressed lengths.
+
+        Parameters
+        ----------
+        src_comp : int
+            The compressed length of src
+        tar_comp : int
+            The compressed length of tar
+        concat_comp : int
+            The lesser compressed length of the concatenations of src & tar
+
+        Returns
+        -------
+        float
+            Compression distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (concat_comp - min(src_comp, tar_comp)) / max(
+            src_comp, tar_comp
+        )
+
+    def dist(self, src: str, tar: str) -> float:
+        """Return the NCD between two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            Compression distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 0.0
+        return self._ncd(*self._lengths(src, tar))
+
+    def _matrix(
+        self,
+        func: Callable[[str, str], float],
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]],
+        upper: bool,
+    ) -> np.ndarray:
+        """Fill a matrix with the values of func applied to each pair.
+
+        For dist_matrix & sim_matrix, each string is compressed once, and
+        each concatenation of a pair of strings once.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if func not in {self.dist, self.sim}:
+            return super(_NCD, self)._matrix(func, srcs, tars, upper)
+
+        srcs = list(srcs)
+        tars_list = srcs if tars is None else list(tars)
+        src_lens = [self._length(src) for src in srcs]
+        tar_lens = [self._length(tar) for tar in tars_list]
+        # forward[i][j] is the compressed length of srcs[i] + tars[j] and
+        # backward[j][i] that of tars[j] + srcs[i].
+        forward = [self._concat_lengths(src, tars_list) for src in srcs]
+        if tars is None:
+            backward = forward
+        else:
+            backward = [self._concat_lengths(tar, srcs) for tar in tars_list]
+
+        matrix = np.full((len(srcs), len(tars_list)), np.nan, dtype=float)
+        for i, src in enumerate(srcs):
+            for j in range(
+                i + 1 if tars is None and upper else 0, len(tars_list)
+            ):
+                if src == tars_list[j]:
+                    matrix[i, j] = 0.0
+                else:
+                    matrix[i, j] = self._ncd(
+                        src_lens[i],
+                        tar_lens[j],
+                        min(forward[i][j], backward[j][i]),
+                    )
+        if func == self.sim:
+            matrix = 1.0 - matrix
+        return matrix
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the compressed length cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the cache's hits, misses, maxsize, and currsize;
+            all are 0 if the instance has no cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._length_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._length_cache.info()
+
+    def cache_clear(self) -> None:
+        """Discard the contents & statistics of the compressed length cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._length_cache is not None:
+            self._length_cache.clear()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -20,27 +20,34 @@ NCD using Arithmetic Coding
 """
 
 from fractions import Fraction
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ._distance import _Distance
+from ._ncd import _NCD
 from ..compression import Arithmetic
 
 __all__ = ['NCDarith']
 
 
-class NCDarith(_Distance):
+class NCDarith(_NCD):
     """Normalized Compression Distance using arithmetic coding.
 
     Cf. https://en.wikipedia.org/wiki/Arithmetic_coding
 
     Normalized compression distance (NCD) :cite:`Cilibrasi:2005`.
 
+    Only the lengths of the encodings are computed, not the encodings
+    themselves.
+
     .. versionadded:: 0.3.6
     """
 
     def __init__(
         self,
         probs: Optional[Dict[str, Tuple[Fraction, Fraction]]] = None,
+        precision: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         """Initialize the arithmetic coder object.
@@ -48,17 +55,46 @@ class NCDarith(_Distance):
         Parameters
         ----------
         probs : dict
-            A dictionary trained with :py:meth:`Arithmetic.train`
+            A dictionary trained with :py:meth:`Arithmetic.train`. If None,
+            the coder is trained on each pair of strings compared.
+        precision : int or None
+            If set, the precision of the integer coder used in place of
+            Fraction arithmetic (see :py:class:`Arithmetic`)
+        **kwargs
+            Arbitrary keyword arguments
+
+
+        Other Parameters
+        ----------------
+        cache_size : int or None
+            The number of strings whose compressed lengths are kept in a
+            least-recently-used cache (128 by default). If None or 0, no
+            cache is used. Lengths are only cached if probs is supplied.
 
 
         .. versionadded:: 0.3.6
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added precision & cache_size parameters
 
         """
         super(NCDarith, self).__init__(**kwargs)
-        self._coder = Arithmetic()
+        self._coder = Arithmetic(precision=precision)
         self._probs = probs
+        if probs is None:
+            # Lengths depend on the pair the coder is trained on.
+            self._length_cache = None
+        else:
+            self._coder.set_probs(probs)
+
+    def _compressed_length(self, string: str) -> int:
+        """Return the length of a string's arithmetic coding in bits.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._coder.encoded_length(string)
 
     def dist(self, src: str, tar: str) -> float:
         """Return the NCD between two strings using arithmetic coding.
@@ -91,6 +127,8 @@ class NCDarith(_Distance):
         .. versionadded:: 0.3.5
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Computes encoded lengths without encoding
 
         """
         if src == tar:
@@ -99,17 +137,27 @@ class NCDarith(_Distance):
         if self._probs is None:
             # lacking a reasonable dictionary, train on the strings themselves
             self._coder.train(src + tar)
-        else:
-            self._coder.set_probs(self._probs)
 
-        src_comp = self._coder.encode(src)[1]
-        tar_comp = self._coder.encode(tar)[1]
-        concat_comp = self._coder.encode(src + tar)[1]
-        concat_comp2 = self._coder.encode(tar + src)[1]
+        return super(NCDarith, self).dist(src, tar)
+
+    def _matrix(
+        self,
+        func: Callable[[str, str], float],
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]],
+        upper: bool,
+    ) -> np.ndarray:
+        """Fill a matrix with the values of func applied to each pair.
 
-        return (
-            min(concat_comp, concat_comp2) - min(src_comp, tar_comp)
-        ) / max(src_comp, tar_comp)
+        .. versionadded:: 0.6.0
+
+        """
+        if self._probs is None:
+            # The coder must be retrained for each pair.
+            return _Distance._matrix(  # noqa: SF01
+                self, func, srcs, tars, upper
+            )
+        return super(NCDarith, self)._matrix(func, srcs, tars, upper)
 
 
 if __name__ == '__main__':
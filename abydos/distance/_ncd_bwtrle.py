@@ -37,6 +37,14 @@ class NCDbwtrle(NCDrle):
 
     _bwt = BWT()
 
+    def _compressed_length(self, string: str) -> int:
+        """Return the length of a string encoded by BWT plus RLE.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._rle.encode(self._bwt.encode(string)))
+
     def dist(self, src: str, tar: str) -> float:
         """Return the NCD between two strings using BWT plus RLE.
 
@@ -68,20 +76,11 @@ class NCDbwtrle(NCDrle):
         .. versionadded:: 0.3.5
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Compressed lengths are cached
 
         """
-        if src == tar:
-            return 0.0
-
-        src_comp = self._rle.encode(self._bwt.encode(src))
-        tar_comp = self._rle.encode(self._bwt.encode(tar))
-        concat_comp = self._rle.encode(self._bwt.encode(src + tar))
-        concat_comp2 = self._rle.encode(self._bwt.encode(tar + src))
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDbwtrle, self).dist(src, tar)
 
 
 if __name__ == '__main__':
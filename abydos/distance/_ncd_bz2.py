@@ -20,15 +20,14 @@ NCD using bzip2
 """
 
 import bz2
-
 from typing import Any
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 __all__ = ['NCDbz2']
 
 
-class NCDbz2(_Distance):
+class NCDbz2(_NCD):
     """Normalized Compression Distance using bzip2 compression.
 
     Cf. https://en.wikipedia.org/wiki/Bzip2
@@ -57,6 +56,16 @@ class NCDbz2(_Distance):
         super().__init__(**kwargs)
         self._level = level
 
+    def _compressed_length(self, string: str) -> int:
+        """Return the length of a string compressed by bzip2.
+
+        The 10 invariant header bytes are not counted.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(bz2.compress(string.encode('utf-8'), self._level)[10:])
+
     def dist(self, src: str, tar: str) -> float:
         """Return the NCD between two strings using bzip2 compression.
 
@@ -88,23 +97,11 @@ class NCDbz2(_Distance):
         .. versionadded:: 0.3.5
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Compressed lengths are cached
 
         """
-        if src == tar:
-            return 0.0
-
-        src_b = src.encode('utf-8')
-        tar_b = tar.encode('utf-8')
-
-        src_comp = bz2.compress(src_b, self._level)[10:]
-        tar_comp = bz2.compress(tar_b, self._level)[10:]
-        concat_comp = bz2.compress(src_b + tar_b, self._level)[10:]
-        concat_comp2 = bz2.compress(tar_b + src_b, self._level)[10:]
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDbz2, self).dist(src, tar)
 
 
 if __name__ == '__main__':
@@ -20,16 +20,15 @@ NCD using LZMA
 """
 
 import lzma
-
 from typing import Any
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 
 __all__ = ['NCDlzma']
 
 
-class NCDlzma(_Distance):
+class NCDlzma(_NCD):
     """Normalized Compression Distance using LZMA compression.
 
     Cf. https://en.wikipedia.org/wiki/Lempel-Ziv-Markov_chain_algorithm
@@ -56,6 +55,18 @@ class NCDlzma(_Distance):
         super().__init__(**kwargs)
         self._level = level
 
+    def _compressed_length(self, string: str) -> int:
+        """Return the length of a string compressed by LZMA.
+
+        The 14 invariant header bytes are not counted.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(
+            lzma.compress(string.encode('utf-8'), preset=self._level)[14:]
+        )
+
     def dist(self, src: str, tar: str) -> float:
         """Return the NCD between two strings using LZMA compression.
 
@@ -87,23 +98,11 @@ class NCDlzma(_Distance):
         .. versionadded:: 0.3.5
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Compressed lengths are cached
 
         """
-        if src == tar:
-            return 0.0
-
-        src_b = src.encode('utf-8')
-        tar_b = tar.encode('utf-8')
-
-        src_comp = lzma.compress(src_b, preset=self._level)[14:]
-        tar_comp = lzma.compress(tar_b, preset=self._level)[14:]
-        concat_comp = lzma.compress(src_b + tar_b, preset=self._level)[14:]
-        concat_comp2 = lzma.compress(tar_b + src_b, preset=self._level)[14:]
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDlzma, self).dist(src, tar)
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@
 NCD using LZSS
 """
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 try:
     import lzss
@@ -31,7 +31,7 @@ except ImportError:  # pragma: no cover
 __all__ = ['NCDlzss']
 
 
-class NCDlzss(_Distance):
+class NCDlzss(_NCD):
     """Normalized Compression Distance using LZSS compression.
 
     Cf. https://en.wikipedia.org/wiki/Lempel-Ziv-Storer-Szymanski
@@ -41,6 +41,16 @@ class NCDlzss(_Distance):
     .. versionadded:: 0.4.0
     """
 
+    def _compressed_length(self, string: str) -> int:
+        """Return the length of a string compressed by LZSS.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if lzss is None:  # pragma: no cover
+            raise ValueError('Install the PyLZSS module in order to use LZSS')
+        return len(lzss.encode(string))
+
     def dist(self, src: str, tar: str) -> float:
         """Return the NCD between two strings using LZSS compression.
 
@@ -75,23 +85,11 @@ class NCDlzss(_Distance):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Compressed lengths are cached
 
         """
-        if src == tar:
-            return 0.0
-
-        if lzss is not None:
-            src_comp = lzss.encode(src)
-            tar_comp = lzss.encode(tar)
-            concat_comp = lzss.encode(src + tar)
-            concat_comp2 = lzss.encode(tar + src)
-        else:  # pragma: no cover
-            raise ValueError('Install the PyLZSS module in order to use LZSS')
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDlzss, self).dist(src, tar)
 
 
 if __name__ == '__main__':
@@ -19,13 +19,13 @@
 NCD using RLE
 """
 
-from ._distance import _Distance
+from ._ncd import _NCD
 from ..compression import RLE
 
 __all__ = ['NCDrle']
 
 
-class NCDrle(_Distance):
+class NCDrle(_NCD):
     """Normalized Compression Distance using RLE.
 
     Cf. https://en.wikipedia.org/wiki/Run-length_encoding
@@ -37,6 +37,14 @@ class NCDrle(_Distance):
 
     _rle = RLE()
 
+    def _compressed_length(self, string: str) -> int:
+        """Return the length of a string encoded by RLE.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._rle.encode(string))
+
     def dist(self, src: str, tar: str) -> float:
         """Return the NCD between two strings using RLE.
 
@@ -68,20 +76,11 @@ class NCDrle(_Distance):
         .. versionadded:: 0.3.5
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Compressed lengths are cached
 
         """
-        if src == tar:
-            return 0.0
-
-        src_comp = self._rle.encode(src)
-        tar_comp = self._rle.encode(tar)
-        concat_comp = self._rle.encode(src + tar)
-        concat_comp2 = self._rle.encode(tar + src)
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDrle, self).dist(src, tar)
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@
 Overlap similarity & distance
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -89,6 +89,39 @@ class Overlap(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _join_min_overlap(
+        self, src_card: float, tar_card: float, threshold: float
+    ) -> Optional[float]:
+        r"""Return the least crisp overlap with which sim may reach threshold.
+
+        :math:`sim_{overlap}(X, Y) \geq t` if and only if
+        :math:`|X \cap Y| \geq t \cdot min(|X|, |Y|)`.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return threshold * min(src_card, tar_card)
+
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the overlap coefficient from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        if not cards._src_card() or not cards._tar_card():
+            return 0.0
+
+        return cards._intersection_card() / min(
+            cards._src_card(), cards._tar_card()
+        )
+
     def sim(self, src: str, tar: str) -> float:
         r"""Return the overlap coefficient of two strings.
 
@@ -122,17 +155,7 @@ class Overlap(_TokenDistance):
             Encapsulated in class
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        if not self._src_card() or not self._tar_card():
-            return 0.0
-
-        return self._intersection_card() / min(
-            self._src_card(), self._tar_card()
-        )
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
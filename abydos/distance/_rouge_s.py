@@ -88,8 +88,8 @@ class RougeS(_Distance):
         if src == tar:
             return 1.0
 
-        qsg_src = self._tokenizer.tokenize(src).get_counter()
-        qsg_tar = self._tokenizer.tokenize(tar).get_counter()
+        qsg_src = self._tokenizer.tokens(src)
+        qsg_tar = self._tokenizer.tokens(tar)
         intersection = sum((qsg_src & qsg_tar).values())
 
         if intersection:
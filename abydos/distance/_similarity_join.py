@@ -0,0 +1,201 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._similarity_join.
+
+The distance._similarity_join module defines _candidate_pairs, which finds
+the pairs of token multisets that may share at least a required number of
+tokens, by the length, prefix, & positional filtering of PPJoin
+:cite:`Xiao:2011`, so that a similarity join need only compare those pairs.
+
+This function is not intended for use by users.
+"""
+
+from collections import Counter
+from math import ceil
+from typing import (
+    Callable,
+    Counter as TCounter,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+__all__ = []  # type: List[str]
+
+# The slack allowed in rounding a required overlap up to an integer, so that
+# rounding error in the bound never excludes a pair
+_EPSILON = 1e-9
+
+
+def _candidate_pairs(
+    left: Sequence[TCounter[str]],
+    right: Optional[Sequence[TCounter[str]]],
+    min_overlap: Callable[[int, int], float],
+) -> Set[Tuple[int, int]]:
+    """Return the pairs of multisets that may have the required overlap.
+
+    Each multiset is treated as the set of its tokens numbered by occurrence
+    (so that a token occurring twice contributes two elements), which are
+    ordered from least to most frequent across all the multisets. Two
+    multisets of sizes x & y that share at least o elements must share one
+    among the first x - o + 1 & y - o + 1 elements of each, so only these
+    prefixes are indexed & probed. A pair is passed over if o exceeds the
+    lesser size (length filtering), or if the elements shared before a
+    position in the prefixes, plus those remaining after it, fall short of o
+    (positional filtering).
+
+    Parameters
+    ----------
+    left : Sequence[Counter]
+        The token multisets of the left records, with positive integral counts
+    right : Sequence[Counter] or None
+        The token multisets of the right records, or None to pair the left
+        records with each other
+    min_overlap : callable
+        A function of the sizes of a left & a right multiset returning the
+        least overlap with which the pair may match. For a self-join, it
+        must be symmetric.
+
+    Returns
+    -------
+    set
+        The (left, right) index pairs of the candidates, or, for a self-join,
+        the (i, j) index pairs with i < j. Multisets that are empty are never
+        candidates.
+
+    Examples
+    --------
+    >>> records = [Counter('abcd'), Counter('abce'), Counter('wxyz')]
+    >>> sorted(_candidate_pairs(records, None, lambda x, y: 3))
+    [(0, 1)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    self_join = right is None
+    sides = (
+        [left] if self_join else [left, cast(Sequence[TCounter[str]], right)]
+    )
+
+    # Rank the elements from least to most frequent, breaking ties by the
+    # elements themselves so that the order is reproducible.
+    frequency = Counter()  # type: TCounter[Tuple[str, int]]
+    for side in sides:
+        for tokens in side:
+            frequency.update(
+                (token, k)
+                for token, count in tokens.items()
+                for k in range(count)
+            )
+    rank = {
+        element: i
+        for i, element in enumerate(
+            sorted(
+                frequency, key=lambda element: (frequency[element], element)
+            )
+        )
+    }
+    ranked = [
+        [
+            sorted(
+                rank[(token, k)]
+                for token, count in tokens.items()
+                for k in range(count)
+            )
+            for tokens in side
+        ]
+        for side in sides
+    ]
+
+    left_sizes = {len(elements) for elements in ranked[0]}
+    right_sizes = (
+        left_sizes if self_join else {len(elements) for elements in ranked[1]}
+    )
+    need = {}  # type: Dict[Tuple[int, int], int]
+    for size_l in left_sizes:
+        for size_r in right_sizes:
+            if size_l and size_r:
+                bound = min_overlap(size_l, size_r) - _EPSILON
+                if bound <= min(size_l, size_r):
+                    need[(size_l, size_r)] = max(1, ceil(bound))
+
+    # The length of the prefix of a multiset of each size: its size less the
+    # least overlap it requires with any multiset it may match, plus 1
+    left_prefix = {size: 0 for size in left_sizes}
+    right_prefix = {size: 0 for size in right_sizes}
+    for (size_l, size_r), required in need.items():
+        left_prefix[size_l] = max(left_prefix[size_l], size_l - required + 1)
+        right_prefix[size_r] = max(right_prefix[size_r], size_r - required + 1)
+
+    if self_join:
+        probes = sorted(
+            range(len(ranked[0])), key=lambda i: (len(ranked[0][i]), i)
+        )
+        indexed = ranked[0]
+    else:
+        probes = list(range(len(ranked[0])))
+        indexed = ranked[1]
+
+    # The positions in the prefixes of the indexed multisets of each element
+    index = {}  # type: Dict[int, List[Tuple[int, int]]]
+    if not self_join:
+        for j, elements in enumerate(indexed):
+            for pos, element in enumerate(
+                elements[: right_prefix[len(elements)]]
+            ):
+                index.setdefault(element, []).append((j, pos))
+
+    candidates = set()  # type: Set[Tuple[int, int]]
+    for i in probes:
+        elements = ranked[0][i]
+        size_i = len(elements)
+        # The elements shared so far with each indexed multiset, or -1 if
+        # it has been ruled out
+        shared = {}  # type: Dict[int, int]
+        for pos_i, element in enumerate(elements[: left_prefix[size_i]]):
+            for j, pos_j in index.get(element, ()):
+                count = shared.get(j, 0)
+                if count < 0:
+                    continue
+                size_j = len(indexed[j])
+                required = need.get((size_i, size_j))
+                if (
+                    required is not None
+                    and count + 1 + min(size_i - pos_i - 1, size_j - pos_j - 1)
+                    >= required
+                ):
+                    shared[j] = count + 1
+                else:
+                    shared[j] = -1
+        for j, count in shared.items():
+            if count > 0:
+                candidates.add((min(i, j), max(i, j)) if self_join else (i, j))
+        if self_join:
+            for pos_i, element in enumerate(elements[: left_prefix[size_i]]):
+                index.setdefault(element, []).append((i, pos_i))
+    return candidates
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -19,7 +19,7 @@
 Sokal & Sneath II similarity
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -96,6 +96,25 @@ class SokalSneathII(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        b = cards._src_only_card()
+        c = cards._tar_only_card()
+
+        return a / (a + 2 * (b + c))
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Sokal & Sneath II similarity of two strings.
 
@@ -127,16 +146,7 @@ class SokalSneathII(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        b = self._src_only_card()
-        c = self._tar_only_card()
-
-        return a / (a + 2 * (b + c))
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
@@ -19,7 +19,15 @@
 Sorgenfrei similarity
 """
 
-from typing import Any, Counter as TCounter, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -98,6 +106,25 @@ class Sorgenfrei(_TokenDistance):
             **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Sorgenfrei similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        apb = cards._src_card()
+        apc = cards._tar_card()
+
+        return a ** 2 / (apb * apc) if a else 0.0
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Sorgenfrei similarity of two strings.
 
@@ -129,16 +156,7 @@ class Sorgenfrei(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        apb = self._src_card()
-        apc = self._tar_card()
-
-        return a ** 2 / (apb * apc) if a else 0.0
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,353 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._tf_idf_index.
+
+Sparse TF-IDF index with top-k cosine search
+"""
+
+from math import isinf, log1p
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from ._tf_idf import TFIDF
+from ..corpus import UnigramCorpus
+from ..tokenizer import Vocabulary
+
+__all__ = ['TFIDFIndex']
+
+
+class TFIDFIndex:
+    r"""Sparse TF-IDF index with top-k cosine search.
+
+    Each record is weighted as by :py:class:`.TFIDF`, each token w of a
+    record S having the weight :math:`log(1+TF_{w,S}) \cdot IDF_w`, and the
+    weights of each record are normalized to unit length. The records' weights
+    are held as the rows of a sparse matrix in compressed sparse row (CSR)
+    form, in NumPy arrays, and the same weights are held by token in
+    compressed sparse column form as an inverted index.
+
+    A query is weighted & normalized in the same way, and its cosine
+    similarity with every record is accumulated from the inverted index
+    entries of its tokens alone, so that records sharing no token with the
+    query cost nothing, rather than comparing the query with each record in
+    turn.
+
+    Tokens whose IDF is infinite, because they do not occur in the corpus,
+    are ignored.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, tfidf: Optional[TFIDF] = None) -> None:
+        """Initialize TFIDFIndex instance.
+
+        Parameters
+        ----------
+        tfidf : TFIDF or None
+            The TFIDF instance whose tokenizer & corpus are used. If it has no
+            corpus, a :py:class:`.UnigramCorpus` of the records in the index,
+            each a document, supplies the document frequencies. By default, a
+            TFIDF instance with the default tokenizer & no corpus is used.
+
+        Examples
+        --------
+        >>> index = TFIDFIndex()
+        >>> for name in ['Niall', 'Neil', 'Nigel', 'Neal', 'Catalan']:
+        ...     index.insert(name)
+        >>> [(key, round(sim, 12)) for key, sim in index.query('Niall', k=3)]
+        [('Niall', 1.0), ('Neal', 0.279785889413), ('Nigel', 0.264586057145)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if tfidf is None:
+            tfidf = TFIDF()
+        self._tokenizer = tfidf.params['tokenizer']
+        self._corpus = tfidf._corpus  # noqa: SF01
+
+        self._vocabulary = Vocabulary()
+        self._keys = []  # type: List[Hashable]
+        self._records = []  # type: List[str]
+        self._tokens = []  # type: List[Tuple[List[int], List[int]]]
+        self._positions = {}  # type: Dict[Hashable, int]
+
+        # The CSR arrays & inverted index, built when first needed after an
+        # insertion, since the IDF of every token may change with each record
+        # if the corpus is made from the records.
+        self._built = False
+        self._idfs = {}  # type: Dict[str, float]
+        self._corpus_used = self._corpus  # type: Optional[UnigramCorpus]
+        self._data = np.zeros(0, dtype=float)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._col_data = np.zeros(0, dtype=float)
+        self._col_rows = np.zeros(0, dtype=np.int64)
+        self._col_ptr = np.zeros(1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Return the number of records in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if a record with this key is in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return key in self._positions
+
+    def insert(self, record: str, key: Optional[Hashable] = None) -> None:
+        """Add a record to the index.
+
+        Parameters
+        ----------
+        record : str
+            The string to add
+        key : Hashable
+            The key identifying the record, which is returned by queries. If
+            None, the record itself is used as its key.
+
+        Raises
+        ------
+        KeyError
+            The key is already in the index
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if key is None:
+            key = record
+        if key in self._positions:
+            raise KeyError('Key {!r} is already in the index.'.format(key))
+
+        counts = self._tokenizer.tokens(record)
+        self._positions[key] = len(self._keys)
+        self._keys.append(key)
+        self._records.append(record)
+        self._tokens.append(
+            (
+                [self._vocabulary.intern(token) for token in counts],
+                list(counts.values()),
+            )
+        )
+        self._built = False
+
+    def _idf(self, token: str, corpus: UnigramCorpus) -> float:
+        """Return the IDF of a token, from the cache if possible.
+
+        .. versionadded:: 0.6.0
+
+        """
+        idf = self._idfs.get(token)
+        if idf is None:
+            idf = corpus.idf(token)
+            self._idfs[token] = idf
+        return idf
+
+    def _build(self) -> None:
+        """Build the CSR arrays & inverted index of the records' weights.
+
+        .. versionadded:: 0.6.0
+
+        """
+        corpus = self._corpus
+        if corpus is None:
+            corpus = UnigramCorpus(word_tokenizer=self._tokenizer)
+            for record in self._records:
+                corpus.add_document(record)
+        self._idfs = {}
+        token_idfs = np.array(
+            [self._idf(token, corpus) for token in self._vocabulary],
+            dtype=float,
+        )
+        usable = ~np.isinf(token_idfs)
+
+        lengths = np.array([len(ids) for ids, _ in self._tokens], dtype=int)
+        rows = np.repeat(np.arange(len(self._tokens)), lengths)
+        indices = np.fromiter(
+            (token_id for ids, _ in self._tokens for token_id in ids),
+            dtype=np.int64,
+            count=int(lengths.sum()),
+        )
+        counts = np.fromiter(
+            (count for _, tok_counts in self._tokens for count in tok_counts),
+            dtype=float,
+            count=len(indices),
+        )
+        keep = usable[indices]
+        rows, indices, counts = rows[keep], indices[keep], counts[keep]
+        data = np.log1p(counts) * token_idfs[indices]
+
+        # Sort the entries by row, then column, and normalize each row.
+        order = np.lexsort((indices, rows))
+        rows, indices, data = rows[order], indices[order], data[order]
+        norms = np.sqrt(np.bincount(rows, data * data, len(self._tokens)))
+        data /= norms[rows]
+
+        self._data = data
+        self._indices = indices
+        self._indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(rows, minlength=len(self._tokens))))
+        )
+
+        # The inverted index is the same matrix in column order.
+        order = np.argsort(indices, kind='stable')
+        self._col_rows = rows[order]
+        self._col_data = data[order]
+        self._col_ptr = np.concatenate(
+            (
+                [0],
+                np.cumsum(
+                    np.bincount(indices, minlength=len(self._vocabulary))
+                ),
+            )
+        )
+        self._corpus_used = corpus
+        self._built = True
+
+    def matrix(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the normalized TF-IDF weights of the records in CSR form.
+
+        Returns
+        -------
+        tuple
+            The arrays data, indices, & indptr: the weights of row i (the
+            i-th record inserted) are data[indptr[i]:indptr[i+1]], in the
+            columns indices[indptr[i]:indptr[i+1]], which are the token ids
+            of :py:meth:`vocabulary`. These are the arguments, in order, of
+            SciPy's csr_matrix((data, indices, indptr)).
+
+        Examples
+        --------
+        >>> index = TFIDFIndex()
+        >>> index.insert('aa')
+        >>> index.insert('ab')
+        >>> data, indices, indptr = index.matrix()
+        >>> data.round(6).tolist(), indices.tolist(), indptr.tolist()
+        ([0.42341, 0.640595, 0.640595, 0.42341, 0.640595, 0.640595],
+         [0, 1, 2, 0, 3, 4], [0, 3, 6])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._built:
+            self._build()
+        return self._data, self._indices, self._indptr
+
+    def vocabulary(self) -> Vocabulary:
+        """Return the vocabulary mapping the index's tokens to columns.
+
+        Returns
+        -------
+        Vocabulary
+            The vocabulary of the records' tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._vocabulary
+
+    def _scores(self, record: str) -> np.ndarray:
+        """Return the cosine similarity of a record with each indexed record.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._built:
+            self._build()
+        weights = []
+        columns = []
+        for token, count in self._tokenizer.tokens(record).items():
+            idf = self._idf(
+                token, self._corpus_used  # type: ignore
+            )
+            if not isinf(idf):
+                weights.append(log1p(count) * idf)
+                columns.append(
+                    self._vocabulary.intern(token)
+                    if token in self._vocabulary
+                    else -1
+                )
+
+        scores = np.zeros(len(self._keys), dtype=float)
+        norm = sum(weight * weight for weight in weights) ** 0.5
+        col_ptr = self._col_ptr
+        for weight, column in zip(weights, columns):
+            if column >= 0 and column + 1 < len(col_ptr):
+                start, end = col_ptr[column], col_ptr[column + 1]
+                scores[self._col_rows[start:end]] += (
+                    weight / norm * self._col_data[start:end]
+                )
+        return scores
+
+    def query(
+        self, record: str, k: Optional[int] = 10, min_sim: float = 0.0
+    ) -> List[Tuple[Hashable, float]]:
+        """Return the records most similar to a record.
+
+        Parameters
+        ----------
+        record : str
+            The string to query
+        k : int or None
+            The greatest number of records to return; if None, all records
+            with a positive similarity are returned
+        min_sim : float
+            The minimum similarity of records to return
+
+        Returns
+        -------
+        list
+            The keys of the records with a positive similarity of at least
+            min_sim, & their similarities, in descending order of similarity,
+            then in the order they were inserted
+
+        Examples
+        --------
+        >>> index = TFIDFIndex()
+        >>> for name in ['Niall', 'Neil', 'Nigel', 'Neal', 'Catalan']:
+        ...     index.insert(name)
+        >>> [key for key, _ in index.query('Nial', k=None)]
+        ['Niall', 'Neal', 'Nigel', 'Neil', 'Catalan']
+        >>> [key for key, _ in index.query('Nial', min_sim=0.5)]
+        ['Niall']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        scores = self._scores(record)
+        candidates = np.flatnonzero((scores > 0) & (scores >= min_sim))
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+        if k is not None:
+            order = order[:k]
+        return [(self._keys[pos], float(scores[pos])) for pos in order]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -23,11 +23,18 @@ _TokenDistance.
 from collections import Counter, OrderedDict
 from itertools import product
 from math import exp, log1p
+from types import MethodType
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Union,
     cast,
@@ -35,15 +42,146 @@ from typing import (
 
 import numpy as np
 
+from ._assignment import _auction, _greedy, _munkres
 from ._damerau_levenshtein import DamerauLevenshtein
 from ._distance import _Distance
 from ._lcprefix import LCPrefix
 from ._levenshtein import Levenshtein
+from ._similarity_join import _candidate_pairs
 from ..stats import ConfusionTable
-from ..tokenizer import QGrams, QSkipgrams, WhitespaceTokenizer, _Tokenizer
+from ..tokenizer import (
+    QGrams,
+    QSkipgrams,
+    TokenIds,
+    TokenProfile,
+    Vocabulary,
+    WhitespaceTokenizer,
+    _Tokenizer,
+)
+from ..util._lru_cache import CacheInfo, _LRUCache
 
 __all__ = ['_TokenDistance']
 
+_Profile = Union[TokenProfile, TokenIds]
+
+
+class _PairCards(object):
+    """The crisp cardinalities of the tokens of one pair of strings.
+
+    This holds the tokens of a pair, & the values derived from them, for a
+    single comparison made by :py:meth:`_TokenDistance.compare`, in place of
+    the measure instance. Its methods have the names & values of the
+    corresponding methods of a _TokenDistance with a crisp intersection &
+    no normalizer, so that a measure may compute its similarity from either.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = ('_src', '_tar', '_exact', '_overlap', '_intersection')
+
+    def __init__(
+        self,
+        src: Union[TCounter[str], TokenIds],
+        tar: Union[TCounter[str], TokenIds],
+    ) -> None:
+        """Initialize _PairCards instance.
+
+        Parameters
+        ----------
+        src : Counter or TokenIds
+            The source tokens
+        tar : Counter or TokenIds
+            The target tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._src = src
+        self._tar = tar
+        # As in _TokenDistance._tokenize, the cardinalities of the crisp set
+        # operations are derived arithmetically when both sides are exact
+        # profiles of the same kind.
+        if isinstance(src, TokenProfile):
+            exact = isinstance(tar, TokenProfile)
+        elif isinstance(src, TokenIds):
+            exact = (
+                isinstance(tar, TokenIds) and src.vocabulary is tar.vocabulary
+            )
+        else:
+            exact = False
+        self._exact = (
+            exact and cast(_Profile, src).exact and cast(_Profile, tar).exact
+        )  # type: bool
+        self._overlap = None  # type: Optional[float]
+        self._intersection = None  # type: Optional[TCounter[str]]
+
+    @staticmethod
+    def _card(tokens: Union[TCounter[str], TokenIds]) -> float:
+        if isinstance(tokens, (TokenProfile, TokenIds)):
+            return tokens.cardinality
+        return sum(abs(val) for val in tokens.values())
+
+    @staticmethod
+    def _counter(tokens: Union[TCounter[str], TokenIds]) -> TCounter[str]:
+        if isinstance(tokens, TokenIds):
+            return tokens.to_counter()
+        return tokens
+
+    def _crisp_intersection(self) -> TCounter[str]:
+        if self._intersection is None:
+            self._intersection = self._counter(self._src) & self._counter(
+                self._tar
+            )
+        return self._intersection
+
+    def _any_empty(self) -> bool:
+        """Return True if the src or tar tokens are empty."""
+        return not self._src or not self._tar
+
+    def _src_card(self) -> float:
+        """Return the cardinality of the tokens in the source set."""
+        return self._card(self._src)
+
+    def _tar_card(self) -> float:
+        """Return the cardinality of the tokens in the target set."""
+        return self._card(self._tar)
+
+    def _intersection_card(self) -> float:
+        """Return the cardinality of the intersection."""
+        if self._overlap is None:
+            if self._exact:
+                self._overlap = cast(_Profile, self._src).overlap(
+                    self._tar  # type: ignore
+                )[0]
+            else:
+                self._overlap = sum(
+                    abs(val) for val in self._crisp_intersection().values()
+                )
+        return self._overlap
+
+    def _src_only_card(self) -> float:
+        """Return the cardinality of the tokens only in the source set."""
+        if self._exact:
+            return self._card(self._src) - self._intersection_card()
+        return sum(
+            abs(val)
+            for val in (
+                self._counter(self._src) - self._crisp_intersection()
+            ).values()
+        )
+
+    def _tar_only_card(self) -> float:
+        """Return the cardinality of the tokens only in the target set."""
+        if self._exact:
+            return self._card(self._tar) - self._intersection_card()
+        return sum(
+            abs(val)
+            for val in (
+                self._counter(self._tar) - self._crisp_intersection()
+            ).values()
+        )
+
 
 class _TokenDistance(_Distance):
     r"""Abstract Token Distance class.
@@ -128,7 +266,27 @@ class _TokenDistance(_Distance):
             ``fuzzy`` variants.
         threshold : float
             A threshold value, similarities above which are counted as
-            members of the intersection for the ``fuzzy`` variant.
+            members of the intersection for the ``fuzzy`` variant. For the
+            ``linkage`` variant, pairs of tokens less similar than this are
+            pruned before they are linked.
+        linkage_solver : str
+            The method of solving the assignment problem in the ``linkage``
+            variant:
+
+                - ``hungarian`` : The Hungarian algorithm
+                  :cite:`Munkres:1957`, which finds an optimal linkage
+                  (Default)
+                - ``greedy`` : Repeatedly linking the most similar unlinked
+                  pair, which finds a linkage whose weight is at least half
+                  the optimum :cite:`Avis:1983`
+                - ``auction`` : The auction algorithm :cite:`Bertsekas:1988`,
+                  which finds a linkage whose weight is within
+                  :math:`n \cdot linkage\_epsilon` of the optimum, for n
+                  linked pairs
+
+        linkage_epsilon : float
+            The minimum bid increment of the ``auction`` solver, 0.01 by
+            default
         alphabet : Counter, collection, int, or None
             This represents the alphabet of possible tokens.
 
@@ -163,7 +321,26 @@ class _TokenDistance(_Distance):
                 - ``inverse`` : :math:`\frac{1}{x}`
                 - ``complement`` : :math:`n-x`, where n is the total population
 
+        cache_size : int
+            If set, the tokens of up to this many strings are kept in a
+            least-recently-used cache, keyed on the tokenizer's configuration
+            and the string, so that strings compared repeatedly are only
+            tokenized once. By default, no cache is used.
+        vocabulary : Vocabulary
+            If set, the tokens that are stored, for a batch or in the cache,
+            are stored as compact :py:class:`.TokenIds` interned in this
+            vocabulary, rather than as :py:class:`.TokenProfile` objects.
+
+        Raises
+        ------
+        ValueError
+            Unknown linkage_solver
+
+
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size, vocabulary, linkage_solver, & linkage_epsilon
+            parameters
 
         """
         super(_TokenDistance, self).__init__(
@@ -229,15 +406,42 @@ class _TokenDistance(_Distance):
                 self.params['metric'] = DamerauLevenshtein()
             if 'threshold' not in self.params:
                 self.params['threshold'] = 0.1
+            if 'linkage_solver' not in self.params:
+                self.params['linkage_solver'] = 'hungarian'
+            elif self.params['linkage_solver'] not in {
+                'hungarian',
+                'greedy',
+                'auction',
+            }:
+                raise ValueError(
+                    'Unknown linkage_solver: {!r}'.format(
+                        self.params['linkage_solver']
+                    )
+                )
+            if 'linkage_epsilon' not in self.params:
+                self.params['linkage_epsilon'] = 0.01
             self._intersection = (  # type: ignore
                 self._group_linkage_intersection
             )
         else:
             self._intersection = self._crisp_intersection  # type: ignore
 
-        self._src_tokens = Counter()  # type: TCounter[str]
-        self._tar_tokens = Counter()  # type: TCounter[str]
+        self._src_counter = Counter()  # type: Optional[TCounter[str]]
+        self._tar_counter = Counter()  # type: Optional[TCounter[str]]
+        self._src_profile = None  # type: Optional[_Profile]
+        self._tar_profile = None  # type: Optional[_Profile]
         self._population_card_value = 0  # type: float
+        self._batch_tokens = {}  # type: Dict[str, _Profile]
+        self._profile_overlap = None  # type: Optional[Tuple[float, int]]
+        self._linkage = None  # type: Optional[TCounter[str]]
+        self._exact_profiles = False
+        self._token_cache = (
+            _LRUCache(self.params['cache_size'])
+            if self.params.get('cache_size')
+            else None
+        )  # type: Optional[_LRUCache]
+        self._cache_tokenizer = None  # type: Optional[_Tokenizer]
+        self._cache_tokenizer_key = None  # type: Hashable
 
         # initialize normalizer
         self.normalizer = (
@@ -286,17 +490,49 @@ class _TokenDistance(_Distance):
     def _norm_complement(x: float, _squares: int, pop: float) -> float:
         return pop - x
 
+    @property
+    def _src_tokens(self) -> TCounter[str]:
+        """Return the src tokens, decoding them from TokenIds if needed.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._src_counter is None:
+            self._src_counter = cast(TokenIds, self._src_profile).to_counter()
+        return self._src_counter
+
+    @_src_tokens.setter
+    def _src_tokens(self, tokens: Optional[TCounter[str]]) -> None:
+        self._src_counter = tokens
+
+    @property
+    def _tar_tokens(self) -> TCounter[str]:
+        """Return the tar tokens, decoding them from TokenIds if needed.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._tar_counter is None:
+            self._tar_counter = cast(TokenIds, self._tar_profile).to_counter()
+        return self._tar_counter
+
+    @_tar_tokens.setter
+    def _tar_tokens(self, tokens: Optional[TCounter[str]]) -> None:
+        self._tar_counter = tokens
+
     def _tokenize(
-        self, src: Union[str, TCounter[str]], tar: Union[str, TCounter[str]]
+        self,
+        src: Union[str, TCounter[str], TokenIds],
+        tar: Union[str, TCounter[str], TokenIds],
     ) -> '_TokenDistance':
         """Return the Q-Grams in src & tar.
 
         Parameters
         ----------
         src : str
-            Source string (or QGrams/Counter objects) for comparison
+            Source string (or QGrams/Counter/TokenIds objects) for comparison
         tar : str
-            Target string (or QGrams/Counter objects) for comparison
+            Target string (or QGrams/Counter/TokenIds objects) for comparison
 
         Returns
         -------
@@ -319,18 +555,55 @@ class _TokenDistance(_Distance):
         self._src_orig = src
         self._tar_orig = tar
 
-        if isinstance(src, Counter):
-            self._src_tokens = src
-        else:
-            self._src_tokens = (
-                self.params['tokenizer'].tokenize(src).get_counter()
+        src_tokens = (
+            src
+            if isinstance(src, (Counter, TokenIds))
+            else self._get_counter(src)
+        )
+        tar_tokens = (
+            tar
+            if isinstance(tar, (Counter, TokenIds))
+            else self._get_counter(tar)
+        )
+        # TokenIds are only decoded to Counters if a measure needs them.
+        self._src_profile = (
+            src_tokens
+            if isinstance(src_tokens, (TokenProfile, TokenIds))
+            else None
+        )
+        self._tar_profile = (
+            tar_tokens
+            if isinstance(tar_tokens, (TokenProfile, TokenIds))
+            else None
+        )
+        self._src_tokens = (
+            None if isinstance(src_tokens, TokenIds) else src_tokens
+        )
+        self._tar_tokens = (
+            None if isinstance(tar_tokens, TokenIds) else tar_tokens
+        )
+
+        # When both sides are profiles of the same kind with positive integral
+        # counts, the cardinalities of the crisp set operations are derived
+        # from the profiles' cardinalities & their overlap, rather than by
+        # building intermediate Counters.
+        src_profile, tar_profile = self._src_profile, self._tar_profile
+        if isinstance(src_profile, TokenProfile):
+            self._exact_profiles = isinstance(tar_profile, TokenProfile)
+        elif isinstance(src_profile, TokenIds):
+            self._exact_profiles = (
+                isinstance(tar_profile, TokenIds)
+                and src_profile.vocabulary is tar_profile.vocabulary
             )
-        if isinstance(tar, Counter):
-            self._tar_tokens = tar
         else:
-            self._tar_tokens = (
-                self.params['tokenizer'].tokenize(tar).get_counter()
-            )
+            self._exact_profiles = False
+        self._exact_profiles = (
+            self._exact_profiles
+            and cast(_Profile, src_profile).exact
+            and cast(_Profile, tar_profile).exact
+        )
+        self._profile_overlap = None
+        self._linkage = None
 
         self._population_card_value = self._calc_population_card()
 
@@ -350,10 +623,533 @@ class _TokenDistance(_Distance):
 
         return self
 
+    def _get_counter(self, string: str) -> Union[TCounter[str], TokenIds]:
+        """Return the tokens of a string, from the batch or cache if possible.
+
+        Tokens that may be reused, because they are stored for a batch or in
+        the cache, are returned as a TokenProfile or as TokenIds.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter or TokenIds
+            The tokens of string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if string in self._batch_tokens:
+            return self._batch_tokens[string]
+        if self._token_cache is None:
+            return self.params['tokenizer'].tokens(string)
+
+        # The tokenizer's configuration key is only recomputed when the
+        # tokenizer is replaced, since computing it costs about as much as
+        # tokenizing a short string.
+        if self.params['tokenizer'] is not self._cache_tokenizer:
+            self._cache_tokenizer = self.params['tokenizer']
+            self._cache_tokenizer_key = self._cache_tokenizer._config_key()
+        key = (self._cache_tokenizer_key, string)
+        tokens = self._token_cache.get(key)
+        if tokens is None:
+            tokens = self._stored_form(self.params['tokenizer'].tokens(string))
+            self._token_cache.set(key, tokens)
+        return tokens
+
+    def _stored_form(self, tokens: TCounter[str]) -> _Profile:
+        """Return tokens in the form in which they are stored for reuse.
+
+        Parameters
+        ----------
+        tokens : Counter
+            The tokens of a string
+
+        Returns
+        -------
+        TokenProfile or TokenIds
+            The tokens as TokenIds if the instance has a vocabulary, otherwise
+            as a TokenProfile
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.params.get('vocabulary') is not None:
+            return cast(Vocabulary, self.params['vocabulary']).encode(tokens)
+        return TokenProfile(tokens)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the token cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the cache's hits, misses, maxsize, and currsize;
+            all are 0 if the instance has no cache
+
+        Examples
+        --------
+        >>> cmp = _TokenDistance(cache_size=100)
+        >>> cmp._tokenize('cat', 'hat')._tokenize('cat', 'hit').cache_info()
+        CacheInfo(hits=1, misses=3, maxsize=100, currsize=3)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._token_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._token_cache.info()
+
+    def cache_clear(self) -> None:
+        """Discard the contents & statistics of the token cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._token_cache is not None:
+            self._token_cache.clear()
+
+    def _batch_prepare(self, strings: Iterable[str]) -> None:
+        """Tokenize each distinct string once for a batch of comparisons.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings that will be compared in the batch
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for string in strings:
+            if string not in self._batch_tokens:
+                tokens = self._get_counter(string)
+                if not isinstance(tokens, (TokenProfile, TokenIds)):
+                    tokens = self._stored_form(tokens)
+                self._batch_tokens[string] = tokens
+
+    def _batch_clear(self) -> None:
+        """Discard the tokens stored for a batch of comparisons.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._batch_tokens = {}
+
+    def compare(
+        self,
+        src: Union[str, TCounter[str], TokenIds],
+        tar: Union[str, TCounter[str], TokenIds],
+        method: str = 'sim',
+    ) -> float:
+        """Return a comparison of two strings without changing the instance.
+
+        The methods of token distance measures store the tokens of the
+        strings they compare, and values derived from them, in the instance.
+        This method instead makes the comparison without changing the
+        instance, so that a single configured measure may serve several
+        threads at once. Measures whose similarity is computed from the
+        cardinalities of crisp sets alone (such as Jaccard, Dice, Cosine,
+        Tversky, & Overlap) tokenize the strings with the tokenizer's tokens
+        method & keep the tokens & their cardinalities for the one comparison,
+        making sim & dist (or dist_abs) cheaper than constructing a new
+        measure. Other comparisons are made with an isolated copy of the
+        instance, sharing its configuration & token cache.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or Counter/TokenIds object) for comparison
+        tar : str
+            Target string (or Counter/TokenIds object) for comparison
+        method : str
+            The name of the method to apply: ``sim``, ``dist``, ``sim_score``,
+            or ``dist_abs``
+
+        Returns
+        -------
+        float
+            The value returned by the method
+
+        Raises
+        ------
+        ValueError
+            The method is not one of those listed
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> cmp = Jaccard()
+        >>> cmp.compare('cat', 'hat')
+        0.3333333333333333
+        >>> cmp.compare('cat', 'hat', method='dist')
+        0.6666666666666667
+        >>> cmp._src_tokens
+        Counter()
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if method not in {'sim', 'dist', 'sim_score', 'dist_abs'}:
+            raise ValueError(
+                'method must be one of sim, dist, sim_score, or dist_abs, '
+                'not {!r}.'.format(method)
+            )
+        if (
+            method != 'sim_score'
+            and self.params['intersection_type'] == 'crisp'
+            and self.params.get('normalizer') not in self._norm_dict
+            and (method == 'sim' or type(self).dist is _Distance.dist)
+            and (
+                method != 'dist_abs'
+                or type(self).dist_abs is _Distance.dist_abs
+            )
+        ):
+            sim = self._sim_cards(src, tar, self._pair_cards)
+            if sim is not None:
+                return sim if method == 'sim' else 1.0 - sim
+        return cast(float, getattr(self._isolated(), method)(src, tar))
+
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> Optional[float]:
+        """Return the similarity of two strings from their cardinalities.
+
+        Measures whose similarity is computed from the cardinalities of the
+        source, target, intersection, & differences alone override this and
+        compute sim by calling it with :py:meth:`_tokenize`, which returns the
+        instance. The same computation then serves :py:meth:`compare`, which
+        calls it with :py:meth:`_pair_cards`. By default, this returns None,
+        and compare uses an isolated copy of the instance.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or Counter/TokenIds object) for comparison
+        tar : str
+            Target string (or Counter/TokenIds object) for comparison
+        tokenize : callable
+            A function of src & tar returning an object with the cardinality
+            methods of a _TokenDistance
+
+        Returns
+        -------
+        float or None
+            The similarity, or None if the measure does not support this
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return None
+
+    def _pair_cards(
+        self,
+        src: Union[str, TCounter[str], TokenIds],
+        tar: Union[str, TCounter[str], TokenIds],
+    ) -> _PairCards:
+        """Return the crisp cardinalities of two strings' tokens.
+
+        The strings are tokenized as by :py:meth:`_tokenize`, from the batch
+        or cache if possible, but nothing is stored in the instance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _PairCards(
+            src
+            if isinstance(src, (Counter, TokenIds))
+            else self._get_counter(src),
+            tar
+            if isinstance(tar, (Counter, TokenIds))
+            else self._get_counter(tar),
+        )
+
+    def _join_min_overlap(
+        self, src_card: float, tar_card: float, threshold: float
+    ) -> Optional[float]:
+        """Return the least crisp overlap with which sim may reach threshold.
+
+        Parameters
+        ----------
+        src_card : float
+            The cardinality of the source tokens
+        tar_card : float
+            The cardinality of the target tokens
+        threshold : float
+            The similarity threshold
+
+        Returns
+        -------
+        float or None
+            The least cardinality of the intersection of tokens with which the
+            similarity of strings having these cardinalities may be at least
+            the threshold, or None if no such bound is known, in which case
+            joins compare every pair. This is None by default.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return None
+
+    def all_pairs_above(
+        self, records: Sequence[str], threshold: float
+    ) -> List[Tuple[int, int, float]]:
+        """Return the pairs of records whose similarity is at least threshold.
+
+        For measures with a bound on the overlap of tokens that a pair must
+        have to reach the threshold (Jaccard, Dice, Cosine, Overlap, & Tversky
+        without bias), with crisp intersections & integral token counts,
+        pairs are found by the length, prefix, & positional filtering of
+        PPJoin :cite:`Xiao:2011` and only those passing the filters are
+        compared. Otherwise, every pair is compared. Either way, the result
+        is that of comparing every pair.
+
+        Parameters
+        ----------
+        records : Sequence[str]
+            The strings to pair with each other
+        threshold : float
+            The least similarity of the pairs returned
+
+        Returns
+        -------
+        list
+            The index i of the first record, the index j of the second, and
+            their similarity, ``sim(records[i], records[j])``, for each pair
+            with i < j whose similarity is at least the threshold, in order of
+            i & j
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> cmp = Jaccard()
+        >>> cmp.all_pairs_above(['Niall', 'Neil', 'Nigel', 'Niel', 'Neal'], 0.4)
+        [(1, 4, 0.42857142857142855), (2, 3, 0.5714285714285714)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._join(list(records), None, threshold)
+
+    def join(
+        self, left: Sequence[str], right: Sequence[str], threshold: float
+    ) -> List[Tuple[int, int, float]]:
+        """Return the pairs across two collections at least threshold similar.
+
+        Pairs are found as for :py:meth:`all_pairs_above`.
+
+        Parameters
+        ----------
+        left : Sequence[str]
+            The source strings
+        right : Sequence[str]
+            The target strings
+        threshold : float
+            The least similarity of the pairs returned
+
+        Returns
+        -------
+        list
+            The index i in left, the index j in right, and their similarity,
+            ``sim(left[i], right[j])``, for each pair whose similarity is at
+            least the threshold, in order of i & j
+
+        Examples
+        --------
+        >>> from abydos.distance import Dice
+        >>> cmp = Dice()
+        >>> cmp.join(['Niall', 'Neil'], ['Nigel', 'Niel', 'Neal', 'Nil'], 0.55)
+        [(0, 3, 0.6), (1, 2, 0.6), (1, 3, 0.6666666666666666)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._join(list(left), list(right), threshold)
+
+    def _join(
+        self, left: List[str], right: Optional[List[str]], threshold: float,
+    ) -> List[Tuple[int, int, float]]:
+        """Return the pairs at least threshold similar, for join methods.
+
+        .. versionadded:: 0.6.0
+
+        """
+        tars = left if right is None else right
+        candidates = self._join_candidates(left, right, threshold)
+        if candidates is None:
+            candidates = [
+                (i, j)
+                for i in range(len(left))
+                for j in range(i + 1 if right is None else 0, len(tars))
+            ]
+        else:
+            candidates = sorted(candidates)
+
+        self._batch_prepare(left if right is None else left + right)
+        try:
+            pairs = []
+            for i, j in candidates:
+                sim = self.sim(left[i], tars[j])
+                if sim >= threshold:
+                    pairs.append((i, j, sim))
+        finally:
+            self._batch_clear()
+        return pairs
+
+    def _join_candidates(
+        self, left: List[str], right: Optional[List[str]], threshold: float,
+    ) -> Optional[Set[Tuple[int, int]]]:
+        """Return the candidate pairs of a join, or None to compare all.
+
+        Pairs including a record without tokens are always candidates, since
+        a record may match another without sharing tokens if the two are
+        equal.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if (
+            threshold <= 0
+            or self.params['intersection_type'] != 'crisp'
+            or self.params.get('normalizer') in self._norm_dict
+            or self._join_min_overlap(1, 1, threshold) is None
+        ):
+            return None
+
+        tokens = {}  # type: Dict[str, TCounter[str]]
+        for string in left if right is None else left + right:
+            if string not in tokens:
+                tokens[string] = self.params['tokenizer'].tokens(string)
+                if not all(
+                    isinstance(count, int) and count > 0
+                    for count in tokens[string].values()
+                ):
+                    return None
+
+        def _min_overlap(size_l: int, size_r: int) -> float:
+            bound = cast(
+                float, self._join_min_overlap(size_l, size_r, threshold)
+            )
+            if right is None:
+                # Either record of a pair may be the source.
+                bound = min(
+                    bound,
+                    cast(
+                        float,
+                        self._join_min_overlap(size_r, size_l, threshold),
+                    ),
+                )
+            return bound
+
+        candidates = _candidate_pairs(
+            [tokens[string] for string in left],
+            None if right is None else [tokens[string] for string in right],
+            _min_overlap,
+        )
+
+        tars = left if right is None else right
+        empty_left = [i for i, string in enumerate(left) if not tokens[string]]
+        empty_tars = [j for j, string in enumerate(tars) if not tokens[string]]
+        for i in empty_left:
+            candidates.update(
+                (min(i, j), max(i, j)) if right is None else (i, j)
+                for j in range(len(tars))
+                if right is not None or j != i
+            )
+        if right is not None:
+            candidates.update(
+                (i, j) for j in empty_tars for i in range(len(left))
+            )
+        return candidates
+
+    def _isolated(self) -> '_TokenDistance':
+        """Return a copy of the instance that may compare strings separately.
+
+        Comparisons replace, rather than modify, the attributes they set, so
+        a shallow copy suffices, except that methods bound to the instance are
+        rebound to the copy, and tokenizers & token distance measures, whether
+        parameters or attributes, are themselves copied. The token cache is
+        shared.
+
+        .. versionadded:: 0.6.0
+
+        """
+
+        def _isolate(value: Any) -> Any:
+            if isinstance(value, _Tokenizer):
+                return value._copy()  # noqa: SF01
+            if isinstance(value, _TokenDistance):
+                return value._isolated()  # noqa: SF01
+            if getattr(value, '__self__', None) is self:
+                return MethodType(value.__func__, clone)
+            return value
+
+        clone = object.__new__(type(self))
+        clone.__dict__.update(
+            (name, _isolate(value)) for name, value in self.__dict__.items()
+        )
+        clone.params = {
+            key: _isolate(value) for key, value in self.params.items()
+        }
+        if self._cache_tokenizer is self.params.get('tokenizer'):
+            clone._cache_tokenizer = clone.params.get('tokenizer')
+        return clone
+
     def _get_tokens(self) -> Tuple[TCounter[str], TCounter[str]]:
         """Return the src and tar tokens as a tuple."""
         return self._src_tokens, self._tar_tokens
 
+    def _any_empty(self) -> bool:
+        """Return True if the src or tar tokens are empty.
+
+        TokenIds are not decoded to find this.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return not (
+            self._src_profile
+            if self._src_profile is not None
+            else self._src_tokens
+        ) or not (
+            self._tar_profile
+            if self._tar_profile is not None
+            else self._tar_tokens
+        )
+
+    def _exact_overlap(self) -> Optional[Tuple[float, int]]:
+        """Return the size of the crisp intersection of two profiles.
+
+        Returns
+        -------
+        tuple or None
+            The cardinality of the crisp intersection & the number of distinct
+            tokens in it, or None if the src & tar tokens are not both exact
+            TokenProfiles or TokenIds
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._exact_profiles:
+            return None
+        if self._profile_overlap is None:
+            self._profile_overlap = cast(_Profile, self._src_profile).overlap(
+                self._tar_profile  # type: ignore
+            )
+        return self._profile_overlap
+
     def _src_card(self) -> float:
         r"""Return the cardinality of the tokens in the source set."""
         if self.params['intersection_type'] == 'soft':
@@ -369,6 +1165,10 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        if self._src_profile is not None:
+            return self.normalizer(
+                self._src_profile.cardinality, 2, self._population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._src_tokens.values()),
             2,
@@ -391,6 +1191,14 @@ class _TokenDistance(_Distance):
 
     def _src_only_card(self) -> float:
         """Return the cardinality of the tokens only in the source set."""
+        if self.params['intersection_type'] == 'crisp':
+            overlap = self._exact_overlap()
+            if overlap is not None:
+                return self.normalizer(
+                    cast(_Profile, self._src_profile).cardinality - overlap[0],
+                    1,
+                    self._population_card_value,
+                )
         return self.normalizer(
             sum(abs(val) for val in self._src_only().values()),
             1,
@@ -412,6 +1220,10 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        if self._tar_profile is not None:
+            return self.normalizer(
+                self._tar_profile.cardinality, 2, self._population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._tar_tokens.values()),
             2,
@@ -434,6 +1246,14 @@ class _TokenDistance(_Distance):
 
     def _tar_only_card(self) -> float:
         """Return the cardinality of the tokens only in the target set."""
+        if self.params['intersection_type'] == 'crisp':
+            overlap = self._exact_overlap()
+            if overlap is not None:
+                return self.normalizer(
+                    cast(_Profile, self._tar_profile).cardinality - overlap[0],
+                    1,
+                    self._population_card_value,
+                )
         return self.normalizer(
             sum(abs(val) for val in self._tar_only().values()),
             1,
@@ -449,6 +1269,14 @@ class _TokenDistance(_Distance):
 
     def _symmetric_difference_card(self) -> float:
         """Return the cardinality of the symmetric difference."""
+        if self.params['intersection_type'] == 'crisp':
+            overlap = self._exact_overlap()
+            if overlap is not None:
+                return self.normalizer(
+                    self._profile_total_card() - 2 * overlap[0],
+                    2,
+                    self._population_card_value,
+                )
         return self.normalizer(
             sum(abs(val) for val in self._symmetric_difference().values()),
             2,
@@ -474,8 +1302,23 @@ class _TokenDistance(_Distance):
             )
         return self._src_tokens + self._tar_tokens
 
+    def _profile_total_card(self) -> float:
+        """Return the summed cardinalities of the src & tar profiles.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            cast(_Profile, self._src_profile).cardinality
+            + cast(_Profile, self._tar_profile).cardinality
+        )
+
     def _total_card(self) -> float:
         """Return the cardinality of the complement of the total."""
+        if self.params['intersection_type'] != 'soft' and self._exact_profiles:
+            return self.normalizer(
+                self._profile_total_card(), 3, self._population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._total().values()),
             3,
@@ -500,8 +1343,17 @@ class _TokenDistance(_Distance):
                 1,
                 self._population_card_value,
             )
+        overlap = self._exact_overlap()
+        if overlap is not None and self.params['intersection_type'] != 'soft':
+            total_len = (
+                len(cast(_Profile, self._src_profile))
+                + len(cast(_Profile, self._tar_profile))
+                - overlap[1]
+            )
+        else:
+            total_len = len(self._total().values())
         return self.normalizer(
-            max(0, self.params['alphabet'] - len(self._total().values())),
+            max(0, self.params['alphabet'] - total_len),
             1,
             self._population_card_value,
         )
@@ -551,6 +1403,14 @@ class _TokenDistance(_Distance):
 
     def _union_card(self) -> float:
         """Return the cardinality of the union."""
+        if self.params['intersection_type'] == 'crisp':
+            overlap = self._exact_overlap()
+            if overlap is not None:
+                return self.normalizer(
+                    self._profile_total_card() - overlap[0],
+                    3,
+                    self._population_card_value,
+                )
         return self.normalizer(
             sum(abs(val) for val in self._union().values()),
             3,
@@ -771,201 +1631,122 @@ member function, such as Levenshtein."
 
         This is based on group linkage, as defined by :cite:`On:2007`.
 
-        Most of this method is concerned with solving the assignment problem,
-        in order to find the weight of the maximum weight bipartite matching.
-        The Hungarian algorithm of Munkres :cite:`Munkres:1957`, implemented
-        below in Python & Numpy is used to solve the assignment problem since
-        it is roughly twice as fast as SciPy's implementation.
+        The similarities of the tokens unique to src & tar are found in a
+        single call to the metric's :py:meth:`.dist_matrix` method. By
+        default, the assignment problem is solved over every pair by the
+        Hungarian algorithm of Munkres :cite:`Munkres:1957`, in order to find
+        the maximum weight bipartite matching, and the pairs of the matching
+        less similar than the threshold are then dropped. A greedy or auction
+        approximation may be used instead; these are given only the pairs
+        meeting the threshold, and the tokens in such pairs.
 
         .. versionadded:: 0.4.0
         .. versionchanged:: 0.4.1
             Corrected the Hungarian algorithm & optimized it so that SciPy's
             version is no longer needed.
+        .. versionchanged:: 0.6.0
+            Fill the similarity matrix in one call & support approximate
+            solvers
 
         """
-        intersection = self._crisp_intersection()
-        src_only_tok = sorted(self._src_tokens - self._tar_tokens)
-        tar_only_tok = sorted(self._tar_tokens - self._src_tokens)
-        src_only = self._src_tokens - self._tar_tokens
-        tar_only = self._tar_tokens - self._src_tokens
-
-        # Quoted text below is from Munkres (1957), cited above.
+        # The linkage is found once per pair of strings, however many of the
+        # cardinalities of the measure depend upon it.
+        if self._linkage is None:
+            self._linkage = self._group_linkage()
+        return self._linkage.copy()
 
-        # Pre-preliminaries: create square the matrix of scores
-        n = max(len(src_only_tok), len(tar_only_tok))
-        arr = np.zeros((n, n), dtype=float)
+    def _group_linkage(self) -> TCounter[str]:
+        """Return the group linkage intersection, as found by its solver.
 
-        for col in range(len(src_only_tok)):
-            for row in range(len(tar_only_tok)):
-                arr[row, col] = self.params['metric'].dist(
-                    src_only_tok[col], tar_only_tok[row]
-                )
+        .. versionadded:: 0.6.0
 
-        src_only_tok += [''] * (n - len(src_only_tok))
-        tar_only_tok += [''] * (n - len(tar_only_tok))
-
-        starred = np.zeros((n, n), dtype=np.bool_)
-        primed = np.zeros((n, n), dtype=np.bool_)
-        row_covered = np.zeros(n, dtype=np.bool_)
-        col_covered = np.zeros(n, dtype=np.bool_)
-
-        orig_sim = 1 - np.copy(arr)
-        # Preliminaries:
-        # P: "No lines are covered; no zeros are starred or primed."
-        # P: "Consider a row of matrix A; subtract from each element in
-        # this row the smallest element of this row. Do the same for each
-        # row of A."
-        arr -= arr.min(axis=1, keepdims=True)
-        # P: "Then consider each column of the resulting matrix and
-        # subtract from each column its smallest entry."
-        arr -= arr.min(axis=0, keepdims=True)
-
-        # P: "Consider a zero Z of the matrix. If there is no starred zero
-        # in its row and none in its column, star Z. Repeat, considering
-        # each zero in the matrix in turn. Then cover every column
-        # containing a starred zero.
-        for col in range(n):
-            for row in range(n):
-                if arr[row, col] == 0:
-                    if (
-                        np.count_nonzero(starred[row, :]) == 0
-                        and np.count_nonzero(starred[:, col]) == 0
-                    ):
-                        starred[row, col] = True
-                        col_covered[col] = True
-
-        step = 1
-        # This is the simple case where independent assignments are obvious
-        # and found without the rest of the algorithm.
-        if np.count_nonzero(col_covered) == n:
-            step = 4
-
-        while step < 4:
-            if step == 1:
-                # Step 1:
-                # 1: "Choose a non-covered zero and prime it. Consider the
-                # row containing it. If there is no starred zero in this
-                # row, go at once to Step 2. If there is a starred zero Z
-                # in this row, cover this row and uncover the column of Z."
-                # 1: Repeat until all zeros are covered. Go to Step 3."
-                zeros = tuple(zip(*((arr == 0).nonzero())))
-                while step == 1:
-                    for row, col in zeros:
-                        if not (col_covered[col] | row_covered[row]):
-                            primed[row, col] = True
-                            z_cols = (starred[row, :]).nonzero()[0]
-                            if not z_cols.size:
-                                step = 2
-                                break
-                            else:
-                                row_covered[row] = True
-                                col_covered[z_cols[0]] = False
-
-                    if step != 1:
-                        break
-
-                    for row, col in zeros:
-                        if not (col_covered[col] | row_covered[row]):
-                            break
-                    else:
-                        step = 3
-
-            if step == 2:
-                # Step 2:
-                # 2: "There is a sequence of alternating starred and primed
-                # zeros, constructed as follows: Let Z_0 denote the
-                # uncovered 0'. [There is only one.] Let Z_1 denote the 0*
-                # in Z_0's column (if any). Let Z_2 denote the 0' in Z_1's
-                # row (we must prove that it exists). Let Z_3 denote the 0*
-                # in Z_2's column (if any). Similarly continue until the
-                # sequence stops at a 0', Z_{2k}, which has no 0* in its
-                # column."
-                z_series = []
-                for row, col in zeros:  # pragma: no branch
-                    if primed[row, col] and not (
-                        row_covered[row] | col_covered[col]
-                    ):
-                        z_series.append((row, col))
-                        break
-                col = z_series[-1][1]
-                while True:
-                    row_content = tuple(
-                        set((arr[:, col] == 0).nonzero()[0])
-                        & set((starred[:, col]).nonzero()[0])
-                    )
-                    if row_content:
-                        row = row_content[0]
-                        z_series.append((row, col))
-                        col = tuple(
-                            set((arr[row, :] == 0).nonzero()[0])
-                            & set((primed[row, :]).nonzero()[0])
-                        )[0]
-                        z_series.append((row, col))
-                    else:
-                        break
-
-                # 2: "Unstar each starred zero of the sequence and star
-                # each primed zero of the sequence. Erase all primes,
-                # uncover every row, and cover every column containing a
-                # 0*."
-                primed[:, :] = False
-                row_covered[:] = False
-                col_covered[:] = False
-                for row, col in z_series:
-                    starred[row, col] = not starred[row, col]
-                for col in range(n):
-                    if np.count_nonzero(starred[:, col]):
-                        col_covered[col] = True
-                # 2: "If all columns are covered, the starred zeros form
-                # the desired independent set. Otherwise, return to Step
-                # 1."
-                if np.count_nonzero(col_covered) == n:
-                    step = 4
-                else:
-                    step = 1
-
-            if step == 3:
-                # Step 3:
-                # 3: "Let h denote the smallest non-covered element of the
-                # matrix; it will be positive. Add h to each covered row;
-                # then subtract h from each uncovered column."
-                h_val = float('inf')
-                for col in range(n):
-                    if not (col_covered[col]):
-                        for row in range(n):
-                            if (
-                                not (row_covered[row])
-                                and arr[row, col] < h_val
-                            ):
-                                h_val = arr[row, col]
-                for row in range(n):
-                    if row_covered[row]:
-                        arr[row, :] += h_val
-                for col in range(n):
-                    if not (col_covered[col]):
-                        arr[:, col] -= h_val
-
-                # 3: "Return to Step 1, without altering any asterisks,
-                # primes, or covered lines."
-                step = 1
-
-        for row, col in tuple(zip(*(starred.nonzero()))):
-            sim = orig_sim[row, col]
-            if sim >= self.params['threshold']:
-                score = float(
-                    (sim / 2)
-                    * min(
-                        src_only[src_only_tok[col]],
-                        tar_only[tar_only_tok[row]],
+        """
+        intersection = self._crisp_intersection()
+        src_only = self._src_tokens - self._tar_tokens
+        tar_only = self._tar_tokens - self._src_tokens
+        src_only_tok = sorted(src_only)
+        tar_only_tok = sorted(tar_only)
+        if not src_only_tok or not tar_only_tok:
+            return intersection
+
+        dists = self.params['metric'].dist_matrix(tar_only_tok, src_only_tok)
+        sims = 1.0 - dists
+        if self.params['linkage_solver'] == 'hungarian':
+            # The optimal linkage is found over every pair, as in 0.5.0, by
+            # minimizing the total distance in the square matrix padded with
+            # zeros. Pairs below the threshold are only dropped from it.
+            n = max(dists.shape)
+            costs = np.zeros((n, n), dtype=float)
+            costs[: dists.shape[0], : dists.shape[1]] = dists
+            for row, col in _munkres(costs):
+                if (
+                    row < dists.shape[0]
+                    and col < dists.shape[1]
+                    and sims[row, col] >= self.params['threshold']
+                ):
+                    self._add_linked(
+                        intersection,
+                        src_only,
+                        tar_only,
+                        src_only_tok[col],
+                        tar_only_tok[row],
+                        sims[row, col],
                     )
+            return intersection
+
+        # The approximate solvers are given only the pairs at or above the
+        # threshold, and only the tokens in such a pair.
+        sims[sims < self.params['threshold']] = 0.0
+        rows = np.flatnonzero(sims.any(axis=1))
+        cols = np.flatnonzero(sims.any(axis=0))
+        if not rows.size:
+            return intersection
+        sims = sims[np.ix_(rows, cols)]
+
+        if self.params['linkage_solver'] == 'greedy':
+            pairs = _greedy(sims)
+        else:
+            pairs = _auction(sims, self.params['linkage_epsilon'])
+
+        for row, col in pairs:
+            if sims[row, col] > 0.0:
+                self._add_linked(
+                    intersection,
+                    src_only,
+                    tar_only,
+                    src_only_tok[cols[col]],
+                    tar_only_tok[rows[row]],
+                    sims[row, col],
                 )
-                intersection[src_only_tok[col]] += score  # type: ignore
-                intersection[tar_only_tok[row]] += score  # type: ignore
 
         return intersection
 
+    @staticmethod
+    def _add_linked(
+        intersection: TCounter[str],
+        src_only: TCounter[str],
+        tar_only: TCounter[str],
+        src_tok: str,
+        tar_tok: str,
+        sim: float,
+    ) -> None:
+        """Add a linked pair of tokens to a group linkage intersection.
+
+        .. versionadded:: 0.6.0
+
+        """
+        score = float((sim / 2) * min(src_only[src_tok], tar_only[tar_tok]))
+        intersection[src_tok] += score  # type: ignore
+        intersection[tar_tok] += score  # type: ignore
+
     def _intersection_card(self) -> float:
         """Return the cardinality of the intersection."""
+        if self.params['intersection_type'] == 'crisp':
+            overlap = self._exact_overlap()
+            if overlap is not None:
+                return self.normalizer(
+                    overlap[0], 1, self._population_card_value
+                )
         return self.normalizer(
             sum(abs(val) for val in self._intersection().values()),
             1,
@@ -20,7 +20,7 @@ Tulloss' R similarity
 """
 
 from math import log
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -92,6 +92,28 @@ class TullossR(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return Tulloss' R similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        if not cards._src_card() or not cards._tar_card():
+            return 0.0
+
+        a = cards._intersection_card()
+        b = cards._src_only_card()
+        c = cards._tar_only_card()
+
+        return log(1 + a / (a + b)) * log(1 + a / (a + c)) / log(2) ** 2
+
     def sim(self, src: str, tar: str) -> float:
         """Return Tulloss' R similarity of two strings.
 
@@ -123,19 +145,7 @@ class TullossR(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        if not self._src_card() or not self._tar_card():
-            return 0.0
-
-        a = self._intersection_card()
-        b = self._src_only_card()
-        c = self._tar_only_card()
-
-        return log(1 + a / (a + b)) * log(1 + a / (a + c)) / log(2) ** 2
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
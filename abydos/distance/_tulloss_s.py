@@ -20,7 +20,7 @@ Tulloss' S similarity
 """
 
 from math import log2
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -91,6 +91,22 @@ class TullossS(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return Tulloss' S similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        b = cards._src_only_card()
+        c = cards._tar_only_card()
+
+        return 1 / (log2(2 + min(b, c) / (a + 1))) ** 0.5
+
     def sim(self, src: str, tar: str) -> float:
         """Return Tulloss' S similarity of two strings.
 
@@ -122,13 +138,7 @@ class TullossS(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        b = self._src_only_card()
-        c = self._tar_only_card()
-
-        return 1 / (log2(2 + min(b, c) / (a + 1))) ** 0.5
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
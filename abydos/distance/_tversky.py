@@ -19,7 +19,7 @@
 Tversky index
 """
 
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -115,43 +115,38 @@ class Tversky(_TokenDistance):
         )
         self.set_params(alpha=alpha, beta=beta, bias=bias)
 
-    def sim(self, src: str, tar: str) -> float:
-        """Return the Tversky index of two strings.
+    def _join_min_overlap(
+        self, src_card: float, tar_card: float, threshold: float
+    ) -> Optional[float]:
+        r"""Return the least crisp overlap with which sim may reach threshold.
 
-        Parameters
-        ----------
-        src : str
-            Source string (or QGrams/Counter objects) for comparison
-        tar : str
-            Target string (or QGrams/Counter objects) for comparison
+        Without bias, :math:`sim_{Tversky}(X, Y) \geq t` if and only if
 
-        Returns
-        -------
-        float
-            Tversky similarity
+            .. math::
 
-        Raises
-        ------
-        ValueError
-            Unsupported weight assignment; alpha and beta must be greater than
-            or equal to 0.
+                |X \cap Y| \geq
+                \frac{t(\alpha|X| + \beta|Y|)}{1 - t + t(\alpha + \beta)}
 
-        Examples
-        --------
-        >>> cmp = Tversky()
-        >>> cmp.sim('cat', 'hat')
-        0.3333333333333333
-        >>> cmp.sim('Niall', 'Neil')
-        0.2222222222222222
-        >>> cmp.sim('aluminum', 'Catalan')
-        0.0625
-        >>> cmp.sim('ATCG', 'TAGC')
-        0.0
+        No bound is given with bias or negative weights.
 
+        .. versionadded:: 0.6.0
 
-        .. versionadded:: 0.1.0
-        .. versionchanged:: 0.3.6
-            Encapsulated in class
+        """
+        alpha, beta = self.params['alpha'], self.params['beta']
+        if self.params['bias'] is not None or alpha < 0 or beta < 0:
+            return None
+        num = threshold * (alpha * src_card + beta * tar_card)
+        denom = 1 - threshold + threshold * (alpha + beta)
+        if denom <= 0:
+            return float('inf') if num > 0 else 0.0
+        return num / denom
+
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Tversky index from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
 
         """
         if self.params['alpha'] < 0 or self.params['beta'] < 0:
@@ -165,13 +160,13 @@ class Tversky(_TokenDistance):
         elif not src or not tar:
             return 0.0
 
-        self._tokenize(src, tar)
+        cards = tokenize(src, tar)
 
-        q_src_mag = self._src_only_card()
-        q_tar_mag = self._tar_only_card()
-        q_intersection_mag = self._intersection_card()
+        q_src_mag = cards._src_only_card()
+        q_tar_mag = cards._tar_only_card()
+        q_intersection_mag = cards._intersection_card()
 
-        if not self._src_tokens or not self._tar_tokens:
+        if cards._any_empty():
             return 0.0
 
         if self.params['bias'] is None:
@@ -200,6 +195,47 @@ class Tversky(_TokenDistance):
             ),
         )
 
+    def sim(self, src: str, tar: str) -> float:
+        """Return the Tversky index of two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or QGrams/Counter objects) for comparison
+        tar : str
+            Target string (or QGrams/Counter objects) for comparison
+
+        Returns
+        -------
+        float
+            Tversky similarity
+
+        Raises
+        ------
+        ValueError
+            Unsupported weight assignment; alpha and beta must be greater than
+            or equal to 0.
+
+        Examples
+        --------
+        >>> cmp = Tversky()
+        >>> cmp.sim('cat', 'hat')
+        0.3333333333333333
+        >>> cmp.sim('Niall', 'Neil')
+        0.2222222222222222
+        >>> cmp.sim('aluminum', 'Catalan')
+        0.0625
+        >>> cmp.sim('ATCG', 'TAGC')
+        0.0
+
+
+        .. versionadded:: 0.1.0
+        .. versionchanged:: 0.3.6
+            Encapsulated in class
+
+        """
+        return self._sim_cards(src, tar, self._tokenize)
+
 
 if __name__ == '__main__':
     import doctest
@@ -21,11 +21,14 @@ Typo edit distance functions.
 
 from itertools import chain
 from math import log
-from typing import Any, Dict, Tuple, cast
+from typing import Any, Dict, Optional, Tuple, cast
 
 from numpy import float_ as np_float
+from numpy import full as np_full
+from numpy import inf as np_inf
 from numpy import zeros as np_zeros
 
+from ._bounded import _bounded_dist, _diagonal_band, _dist_bound
 from ._distance import _Distance
 
 
@@ -39,6 +42,11 @@ class Typo(_Distance):
     this was copied from that module. Compared to the original, this supports
     different metrics for substitution.
 
+    If a maximum distance or minimum similarity is set, only the diagonal band
+    of the alignment matrix that can hold a sufficiently close alignment is
+    computed :cite:`Ukkonen:1985`, and computation stops as soon as the bound
+    is known to be exceeded.
+
     .. versionadded:: 0.3.6
     """
 
@@ -116,6 +124,8 @@ class Typo(_Distance):
         cost: Tuple[float, float, float, float] = (1.0, 1.0, 0.5, 0.5),
         layout: str = 'QWERTY',
         failsafe: bool = False,
+        max_dist: Optional[float] = None,
+        min_sim: Optional[float] = None,
         **kwargs: Any
     ):
         """Initialize Typo instance.
@@ -140,11 +150,19 @@ class Typo(_Distance):
             If True, substitution of an unknown character (one not present on
             the selected keyboard) will incur a cost equal to an insertion plus
             a deletion.
+        max_dist : float
+            If set, distances greater than max_dist are not computed exactly:
+            dist_abs returns float('inf') and dist returns 1.0 for them
+        min_sim : float
+            If set, similarities less than min_sim are not computed exactly:
+            sim returns 0.0 (and dist returns 1.0) for them
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_dist & min_sim parameters
 
         """
         super(Typo, self).__init__(**kwargs)
@@ -152,6 +170,8 @@ class Typo(_Distance):
         self._cost = cost
         self._layout = layout
         self._failsafe = failsafe
+        self._max_dist = max_dist
+        self._min_sim = min_sim
 
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the typo distance between two strings.
@@ -205,10 +225,51 @@ class Typo(_Distance):
         >>> cmp.dist_abs('ATCG', 'TAGC')
         2.3465735902799727
 
+        >>> cmp = Typo(max_dist=3)
+        >>> cmp.dist_abs('Niall', 'Neil')
+        2.8251407699364424
+        >>> cmp.dist_abs('Colin', 'Cuilen')
+        inf
+
 
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_dist
+
+        """
+        distance = self._bounded_dist_abs(src, tar, self._max_dist)
+        if self._max_dist is not None and distance > self._max_dist:
+            return float('inf')
+        return distance
+
+    def _bounded_dist_abs(
+        self, src: str, tar: str, bound: Optional[float]
+    ) -> float:
+        """Return the typo distance, if it is within a bound.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        bound : float or None
+            The maximum distance of interest
+
+        Returns
+        -------
+        float
+            Typo distance, or some greater value if that exceeds bound
+
+        Raises
+        ------
+        ValueError
+            char not found in any keyboard layouts
+
+
+        .. versionadded:: 0.6.0
 
         """
         ins_cost, del_cost, sub_cost, shift_cost = self._cost
@@ -321,14 +382,26 @@ class Typo(_Distance):
             'log-manhattan': _log_manhattan_keyboard_distance,
         }
 
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
+        band = (-len(src), len(tar))  # type: Optional[Tuple[int, int]]
+        if bound is None:
+            d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
+        else:
+            band = _diagonal_band(
+                len(src), len(tar), bound, ins_cost, del_cost
+            )
+            if band is None:
+                return float('inf')
+            d_mat = np_full((len(src) + 1, len(tar) + 1), np_inf)
+        band_lo, band_hi = cast(Tuple[int, int], band)
         for i in range(len(src) + 1):
             d_mat[i, 0] = i * del_cost
         for j in range(len(tar) + 1):
             d_mat[0, j] = j * ins_cost
 
         for i in range(len(src)):
-            for j in range(len(tar)):
+            for j in range(
+                max(0, i + band_lo), min(len(tar), i + band_hi + 1)
+            ):
                 d_mat[i + 1, j + 1] = min(
                     d_mat[i + 1, j] + ins_cost,  # ins
                     d_mat[i, j + 1] + del_cost,  # del
@@ -340,6 +413,11 @@ class Typo(_Distance):
                     ),  # sub/==
                 )
 
+            # Costs never decrease from one row to the next, so the
+            # computation can stop once every cell of a row exceeds the bound.
+            if bound is not None and d_mat[i + 1].min() > bound:
+                break
+
         return cast(float, d_mat[len(src), len(tar)])
 
     def dist(self, src: str, tar: str) -> float:
@@ -371,17 +449,33 @@ class Typo(_Distance):
         >>> cmp.dist('ATCG', 'TAGC')
         0.625
 
+        >>> cmp = Typo(min_sim=0.5)
+        >>> round(cmp.dist('Niall', 'Neil'), 12)
+        1.0
+        >>> cmp.dist('ATCG', 'TAGC')
+        1.0
+
 
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_dist & min_sim
 
         """
         if src == tar:
             return 0.0
         ins_cost, del_cost = self._cost[:2]
-        return self.dist_abs(src, tar) / (
-            max(len(src) * del_cost, len(tar) * ins_cost)
+        normalize_term = max(len(src) * del_cost, len(tar) * ins_cost)
+        if self._max_dist is None and self._min_sim is None:
+            return self.dist_abs(src, tar) / normalize_term
+
+        bound = _dist_bound(self._max_dist, self._min_sim, normalize_term)
+        return _bounded_dist(
+            self._bounded_dist_abs(src, tar, bound),
+            bound,
+            self._min_sim,
+            normalize_term,
         )
 
 
@@ -19,7 +19,7 @@
 Unknown G similarity
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -91,6 +91,25 @@ class UnknownG(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Unknown G similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        b = cards._src_only_card()
+        c = cards._tar_only_card()
+
+        num = 0.5 * a * (2 * a + b + c)
+        if num:
+            return num / ((a + b) * (a + c))
+        return 0.0
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Unknown G similarity of two strings.
 
@@ -122,16 +141,7 @@ class UnknownG(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        b = self._src_only_card()
-        c = self._tar_only_card()
-
-        num = 0.5 * a * (2 * a + b + c)
-        if num:
-            return num / ((a + b) * (a + c))
-        return 0.0
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@
 Unknown I similarity
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -90,6 +90,22 @@ class UnknownI(_TokenDistance):
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Unknown I similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card() + 1
+        b = cards._src_only_card() + 1
+        c = cards._tar_only_card() + 1
+
+        return 2.0 * a / (c * (a + 2.0 * b) + a * b)
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Unknown I similarity of two strings.
 
@@ -121,13 +137,7 @@ class UnknownI(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        self._tokenize(src, tar)
-
-        a = self._intersection_card() + 1
-        b = self._src_only_card() + 1
-        c = self._tar_only_card() + 1
-
-        return 2.0 * a / (c * (a + 2.0 * b) + a * b)
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
@@ -19,7 +19,15 @@
 Upholt similarity
 """
 
-from typing import Any, Counter as TCounter, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
@@ -103,6 +111,27 @@ class Upholt(_TokenDistance):
             **kwargs
         )
 
+    def _sim_cards(
+        self, src: str, tar: str, tokenize: Callable[[str, str], Any]
+    ) -> float:
+        """Return the Upholt similarity from the tokens' cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 1.0
+
+        cards = tokenize(src, tar)
+
+        a = cards._intersection_card()
+        b = cards._src_only_card()
+        c = cards._tar_only_card()
+
+        f = 2 * a / (2 * a + b + c)
+
+        return (-f + ((8 + f) * f) ** 0.5) / 2
+
     def sim(self, src: str, tar: str) -> float:
         """Return the Upholt similarity of two strings.
 
@@ -134,18 +163,7 @@ class Upholt(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 1.0
-
-        self._tokenize(src, tar)
-
-        a = self._intersection_card()
-        b = self._src_only_card()
-        c = self._tar_only_card()
-
-        f = 2 * a / (2 * a + b + c)
-
-        return (-f + ((8 + f) * f) ** 0.5) / 2
+        return self._sim_cards(src, tar, self._tokenize)
 
 
 if __name__ == '__main__':
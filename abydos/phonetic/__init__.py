@@ -91,6 +91,7 @@ Classes for which ``encode`` returns a numeric value generally have an
 ``encode_alpha`` method that returns an alphabetic version of the phonetic
 encoding, as demonstrated below:
 
+>>> from abydos.phonetic import RussellIndex
 >>> rus = RussellIndex()
 >>> rus.encode('Abramson')
 '128637'
@@ -101,50 +102,58 @@ encoding, as demonstrated below:
 
 """
 
-from ._ainsworth import Ainsworth
-from ._alpha_sis import AlphaSIS
-from ._beider_morse import BeiderMorse
-from ._caverphone import Caverphone
-from ._daitch_mokotoff import DaitchMokotoff
-from ._davidson import Davidson
-from ._dolby import Dolby
-from ._double_metaphone import DoubleMetaphone
-from ._eudex import Eudex
-from ._fonem import FONEM
-from ._fuzzy_soundex import FuzzySoundex
-from ._haase import Haase
-from ._henry_early import HenryEarly
-from ._koelner import Koelner
-from ._lein import LEIN
-from ._meta_soundex import MetaSoundex
-from ._metaphone import Metaphone
-from ._mra import MRA
-from ._norphone import Norphone
-from ._nrl import NRL
-from ._nysiis import NYSIIS
-from ._onca import ONCA
-from ._parmar_kumbharana import ParmarKumbharana
-from ._phonem import Phonem
-from ._phonet import Phonet
-from ._phonetic import _Phonetic
-from ._phonetic_spanish import PhoneticSpanish
-from ._phonex import Phonex
-from ._phonic import PHONIC
-from ._phonix import Phonix
-from ._pshp_soundex_first import PSHPSoundexFirst
-from ._pshp_soundex_last import PSHPSoundexLast
-from ._refined_soundex import RefinedSoundex
-from ._reth_schek import RethSchek
-from ._roger_root import RogerRoot
-from ._russell_index import RussellIndex
-from ._sfinx_bis import SfinxBis
-from ._sound_d import SoundD
-from ._soundex import Soundex
-from ._soundex_br import SoundexBR
-from ._spanish_metaphone import SpanishMetaphone
-from ._spfc import SPFC
-from ._statistics_canada import StatisticsCanada
-from ._waahlin import Waahlin
+import sys as _sys
+from importlib import import_module as _import_module
+from typing import Any as _Any, List as _List
+
+# The module defining each class, which is imported when the class is first
+# accessed, so that importing this package does not import every module.
+_MODULES = {
+    'Ainsworth': '_ainsworth',
+    'AlphaSIS': '_alpha_sis',
+    'BeiderMorse': '_beider_morse',
+    'Caverphone': '_caverphone',
+    'DaitchMokotoff': '_daitch_mokotoff',
+    'Davidson': '_davidson',
+    'Dolby': '_dolby',
+    'DoubleMetaphone': '_double_metaphone',
+    'Eudex': '_eudex',
+    'FONEM': '_fonem',
+    'FuzzySoundex': '_fuzzy_soundex',
+    'Haase': '_haase',
+    'HenryEarly': '_henry_early',
+    'Koelner': '_koelner',
+    'LEIN': '_lein',
+    'MetaSoundex': '_meta_soundex',
+    'Metaphone': '_metaphone',
+    'MRA': '_mra',
+    'Norphone': '_norphone',
+    'NRL': '_nrl',
+    'NYSIIS': '_nysiis',
+    'ONCA': '_onca',
+    'ParmarKumbharana': '_parmar_kumbharana',
+    'Phonem': '_phonem',
+    'Phonet': '_phonet',
+    '_Phonetic': '_phonetic',
+    'PhoneticSpanish': '_phonetic_spanish',
+    'Phonex': '_phonex',
+    'PHONIC': '_phonic',
+    'Phonix': '_phonix',
+    'PSHPSoundexFirst': '_pshp_soundex_first',
+    'PSHPSoundexLast': '_pshp_soundex_last',
+    'RefinedSoundex': '_refined_soundex',
+    'RethSchek': '_reth_schek',
+    'RogerRoot': '_roger_root',
+    'RussellIndex': '_russell_index',
+    'SfinxBis': '_sfinx_bis',
+    'SoundD': '_sound_d',
+    'Soundex': '_soundex',
+    'SoundexBR': '_soundex_br',
+    'SpanishMetaphone': '_spanish_metaphone',
+    'SPFC': '_spfc',
+    'StatisticsCanada': '_statistics_canada',
+    'Waahlin': '_waahlin',
+}
 
 __all__ = [
     '_Phonetic',
@@ -194,6 +203,39 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> _Any:
+    """Import a class from its module on first access (PEP 562).
+
+    .. versionadded:: 0.6.0
+
+    """
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        ) from None
+    value = getattr(_import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _List[str]:
+    """Return the names in the module, including those not yet imported.
+
+    .. versionadded:: 0.6.0
+
+    """
+    return sorted(set(globals()) | set(_MODULES))
+
+
+if _sys.version_info < (3, 7):  # pragma: no cover
+    # Module __getattr__ is not supported, so import every class now.
+    for _name in _MODULES:
+        __getattr__(_name)
+    del _name
+
+
 if __name__ == '__main__':
     import doctest
 
@@ -23,8 +23,8 @@
 Beider-Morse Phonetic Matching (BMPM) algorithm
 """
 
-from re import search
-from typing import Any, Optional, Tuple, Union
+from re import compile as re_compile
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 from unicodedata import normalize
 
 from ._beider_morse_data import (
@@ -121,6 +121,85 @@ _LCONTEXT_POS = 1
 _RCONTEXT_POS = 2
 _PHONETIC_POS = 3
 
+# A compiled rule: its pattern, the pattern's length, its left context (if
+# any) compiled with a trailing $, its right context (if any) compiled, and
+# its phonetic value
+_CompiledRule = Tuple[str, int, Optional[Pattern], Optional[Pattern], str]
+
+# Rule sets compiled by _compile_rules, keyed by the id of the rule tuple.
+# Each entry also holds the rule tuple, so that its id cannot be reused.
+_COMPILED_RULES = (
+    {}
+)  # type: Dict[int, Tuple[Tuple[Any, ...], Dict[str, List[_CompiledRule]]]]
+_COMPILED_CONTEXTS = {}  # type: Dict[str, Pattern]
+_COMPILED_LANGUAGE_RULES = (
+    {}
+)  # type: Dict[str, List[Tuple[Pattern, int, bool]]]
+
+
+def _compile_context(context: str) -> Pattern:
+    """Return a compiled context regex, compiling each distinct one once.
+
+    .. versionadded:: 0.6.0
+
+    """
+    try:
+        return _COMPILED_CONTEXTS[context]
+    except KeyError:
+        compiled = _COMPILED_CONTEXTS[context] = re_compile(context)
+        return compiled
+
+
+def _compile_rules(rules: Tuple[Any, ...]) -> Dict[str, List[_CompiledRule]]:
+    """Return a rule set's compiled rules, by the first letter of pattern.
+
+    A rule can only apply at a position in a term if its pattern begins with
+    the letter there, so only the rules in that letter's bucket need be
+    tried. Within each bucket, the rules keep their original order. Each rule
+    set is compiled once, when it is first used.
+
+    The contexts are compiled so that they can be matched within the term,
+    without slicing it: the right context with pattern.match(term, end),
+    which is equivalent to matching '^' + context against the rest of the
+    term, and the left context, followed by '$', with
+    pattern.search(term, 0, start).
+
+    Parameters
+    ----------
+    rules : tuple
+        A set of phonetic transform rules
+
+    Returns
+    -------
+    dict
+        The compiled rules, keyed by the first letter of their patterns
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    try:
+        return _COMPILED_RULES[id(rules)][1]
+    except KeyError:
+        pass
+
+    buckets = {}  # type: Dict[str, List[_CompiledRule]]
+    for rule in rules:
+        pattern = rule[_PATTERN_POS]
+        lcontext = rule[_LCONTEXT_POS]
+        rcontext = rule[_RCONTEXT_POS]
+        buckets.setdefault(pattern[0], []).append(
+            (
+                pattern,
+                len(pattern),
+                _compile_context(lcontext + '$') if lcontext else None,
+                _compile_context(rcontext) if rcontext else None,
+                rule[_PHONETIC_POS],
+            )
+        )
+    _COMPILED_RULES[id(rules)] = (rules, buckets)
+    return buckets
+
 
 class BeiderMorse(_Phonetic):
     """Beider-Morse Phonetic Matching.
@@ -155,14 +234,22 @@ class BeiderMorse(_Phonetic):
 
         """
         name = name.strip().lower()
-        rules = BMDATA[name_mode]['language_rules']
+        try:
+            rules = _COMPILED_LANGUAGE_RULES[name_mode]
+        except KeyError:
+            rules = _COMPILED_LANGUAGE_RULES[name_mode] = [
+                (re_compile(letters), languages, accept)
+                for letters, languages, accept in BMDATA[name_mode][
+                    'language_rules'
+                ]
+            ]
         all_langs = (
             sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages']) - 1
         )
         choices_remaining = all_langs
         for rule in rules:
             letters, languages, accept = rule
-            if search(letters, name) is not None:
+            if letters.search(name) is not None:
                 if accept:
                     choices_remaining &= languages
                 else:
@@ -341,6 +428,7 @@ class BeiderMorse(_Phonetic):
             return result
 
         term_length = len(term)
+        buckets = _compile_rules(rules)
 
         # apply language rules to map to phonetic alphabet
         phonetic = ''
@@ -350,35 +438,26 @@ class BeiderMorse(_Phonetic):
                 skip -= 1
                 continue
             found = False
-            for rule in rules:
-                pattern = rule[_PATTERN_POS]
-                pattern_length = len(pattern)
-                lcontext = rule[_LCONTEXT_POS]
-                rcontext = rule[_RCONTEXT_POS]
-
+            for rule in buckets.get(term[i], ()):
+                pattern, pattern_length, left, right, target = rule
                 # check to see if next sequence in input matches the string in
                 # the rule
-                if (pattern_length > term_length - i) or (
-                    term[i : i + pattern_length] != pattern
-                ):  # no match
+                if not term.startswith(pattern, i):  # no match
                     continue
 
-                right = '^' + rcontext
-                left = lcontext + '$'
-
                 # check that right context is satisfied
-                if rcontext != '':
-                    if not search(right, term[i + pattern_length :]):
+                if right is not None:
+                    if not right.match(term, i + pattern_length):
                         continue
 
                 # check that left context is satisfied
-                if lcontext != '':
-                    if not search(left, term[:i]):
+                if left is not None:
+                    if not left.search(term, 0, i):
                         continue
 
                 # check for incompatible attributes
                 candidate = self._apply_rule_if_compat(
-                    phonetic, rule[_PHONETIC_POS], language_arg
+                    phonetic, target, language_arg
                 )
                 # The below condition shouldn't ever be false
                 if candidate is not None:  # pragma: no branch
@@ -441,6 +520,8 @@ class BeiderMorse(_Phonetic):
         if not final_rules:
             return phonetic
 
+        buckets = _compile_rules(final_rules)
+
         # expand the result
         phonetic = self._expand_alternates(phonetic)
         phonetic_array = phonetic.split('|')
@@ -465,35 +546,28 @@ class BeiderMorse(_Phonetic):
                         i += 1
                     continue
 
-                for rule in final_rules:
-                    pattern = rule[_PATTERN_POS]
-                    pattern_length = len(pattern)
-                    lcontext = rule[_LCONTEXT_POS]
-                    rcontext = rule[_RCONTEXT_POS]
-
-                    right = '^' + rcontext
-                    left = lcontext + '$'
-
+                for rule in (
+                    buckets.get(phoneticx[i], ()) if i < len(phoneticx) else ()
+                ):
+                    pattern, pattern_length, left, right, target = rule
                     # check to see if next sequence in phonetic matches the
                     # string in the rule
-                    if (pattern_length > len(phoneticx) - i) or phoneticx[
-                        i : i + pattern_length
-                    ] != pattern:
+                    if not phoneticx.startswith(pattern, i):
                         continue
 
                     # check that right context is satisfied
-                    if rcontext != '':
-                        if not search(right, phoneticx[i + pattern_length :]):
+                    if right is not None:
+                        if not right.match(phoneticx, i + pattern_length):
                             continue
 
                     # check that left context is satisfied
-                    if lcontext != '':
-                        if not search(left, phoneticx[:i]):
+                    if left is not None:
+                        if not left.search(phoneticx, 0, i):
                             continue
 
                     # check for incompatible attributes
                     candidate = self._apply_rule_if_compat(
-                        phonetic2, rule[_PHONETIC_POS], language_arg
+                        phonetic2, target, language_arg
                     )
                     # The below condition shouldn't ever be false
                     if candidate is not None:  # pragma: no branch
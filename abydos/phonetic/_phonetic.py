@@ -20,10 +20,57 @@ The phonetic._phonetic module implements abstract class Phonetic.
 """
 
 from itertools import groupby
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from ..util._lru_cache import CacheInfo, _DBMCache, _LRUCache
 
 __all__ = ['_Phonetic']
 
 
+class _CachedEncode:
+    """A phonetic algorithm's encode method, memoized in a cache.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, phonetic: '_Phonetic', cache: Union[_LRUCache, _DBMCache]
+    ) -> None:
+        """Initialize _CachedEncode instance.
+
+        Parameters
+        ----------
+        phonetic : _Phonetic
+            The phonetic algorithm whose encode method is memoized
+        cache : _LRUCache or _DBMCache
+            The cache to hold the encodings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._encode = type(phonetic).encode.__get__(phonetic)
+        self._namespace = phonetic._config_key() + '\x00'  # noqa: SF01
+        self.cache = cache
+
+    def __call__(self, word: Any, *args: Any, **kwargs: Any) -> str:
+        """Return the encoding of a word, from the cache if possible.
+
+        Only calls with a single str argument are cached.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if args or kwargs or not isinstance(word, str):
+            return self._encode(word, *args, **kwargs)
+        key = self._namespace + word
+        code = self.cache.get(key)
+        if code is None:
+            code = self._encode(word)
+            self.cache.set(key, code)
+        return code
+
+
 class _Phonetic:
     """Abstract Phonetic class.
 
@@ -69,6 +116,152 @@ class _Phonetic:
         """
         return ''.join(char for char, _ in groupby(word))
 
+    def _config_key(self) -> str:
+        """Return a key identifying the phonetic algorithm's configuration.
+
+        Two phonetic algorithms with equal keys produce the same encodings.
+        Unlike the key of a tokenizer, this is a string, so that it can be
+        stored on disk.
+
+        Returns
+        -------
+        str
+            A key built from the algorithm's class and its attributes
+
+        Examples
+        --------
+        >>> _Phonetic()._config_key()
+        'abydos.phonetic._phonetic._Phonetic()'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+        def _param_repr(value: Any) -> str:
+            if isinstance(value, _Phonetic):
+                return value._config_key()  # noqa: SF01
+            if isinstance(value, (set, frozenset)):
+                return repr(sorted(value))
+            if isinstance(value, (list, tuple)):
+                return '({})'.format(', '.join(_param_repr(_) for _ in value))
+            if isinstance(value, dict):
+                return '{{{}}}'.format(
+                    ', '.join(
+                        '{!r}: {}'.format(key, _param_repr(val))
+                        for key, val in sorted(value.items())
+                    )
+                )
+            return repr(value)
+
+        cls = type(self)
+        return '{}.{}({})'.format(
+            cls.__module__,
+            cls.__qualname__,
+            ', '.join(
+                '{}={}'.format(name, _param_repr(value))
+                for name, value in sorted(vars(self).items())
+                if name != 'encode'
+            ),
+        )
+
+    def enable_cache(
+        self, maxsize: Optional[int] = 1024, path: Optional[str] = None
+    ) -> None:
+        """Memoize the encode method in a least-recently-used cache.
+
+        Encoding a word that is in the cache returns its cached encoding
+        without encoding it again, which greatly reduces the cost of encoding
+        data in which words repeat, especially with expensive algorithms such
+        as :py:class:`.BeiderMorse` & :py:class:`.Phonet`. The algorithm's
+        parameters should not be changed while the cache is enabled.
+
+        Parameters
+        ----------
+        maxsize : int or None
+            The maximum number of encodings to keep in memory, or None to keep
+            all encodings
+        path : str or None
+            If set, the path of a dbm database file in which encodings are
+            also stored, so that they persist between processes. Entries are
+            keyed by the algorithm's class, its parameters, and the word, so
+            a single file may be shared by several algorithms, though most
+            dbm formats permit only one of them to open it at a time.
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> pe = Soundex()
+        >>> pe.enable_cache(100)
+        >>> pe.encode('Niall'), pe.encode('Neil'), pe.encode('Niall')
+        ('N400', 'N400', 'N400')
+        >>> pe.cache_info()
+        CacheInfo(hits=1, misses=2, maxsize=100, currsize=2)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.disable_cache()
+        cache = (
+            _LRUCache(maxsize) if path is None else _DBMCache(path, maxsize)
+        )  # type: Union[_LRUCache, _DBMCache]
+        # The instance attribute shadows the class's encode method.
+        self.encode = _CachedEncode(self, cache)  # type: ignore
+
+    def disable_cache(self) -> None:
+        """Discard the encode cache, closing its database if it has one.
+
+        .. versionadded:: 0.6.0
+
+        """
+        cached = self.__dict__.pop('encode', None)
+        if isinstance(cached, _CachedEncode) and isinstance(
+            cached.cache, _DBMCache
+        ):
+            cached.cache.close()
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the encode cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the cache's hits, misses, maxsize, and currsize;
+            all are 0 if the cache is not enabled
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        cached = self.__dict__.get('encode')
+        if isinstance(cached, _CachedEncode):
+            return cached.cache.info()
+        return CacheInfo(0, 0, 0, 0)
+
+    def cache_clear(self) -> None:
+        """Discard the in-memory contents & statistics of the encode cache.
+
+        Encodings already written to a database file are kept.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        cached = self.__dict__.get('encode')
+        if isinstance(cached, _CachedEncode):
+            cached.cache.clear()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state to pickle, without the encode cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        state.pop('encode', None)
+        return state
+
     def encode(self, word: str) -> str:
         """Encode phonetically.
 
@@ -102,6 +295,39 @@ class _Phonetic:
         """
         return self.encode(word)
 
+    def encode_many(self, words: Iterable[str]) -> List[str]:
+        """Encode each of a collection of words.
+
+        Each distinct word is encoded once, so repeated words cost only a
+        lookup (as does any word already in the cache, if it is enabled).
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words to transform
+
+        Returns
+        -------
+        list
+            The encoding of each word, in order
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> Soundex().encode_many(['Niall', 'Colin', 'Neil', 'Niall'])
+        ['N400', 'C450', 'N400', 'N400']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        words = list(words)
+        encode = self.encode
+        codes = {
+            word: encode(word) for word in dict.fromkeys(words)
+        }  # type: Dict[str, str]
+        return [codes[word] for word in words]
+
 
 if __name__ == '__main__':
     import doctest
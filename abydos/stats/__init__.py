@@ -60,7 +60,7 @@ Some examples of the basic functions:
 
 
 
-Two pairwise functions are provided:
+Three pairwise functions are provided:
 
     - mean pairwise similarity (:py:func:`.mean_pairwise_similarity`), which
       returns the mean similarity (using a supplied similarity function) among
@@ -69,6 +69,12 @@ Two pairwise functions are provided:
       (:py:func:`.pairwise_similarity_statistics`), which returns the max, min,
       mean, and standard deviation of pairwise similarities between two
       collections
+    - iterated pairwise similarity statistics
+      (:py:func:`.iter_pairwise_similarity_statistics`), which yields the
+      same statistics for each consecutive block of the first collection
+
+Each of these accepts a ``workers`` argument to spread the pairwise
+comparisons across a pool of processes.
 
 The confusion table class (:py:class:`.ConfusionTable`) can be constructed in
 a number of ways:
@@ -163,10 +169,27 @@ True
 >>> str(ConfusionTable(120, 60, 20, 30))
 'tp:120, tn:60, fp:20, fn:30'
 
+The confusion curve class (:py:class:`.ConfusionCurve`) is constructed from a
+score & a label (truly positive or not) for each of a set of items, and holds
+the confusion table at every threshold on the scores at once. Each of the
+statistics of :py:class:`.ConfusionTable` is a method of the same name, which
+returns a NumPy array of the statistic at each threshold. It also has methods
+for ROC & precision-recall curves, the area under the ROC curve, the average
+precision, and the threshold maximizing a statistic:
+
+>>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+>>> curve.thresholds()
+array([0.9, 0.8, 0.7, 0.6, 0.5])
+>>> curve.recall()
+array([0.33333333, 0.66666667, 0.66666667, 1.        , 1.        ])
+>>> curve.best_threshold('f1_score')
+(0.6, 0.8571428571428571)
+
 ----
 
 """
 
+from ._confusion_curve import ConfusionCurve
 from ._confusion_table import ConfusionTable
 from ._mean import (
     aghmean,
@@ -189,10 +212,15 @@ from ._mean import (
     std,
     var,
 )
-from ._pairwise import mean_pairwise_similarity, pairwise_similarity_statistics
+from ._pairwise import (
+    iter_pairwise_similarity_statistics,
+    mean_pairwise_similarity,
+    pairwise_similarity_statistics,
+)
 
 __all__ = [
     'ConfusionTable',
+    'ConfusionCurve',
     'amean',
     'gmean',
     'hmean',
@@ -214,6 +242,7 @@ __all__ = [
     'var',
     'mean_pairwise_similarity',
     'pairwise_similarity_statistics',
+    'iter_pairwise_similarity_statistics',
 ]
 
 
@@ -0,0 +1,1072 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+r"""abydos.stats._confusion_curve.
+
+This includes the ConfusionCurve object, which holds the confusion table of a
+set of scores & labels at every threshold at once, and calculates each of the
+statistics of :py:class:`.ConfusionTable` for all thresholds as NumPy arrays,
+along with:
+
+    - ROC & precision-recall curves
+    - the area under the ROC curve & the average precision
+    - the threshold maximizing any statistic
+"""
+
+from typing import Any, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._confusion_table import ConfusionTable
+
+__all__ = ['ConfusionCurve']
+
+_Array = Union[np.ndarray, Sequence[float]]
+
+
+def _div(num: _Array, den: _Array) -> np.ndarray:
+    """Divide arrays, giving NaN where the denominator is 0.
+
+    This matches the ConfusionTable methods, which return NaN rather than
+    dividing by 0.
+
+    .. versionadded:: 0.6.0
+
+    """
+    num, den = np.broadcast_arrays(
+        np.asarray(num, dtype=float), np.asarray(den, dtype=float)
+    )
+    out = np.full(num.shape, np.nan)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+class ConfusionCurve:
+    """Confusion tables at every threshold of a set of scores.
+
+    Given a score for each of a set of items, such as the similarity of each
+    of a set of pairs, and a label for each, indicating whether it is truly
+    positive (e.g. a match), the items scoring at least a threshold are
+    predicted to be positive. A ConfusionCurve holds the confusion table at
+    each distinct score used as a threshold, computed at once from cumulative
+    counts of the items sorted by score, rather than by building a
+    :py:class:`.ConfusionTable` for each threshold.
+
+    Each statistic of :py:class:`.ConfusionTable` is provided as a method of
+    the same name & parameters, which returns an array of its value at each
+    threshold, in descending order of threshold. Where the method of
+    :py:class:`.ConfusionTable` would divide by 0 or take the logarithm of 0,
+    the value is NaN.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, scores: _Array, labels: _Array) -> None:
+        """Initialize ConfusionCurve.
+
+        Parameters
+        ----------
+        scores : array-like
+            The score of each item
+        labels : array-like
+            Whether each item is truly positive (True or 1) or negative (False
+            or 0)
+
+        Raises
+        ------
+        ValueError
+            The scores & labels are not 1-dimensional arrays of equal length,
+            or a score is NaN
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> curve.thresholds()
+        array([0.9, 0.8, 0.7, 0.6, 0.5])
+        >>> curve.true_pos()
+        array([1., 2., 2., 3., 3.])
+        >>> curve[1]
+        ConfusionTable(tp=2.0, tn=2.0, fp=0.0, fn=1.0)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        scores = np.asarray(scores, dtype=float)
+        labels = np.asarray(labels, dtype=bool)
+        if scores.ndim != 1 or scores.shape != labels.shape:
+            raise ValueError(
+                'Scores & labels must be 1-dimensional arrays of equal length.'
+            )
+        if np.isnan(scores).any():
+            raise ValueError('Scores must not be NaN.')
+
+        order = np.argsort(-scores, kind='stable')
+        scores = scores[order]
+        labels = labels[order]
+        # The last position of each distinct score in descending order
+        last = np.flatnonzero(np.diff(scores, append=-np.inf))
+
+        self._thresholds = scores[last]
+        self._tp = np.cumsum(labels, dtype=float)[last]
+        self._fp = (last + 1) - self._tp
+        self._fn = np.count_nonzero(labels) - self._tp
+        self._tn = (len(labels) - np.count_nonzero(labels)) - self._fp
+
+    def __len__(self) -> int:
+        """Return the number of thresholds.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._thresholds)
+
+    def __getitem__(self, index: int) -> ConfusionTable:
+        """Return the ConfusionTable at a threshold.
+
+        Parameters
+        ----------
+        index : int
+            The position of the threshold, in descending order
+
+        Returns
+        -------
+        ConfusionTable
+            The confusion table at the threshold
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return ConfusionTable(
+            float(self._tp[index]),
+            float(self._tn[index]),
+            float(self._fp[index]),
+            float(self._fn[index]),
+        )
+
+    def thresholds(self) -> np.ndarray:
+        """Return the thresholds.
+
+        Returns
+        -------
+        numpy.ndarray
+            The distinct scores, in descending order
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._thresholds.copy()
+
+    def true_pos(self) -> np.ndarray:
+        """Return the number of true positives at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tp.copy()
+
+    def true_neg(self) -> np.ndarray:
+        """Return the number of true negatives at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tn.copy()
+
+    def false_pos(self) -> np.ndarray:
+        """Return the number of false positives at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._fp.copy()
+
+    def false_neg(self) -> np.ndarray:
+        """Return the number of false negatives at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._fn.copy()
+
+    def correct_pop(self) -> np.ndarray:
+        """Return the correct population at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tp + self._tn
+
+    def error_pop(self) -> np.ndarray:
+        """Return the error population at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._fp + self._fn
+
+    def pred_pos_pop(self) -> np.ndarray:
+        """Return the test positive population at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tp + self._fp
+
+    def pred_neg_pop(self) -> np.ndarray:
+        """Return the test negative population at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tn + self._fn
+
+    def cond_pos_pop(self) -> np.ndarray:
+        """Return the condition positive population at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tp + self._fn
+
+    def cond_neg_pop(self) -> np.ndarray:
+        """Return the condition negative population at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._fp + self._tn
+
+    def population(self) -> np.ndarray:
+        """Return the population at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tp + self._tn + self._fp + self._fn
+
+    def precision(self) -> np.ndarray:
+        """Return the precision at each threshold.
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> curve.precision()
+        array([1.  , 1.  , 0.66666667, 0.75 , 0.6 ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._tp, self._tp + self._fp)
+
+    def precision_gain(self) -> np.ndarray:
+        """Return the gain in precision at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(
+            self.precision(), _div(self.cond_pos_pop(), self.population())
+        )
+
+    def recall(self) -> np.ndarray:
+        """Return the recall at each threshold.
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> curve.recall()
+        array([0.33333333, 0.66666667, 0.66666667, 1. , 1. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._tp, self._tp + self._fn)
+
+    def specificity(self) -> np.ndarray:
+        """Return the specificity at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._tn, self._tn + self._fp)
+
+    def fnr(self) -> np.ndarray:
+        """Return the false negative rate at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1 - self.recall()
+
+    def npv(self) -> np.ndarray:
+        """Return the negative predictive value at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._tn, self._tn + self._fn)
+
+    def false_omission_rate(self) -> np.ndarray:
+        """Return the false omission rate at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._fn, self._tn + self._fn)
+
+    def fallout(self) -> np.ndarray:
+        """Return the fall-out at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1 - self.specificity()
+
+    def pos_likelihood_ratio(self) -> np.ndarray:
+        """Return the positive likelihood ratio at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self.recall(), 1.0 - self.specificity())
+
+    def neg_likelihood_ratio(self) -> np.ndarray:
+        """Return the negative likelihood ratio at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(1.0 - self.recall(), self.specificity())
+
+    def diagnostic_odds_ratio(self) -> np.ndarray:
+        """Return the diagnostic odds ratio at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._tp * self._tn, self._fp * self._fn)
+
+    def fdr(self) -> np.ndarray:
+        """Return the false discovery rate at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._fp, self._fp + self._tp)
+
+    def accuracy(self) -> np.ndarray:
+        """Return the accuracy at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._tp + self._tn, self.population())
+
+    def accuracy_gain(self) -> np.ndarray:
+        """Return the gain in accuracy at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        random_accuracy = (
+            _div(self.cond_pos_pop(), self.population()) ** 2
+            + _div(self.cond_neg_pop(), self.population()) ** 2
+        )
+        return _div(self.accuracy(), random_accuracy)
+
+    def balanced_accuracy(self) -> np.ndarray:
+        """Return the balanced accuracy at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 0.5 * (self.recall() + self.specificity())
+
+    def error_rate(self) -> np.ndarray:
+        """Return the error rate at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(
+            self._fn + self._fp, self._fn + self._fp + self._tn + self._tp
+        )
+
+    def prevalence(self) -> np.ndarray:
+        """Return the prevalence at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self.cond_pos_pop(), self.population())
+
+    def informedness(self) -> np.ndarray:
+        """Return the informedness at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.recall() + self.specificity() - 1
+
+    def markedness(self) -> np.ndarray:
+        """Return the markedness at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.precision() + self.npv() - 1
+
+    def pr_amean(self) -> np.ndarray:
+        """Return the arithmetic mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (self.precision() + self.recall()) / 2
+
+    def pr_gmean(self) -> np.ndarray:
+        """Return the geometric mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (self.precision() * self.recall()) ** (1 / 2)
+
+    def pr_hmean(self) -> np.ndarray:
+        """Return the harmonic mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        precision = self.precision()
+        recall = self.recall()
+        return np.where(
+            precision == recall,
+            precision,
+            np.where(
+                (precision == 0) | (recall == 0),
+                0.0,
+                _div(2, _div(1.0, precision) + _div(1.0, recall)),
+            ),
+        )
+
+    def pr_qmean(self) -> np.ndarray:
+        """Return the quadratic mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return ((self.precision() ** 2 + self.recall() ** 2) / 2) ** 0.5
+
+    def pr_cmean(self) -> np.ndarray:
+        """Return the contraharmonic mean of precision & recall.
+
+        .. versionadded:: 0.6.0
+
+        """
+        precision = self.precision()
+        recall = self.recall()
+        return _div(precision ** 2 + recall ** 2, precision + recall)
+
+    def pr_lmean(self) -> np.ndarray:
+        """Return the logarithmic mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        precision = self.precision()
+        recall = self.recall()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_diff = np.log(precision) - np.log(recall)
+        return np.where(
+            (precision == 0) | (recall == 0),
+            0.0,
+            np.where(
+                precision == recall,
+                precision,
+                _div(precision - recall, log_diff),
+            ),
+        )
+
+    def pr_imean(self) -> np.ndarray:
+        """Return the identric mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        high = np.fmax(self.precision(), self.recall())
+        low = np.fmin(self.precision(), self.recall())
+        valid = (low > 0) & (high > low)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            mean = (1 / np.e) * (high ** high / low ** low) ** _div(
+                1, high - low
+            )
+        return np.where(
+            valid, mean, np.where((low > 0) & (high == low), low, np.nan)
+        )
+
+    def pr_seiffert_mean(self) -> np.ndarray:
+        """Return Seiffert's mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        precision = self.precision()
+        recall = self.recall()
+        with np.errstate(invalid='ignore'):
+            arcsin = np.arcsin(_div(precision - recall, precision + recall))
+        return np.where(
+            precision == recall, np.nan, _div(precision - recall, 2 * arcsin),
+        )
+
+    def pr_lehmer_mean(self, exp: float = 2.0) -> np.ndarray:
+        """Return the Lehmer mean of precision & recall at each threshold.
+
+        Parameters
+        ----------
+        exp : float
+            The exponent of the Lehmer mean
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        precision = self.precision()
+        recall = self.recall()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _div(
+                precision ** exp + recall ** exp,
+                precision ** (exp - 1) + recall ** (exp - 1),
+            )
+
+    def pr_heronian_mean(self) -> np.ndarray:
+        """Return the Heronian mean of precision & recall at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        precision = self.precision()
+        recall = self.recall()
+        cross = np.where(
+            precision == recall, precision, (precision * recall) ** 0.5
+        )
+        return (precision + cross + recall) * 2 / 6
+
+    def pr_hoelder_mean(self, exp: float = 2.0) -> np.ndarray:
+        """Return the Hölder mean of precision & recall at each threshold.
+
+        Parameters
+        ----------
+        exp : float
+            The exponent of the Hölder mean
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if exp == 0:
+            return self.pr_gmean()
+        with np.errstate(divide='ignore'):
+            return (
+                (1 / 2) * (self.precision() ** exp + self.recall() ** exp)
+            ) ** (1 / exp)
+
+    def pr_agmean(self) -> np.ndarray:
+        """Return the arithmetic-geometric mean of precision & recall.
+
+        The means at all thresholds are iterated together until each
+        converges.
+
+        .. versionadded:: 0.6.0
+
+        """
+        m_a = self.pr_amean()
+        m_g = self.pr_gmean()
+        active = ~(np.isnan(m_a) | np.isnan(m_g))
+        while True:
+            active &= np.round(m_a, 12) != np.round(m_g, 12)
+            if not active.any():
+                return m_a
+            m_a[active], m_g[active] = (
+                (m_a[active] + m_g[active]) / 2,
+                (m_a[active] * m_g[active]) ** (1 / 2),
+            )
+
+    def pr_ghmean(self) -> np.ndarray:
+        """Return the geometric-harmonic mean of precision & recall.
+
+        The means at all thresholds are iterated together until each
+        converges.
+
+        .. versionadded:: 0.6.0
+
+        """
+        m_g = self.pr_gmean()
+        m_h = self.pr_hmean()
+        invalid = np.isnan(m_g) | np.isnan(m_h)
+        active = ~invalid
+        while True:
+            active &= np.round(m_h, 12) != np.round(m_g, 12)
+            if not active.any():
+                return np.where(invalid, np.nan, m_g)
+            m_g[active], m_h[active] = (
+                (m_g[active] * m_h[active]) ** (1 / 2),
+                _div(2 * m_g[active] * m_h[active], m_g[active] + m_h[active]),
+            )
+
+    def pr_aghmean(self) -> np.ndarray:
+        """Return the arithmetic-geometric-harmonic mean of precision & recall.
+
+        The means at all thresholds are iterated together until each
+        converges.
+
+        .. versionadded:: 0.6.0
+
+        """
+        m_a = self.pr_amean()
+        m_g = self.pr_gmean()
+        m_h = self.pr_hmean()
+        invalid = np.isnan(m_a) | np.isnan(m_g) | np.isnan(m_h)
+        active = ~invalid
+        while True:
+            active &= (np.round(m_a, 12) != np.round(m_g, 12)) & (
+                np.round(m_g, 12) != np.round(m_h, 12)
+            )
+            if not active.any():
+                return np.where(invalid, np.nan, m_a)
+            m_a[active], m_g[active], m_h[active] = (
+                (m_a[active] + m_g[active] + m_h[active]) / 3,
+                (m_a[active] * m_g[active] * m_h[active]) ** (1 / 3),
+                _div(
+                    3,
+                    _div(1, m_a[active])
+                    + _div(1, m_g[active])
+                    + _div(1, m_h[active]),
+                ),
+            )
+
+    def fbeta_score(self, beta: float = 1.0) -> np.ndarray:
+        """Return the :math:`F_{\\beta}` score at each threshold.
+
+        Parameters
+        ----------
+        beta : float
+            The :math:`\\beta` parameter in the above formula
+
+        Raises
+        ------
+        AttributeError
+            Beta must be a positive real value.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if beta <= 0.0:
+            raise AttributeError('Beta must be a positive real value.')
+        precision = self.precision()
+        recall = self.recall()
+        return _div(
+            (1.0 + beta ** 2) * precision * recall,
+            (beta ** 2 * precision) + recall,
+        )
+
+    def f2_score(self) -> np.ndarray:
+        """Return the :math:`F_{2}` score at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.fbeta_score(2.0)
+
+    def fhalf_score(self) -> np.ndarray:
+        """Return the :math:`F_{0.5}` score at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.fbeta_score(0.5)
+
+    def e_score(self, beta: float = 1.0) -> np.ndarray:
+        """Return the :math:`E`-score at each threshold.
+
+        Parameters
+        ----------
+        beta : float
+            The :math:`\\beta` parameter of the :math:`F_{\\beta}` score
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.fbeta_score(beta)
+
+    def f1_score(self) -> np.ndarray:
+        """Return the :math:`F_{1}` score at each threshold.
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> curve.f1_score()
+        array([0.5 , 0.8 , 0.66666667, 0.85714286, 0.75 ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.fbeta_score(1.0)
+
+    def jaccard(self) -> np.ndarray:
+        """Return the Jaccard index at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self._tp, self._tp + self._fp + self._fn)
+
+    def d_measure(self) -> np.ndarray:
+        """Return the D-measure at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - _div(
+            1.0, _div(1.0, self.precision()) + _div(1.0, self.recall()) - 1.0,
+        )
+
+    def mcc(self) -> np.ndarray:
+        """Return the Matthews correlation coefficient at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(
+            (self._tp * self._tn) - (self._fp * self._fn),
+            np.sqrt(
+                (self._tp + self._fp)
+                * (self._tp + self._fn)
+                * (self._tn + self._fp)
+                * (self._tn + self._fn)
+            ),
+        )
+
+    def significance(self) -> np.ndarray:
+        """Return the significance, :math:`\\chi^{2}`, at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(
+            (self._tp * self._tn - self._fp * self._fn) ** 2
+            * (self._tp + self._tn + self._fp + self._fn),
+            (self._tp + self._fp)
+            * (self._tp + self._fn)
+            * (self._tn + self._fp)
+            * (self._tn + self._fn),
+        )
+
+    def kappa_statistic(self) -> np.ndarray:
+        """Return the κ statistic at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        random_accuracy = _div(
+            (self._tn + self._fp) * (self._tn + self._fn)
+            + (self._fn + self._tp) * (self._fp + self._tp),
+            self.population() ** 2,
+        )
+        return _div(self.accuracy() - random_accuracy, 1 - random_accuracy)
+
+    def phi_coefficient(self) -> np.ndarray:
+        """Return the φ coefficient at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(
+            (self._tp * self._tn) - (self._fp * self._fn),
+            (
+                (self._tp + self._fn)
+                * (self._tp + self._fp)
+                * (self._tn + self._fn)
+                * (self._tn + self._fp)
+            )
+            ** 0.5,
+        )
+
+    def _entropy(self, *counts: np.ndarray) -> np.ndarray:
+        """Return the entropy of counts, or NaN where any count is 0.
+
+        .. versionadded:: 0.6.0
+
+        """
+        population = self.population()
+        valid = np.logical_and.reduce([count > 0 for count in counts])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(
+                valid,
+                np.log(population)
+                - sum(count * np.log(count) for count in counts) / population,
+                np.nan,
+            )
+
+    def joint_entropy(self) -> np.ndarray:
+        """Return the joint entropy at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._entropy(self._tp, self._tn, self._fp, self._fn)
+
+    def actual_entropy(self) -> np.ndarray:
+        """Return the actual entropy at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._entropy(self.cond_pos_pop(), self.cond_neg_pop())
+
+    def predicted_entropy(self) -> np.ndarray:
+        """Return the predicted entropy at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._entropy(self.pred_pos_pop(), self.pred_neg_pop())
+
+    def mutual_information(self) -> np.ndarray:
+        """Return the mutual information at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        population = self.population()
+        terms = (
+            (self._fp, self.cond_neg_pop() * self.pred_pos_pop()),
+            (self._fn, self.cond_pos_pop() * self.pred_neg_pop()),
+            (self._tn, self.cond_neg_pop() * self.pred_neg_pop()),
+            (self._tp, self.cond_pos_pop() * self.pred_pos_pop()),
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            total = sum(
+                count * np.log(_div(population * count, expected))
+                for count, expected in terms
+            )
+            # The logarithm of 0 is undefined, as is that of 0 / 0.
+            valid = np.logical_and.reduce(
+                [(count > 0) & (expected > 0) for count, expected in terms]
+            )
+        return np.where(valid, _div(total, population), np.nan)
+
+    def proficiency(self) -> np.ndarray:
+        """Return the proficiency at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self.mutual_information(), self.actual_entropy())
+
+    def igr(self) -> np.ndarray:
+        """Return the information gain ratio at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self.mutual_information(), self.predicted_entropy())
+
+    def dependency(self) -> np.ndarray:
+        """Return the dependency at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(self.mutual_information(), self.joint_entropy())
+
+    def lift(self) -> np.ndarray:
+        """Return the lift at each threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _div(
+            self._tp * self.population(),
+            self.pred_pos_pop() * self.cond_pos_pop(),
+        )
+
+    def roc_curve(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the receiver operating characteristic (ROC) curve.
+
+        Returns
+        -------
+        tuple
+            The false positive rate (fall-out) & the true positive rate
+            (recall) at each threshold, & the thresholds, each preceded by the
+            point at which no item is predicted positive, whose threshold is
+            infinity
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> fpr, tpr, thresholds = curve.roc_curve()
+        >>> fpr
+        array([0. , 0. , 0. , 0.5, 0.5, 1. ])
+        >>> tpr
+        array([0. , 0.33333333, 0.66666667, 0.66666667, 1. , 1. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            np.concatenate(([0.0], self.fallout())),
+            np.concatenate(([0.0], self.recall())),
+            np.concatenate(([np.inf], self._thresholds)),
+        )
+
+    def pr_curve(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the precision-recall curve.
+
+        Returns
+        -------
+        tuple
+            The precision & recall at each threshold, & the thresholds, in
+            descending order of threshold (so, ascending order of recall)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.precision(), self.recall(), self.thresholds()
+
+    def roc_auc(self) -> float:
+        """Return the area under the ROC curve.
+
+        This is the probability that a randomly chosen positive item scores
+        higher than a randomly chosen negative item (counting ties as half).
+
+        Returns
+        -------
+        float
+            The area under the ROC curve, or NaN if there are no positive or no
+            negative items
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> curve.roc_auc()
+        0.8333333333333333
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not len(self) or not self._tp[-1] or not self._fp[-1]:
+            return float('nan')
+        fpr, tpr, _ = self.roc_curve()
+        return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+    def average_precision(self) -> float:
+        """Return the average precision.
+
+        This is the mean of the precision at each threshold, weighted by the
+        increase in recall from the previous threshold.
+
+        Returns
+        -------
+        float
+            The average precision, or NaN if there are no positive items
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> curve.average_precision()
+        0.9166666666666666
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not len(self) or not self._tp[-1]:
+            return float('nan')
+        recall = self.recall()
+        return float(np.sum(np.diff(recall, prepend=0.0) * self.precision()))
+
+    def best_threshold(
+        self, metric: str = 'f1_score', *args: Any, **kwargs: Any
+    ) -> Tuple[float, float]:
+        """Return the threshold maximizing a statistic.
+
+        Parameters
+        ----------
+        metric : str
+            The name of the statistic to maximize, such as ``f1_score`` or
+            ``mcc``
+        *args
+            Positional arguments of the statistic's method
+        **kwargs
+            Keyword arguments of the statistic's method
+
+        Returns
+        -------
+        tuple
+            The threshold at which the statistic is greatest & the statistic
+            at that threshold; the highest such threshold if there are several
+
+        Raises
+        ------
+        ValueError
+            The metric is not a statistic of ConfusionTable, or it is NaN at
+            every threshold
+
+        Examples
+        --------
+        >>> curve = ConfusionCurve([0.9, 0.8, 0.7, 0.6, 0.5], [1, 1, 0, 1, 0])
+        >>> curve.best_threshold()
+        (0.6, 0.8571428571428571)
+        >>> curve.best_threshold('fbeta_score', beta=0.5)
+        (0.8, 0.9090909090909091)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if (
+            metric.startswith('_')
+            or metric in {'to_tuple', 'to_dict'}
+            or not callable(getattr(ConfusionTable, metric, None))
+        ):
+            raise ValueError(
+                '{!r} is not a statistic of ConfusionTable.'.format(metric)
+            )
+        values = getattr(self, metric)(*args, **kwargs)
+        if np.isnan(values).all():
+            raise ValueError(
+                '{} is undefined at every threshold.'.format(metric)
+            )
+        best = int(np.nanargmax(values))
+        return float(self._thresholds[best]), float(values[best])
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
@@ -19,12 +19,230 @@
 The stats._pairwise module implements pairwise statistical algorithms.
 """
 
-from typing import Callable, Optional, Sequence, Set, Tuple, Union, cast
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from math import ceil
+from os import cpu_count
+from typing import (
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 from ._mean import amean, hmean, std
+from ..distance._distance import _Distance
 from ..distance._levenshtein import Levenshtein
 
-__all__ = ['mean_pairwise_similarity', 'pairwise_similarity_statistics']
+__all__ = [
+    'iter_pairwise_similarity_statistics',
+    'mean_pairwise_similarity',
+    'pairwise_similarity_statistics',
+]
+
+
+def _metric_matrix(
+    metric: Callable[[str, str], float],
+    src_collection: List[str],
+    tar_collection: Optional[List[str]] = None,
+    upper: bool = False,
+) -> np.ndarray:
+    """Return the matrix of metric values between two collections.
+
+    If metric is the sim or dist method of a _Distance instance, the
+    instance's matrix method is used so that any per-batch setup is shared
+    across all comparisons. Otherwise, metric is called on each pair.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+    src_collection : list
+        A collection of terms
+    tar_collection : list or None
+        A collection of terms, or None to compare src_collection with itself
+    upper : bool
+        If True and tar_collection is None, only the values above the main
+        diagonal are calculated
+
+    Returns
+    -------
+    numpy.ndarray
+        The matrix of metric values
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    measure = getattr(metric, '__self__', None)
+    name = getattr(metric, '__name__', None)
+    if isinstance(measure, _Distance) and name in {'sim', 'dist'}:
+        return cast(
+            np.ndarray,
+            getattr(measure, name + '_matrix')(
+                src_collection, tar_collection, upper
+            ),
+        )
+
+    if tar_collection is None:
+        tar_collection = src_collection
+    else:
+        upper = False
+    matrix = np.full(
+        (len(src_collection), len(tar_collection)), np.nan, dtype=float
+    )
+    for i, src in enumerate(src_collection):
+        for j in range(i + 1 if upper else 0, len(tar_collection)):
+            matrix[i, j] = metric(src, tar_collection[j])
+    return matrix
+
+
+def _block_matrix(
+    metric: Callable[[str, str], float],
+    src_block: List[str],
+    tar_collection: List[str],
+    offset: int = 0,
+    upper: bool = False,
+    symmetric: bool = False,
+) -> np.ndarray:
+    """Return the matrix of metric values for a block of source rows.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+    src_block : list
+        A block of consecutive terms from the source collection
+    tar_collection : list
+        A collection of terms
+    offset : int
+        The index of the first member of src_block in the source collection
+    upper : bool
+        If True, the source collection is tar_collection and only the values
+        above the main diagonal are calculated
+    symmetric : bool
+        If True, the values in the reverse direction are stacked along a
+        third axis
+
+    Returns
+    -------
+    numpy.ndarray
+        The matrix of metric values for the block
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if upper:
+        matrix = np.full(
+            (len(src_block), len(tar_collection)), np.nan, dtype=float
+        )
+        stop = offset + len(src_block)
+        matrix[:, offset:stop] = _metric_matrix(metric, src_block, upper=True)
+        matrix[:, stop:] = _metric_matrix(
+            metric, src_block, tar_collection[stop:]
+        )
+        return matrix
+
+    matrix = _metric_matrix(metric, src_block, tar_collection)
+    if symmetric:
+        # Interleave each value with its reverse-direction counterpart.
+        matrix = np.stack(
+            (matrix, _metric_matrix(metric, tar_collection, src_block).T),
+            axis=-1,
+        )
+    return matrix
+
+
+def _iter_blocks(
+    metric: Callable[[str, str], float],
+    src_collection: List[str],
+    tar_collection: List[str],
+    upper: bool = False,
+    symmetric: bool = False,
+    workers: Optional[int] = 1,
+    block_size: Optional[int] = None,
+) -> Iterator[np.ndarray]:
+    """Yield the matrices of metric values for each block of source rows.
+
+    Blocks are yielded in order, whether they are calculated serially or by
+    a pool of worker processes. In the latter case, the metric must be
+    picklable and at most two blocks per worker are held pending at once.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+    src_collection : list
+        A collection of terms
+    tar_collection : list
+        A collection of terms
+    upper : bool
+        If True, src_collection is tar_collection and only the values above
+        the main diagonal are calculated
+    symmetric : bool
+        If True, the values in the reverse direction are stacked along a
+        third axis
+    workers : int or None
+        The number of worker processes, or None to use one per CPU
+    block_size : int or None
+        The number of source rows in each block. If None, the rows are
+        divided into four blocks per worker.
+
+    Yields
+    ------
+    numpy.ndarray
+        The matrix of metric values for each block
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if workers is None:
+        workers = cpu_count() or 1
+    if block_size is None:
+        block_size = ceil(len(src_collection) / (4 * workers))
+    block_size = max(1, block_size)
+    starts = range(0, len(src_collection), block_size)
+
+    if workers <= 1:
+        for start in starts:
+            yield _block_matrix(
+                metric,
+                src_collection[start : start + block_size],
+                tar_collection,
+                start,
+                upper,
+                symmetric,
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()  # type: Deque[Future[np.ndarray]]
+        for start in starts:
+            pending.append(
+                executor.submit(
+                    _block_matrix,
+                    metric,
+                    src_collection[start : start + block_size],
+                    tar_collection,
+                    start,
+                    upper,
+                    symmetric,
+                )
+            )
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def mean_pairwise_similarity(
@@ -32,6 +250,8 @@ def mean_pairwise_similarity(
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = hmean,
     symmetric: bool = False,
+    workers: Optional[int] = 1,
+    block_size: Optional[int] = None,
 ) -> float:
     """Calculate the mean pairwise similarity of a collection of strings.
 
@@ -50,6 +270,13 @@ def mean_pairwise_similarity(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    workers : int or None
+        The number of worker processes to calculate similarities in, or None
+        to use one per CPU. When more than 1, the metric must be picklable,
+        e.g. the sim method of a distance measure instance.
+    block_size : int or None
+        The number of rows of pairwise similarities calculated in each task
+        (by default, the collection is divided into four blocks per worker)
 
     Returns
     -------
@@ -76,6 +303,8 @@ def mean_pairwise_similarity(
     0.545454545455
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.6.0
+        Added workers & block_size parameters
 
     """
     if metric is None:
@@ -94,15 +323,28 @@ def mean_pairwise_similarity(
 
     collection = list(collection)
 
-    pairwise_values = []
-
-    for i in range(len(collection)):
-        for j in range(i + 1, len(collection)):
-            pairwise_values.append(metric(collection[i], collection[j]))
-            if symmetric:
-                pairwise_values.append(metric(collection[j], collection[i]))
+    matrix = np.vstack(
+        tuple(
+            _iter_blocks(
+                metric,
+                collection,
+                collection,
+                upper=not symmetric,
+                workers=workers,
+                block_size=block_size,
+            )
+        )
+    )
+    above = np.triu_indices(len(collection), 1)
+    if symmetric:
+        # Interleave each value with its reverse-direction counterpart.
+        pairwise_values = np.empty(2 * len(above[0]), dtype=float)
+        pairwise_values[0::2] = matrix[above]
+        pairwise_values[1::2] = matrix.T[above]
+    else:
+        pairwise_values = matrix[above]
 
-    return mean_func(pairwise_values)
+    return mean_func(pairwise_values.tolist())
 
 
 def pairwise_similarity_statistics(
@@ -111,6 +353,8 @@ def pairwise_similarity_statistics(
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = amean,
     symmetric: bool = False,
+    workers: Optional[int] = 1,
+    block_size: Optional[int] = None,
 ) -> Tuple[float, float, float, float]:
     """Calculate the pairwise similarity statistics a collection of strings.
 
@@ -132,6 +376,13 @@ def pairwise_similarity_statistics(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    workers : int or None
+        The number of worker processes to calculate similarities in, or None
+        to use one per CPU. When more than 1, the metric must be picklable,
+        e.g. the sim method of a distance measure instance.
+    block_size : int or None
+        The number of members of src_collection compared in each task (by
+        default, src_collection is divided into four blocks per worker)
 
     Returns
     -------
@@ -156,6 +407,129 @@ def pairwise_similarity_statistics(
     (0.2, 0.0, 0.118614718615, 0.075070477184)
 
     .. versionadded:: 0.3.0
+    .. versionchanged:: 0.6.0
+        Added workers & block_size parameters
+
+    """
+    metric, src_collection, tar_collection = _check_statistics_args(
+        src_collection, tar_collection, metric, mean_func
+    )
+
+    pairwise_values = (
+        np.vstack(
+            tuple(
+                _iter_blocks(
+                    metric,
+                    src_collection,
+                    tar_collection,
+                    symmetric=symmetric,
+                    workers=workers,
+                    block_size=block_size,
+                )
+            )
+        )
+        .ravel()
+        .tolist()
+    )
+
+    return _statistics(pairwise_values, mean_func)
+
+
+def iter_pairwise_similarity_statistics(
+    src_collection: Union[Sequence[str], Set[str]],
+    tar_collection: Union[Sequence[str], Set[str]],
+    metric: Optional[Callable[[str, str], float]] = None,
+    mean_func: Callable[[Sequence[float]], float] = amean,
+    symmetric: bool = False,
+    workers: Optional[int] = 1,
+    block_size: int = 1000,
+) -> Iterator[Tuple[float, float, float, float]]:
+    """Yield the pairwise similarity statistics of each block of a collection.
+
+    Like :py:func:`.pairwise_similarity_statistics`, but src_collection is
+    divided into consecutive blocks of block_size members and the statistics
+    of each block's similarities to tar_collection are yielded in turn, so
+    that only a few blocks of similarities are held in memory at once.
+
+    Parameters
+    ----------
+    src_collection : list
+        A collection of terms or a string that can be split
+    tar_collection : list
+        A collection of terms or a string that can be split
+    metric : function
+        A similarity metric function
+    mean_func : function
+        A mean function that takes a list of values and returns a float
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions
+    workers : int or None
+        The number of worker processes to calculate similarities in, or None
+        to use one per CPU. When more than 1, the metric must be picklable,
+        e.g. the sim method of a distance measure instance.
+    block_size : int
+        The number of members of src_collection in each block
+
+    Yields
+    ------
+    tuple
+        The max, min, mean, and standard deviation of similarities of each
+        block
+
+    Raises
+    ------
+    ValueError
+        mean_func must be a function
+    ValueError
+        metric must be a function
+    ValueError
+        src_collection is neither a string nor iterable
+    ValueError
+        tar_collection is neither a string nor iterable
+
+    Example
+    -------
+    >>> for stats in iter_pairwise_similarity_statistics(
+    ... ['Christopher', 'Kristof', 'Christobal'], ['Niall', 'Neal', 'Neil'],
+    ... block_size=2):
+    ...     print(tuple(round(_, 12) for _ in stats))
+    (0.142857142857, 0.0, 0.077922077922, 0.059039747606)
+    (0.2, 0.2, 0.2, 0.0)
+
+    .. versionadded:: 0.6.0
+
+    """
+    metric, src_collection, tar_collection = _check_statistics_args(
+        src_collection, tar_collection, metric, mean_func
+    )
+
+    for block in _iter_blocks(
+        metric,
+        src_collection,
+        tar_collection,
+        symmetric=symmetric,
+        workers=workers,
+        block_size=block_size,
+    ):
+        yield _statistics(block.ravel().tolist(), mean_func)
+
+
+def _check_statistics_args(
+    src_collection: Union[Sequence[str], Set[str]],
+    tar_collection: Union[Sequence[str], Set[str]],
+    metric: Optional[Callable[[str, str], float]],
+    mean_func: Callable[[Sequence[float]], float],
+) -> Tuple[Callable[[str, str], float], List[str], List[str]]:
+    """Check the arguments of the pairwise similarity statistics functions.
+
+    Returns
+    -------
+    tuple
+        The metric and the source & target collections as lists
+
+
+    .. versionadded:: 0.6.0
 
     """
     if metric is None:
@@ -175,22 +549,22 @@ def pairwise_similarity_statistics(
     if not hasattr(tar_collection, '__iter__'):
         raise ValueError('tar_collection is neither a string nor iterable')
 
-    src_collection = list(src_collection)
-    tar_collection = list(tar_collection)
+    return metric, list(src_collection), list(tar_collection)
 
-    pairwise_values = []
 
-    for src in src_collection:
-        for tar in tar_collection:
-            pairwise_values.append(metric(src, tar))
-            if symmetric:
-                pairwise_values.append(metric(tar, src))
+def _statistics(
+    values: List[float], mean_func: Callable[[Sequence[float]], float]
+) -> Tuple[float, float, float, float]:
+    """Return the max, min, mean, and standard deviation of values.
+
+    .. versionadded:: 0.6.0
 
+    """
     return (
-        max(pairwise_values),
-        min(pairwise_values),
-        mean_func(pairwise_values),
-        std(pairwise_values, mean_func, 0),
+        max(values),
+        min(values),
+        mean_func(values),
+        std(values, mean_func, 0),
     )
 
 
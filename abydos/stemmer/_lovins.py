@@ -19,10 +19,11 @@
 Lovins stemmer.
 """
 
-from typing import Callable, Dict, Optional, Tuple, Union, cast
+from typing import Callable, Dict, Optional, Tuple, Union
 from unicodedata import normalize
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['Lovins']
 
@@ -1171,6 +1172,14 @@ class Lovins(_Stemmer):
             ('yz', 'ys'),
         )
 
+        # Both sets of endings are sought in a single walk from the end of
+        # each word; recodings are identified by their positions in
+        # _recode, since they are applied in order.
+        self._suffix_trie = _SuffixTrie(self._suffix)
+        self._recode_trie = _SuffixTrie(
+            (ending, pos) for pos, (ending, _) in enumerate(self._recode)
+        )
+
     def stem(self, word: str) -> str:
         """Return Lovins stem.
 
@@ -1203,18 +1212,12 @@ class Lovins(_Stemmer):
         # lowercase, normalize, and compose
         word = normalize('NFC', word.lower())
 
-        for suffix_len in range(11, 0, -1):
-            ending = word[-suffix_len:]
-            if (
-                ending in self._suffix
-                and len(word) - suffix_len >= 2
-                and (
-                    self._suffix[ending] is None
-                    or cast(Callable[[str, int], bool], self._suffix[ending])(
-                        word, suffix_len
-                    )
-                )
-            ):
+        # Try the longest suffix leaving a stem of at least 2 characters
+        # whose condition is met.
+        for suffix_len, cond in reversed(
+            self._suffix_trie.matches(word, min_stem=2)
+        ):
+            if cond is None or cond(word, suffix_len):
                 word = word[:-suffix_len]
                 break
 
@@ -1232,12 +1235,24 @@ class Lovins(_Stemmer):
         }:
             word = word[:-1]
 
-        for ending, replacement in self._recode:
-            if word.endswith(ending):
-                if callable(replacement):
-                    word = replacement(word)
-                else:
-                    word = word[: -len(ending)] + replacement
+        # Apply each recoding whose ending matches the word as recoded by the
+        # recodings before it.
+        pos = 0
+        while True:
+            positions = [
+                rule_pos
+                for _, rule_pos in self._recode_trie.matches(word)
+                if rule_pos >= pos
+            ]
+            if not positions:
+                break
+            pos = min(positions)
+            ending, replacement = self._recode[pos]
+            if callable(replacement):
+                word = replacement(word)
+            else:
+                word = word[: -len(ending)] + replacement
+            pos += 1
 
         return word
 
@@ -22,6 +22,7 @@ Paice-Husk Stemmer
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['PaiceHusk']
 
@@ -165,6 +166,14 @@ class PaiceHusk(_Stemmer):
         },
     }  # type: Dict[int, Dict[str, Tuple[Tuple[bool, int, Optional[str], bool], ...]]]  # noqa: E501
 
+    # The rules of every suffix length, sought in a single walk from the end
+    # of each word
+    _rule_trie = _SuffixTrie(
+        (suffix, rules)
+        for table in _rule_table.values()
+        for suffix, rules in table.items()
+    )
+
     def _has_vowel(self, word: str) -> bool:
         for char in word:
             if char in {'a', 'e', 'i', 'o', 'u', 'y'}:
@@ -236,18 +245,18 @@ class PaiceHusk(_Stemmer):
         terminate = False
         intact = True
         while not terminate:
-            for n in range(6, 0, -1):
-                if word[-n:] in self._rule_table[n]:
-                    accept = False
-                    for rule in self._rule_table[n][word[-n:]]:
-                        (word, accept, intact, terminate,) = self._apply_rule(
-                            word, rule, intact, terminate
-                        )
-                        if accept:
-                            break
-
+            # Try the rules of the longest matching suffix first.
+            for _, rules in reversed(self._rule_trie.matches(word)):
+                accept = False
+                for rule in rules:
+                    (word, accept, intact, terminate,) = self._apply_rule(
+                        word, rule, intact, terminate
+                    )
                     if accept:
                         break
+
+                if accept:
+                    break
             else:
                 break
 
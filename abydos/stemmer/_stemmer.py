@@ -19,6 +19,10 @@
 abstract class _Stemmer
 """
 
+from typing import Dict, Iterable, List, Optional
+
+from ..util._lru_cache import CacheInfo, _LRUCache
+
 __all__ = ['_Stemmer']
 
 
@@ -28,6 +32,9 @@ class _Stemmer:
     .. versionadded:: 0.3.6
     """
 
+    # The number of stems kept in the cache of stem_many
+    _stem_cache_size = 4096  # type: Optional[int]
+
     def stem(self, word: str) -> str:
         """Return stem.
 
@@ -47,6 +54,82 @@ class _Stemmer:
         """
         return word
 
+    def stem_many(self, words: Iterable[str]) -> List[str]:
+        """Return the stem of each of a collection of words.
+
+        Each distinct word is stemmed once, and the stems of the most
+        recently stemmed words are kept in a least-recently-used cache, so
+        that words that recur, within a collection or across calls, are only
+        looked up. The stemmer's parameters should not be changed once this
+        has been called.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words to stem
+
+        Returns
+        -------
+        list
+            The stem of each word, in order
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter
+        >>> stmr = Porter()
+        >>> stmr.stem_many(['reading', 'readings', 'reading'])
+        ['read', 'read', 'read']
+        >>> stmr.stem_many(['reading', 'trusted'])
+        ['read', 'trust']
+        >>> stmr.cache_info()
+        CacheInfo(hits=1, misses=3, maxsize=4096, currsize=3)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        cache = self.__dict__.get('_stem_cache')
+        if cache is None:
+            cache = self._stem_cache = _LRUCache(self._stem_cache_size)
+        words = list(words)
+        stem = self.stem
+        stems = {}  # type: Dict[str, str]
+        for word in dict.fromkeys(words):
+            word_stem = cache.get(word)
+            if word_stem is None:
+                word_stem = stem(word)
+                cache.set(word, word_stem)
+            stems[word] = word_stem
+        return [stems[word] for word in words]
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the stem_many cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the cache's hits, misses, maxsize, and currsize;
+            all are 0 if stem_many has not been called
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        cache = self.__dict__.get('_stem_cache')
+        if cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return cache.info()
+
+    def cache_clear(self) -> None:
+        """Discard the contents & statistics of the stem_many cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        cache = self.__dict__.get('_stem_cache')
+        if cache is not None:
+            cache.clear()
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,153 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.stemmer._suffix_trie.
+
+The stemmer._suffix_trie module defines _SuffixTrie, a trie of reversed
+suffixes, which finds every suffix of a word that has a rule in a single walk
+from the end of the word, rather than by slicing off & looking up each
+possible ending in turn.
+
+This class is not intended for use by users.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
+
+__all__ = []  # type: List[str]
+
+# The key under which a node holds the value of the suffix ending there; as it
+# is not a single character, it cannot collide with the key of a child node.
+_VALUE = ''
+
+
+class _SuffixTrie:
+    """A trie of reversed suffixes, each with a value.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        suffixes: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]] = (),
+    ) -> None:
+        """Initialize _SuffixTrie instance.
+
+        Parameters
+        ----------
+        suffixes : Mapping or Iterable
+            A mapping of suffixes to values, or an iterable of (suffix,
+            value) pairs
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie({'s': 1, 'es': 2, 'ies': 3})
+        >>> len(trie)
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._root = {}  # type: Dict[str, Any]
+        self._size = 0
+        if isinstance(suffixes, Mapping):
+            suffixes = suffixes.items()
+        for suffix, value in suffixes:
+            self.insert(suffix, value)
+
+    def __len__(self) -> int:
+        """Return the number of suffixes in the trie.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._size
+
+    def insert(self, suffix: str, value: Any) -> None:
+        """Add a suffix to the trie, replacing its value if present.
+
+        Parameters
+        ----------
+        suffix : str
+            The suffix to add
+        value : Any
+            The value of the suffix
+
+        Raises
+        ------
+        ValueError
+            The suffix is empty
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not suffix:
+            raise ValueError('Suffixes must not be empty.')
+        node = self._root
+        for char in reversed(suffix):
+            node = node.setdefault(char, {})
+        if _VALUE not in node:
+            self._size += 1
+        node[_VALUE] = value
+
+    def matches(self, word: str, min_stem: int = 0) -> List[Tuple[int, Any]]:
+        """Return the suffixes of a word that are in the trie.
+
+        Parameters
+        ----------
+        word : str
+            The word whose suffixes are sought
+        min_stem : int
+            The minimum number of characters that must precede a suffix
+
+        Returns
+        -------
+        list
+            The length & value of each suffix of the word in the trie, from
+            shortest to longest
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie({'s': 1, 'es': 2, 'ies': 3})
+        >>> trie.matches('flies')
+        [(1, 1), (2, 2), (3, 3)]
+        >>> trie.matches('flies', min_stem=3)
+        [(1, 1), (2, 2)]
+        >>> trie.matches('fly')
+        []
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        found = []
+        node = self._root
+        length = 0
+        for char in reversed(word[min_stem:]):
+            node = node.get(char)
+            if node is None:
+                break
+            length += 1
+            if _VALUE in node:
+                found.append((length, node[_VALUE]))
+        return found
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
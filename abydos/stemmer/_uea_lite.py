@@ -23,6 +23,7 @@ from re import match as re_match
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['UEALite']
 
@@ -609,6 +610,17 @@ class UEALite(_Stemmer):
         'Perl': _perl_rule_table,
     }  # type: Dict[str, Dict[int, Dict[str, Tuple[float, int, Optional[str]]]]]
 
+    # The rules of each variant, sought in a single walk from the end of
+    # each word
+    _rule_tries = {
+        var: _SuffixTrie(
+            (suffix, rule)
+            for table in rule_table.values()
+            for suffix, rule in table.items()
+        )
+        for var, rule_table in _rules.items()
+    }  # type: Dict[str, _SuffixTrie]
+
     def __init__(
         self,
         max_word_length: int = 20,
@@ -778,18 +790,16 @@ class UEALite(_Stemmer):
                 ):
                     return word, 97
 
-            for n in range(7, 1, -1):
-                if word[-n:] in self._rules[self._var][n]:
-                    rule_no, del_len, add_str = self._rules[self._var][n][
-                        word[-n:]
-                    ]
-                    if del_len:
-                        stemmed_word = word[:-del_len]
-                    else:
-                        stemmed_word = word
-                    if add_str:
-                        stemmed_word += add_str
-                    break
+            matches = self._rule_tries[self._var].matches(word)
+            if matches:
+                # Apply the rule of the longest matching suffix.
+                rule_no, del_len, add_str = matches[-1][1]
+                if del_len:
+                    stemmed_word = word[:-del_len]
+                else:
+                    stemmed_word = word
+                if add_str:
+                    stemmed_word += add_str
 
             if not rule_no:
                 if re_match(r'.*\w\wings?$', word):  # rule 58
@@ -83,6 +83,13 @@ Finally, an NLTK tokenizer is provided:
     - :py:class:`.NLTKTokenizer` does tokenization using an instantiated NLTK
       tokenizer. Accordingly, NLTK_ needs to be installed.
 
+The tokens of a string may also be retrieved as a :py:class:`.TokenProfile`,
+a Counter that stores its cardinality and other values needed by the
+token-based distance measures, so that a string compared many times need only
+be tokenized and summarized once. Where many token sets must be stored, a
+:py:class:`.Vocabulary` can map tokens to integer ids, so that the tokens of a
+string can be retrieved as compact, sorted :py:class:`.TokenIds` arrays.
+
 .. _SyllabiPy: https://pypi.org/project/syllabipy/
 .. _NLTK: https://www.nltk.org/
 
@@ -101,8 +108,11 @@ from ._q_skipgrams import QSkipgrams
 from ._regexp import RegexpTokenizer
 from ._saps import SAPSTokenizer
 from ._sonoripy import SonoriPyTokenizer
+from ._token_ids import TokenIds
+from ._token_profile import TokenProfile
 from ._tokenizer import _Tokenizer
 from ._vc_cluster import VCClusterTokenizer
+from ._vocabulary import Vocabulary
 from ._whitespace import WhitespaceTokenizer
 from ._wordpunct import WordpunctTokenizer
 
@@ -121,6 +131,9 @@ __all__ = [
     'SonoriPyTokenizer',
     'LegaliPyTokenizer',
     'NLTKTokenizer',
+    'TokenProfile',
+    'TokenIds',
+    'Vocabulary',
 ]
 
 
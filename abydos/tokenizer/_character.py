@@ -19,7 +19,7 @@
 Character tokenizer
 """
 
-from typing import Callable, Optional, Union
+from typing import Callable, Iterator, Optional, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -80,6 +80,14 @@ class CharacterTokenizer(_Tokenizer):
         self._scale_and_counterize()
         return self
 
+    def _grams(self, string: str) -> Iterator[str]:
+        """Return an iterator of the characters of a string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return iter(string)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,13 +19,28 @@
 QGrams multi-set class
 """
 
-from collections import Iterable
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from collections import Counter, Iterable
+from itertools import chain
+from typing import (
+    Callable,
+    Counter as TCounter,
+    Iterable as TIterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 from ._tokenizer import _Tokenizer
 
 __all__ = ['QGrams']
 
+# The multiplier of the polynomial hash of q-grams (the 64-bit FNV prime)
+_HASH_BASE = np.uint64(0x100000001B3)
+
 
 class QGrams(_Tokenizer):
     """A q-gram class, which functions like a bag/multiset.
@@ -135,6 +150,88 @@ class QGrams(_Tokenizer):
 
         self._string_ss = self._string
 
+    def _sizes(self, string: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield the size, step, & padded string of each kind of q-gram.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Yields
+        ------
+        tuple
+            Each valid q-gram length, the distance between the characters of
+            its q-grams (1 more than the skip), and the string padded with
+            start & stop symbols for that length
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not string:
+            return
+        qvals = self.qval if hasattr(self.qval, '__iter__') else (self.qval,)
+        skips = self.skip if hasattr(self.skip, '__iter__') else (self.skip,)
+        for qval_i in cast(TIterable[int], qvals):
+            if qval_i < 1:
+                continue
+            if self.start_stop:
+                padded = (
+                    self.start_stop[0] * (qval_i - 1)
+                    + string
+                    + self.start_stop[-1] * (qval_i - 1)
+                )
+            else:
+                padded = string
+            if qval_i > 1 and len(padded) < qval_i:
+                continue
+            for skip_i in cast(TIterable[int], skips):
+                yield qval_i, skip_i + 1, padded
+
+    @staticmethod
+    def _slices(padded: str, qval_i: int, step: int) -> Iterator[str]:
+        """Return an iterator of the q-grams of one size & step.
+
+        Near the end of the string, q-grams with skips are truncated.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if qval_i == 1:
+            return iter(padded)
+        # Q-grams lying wholly within the string are joined from the
+        # characters of staggered copies of it, which is faster than slicing;
+        # the remaining q-grams are truncated by their skips.
+        full_end = max(len(padded) - (qval_i - 1) * step, 0)
+        grams = map(
+            ''.join,
+            zip(*(padded[pos:] for pos in range(0, qval_i * step, step))),
+        )  # type: Iterator[str]
+        if full_end < len(padded) - (qval_i - 1):
+            grams = chain(
+                grams,
+                (
+                    padded[i : i + qval_i * step : step]
+                    for i in range(full_end, len(padded) - (qval_i - 1))
+                ),
+            )
+        return grams
+
+    def _grams(self, string: str) -> Iterator[str]:
+        """Return an iterator of the q-grams of a string.
+
+        The q-grams of every size & skip are generated lazily, in the order
+        in which tokenize stores them.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return chain.from_iterable(
+            self._slices(padded, qval_i, step)
+            for qval_i, step, padded in self._sizes(string)
+        )
+
     def tokenize(self, string: str) -> 'QGrams':
         """Tokenize the term and store it.
 
@@ -158,38 +255,105 @@ class QGrams(_Tokenizer):
         if not isinstance(self.skip, Iterable):
             self.skip = (self.skip,)
 
-        if string:
-            for qval_i in cast(TIterable[int], self.qval):
-                for skip_i in cast(TIterable[int], self.skip):
-                    if qval_i < 1:
-                        continue
-
-                    if self.start_stop:
-                        string = (
-                            self.start_stop[0] * (qval_i - 1)
-                            + self._string
-                            + self.start_stop[-1] * (qval_i - 1)
-                        )
-                    else:
-                        string = self._string
-
-                    if qval_i > 1 and len(string) < qval_i:
-                        continue
-
-                    # Having appended start & stop symbols (or not), save the
-                    # result, but only for the longest valid qval_i
-                    if len(string) > len(self._string_ss):
-                        self._string_ss = string
-
-                    skip_i += 1
-                    self._ordered_tokens += [
-                        string[i : i + (qval_i * skip_i) : skip_i]
-                        for i in range(len(string) - (qval_i - 1))
-                    ]
+        for qval_i, step, padded in self._sizes(string):
+            # Having appended start & stop symbols (or not), save the
+            # result, but only for the longest valid qval_i
+            if len(padded) > len(self._string_ss):
+                self._string_ss = padded
+            self._ordered_tokens += self._slices(padded, qval_i, step)
 
         self._scale_and_counterize()
         return self
 
+    def hashes(self, string: str) -> TCounter[int]:
+        """Return the hash codes of the q-grams of a string as a Counter.
+
+        Each q-gram is represented by a 64-bit polynomial hash of its length
+        & its characters' code points, which, unlike Python's hash of
+        strings, is the same in every process. The codes of all q-grams of
+        one size & skip are computed together as a rolling hash over the
+        string's code points, without building the q-grams themselves, which
+        is faster than tokenizing long strings. Like :py:meth:`tokens`, this
+        leaves the tokenizer unchanged.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The Counter of q-gram hash codes
+
+        Raises
+        ------
+        ValueError
+            The scaler depends on the q-grams themselves
+
+        Examples
+        --------
+        >>> qg = QGrams()
+        >>> codes = qg.hashes('AATTATAT')
+        >>> sorted(codes.values())
+        [1, 1, 1, 1, 2, 3]
+        >>> codes[qg.hash_code('AT')]
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler in self._token_scalers:
+            raise ValueError(
+                'Hash codes cannot be scaled by {!r}.'.format(self._scaler)
+            )
+        counts = Counter()  # type: TCounter[int]
+        for qval_i, step, padded in self._sizes(string):
+            points = np.frombuffer(
+                padded.encode('utf-32-le'), dtype=np.uint32
+            ).astype(np.uint64)
+            # Q-grams starting before full_end lie wholly within the string;
+            # those after are truncated by their skips.
+            full_end = max(len(padded) - (qval_i - 1) * step, 0)
+            codes = np.full(full_end, qval_i, dtype=np.uint64)
+            for pos in range(0, qval_i * step, step):
+                codes = codes * _HASH_BASE + points[pos : pos + full_end]
+            counts.update(codes.tolist())
+            counts.update(
+                self.hash_code(padded[i : i + qval_i * step : step])
+                for i in range(full_end, len(padded) - (qval_i - 1))
+            )
+        return cast(TCounter[int], self._scale_counts(counts))
+
+    @staticmethod
+    def hash_code(gram: str) -> int:
+        """Return the hash code of a q-gram, as used by hashes.
+
+        Parameters
+        ----------
+        gram : str
+            The q-gram to hash
+
+        Returns
+        -------
+        int
+            The 64-bit polynomial hash of its length & characters
+
+        Examples
+        --------
+        >>> QGrams.hash_code('AT')
+        1984618488542489
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        code = len(gram)
+        for char in gram:
+            code = (code * int(_HASH_BASE) + ord(char)) & 0xFFFFFFFFFFFFFFFF
+        return code
+
 
 if __name__ == '__main__':
     import doctest
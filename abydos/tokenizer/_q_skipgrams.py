@@ -20,8 +20,16 @@ Q-Skipgrams multi-set class
 """
 
 from collections import Iterable
-from itertools import combinations
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from itertools import chain, combinations
+from typing import (
+    Callable,
+    Iterable as TIterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ._tokenizer import _Tokenizer
 
@@ -154,6 +162,55 @@ class QSkipgrams(_Tokenizer):
         else:
             self._lambda = tuple(ssk_lambda)
 
+    def _sizes(self, string: str) -> Iterator[Tuple[int, str]]:
+        """Yield the size & padded string of each kind of q-skipgram.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Yields
+        ------
+        tuple
+            Each valid q-skipgram length & the string padded with start &
+            stop symbols for that length
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        qvals = self.qval if hasattr(self.qval, '__iter__') else (self.qval,)
+        for qval_i in cast(TIterable[int], qvals):
+            if qval_i < 1:
+                continue
+            if self.start_stop and string:
+                padded = (
+                    self.start_stop[0] * (qval_i - 1)
+                    + string
+                    + self.start_stop[-1] * (qval_i - 1)
+                )
+            else:
+                padded = string
+            if len(padded) < qval_i:
+                continue
+            yield qval_i, padded
+
+    def _grams(self, string: str) -> Iterator[str]:
+        """Return an iterator of the q-skipgrams of a string.
+
+        The q-skipgrams of every size are joined from the combinations of the
+        string's characters lazily, in the order in which tokenize stores
+        them.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return chain.from_iterable(
+            map(''.join, combinations(padded, qval_i))
+            for qval_i, padded in self._sizes(string)
+        )
+
     def tokenize(self, string: str) -> 'QSkipgrams':
         """Tokenize the term and store it.
 
@@ -176,31 +233,17 @@ class QSkipgrams(_Tokenizer):
         if not isinstance(self.qval, Iterable):
             self.qval = (self.qval,)
 
-        for qval_i in cast(TIterable[int], self.qval):
-            if qval_i < 1:
-                continue
-
-            if self.start_stop and self._string:
-                string = (
-                    self.start_stop[0] * (qval_i - 1)
-                    + self._string
-                    + self.start_stop[-1] * (qval_i - 1)
-                )
-            else:
-                string = self._string
-
-            if len(string) < qval_i:
-                continue
-
+        for qval_i, padded in self._sizes(string):
             # Having appended start & stop symbols (or not), save the
             # result, but only for the longest valid qval_i
-            if len(string) > len(self._string_ss):
-                self._string_ss = string
-
-            combs = list(combinations(enumerate(string), qval_i))
-            self._ordered_tokens += [''.join(l[1] for l in t) for t in combs]
+            if len(padded) > len(self._string_ss):
+                self._string_ss = padded
 
             if self._scaler == 'SSK':
+                combs = list(combinations(enumerate(padded), qval_i))
+                self._ordered_tokens += [
+                    ''.join(l[1] for l in t) for t in combs
+                ]
                 self._ordered_weights += [
                     sum(
                         l ** (t[-1][0] - t[0][0] + len(t) - 1)
@@ -209,7 +252,13 @@ class QSkipgrams(_Tokenizer):
                     for t in combs
                 ]
             else:
-                self._ordered_weights += [1] * len(combs)
+                count = len(self._ordered_tokens)
+                self._ordered_tokens += map(
+                    ''.join, combinations(padded, qval_i)
+                )
+                self._ordered_weights += [1] * (
+                    len(self._ordered_tokens) - count
+                )
 
         self._scale_and_counterize()
         return self
@@ -20,7 +20,7 @@ Regexp tokenizer
 """
 import re
 
-from typing import Callable, Optional, Union
+from typing import Callable, Iterator, Optional, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -100,6 +100,14 @@ class RegexpTokenizer(_Tokenizer):
         self._scale_and_counterize()
         return self
 
+    def _grams(self, string: str) -> Iterator[str]:
+        """Return an iterator of the matches of the regexp in a string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return iter(self._regexp.findall(string))
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,229 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._token_ids.
+
+TokenIds class
+"""
+
+from array import array
+from typing import TYPE_CHECKING, Counter as TCounter, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._vocabulary import Vocabulary  # noqa: F401
+
+__all__ = ['TokenIds']
+
+
+class TokenIds:
+    """Token ids.
+
+    TokenIds are a compact form of a Counter of tokens, in which each token is
+    replaced by its integer id in a :py:class:`.Vocabulary`. The ids are held
+    in ascending order in an array('I'), alongside an array of their counts,
+    so that the intersection of two TokenIds can be found by merging their
+    ids. Both arrays support the buffer protocol, so they can be viewed as
+    NumPy arrays without copying.
+
+    Like a :py:class:`.TokenProfile`, TokenIds can be passed to the
+    token-based distance measures in place of a string.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = ('ids', 'counts', 'vocabulary', 'cardinality', 'exact')
+
+    # Below this combined length, merging in Python is faster than calling
+    # into NumPy.
+    _numpy_threshold = 64
+
+    def __init__(
+        self, ids: array, counts: array, vocabulary: Optional['Vocabulary']
+    ) -> None:
+        """Initialize TokenIds instance.
+
+        Parameters
+        ----------
+        ids : array
+            The token ids, in ascending order, as an array('I')
+        counts : array
+            The count of each token, as an array('I') if all counts are
+            non-negative integers, else as an array('d')
+        vocabulary : Vocabulary or None
+            The vocabulary that the ids belong to
+
+        Examples
+        --------
+        >>> from array import array
+        >>> tids = TokenIds(array('I', [0, 2]), array('I', [2, 1]), None)
+        >>> tids.cardinality
+        3
+        >>> len(tids)
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.ids = ids
+        self.counts = counts
+        self.vocabulary = vocabulary
+        self.cardinality = sum(abs(val) for val in counts)  # type: float
+        self.exact = counts.typecode == 'I' and (
+            not counts or min(counts) > 0
+        )  # type: bool
+
+    def __len__(self) -> int:
+        """Return the number of distinct tokens.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self.ids)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if other has the same ids, counts, & vocabulary.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(other, TokenIds):
+            return NotImplemented
+        return (
+            self.vocabulary is other.vocabulary
+            and self.ids == other.ids
+            and list(self.counts) == list(other.counts)
+        )
+
+    def __repr__(self) -> str:
+        """Return a representation of the TokenIds.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 'TokenIds({!r}, {!r})'.format(self.ids, self.counts)
+
+    def to_counter(self) -> TCounter[str]:
+        """Return the tokens as a Counter object.
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens
+
+        Raises
+        ------
+        ValueError
+            The TokenIds have no vocabulary
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import QGrams, Vocabulary
+        >>> vocab = Vocabulary()
+        >>> QGrams().tokenize('NELSON').get_ids(vocab).to_counter()
+        Counter({'$N': 1, 'NE': 1, 'EL': 1, 'LS': 1, 'SO': 1, 'ON': 1,
+        'N#': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.vocabulary is None:
+            raise ValueError('TokenIds without a vocabulary cannot be decoded')
+        return self.vocabulary.decode(self)
+
+    def overlap(self, other: 'TokenIds') -> Tuple[float, int]:
+        """Return the size of the intersection with other TokenIds.
+
+        Parameters
+        ----------
+        other : TokenIds
+            The TokenIds to intersect with, which must use the same vocabulary
+
+        Returns
+        -------
+        tuple
+            The cardinality of the (multiset) intersection of the tokens and
+            the number of distinct tokens it contains
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import QGrams, Vocabulary
+        >>> vocab = Vocabulary()
+        >>> nelson = QGrams().tokenize('NELSON').get_ids(vocab)
+        >>> neilsen = QGrams().tokenize('NEILSEN').get_ids(vocab)
+        >>> nelson.overlap(neilsen)
+        (4, 4)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ids_a, counts_a = self.ids, self.counts
+        ids_b, counts_b = other.ids, other.counts
+
+        if len(ids_a) + len(ids_b) >= self._numpy_threshold:
+            _, idx_a, idx_b = np.intersect1d(
+                np.frombuffer(ids_a, dtype=ids_a.typecode),
+                np.frombuffer(ids_b, dtype=ids_b.typecode),
+                assume_unique=True,
+                return_indices=True,
+            )
+            shared = np.minimum(
+                np.frombuffer(counts_a, dtype=counts_a.typecode)[idx_a],
+                np.frombuffer(counts_b, dtype=counts_b.typecode)[idx_b],
+            )
+            shared = shared[shared > 0]
+            return shared.sum().item(), len(shared)
+
+        if (
+            self.exact
+            and other.exact
+            and self.cardinality == len(ids_a)
+            and other.cardinality == len(ids_b)
+        ):
+            # Every count is 1, so the intersection is a set intersection.
+            common = len(set(ids_a).intersection(ids_b))
+            return common, common
+
+        card = 0  # type: float
+        common = 0
+        pos_a = pos_b = 0
+        len_a = len(ids_a)
+        len_b = len(ids_b)
+        while pos_a < len_a and pos_b < len_b:
+            id_a = ids_a[pos_a]
+            id_b = ids_b[pos_b]
+            if id_a < id_b:
+                pos_a += 1
+            elif id_a > id_b:
+                pos_b += 1
+            else:
+                shared = min(counts_a[pos_a], counts_b[pos_b])
+                if shared > 0:
+                    card += shared
+                    common += 1
+                pos_a += 1
+                pos_b += 1
+        return card, common
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
@@ -0,0 +1,148 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._token_profile.
+
+TokenProfile class
+"""
+
+from typing import Any, Counter as TCounter, Optional, Tuple
+
+__all__ = ['TokenProfile']
+
+
+class TokenProfile(TCounter[str]):
+    """Token profile.
+
+    A token profile is a Counter of tokens that also stores summary values
+    computed once, when it is created, so that they need not be recomputed
+    each time the profile is compared. Since the token-based distance measures
+    accept Counters in place of strings, a profile can be passed to any of
+    them in place of the string it was made from.
+
+    A profile should not be modified after it is created.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize TokenProfile instance.
+
+        Parameters
+        ----------
+        *args
+            Arguments, as for Counter (e.g. a mapping of tokens to counts or
+            an iterable of tokens)
+        **kwargs
+            Arbitrary keyword arguments, as for Counter
+
+        Examples
+        --------
+        >>> profile = TokenProfile({'$N': 1, 'Ni': 1, 'ia': 1, 'al': 1,
+        ... 'll': 1, 'l#': 1})
+        >>> profile.cardinality
+        6
+        >>> profile.squared_norm
+        6
+        >>> TokenProfile('aab')
+        TokenProfile({'a': 2, 'b': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(TokenProfile, self).__init__(*args, **kwargs)
+        self.cardinality = sum(
+            abs(val) for val in self.values()
+        )  # type: float
+        self.squared_norm = sum(
+            val * val for val in self.values()
+        )  # type: float
+        self._ids = None  # type: Optional[Tuple[str, ...]]
+        # With positive integral counts, cardinalities of Counter operations
+        # can be derived arithmetically from those of the operands without
+        # any change in the result.
+        self.exact = all(
+            isinstance(val, int) and val > 0 for val in self.values()
+        )  # type: bool
+
+    @property
+    def ids(self) -> Tuple[str, ...]:
+        """Return the distinct tokens of the profile in sorted order.
+
+        Returns
+        -------
+        tuple
+            The sorted tokens
+
+        Examples
+        --------
+        >>> TokenProfile({'$N': 1, 'Ni': 1, 'ia': 1, 'al': 1, 'll': 1}).ids
+        ('$N', 'Ni', 'al', 'ia', 'll')
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._ids is None:
+            self._ids = tuple(sorted(self))
+        return self._ids
+
+    def overlap(self, other: TCounter[str]) -> Tuple[float, int]:
+        """Return the size of the intersection with another Counter.
+
+        Only the smaller of the two is traversed, and no intersection Counter
+        is built.
+
+        Parameters
+        ----------
+        other : Counter
+            The Counter to intersect with
+
+        Returns
+        -------
+        tuple
+            The cardinality of the (multiset) intersection, as for the Counter
+            produced by self & other, and the number of distinct tokens it
+            contains
+
+        Examples
+        --------
+        >>> TokenProfile('aabc').overlap(TokenProfile('abbd'))
+        (2, 2)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        small, large = (
+            (self, other) if len(self) <= len(other) else (other, self)
+        )
+        card = 0  # type: float
+        common = 0
+        for token, count in small.items():
+            if token in large:
+                shared = min(count, large[token])
+                if shared > 0:
+                    card += shared
+                    common += 1
+        return card, common
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -26,6 +26,8 @@ from typing import (
     Callable,
     Counter as TCounter,
     DefaultDict,
+    Hashable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -33,6 +35,10 @@ from typing import (
     cast,
 )
 
+from ._token_ids import TokenIds
+from ._token_profile import TokenProfile
+from ._vocabulary import Vocabulary
+
 __all__ = ['_Tokenizer']
 
 
@@ -42,6 +48,22 @@ class _Tokenizer:
     .. versionadded:: 0.4.0
     """
 
+    # Attributes holding the most recently tokenized string & its tokens,
+    # rather than the tokenizer's configuration
+    _state_attrs = frozenset(
+        {
+            '_string',
+            '_string_ss',
+            '_tokens',
+            '_ordered_tokens',
+            '_ordered_weights',
+        }
+    )
+
+    # Scalers whose weights depend on the tokens themselves, rather than on
+    # their counts alone
+    _token_scalers = frozenset({'SSK', 'length', 'length-log', 'length-exp'})
+
     def __init__(
         self,
         scaler: Optional[Union[str, Callable[[float], float]]] = None,
@@ -113,7 +135,7 @@ class _Tokenizer:
         .. versionadded:: 0.6.0
 
         """
-        if self._scaler in {'SSK', 'length', 'length-log', 'length-exp'}:
+        if self._scaler in self._token_scalers:
             self._tokens = defaultdict(float)
             if cast(str, self._scaler)[:6] == 'length':
                 self._ordered_weights = [len(_) for _ in self._ordered_tokens]
@@ -213,6 +235,192 @@ class _Tokenizer:
         else:
             return Counter(self._tokens)
 
+    def get_profile(self) -> TokenProfile:
+        """Return the tokens as a TokenProfile object.
+
+        Returns
+        -------
+        TokenProfile
+            The TokenProfile of tokens
+
+        Examples
+        --------
+        >>> tok = _Tokenizer().tokenize('term')
+        >>> tok.get_profile()
+        TokenProfile({'term': 1})
+        >>> tok.get_profile().cardinality
+        1
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return TokenProfile(self.get_counter())
+
+    def tokens(self, string: str) -> TCounter[str]:
+        """Return the tokens of a string as a Counter object.
+
+        Unlike :py:meth:`tokenize`, this leaves the tokenizer unchanged, so
+        that one tokenizer may be used by several threads at once. Tokenizers
+        that generate their tokens lazily (QGrams, QSkipgrams, and the
+        character, regexp, & cluster tokenizers) count them directly, without
+        storing them in order or changing any state, unless their scaler is
+        'SSK'. Other tokenizers tokenize the string with a shallow copy of
+        themselves.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens
+
+        Examples
+        --------
+        >>> tok = _Tokenizer()
+        >>> tok.tokens('term')
+        Counter({'term': 1})
+        >>> tok.get_counter()
+        Counter()
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler != 'SSK':
+            grams = self._grams(string)
+            if grams is not None:
+                if self._scaler in self._token_scalers:
+                    return self._weigh_by_length(grams)
+                return self._scale_counts(Counter(grams))
+        return self._copy().tokenize(string).get_counter()
+
+    def _grams(self, string: str) -> Optional[Iterator[str]]:
+        """Return an iterator of the tokens of a string, if supported.
+
+        Tokenizers that can generate the tokens of a string without changing
+        their state override this to yield them in the order in which
+        tokenize stores them. By default, this returns None.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return None
+
+    def _weigh_by_length(self, grams: Iterator[str]) -> TCounter[str]:
+        """Return tokens weighted as the length scalers weigh them.
+
+        Weights are summed in the order of the tokens, as tokenize sums them.
+
+        .. versionadded:: 0.6.0
+
+        """
+        weights = Counter()  # type: TCounter[str]
+        for token in grams:
+            if self._scaler == 'length':
+                weights[token] += float(len(token))
+            elif self._scaler == 'length-log':
+                weights[token] += log1p(len(token))
+            else:
+                weights[token] += exp(len(token))
+        return weights
+
+    def _scale_counts(self, counts: TCounter[Hashable]) -> TCounter[Hashable]:
+        """Return token counts scaled as get_counter would scale them.
+
+        The scalers that depend on the tokens themselves, rather than on
+        their counts, are not supported.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler == 'set':
+            return Counter(dict.fromkeys(counts, 1))
+        elif self._scaler == 'entropy':
+            n = sum(counts.values())
+            return Counter(
+                {
+                    key: -(val / n) * log2(val / n)
+                    for key, val in counts.items()
+                }
+            )
+        elif callable(self._scaler):
+            return Counter(
+                {key: self._scaler(val) for key, val in counts.items()}
+            )
+        return counts
+
+    def profile(self, string: str) -> TokenProfile:
+        """Return the tokens of a string as a TokenProfile object.
+
+        Like :py:meth:`tokens`, this leaves the tokenizer unchanged.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        TokenProfile
+            The TokenProfile of tokens
+
+        Examples
+        --------
+        >>> _Tokenizer().profile('term')
+        TokenProfile({'term': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return TokenProfile(self.tokens(string))
+
+    def _copy(self) -> '_Tokenizer':
+        """Return a shallow copy of the tokenizer.
+
+        Since tokenize replaces, rather than modifies, the attributes holding
+        the string & its tokens, a shallow copy may tokenize a string without
+        affecting the original.
+
+        .. versionadded:: 0.6.0
+
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    def get_ids(self, vocabulary: Vocabulary) -> TokenIds:
+        """Return the tokens as TokenIds from a Vocabulary.
+
+        Parameters
+        ----------
+        vocabulary : Vocabulary
+            The vocabulary to intern the tokens in
+
+        Returns
+        -------
+        TokenIds
+            The sorted ids & counts of the tokens
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import Vocabulary
+        >>> vocab = Vocabulary()
+        >>> _Tokenizer().tokenize('term').get_ids(vocab)
+        TokenIds(array('I', [0]), array('I', [1]))
+        >>> _Tokenizer().tokenize('terms').get_ids(vocab)
+        TokenIds(array('I', [1]), array('I', [1]))
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return vocabulary.encode(self.get_counter())
+
     def get_set(self) -> Set[str]:
         """Return the unique tokens as a set.
 
@@ -253,6 +461,57 @@ class _Tokenizer:
         """
         return self._ordered_tokens
 
+    def _config_key(self) -> Hashable:
+        """Return a hashable key identifying the tokenizer's configuration.
+
+        Two tokenizers with equal keys produce the same tokens from the same
+        string.
+
+        Returns
+        -------
+        Hashable
+            A key built from the tokenizer's class and its attributes, other
+            than those holding the most recently tokenized string
+
+        Examples
+        --------
+        >>> _Tokenizer()._config_key() == _Tokenizer()._config_key()
+        True
+        >>> _Tokenizer()._config_key() == _Tokenizer('set')._config_key()
+        False
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+        def _hashable(value: Any) -> Hashable:
+            if isinstance(value, (set, frozenset)):
+                return frozenset(_hashable(_) for _ in value)
+            if isinstance(value, (list, tuple)):
+                # Tokenizers such as QGrams store a scalar parameter as a
+                # 1-tuple once they have tokenized a string.
+                if len(value) == 1:
+                    return _hashable(value[0])
+                return tuple(_hashable(_) for _ in value)
+            if isinstance(value, dict):
+                return frozenset(
+                    (key, _hashable(val)) for key, val in value.items()
+                )
+            try:
+                hash(value)
+            except TypeError:
+                return repr(value)
+            return value
+
+        return (type(self),) + tuple(
+            sorted(
+                (name, _hashable(value))
+                for name, value in vars(self).items()
+                if name not in self._state_attrs
+            )
+        )
+
     def __repr__(self) -> str:
         """Return representation of tokens object.
 
@@ -28,7 +28,7 @@ to vowel transition marks the start of a new token.
 import re
 import unicodedata
 
-from typing import Callable, Optional, Set, Union
+from typing import Callable, Iterator, Optional, Set, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -110,14 +110,23 @@ class VCClusterTokenizer(_Tokenizer):
 
         """
         self._string = string
-        self._ordered_tokens = []
-        token_list = self._regexp.findall(self._string)
-        for token in token_list:
+        self._ordered_tokens = list(self._grams(string))
+
+        self._scale_and_counterize()
+        return self
+
+    def _grams(self, string: str) -> Iterator[str]:
+        """Return an iterator of the V*C* clusters of a string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        for token in self._regexp.findall(string):
             if (
                 token[0] not in self._consonants
                 and token[0] not in self._vowels
             ):
-                self._ordered_tokens.append(token)
+                yield unicodedata.normalize('NFC', token)
             else:
                 token = unicodedata.normalize('NFD', token)
                 mode = 0  # 0 = starting mode, 1 = cons, 2 = vowels
@@ -128,7 +137,7 @@ class VCClusterTokenizer(_Tokenizer):
                         mode = 1
                     elif char in self._vowels:
                         if mode == 1:
-                            self._ordered_tokens.append(new_token)
+                            yield unicodedata.normalize('NFC', new_token)
                             new_token = char
                         else:
                             new_token += char
@@ -136,14 +145,7 @@ class VCClusterTokenizer(_Tokenizer):
                     else:  # This should cover combining marks, marks, etc.
                         new_token += char
 
-                self._ordered_tokens.append(new_token)
-
-        self._ordered_tokens = [
-            unicodedata.normalize('NFC', token)
-            for token in self._ordered_tokens
-        ]
-        self._scale_and_counterize()
-        return self
+                yield unicodedata.normalize('NFC', new_token)
 
 
 if __name__ == '__main__':
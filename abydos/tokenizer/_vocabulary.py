@@ -0,0 +1,232 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._vocabulary.
+
+Vocabulary class
+"""
+
+from array import array
+from collections import Counter
+from typing import (
+    Counter as TCounter,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+from ._token_ids import TokenIds
+
+__all__ = ['Vocabulary']
+
+
+class Vocabulary:
+    """Vocabulary.
+
+    A vocabulary assigns each token it is given a distinct integer id, in the
+    order tokens are first seen, and converts Counters of tokens to & from
+    :py:class:`.TokenIds`. A single vocabulary may be shared by any number of
+    tokenizers & distance measures.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, tokens: Optional[Iterable[str]] = None) -> None:
+        """Initialize Vocabulary instance.
+
+        Parameters
+        ----------
+        tokens : Iterable[str]
+            Tokens to add to the vocabulary initially
+
+        Examples
+        --------
+        >>> vocab = Vocabulary(['$N', 'NE', 'EL'])
+        >>> len(vocab)
+        3
+        >>> vocab.intern('NE')
+        1
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._ids = {}  # type: Dict[str, int]
+        self._tokens = []  # type: List[str]
+        if tokens is not None:
+            for token in tokens:
+                self.intern(token)
+
+    def __len__(self) -> int:
+        """Return the number of tokens in the vocabulary.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._tokens)
+
+    def __contains__(self, token: object) -> bool:
+        """Return True if token is in the vocabulary.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return token in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the tokens in the order of their ids.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return iter(self._tokens)
+
+    def intern(self, token: str) -> int:
+        """Return the id of a token, adding it to the vocabulary if needed.
+
+        Parameters
+        ----------
+        token : str
+            The token to look up
+
+        Returns
+        -------
+        int
+            The token's id
+
+        Examples
+        --------
+        >>> vocab = Vocabulary()
+        >>> vocab.intern('NE'), vocab.intern('EL'), vocab.intern('NE')
+        (0, 1, 0)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            return self._ids[token]
+        except KeyError:
+            token_id = len(self._tokens)
+            self._ids[token] = token_id
+            self._tokens.append(token)
+            return token_id
+
+    def token(self, token_id: int) -> str:
+        """Return the token with a given id.
+
+        Parameters
+        ----------
+        token_id : int
+            The id to look up
+
+        Returns
+        -------
+        str
+            The token
+
+        Examples
+        --------
+        >>> Vocabulary(['$N', 'NE', 'EL']).token(2)
+        'EL'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tokens[token_id]
+
+    def encode(self, tokens: Mapping[str, float]) -> TokenIds:
+        """Return the TokenIds of a Counter of tokens.
+
+        Tokens not yet in the vocabulary are added to it.
+
+        Parameters
+        ----------
+        tokens : Mapping[str, float]
+            A Counter (or other mapping) of tokens to their counts
+
+        Returns
+        -------
+        TokenIds
+            The ids & counts of the tokens
+
+        Examples
+        --------
+        >>> vocab = Vocabulary()
+        >>> vocab.encode({'NE': 1, 'EL': 2})
+        TokenIds(array('I', [0, 1]), array('I', [1, 2]))
+        >>> vocab.encode({'LS': 1, 'EL': 0.5})
+        TokenIds(array('I', [1, 2]), array('d', [0.5, 1.0]))
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        pairs = sorted(
+            (self.intern(token), count) for token, count in tokens.items()
+        )
+        counts = [count for _, count in pairs]
+        typecode = (
+            'I'
+            if all(isinstance(count, int) and count >= 0 for count in counts)
+            else 'd'
+        )
+        return TokenIds(
+            array('I', [token_id for token_id, _ in pairs]),
+            array(typecode, counts),
+            self,
+        )
+
+    def decode(self, token_ids: TokenIds) -> TCounter[str]:
+        """Return the Counter of tokens represented by TokenIds.
+
+        Parameters
+        ----------
+        token_ids : TokenIds
+            The ids & counts of some tokens
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens
+
+        Examples
+        --------
+        >>> vocab = Vocabulary()
+        >>> vocab.decode(vocab.encode({'NE': 1, 'EL': 2}))
+        Counter({'EL': 2, 'NE': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokens = self._tokens
+        return Counter(
+            {
+                tokens[token_id]: count
+                for token_id, count in zip(token_ids.ids, token_ids.counts)
+            }
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
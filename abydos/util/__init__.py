@@ -20,6 +20,7 @@ The util module defines various utility functions for other modules within
 Abydos, including:
 
     - _prod -- computes the product of a collection of numbers (akin to sum)
+    - _LRUCache -- a least-recently-used cache
 
 These functions are not intended for use by users.
 """
@@ -0,0 +1,288 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._lru_cache.
+
+The util._lru_cache module defines _LRUCache, a bounded mapping that discards
+its least recently used entries, _DBMCache, an _LRUCache of strings backed by a
+dbm database on disk, and CacheInfo, which reports their statistics.
+
+Unlike functools.lru_cache, an _LRUCache is keyed explicitly rather than on
+function arguments, and it can be pickled along with the object that holds it.
+"""
+
+import dbm
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, Hashable, List, Optional
+
+__all__ = []  # type: List[str]
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _LRUCache:
+    """A least-recently-used cache.
+
+    A cache may be shared by several threads: entries are never corrupted,
+    though its statistics are then approximate.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128) -> None:
+        """Initialize _LRUCache instance.
+
+        Parameters
+        ----------
+        maxsize : int or None
+            The maximum number of entries to keep, or None to keep all entries
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # type: OrderedDict[Hashable, Any]
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value and record a hit or miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look up
+        default : Any
+            The value to return if key is not in the cache
+
+        Returns
+        -------
+        Any
+            The value cached for key, or default
+
+        Examples
+        --------
+        >>> cache = _LRUCache(2)
+        >>> cache.set('a', 1)
+        >>> cache.get('a')
+        1
+        >>> cache.get('b') is None
+        True
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+        except KeyError:
+            # The key is absent, or was discarded by another thread between
+            # the lookup and the move.
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, discarding the least recently used if necessary.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to cache the value under
+        value : Any
+            The value to cache
+
+        Examples
+        --------
+        >>> cache = _LRUCache(2)
+        >>> cache.set('a', 1)
+        >>> cache.set('b', 2)
+        >>> cache.get('a')
+        1
+        >>> cache.set('c', 3)
+        >>> cache.get('b') is None
+        True
+        >>> cache.get('a'), cache.get('c')
+        (1, 3)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._data[key] = value
+        try:
+            self._data.move_to_end(key)
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        except KeyError:
+            # Another thread discarded entries concurrently; the cache may
+            # briefly hold one entry more or fewer than maxsize.
+            pass
+
+    def clear(self) -> None:
+        """Discard all entries and reset the statistics.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            The hits, misses, maximum size, and current size of the cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class _DBMCache(_LRUCache):
+    """A least-recently-used cache of strings backed by a dbm database.
+
+    Entries are kept in memory, as in an _LRUCache, and are also written to a
+    database file, so that they outlive the process and can be shared by later
+    ones. Entries missing from memory are looked up in the database, which is
+    never pruned. Keys & values must be strings.
+
+    The database is opened with :py:func:`dbm.open`, so its format is the best
+    available on the platform. Most formats permit only one process to write
+    to a database at a time.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, path: str, maxsize: Optional[int] = 128) -> None:
+        """Initialize _DBMCache instance.
+
+        Parameters
+        ----------
+        path : str
+            The path of the database file, which is created if it does not
+            exist
+        maxsize : int or None
+            The maximum number of entries to keep in memory, or None to keep
+            all entries
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(_DBMCache, self).__init__(maxsize)
+        self.path = path
+        self._db = dbm.open(path, 'c')
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value and record a hit or miss.
+
+        Parameters
+        ----------
+        key : str
+            The key to look up
+        default : Any
+            The value to return if key is in neither memory nor the database
+
+        Returns
+        -------
+        Any
+            The value cached for key, or default
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+        except KeyError:
+            raw = self._db.get(key.encode('utf-8'))  # type: ignore
+            if raw is None:
+                self.misses += 1
+                return default
+            value = raw.decode('utf-8')
+            super(_DBMCache, self).set(key, value)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value in memory & in the database.
+
+        Parameters
+        ----------
+        key : str
+            The key to cache the value under
+        value : str
+            The value to cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(_DBMCache, self).set(key, value)
+        self._db[key.encode('utf-8')] = value.encode('utf-8')  # type: ignore
+
+    def close(self) -> None:
+        """Close the database, writing any pending entries to disk.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._db.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state to pickle, without the open database.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_db']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled state, reopening the database.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._db = dbm.open(self.path, 'c')
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
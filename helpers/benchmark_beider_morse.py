@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""benchmark_beider_morse.py.
+
+This helper script measures the per-name latency of Beider-Morse Phonetic
+Matching on the nachnamen corpus in tests/corpora, for each name mode and
+match mode. It should be run from the root of the repository:
+
+    python helpers/benchmark_beider_morse.py [number of names]
+
+By default, the first 1000 names of the corpus are encoded. Each name is
+encoded once before timing begins, so that the rules of every language used
+have been compiled (by versions of BeiderMorse that compile them) and the
+figures reported are those of encoding alone.
+"""
+
+import os
+import sys
+from statistics import mean, median
+from timeit import default_timer
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+from abydos.phonetic import BeiderMorse  # noqa: E402
+
+
+def _run_script():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    corpus = os.path.join(
+        os.path.dirname(__file__), '..', 'tests', 'corpora', 'nachnamen.csv'
+    )
+    with open(corpus, encoding='utf-8') as names_file:
+        names = [
+            line.split(',')[0]
+            for line in names_file
+            if line.strip() and not line.startswith('#')
+        ][:count]
+
+    print('{} names from nachnamen.csv'.format(len(names)))
+    print(
+        '{:<6} {:<7} {:>10} {:>10} {:>10}'.format(
+            'mode', 'match', 'mean (µs)', 'median', 'total (s)'
+        )
+    )
+    for name_mode in ('gen', 'ash', 'sep'):
+        for match_mode in ('approx', 'exact'):
+            bmpm = BeiderMorse(name_mode=name_mode, match_mode=match_mode)
+            for name in names:
+                bmpm.encode(name)
+            latencies = []
+            for name in names:
+                start = default_timer()
+                bmpm.encode(name)
+                latencies.append(default_timer() - start)
+            print(
+                '{:<6} {:<7} {:>10.1f} {:>10.1f} {:>10.2f}'.format(
+                    name_mode,
+                    match_mode,
+                    mean(latencies) * 1e6,
+                    median(latencies) * 1e6,
+                    sum(latencies),
+                )
+            )
+
+
+if __name__ == '__main__':
+    _run_script()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""benchmark_compare.py.
+
+This helper script measures the cost of comparing strings with compare on a
+shared token distance measure, against calling sim on the shared measure and
+constructing a new measure for each comparison. It should be run from the
+root of the repository:
+
+    python helpers/benchmark_compare.py [-n number] [-r repeats] [class ...]
+
+By default, each approach is timed over 200 comparisons of a few names, 5
+times, and the minimum time per comparison is reported.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+import abydos.distance  # noqa: E402
+
+CLASSES = ('Jaccard', 'Dice', 'Cosine', 'Tversky', 'Overlap')
+
+PAIRS = (('Niall', 'Neil'), ('Nigel', 'Njall'), ('Neal', 'Niall'))
+
+
+def _times(cls, number, repeats):
+    """Return the time in µs per comparison of each approach."""
+    cmp = cls()
+
+    def _compare():
+        for src, tar in PAIRS:
+            cmp.compare(src, tar)
+
+    def _sim():
+        for src, tar in PAIRS:
+            cmp.sim(src, tar)
+
+    def _construct():
+        for src, tar in PAIRS:
+            cls().sim(src, tar)
+
+    return [
+        min(timeit.repeat(func, number=number, repeat=repeats))
+        / (number * len(PAIRS))
+        * 1e6
+        for func in (_compare, _sim, _construct)
+    ]
+
+
+def _run_script():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('classes', nargs='*', default=CLASSES)
+    parser.add_argument('-n', '--number', type=int, default=200)
+    parser.add_argument('-r', '--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        '{:<12} {:>14} {:>14} {:>14}'.format(
+            'class', 'compare (µs)', 'sim (µs)', 'new+sim (µs)'
+        )
+    )
+    for name in args.classes:
+        times = _times(
+            getattr(abydos.distance, name), args.number, args.repeats
+        )
+        print('{:<12} {:>14.2f} {:>14.2f} {:>14.2f}'.format(name, *times))
+
+
+if __name__ == '__main__':
+    _run_script()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""benchmark_import.py.
+
+This helper script measures the time taken to import each subpackage of
+Abydos in a new interpreter, as a guard against regressions in start-up
+time, such as a package importing all of its modules eagerly. It should be
+run from the root of the repository:
+
+    python helpers/benchmark_import.py [-n repeats] [--limit ms] [package ...]
+
+By default, every subpackage is imported 5 times and the median & minimum
+times are reported. If a limit is given, the script exits with status 1 if
+the median time of any package exceeds it.
+"""
+
+import argparse
+import os
+import subprocess  # noqa: S404
+import sys
+from statistics import median
+
+PACKAGES = (
+    'abydos.blocking',
+    'abydos.compression',
+    'abydos.corpus',
+    'abydos.distance',
+    'abydos.fingerprint',
+    'abydos.phones',
+    'abydos.phonetic',
+    'abydos.stats',
+    'abydos.stemmer',
+    'abydos.tokenizer',
+    'abydos.util',
+)
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _import_time(package):
+    """Return the time in ms to import a package in a new interpreter."""
+    # -X importtime reports the cumulative time of each import in µs.
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + package],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stderr
+    for line in output.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == package:
+            return int(fields[1]) / 1000
+    raise RuntimeError('No import time reported for {}.'.format(package))
+
+
+def _run_script():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('packages', nargs='*', default=PACKAGES)
+    parser.add_argument('-n', '--repeats', type=int, default=5)
+    parser.add_argument('--limit', type=float, default=None)
+    args = parser.parse_args()
+
+    print('{:<20} {:>12} {:>12}'.format('package', 'median (ms)', 'min (ms)'))
+    slow = []
+    for package in args.packages:
+        times = [_import_time(package) for _ in range(args.repeats)]
+        print(
+            '{:<20} {:>12.1f} {:>12.1f}'.format(
+                package, median(times), min(times)
+            )
+        )
+        if args.limit is not None and median(times) > args.limit:
+            slow.append(package)
+
+    if slow:
+        print(
+            'Import time exceeded {} ms: {}'.format(
+                args.limit, ', '.join(slow)
+            )
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    _run_script()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""benchmark_suite.py.
+
+This helper script benchmarks every distance measure, phonetic algorithm,
+stemmer, and fingerprint in Abydos over fixed corpora from tests/corpora, at
+several string lengths, and writes the results as JSON, so that the results
+of two versions can be compared. It should be run from the root of the
+repository:
+
+    python helpers/benchmark_suite.py [-o results.json] [--compare old.json]
+                                      [-k filter] [package ...]
+
+Each class is constructed with its default parameters & measured on:
+
+    - nachnamen.csv -- consecutive pairs of German surnames
+    - misspellings.csv -- pairs of misspelled & corrected English words
+    - fake_words.csv -- pairs of non-words & the words they were derived from
+
+The strings of each corpus are joined with spaces & cut to each length given
+(4, 8, 16, & 32 characters by default), so that longer strings are real text
+rather than padding. Distance measures are given pairs of strings (calling
+dist, or the first of sim, dist_abs, & sim_score that is not disabled, if
+dist is); phonetic algorithms, stemmers, & fingerprints are given the first
+string of each pair (calling encode, stem, & fingerprint).
+
+For each class, corpus, & length, the inputs are processed repeatedly, with
+garbage collection disabled, until at least --min-time seconds have elapsed,
+and the rate in operations per second is reported. The peak memory allocated
+while processing the inputs once more is then measured with tracemalloc.
+Classes that cannot be constructed, or that raise an exception for an input,
+are reported with the exception in place of a result, and classes whose time
+grows exponentially with the length of the strings (Covington) are skipped
+at lengths beyond those listed in MAX_LENGTHS.
+
+Given --compare, the rates are compared with those of an earlier results
+file, and the script exits with status 1 if any has fallen by more than
+--tolerance (20% by default).
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from inspect import getdoc, getmembers, isclass
+from time import perf_counter
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+import abydos  # noqa: E402
+import abydos.distance  # noqa: E402
+import abydos.fingerprint  # noqa: E402
+import abydos.phonetic  # noqa: E402
+import abydos.stemmer  # noqa: E402
+from abydos.distance._distance import _Distance  # noqa: E402
+from abydos.fingerprint._fingerprint import _Fingerprint  # noqa: E402
+from abydos.phonetic._phonetic import _Phonetic  # noqa: E402
+from abydos.stemmer._stemmer import _Stemmer  # noqa: E402
+
+# Each package benchmarked: its module, the base class of its members, and
+# the methods that may be measured, in order of preference
+PACKAGES = {
+    'distance': (
+        abydos.distance,
+        _Distance,
+        ('dist', 'sim', 'dist_abs', 'sim_score'),
+    ),
+    'phonetic': (abydos.phonetic, _Phonetic, ('encode',)),
+    'stemmer': (abydos.stemmer, _Stemmer, ('stem',)),
+    'fingerprint': (abydos.fingerprint, _Fingerprint, ('fingerprint',)),
+}
+
+CORPORA = ('nachnamen', 'misspellings', 'fake_words')
+
+# The greatest length benchmarked for classes whose time grows exponentially
+# with the lengths of the strings
+MAX_LENGTHS = {'distance.Covington': 8}
+
+CORPORA_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'corpora')
+
+
+def _read_pairs(corpus):
+    """Return the pairs of strings of a corpus."""
+    with open(
+        os.path.join(CORPORA_DIR, corpus + '.csv'), encoding='utf-8'
+    ) as corpus_file:
+        rows = [
+            line.rstrip('\n').split(',')
+            for line in corpus_file
+            if line.strip() and not line.startswith('#')
+        ]
+    if corpus == 'nachnamen':
+        names = [row[0] for row in rows]
+        return list(zip(names, names[1:]))
+    # Skip the header of misspelling corpora.
+    return [(row[0], row[1]) for row in rows[1:]]
+
+
+def _cut(words, start, length):
+    """Return the words from start joined by spaces & cut to length."""
+    joined = ''
+    pos = start
+    while len(joined) < length:
+        joined += (' ' if joined else '') + words[pos % len(words)]
+        pos += 1
+    return joined[:length]
+
+
+def _inputs(pairs, length, count):
+    """Return count pairs of strings of the given length from pairs."""
+    srcs = [src for src, _ in pairs]
+    tars = [tar for _, tar in pairs]
+    step = max(1, len(pairs) // count)
+    return [
+        (_cut(srcs, i * step, length), _cut(tars, i * step, length))
+        for i in range(count)
+    ]
+
+
+def _classes(packages, name_filter):
+    """Yield the package, name, & class of each class to benchmark."""
+    for package in packages:
+        module, base, _ = PACKAGES[package]
+        for name, obj in getmembers(module, isclass):
+            if (
+                name[0] != '_'
+                and issubclass(obj, base)
+                and (
+                    name_filter is None
+                    or name_filter.lower()
+                    in '{}.{}'.format(package, name).lower()
+                )
+            ):
+                yield package, name, obj
+
+
+def _measure(call, args_list, min_time):
+    """Return the calls made, time taken, & peak memory of call."""
+    calls = 0
+    elapsed = 0.0
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while elapsed < min_time:
+            start = perf_counter()
+            for args in args_list:
+                call(*args)
+            elapsed += perf_counter() - start
+            calls += len(args_list)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        for args in args_list:
+            call(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return calls, elapsed, peak
+
+
+def _benchmark(package, name, cls, inputs, min_time):
+    """Return the results of benchmarking a class on each input set."""
+    methods = PACKAGES[package][2]
+    method = methods[0]
+    call = None
+    try:
+        instance = cls()
+    except Exception as inst:
+        error = '{}: {}'.format(type(inst).__name__, inst)
+    else:
+        # As in the fuzz tests, methods a class has disabled are passed over,
+        # as are those that raise NotImplementedError.
+        for method in methods:
+            call = getattr(instance, method)
+            if 'Method disabled' in (getdoc(call) or ''):
+                continue
+            try:
+                call(*(('abc', 'abd') if package == 'distance' else ('abc',)))
+            except NotImplementedError:
+                continue
+            except Exception:
+                # Other exceptions are reported with the results.
+                break
+            break
+        else:
+            method = methods[0]
+            call = None
+            error = 'NotImplementedError: All methods disabled'
+    results = []
+
+    for (corpus, length), pairs in inputs.items():
+        result = {
+            'id': '{}.{}.{}[{},{}]'.format(
+                package, name, method, corpus, length
+            ),
+            'package': package,
+            'class': name,
+            'method': method,
+            'corpus': corpus,
+            'length': length,
+        }
+        args_list = (
+            pairs if package == 'distance' else [(s,) for s, _ in pairs]
+        )
+        max_length = MAX_LENGTHS.get('{}.{}'.format(package, name))
+        if max_length is not None and length > max_length:
+            result['skipped'] = 'Length exceeds {}'.format(max_length)
+            results.append(result)
+            continue
+        if call is not None:
+            try:
+                calls, elapsed, peak = _measure(call, args_list, min_time)
+            except Exception as inst:
+                error = '{}: {}'.format(type(inst).__name__, inst)
+            else:
+                result.update(
+                    {
+                        'calls': calls,
+                        'seconds': elapsed,
+                        'ops_per_sec': calls / elapsed,
+                        'peak_memory_bytes': peak,
+                    }
+                )
+                results.append(result)
+                continue
+        result['error'] = error
+        results.append(result)
+    return results
+
+
+def _compare(results, old_path, tolerance):
+    """Print the change in rate of each result & return the regressions."""
+    with open(old_path, encoding='utf-8') as old_file:
+        old = {
+            result['id']: result
+            for result in json.load(old_file)['results']
+            if 'ops_per_sec' in result
+        }
+
+    regressions = []
+    print()
+    print('Compared with {}:'.format(old_path))
+    print(
+        '{:<60} {:>12} {:>12} {:>8}'.format(
+            'id', 'old ops/s', 'ops/s', 'ratio'
+        )
+    )
+    for result in results:
+        if result['id'] not in old or 'ops_per_sec' not in result:
+            continue
+        before = old[result['id']]['ops_per_sec']
+        ratio = result['ops_per_sec'] / before
+        flag = ''
+        if ratio < 1 - tolerance:
+            regressions.append(result['id'])
+            flag = ' slower'
+        print(
+            '{:<60} {:>12.1f} {:>12.1f} {:>8.2f}{}'.format(
+                result['id'], before, result['ops_per_sec'], ratio, flag
+            )
+        )
+    return regressions
+
+
+def _run_script():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('packages', nargs='*', default=list(PACKAGES))
+    parser.add_argument(
+        '-k', '--filter', default=None, help='benchmark only matching classes'
+    )
+    parser.add_argument(
+        '--corpora', default=','.join(CORPORA), help='comma-separated corpora'
+    )
+    parser.add_argument(
+        '--lengths', default='4,8,16,32', help='comma-separated lengths'
+    )
+    parser.add_argument(
+        '-n', '--count', type=int, default=100, help='inputs per length'
+    )
+    parser.add_argument('--min-time', type=float, default=0.1)
+    parser.add_argument('-o', '--output', default=None, help='JSON results')
+    parser.add_argument('--compare', default=None, help='earlier results')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+    for package in args.packages:
+        if package not in PACKAGES:
+            parser.error(
+                'package must be one of: {}'.format(', '.join(PACKAGES))
+            )
+
+    lengths = [int(length) for length in args.lengths.split(',')]
+    inputs = {}
+    for corpus in args.corpora.split(','):
+        pairs = _read_pairs(corpus)
+        for length in lengths:
+            inputs[(corpus, length)] = _inputs(pairs, length, args.count)
+
+    results = []
+    print('{:<60} {:>12} {:>12}'.format('id', 'ops/s', 'peak (KiB)'))
+    for package, name, cls in _classes(args.packages, args.filter):
+        for result in _benchmark(package, name, cls, inputs, args.min_time):
+            if 'ops_per_sec' not in result:
+                print(
+                    '{:<60} {}'.format(
+                        result['id'],
+                        result.get('error', result.get('skipped')),
+                    )
+                )
+            else:
+                print(
+                    '{:<60} {:>12.1f} {:>12.1f}'.format(
+                        result['id'],
+                        result['ops_per_sec'],
+                        result['peak_memory_bytes'] / 1024,
+                    )
+                )
+            results.append(result)
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(
+                {
+                    'abydos_version': abydos.__version__,
+                    'python_version': platform.python_version(),
+                    'platform': platform.platform(),
+                    'date': datetime.now(timezone.utc).isoformat(),
+                    'settings': {
+                        'corpora': args.corpora.split(','),
+                        'lengths': lengths,
+                        'count': args.count,
+                        'min_time': args.min_time,
+                    },
+                    'results': results,
+                },
+                output_file,
+                indent=1,
+            )
+
+    if args.compare is not None:
+        regressions = _compare(results, args.compare, args.tolerance)
+        if regressions:
+            print(
+                '{} benchmarks slowed by more than {:.0%}'.format(
+                    len(regressions), args.tolerance
+                )
+            )
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    _run_script()
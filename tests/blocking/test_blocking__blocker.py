@@ -0,0 +1,72 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.blocking.test_blocking__blocker.
+
+This module contains unit tests for abydos.blocking._Blocker
+"""
+
+import unittest
+
+from abydos.blocking import _Blocker
+from abydos.distance import Jaccard
+from abydos.fingerprint import SkeletonKey
+from abydos.phonetic import Soundex
+
+
+class BlockerTestCases(unittest.TestCase):
+    """Test _Blocker functions.
+
+    abydos.blocking._Blocker
+    """
+
+    def test_blocker(self):
+        """Test abydos.blocking._Blocker."""
+        blocker = _Blocker(Soundex())
+        self.assertEqual(len(blocker), 0)
+        self.assertEqual(list(blocker.candidate_pairs()), [])
+        self.assertEqual(list(blocker.matches(Jaccard())), [])
+
+        self.assertEqual(blocker.insert('Niall'), 0)
+        self.assertEqual(blocker.insert('Neil', record_id=7), 1)
+        self.assertIn('Niall', blocker)
+        self.assertIn(7, blocker)
+        self.assertNotIn('Neil', blocker)
+        with self.assertRaises(KeyError):
+            blocker.insert('Nigel', record_id=7)
+
+        # Repeated records are only added once by extend
+        blocker.extend(['Niall', 'Nigel', 'Nigel'])
+        self.assertEqual(len(blocker), 3)
+
+        with self.assertRaises(TypeError):
+            _Blocker(5)
+
+    def test_blocker_keys(self):
+        """Test abydos.blocking._Blocker key functions."""
+        blocker = _Blocker([Soundex(), SkeletonKey(), str.split, str.lower])
+        self.assertEqual(
+            blocker._record_keys('Van Dyke'),  # noqa: SF01
+            (('V532',), ('VNDYKAE',), ('Dyke', 'Van'), ('van dyke',)),
+        )
+        # Empty keys are discarded
+        self.assertEqual(
+            blocker._record_keys(''), (('0000',), (), (), ())  # noqa: SF01
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.blocking.test_blocking_key_blocker.
+
+This module contains unit tests for abydos.blocking.KeyBlocker
+"""
+
+import unittest
+from itertools import combinations
+
+from abydos.blocking import KeyBlocker
+from abydos.distance import Jaccard
+from abydos.fingerprint import SkeletonKey
+from abydos.phonetic import Metaphone, Soundex
+
+from .. import _corpus_file
+
+
+class KeyBlockerTestCases(unittest.TestCase):
+    """Test KeyBlocker functions.
+
+    abydos.blocking.KeyBlocker
+    """
+
+    names = ['Niall', 'Neil', 'Nigel', 'Colin', 'Collin', 'Cloin']
+
+    def test_key_blocker(self):
+        """Test abydos.blocking.KeyBlocker."""
+        blocker = KeyBlocker(Soundex())
+        self.assertEqual(list(blocker.candidate_pairs()), [])
+        blocker.extend(self.names)
+        self.assertEqual(
+            blocker.blocks(),
+            {
+                'N400': ['Niall', 'Neil'],
+                'N240': ['Nigel'],
+                'C450': ['Colin', 'Collin', 'Cloin'],
+            },
+        )
+        self.assertEqual(
+            list(blocker.candidate_pairs()),
+            [
+                ('Niall', 'Neil'),
+                ('Colin', 'Collin'),
+                ('Colin', 'Cloin'),
+                ('Collin', 'Cloin'),
+            ],
+        )
+        # Candidates are generated lazily, so a new record is included
+        blocker.insert('Nil', record_id=8)
+        self.assertIn(('Neil', 8), list(blocker.candidate_pairs()))
+
+        blocker = KeyBlocker(Soundex(), max_block_size=2)
+        blocker.extend(self.names)
+        self.assertEqual(list(blocker.candidate_pairs()), [('Niall', 'Neil')])
+
+        # Multiple passes
+        def prefix(name):
+            return name[:2]
+
+        blocker = KeyBlocker([Soundex(), prefix], max_block_size=2)
+        blocker.extend(self.names)
+        self.assertEqual(blocker.blocks(1)['Ni'], ['Niall', 'Nigel'])
+        self.assertEqual(
+            list(blocker.candidate_pairs()),
+            [('Niall', 'Neil'), ('Niall', 'Nigel'), ('Colin', 'Collin')],
+        )
+        blocker = KeyBlocker([SkeletonKey(), Soundex()])
+        blocker.extend(self.names)
+        self.assertEqual(
+            list(blocker.candidate_pairs()),
+            [
+                ('Colin', 'Collin'),
+                ('Colin', 'Cloin'),
+                ('Collin', 'Cloin'),
+                ('Niall', 'Neil'),
+            ],
+        )
+
+        self.assertEqual(
+            list(KeyBlocker(Soundex()).matches(Jaccard(), min_sim=0.5)), []
+        )
+        blocker = KeyBlocker(Soundex())
+        blocker.extend(self.names)
+        self.assertEqual(
+            [
+                (id_a, id_b, round(sim, 12))
+                for id_a, id_b, sim in blocker.matches(Jaccard(), min_sim=0.5)
+            ],
+            [('Colin', 'Collin', 0.857142857143)],
+        )
+
+    def test_key_blocker_corpus(self):
+        """Test abydos.blocking.KeyBlocker on the US Census corpus."""
+        with open(_corpus_file('uscensus2000.csv')) as corpus:
+            names = [line.split(',')[0] for line in corpus.readlines()[1:501]]
+
+        def initials(name):
+            return {name[:1], name[:2]}
+
+        passes = [Soundex(), Metaphone(), initials]
+        for max_block_size in (None, 20):
+            blocker = KeyBlocker(passes, max_block_size=max_block_size)
+            blocker.extend(names)
+
+            expected = set()
+            for pass_num in range(len(passes)):
+                for members in blocker.blocks(pass_num).values():
+                    if max_block_size is None or (
+                        len(members) <= max_block_size
+                    ):
+                        expected.update(combinations(members, 2))
+
+            pairs = list(blocker.candidate_pairs())
+            self.assertEqual(len(pairs), len(set(pairs)))
+            self.assertEqual(set(pairs), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.blocking.test_blocking_sorted_neighborhood.
+
+This module contains unit tests for abydos.blocking.SortedNeighborhood
+"""
+
+import unittest
+
+from abydos.blocking import SortedNeighborhood
+from abydos.distance import Jaccard
+from abydos.fingerprint import SkeletonKey
+from abydos.phonetic import Metaphone, Soundex
+
+from .. import _corpus_file
+
+
+class SortedNeighborhoodTestCases(unittest.TestCase):
+    """Test SortedNeighborhood functions.
+
+    abydos.blocking.SortedNeighborhood
+    """
+
+    names = ['Niall', 'Neil', 'Nigel', 'Colin', 'Collin', 'Cloin']
+
+    def test_sorted_neighborhood(self):
+        """Test abydos.blocking.SortedNeighborhood."""
+        with self.assertRaises(ValueError):
+            SortedNeighborhood(Soundex(), window=1)
+
+        blocker = SortedNeighborhood(Soundex())
+        self.assertEqual(blocker.sorted_order(), [])
+        self.assertEqual(list(blocker.candidate_pairs()), [])
+        blocker.extend(self.names)
+        self.assertEqual(
+            blocker.sorted_order(),
+            ['Colin', 'Collin', 'Cloin', 'Nigel', 'Niall', 'Neil'],
+        )
+        self.assertEqual(
+            list(blocker.candidate_pairs()),
+            [
+                ('Colin', 'Collin'),
+                ('Colin', 'Cloin'),
+                ('Collin', 'Cloin'),
+                ('Collin', 'Nigel'),
+                ('Cloin', 'Nigel'),
+                ('Cloin', 'Niall'),
+                ('Nigel', 'Niall'),
+                ('Nigel', 'Neil'),
+                ('Niall', 'Neil'),
+            ],
+        )
+
+        # Records with no key are left out
+        empty = SortedNeighborhood(SkeletonKey())
+        empty.extend(['', 'Niall'])
+        self.assertEqual(empty.sorted_order(), ['Niall'])
+
+        # The order is recomputed after an insertion
+        blocker.insert('Bob')
+        self.assertEqual(blocker.sorted_order()[0], 'Bob')
+
+        # Multiple passes
+        blocker = SortedNeighborhood([Soundex(), SkeletonKey()], window=2)
+        blocker.extend(self.names)
+        self.assertEqual(
+            blocker.sorted_order(1),
+            ['Colin', 'Collin', 'Cloin', 'Nigel', 'Neil', 'Niall'],
+        )
+        self.assertEqual(
+            list(blocker.candidate_pairs()),
+            [
+                ('Colin', 'Collin'),
+                ('Collin', 'Cloin'),
+                ('Cloin', 'Nigel'),
+                ('Nigel', 'Niall'),
+                ('Niall', 'Neil'),
+                ('Nigel', 'Neil'),
+            ],
+        )
+
+        self.assertEqual(
+            [
+                (id_a, id_b, round(sim, 12))
+                for id_a, id_b, sim in blocker.matches(Jaccard(), min_sim=0.5)
+            ],
+            [('Colin', 'Collin', 0.857142857143)],
+        )
+
+    def test_sorted_neighborhood_corpus(self):
+        """Test abydos.blocking.SortedNeighborhood on the US Census corpus."""
+        with open(_corpus_file('uscensus2000.csv')) as corpus:
+            names = [line.split(',')[0] for line in corpus.readlines()[1:501]]
+
+        window = 5
+        blocker = SortedNeighborhood([Soundex(), Metaphone()], window=window)
+        blocker.extend(names)
+
+        expected = set()
+        for pass_num in range(2):
+            order = blocker.sorted_order(pass_num)
+            for i in range(len(order)):
+                for j in range(i + 1, min(i + window, len(order))):
+                    expected.add(frozenset((order[i], order[j])))
+
+        pairs = list(blocker.candidate_pairs())
+        self.assertEqual(len(pairs), len(set(map(frozenset, pairs))))
+        self.assertEqual(set(map(frozenset, pairs)), expected)
+        # The number of candidates is linear in the number of records
+        self.assertLessEqual(len(pairs), 2 * (window - 1) * len(names))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -106,6 +106,55 @@ class ArithmeticCoderTestCases(unittest.TestCase):
         self.coder.set_probs({'\x00': (0, 1)})
         self.assertEqual(self.coder.decode(1, 1), '')
 
+    def test_arithmetic_encoded_length(self):
+        """Test abydos.compression.Arithmetic.encoded_length."""
+        self.coder.set_probs(self.niall_probs)
+        for text in NIALL + ('', 'a', 'Ni\x00ll', 'Mean', ' '.join(NIALL)):
+            self.assertEqual(
+                self.coder.encoded_length(text), self.coder.encode(text)[1]
+            )
+        self.assertRaises(KeyError, self.coder.encoded_length, 'NIALL')
+        self.coder.set_probs({'\x00': (0, 1)})
+        self.assertEqual(self.coder.encoded_length(''), 1)
+        self.coder.set_probs({'a': (0, 1), '\x00': (1, 1)})
+        self.assertRaises(ValueError, self.coder.encoded_length, 'a')
+
+    def test_arithmetic_precision(self):
+        """Test abydos.compression.Arithmetic with integer coding."""
+        self.assertRaises(ValueError, Arithmetic, precision=8)
+        self.assertRaises(
+            ValueError, Arithmetic, 'a' * (1 << 14), precision=16
+        )
+
+        for precision in (16, 32, 64):
+            coder = Arithmetic(' '.join(NIALL), precision=precision)
+            self.assertEqual(
+                coder.get_freqs()['\x00'], (113, 114),
+            )
+            for text in NIALL + ('', 'a', 'Mean', ' '.join(NIALL) * 10):
+                longval, nbits = coder.encode(text)
+                self.assertEqual(coder.decode(longval, nbits), text)
+                self.assertEqual(coder.encoded_length(text), nbits)
+            self.assertEqual(coder.decode(*coder.encode('Ni\x00ll')), 'Ni ll')
+            self.assertRaises(KeyError, coder.encode, 'NIALL')
+
+        coder = Arithmetic(precision=32)
+        coder.set_probs(self.niall_probs)
+        self.assertEqual(coder.get_freqs()['l'], (0, 25))
+        self.assertEqual(coder.decode(*coder.encode('Niall')), 'Niall')
+        # The integer coder needs at most a few bits more than Fractions.
+        self.coder.set_probs(self.niall_probs)
+        self.assertLessEqual(
+            coder.encoded_length('Neil Noígíallach'),
+            self.coder.encode('Neil Noígíallach')[1] + 2,
+        )
+
+        coder.set_probs(
+            {'\x00': (Fraction(1, 2), 1), 'a': (0, Fraction(1, 2))}
+        )
+        self.assertEqual(coder.get_freqs(), {'\x00': (1, 2), 'a': (0, 1)})
+        self.assertRaises(ValueError, coder.decode, 0, 4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,10 +19,13 @@
 This module contains unit tests for abydos.compression.BWT
 """
 
+import random
 import unittest
 
 from abydos.compression import BWT
 
+from .. import _corpus_file
+
 
 class BWTTestCases(unittest.TestCase):
     """Test abydos.compression.BWT.encode and .decode."""
@@ -81,6 +84,45 @@ class BWTTestCases(unittest.TestCase):
                 self.coder_dollar.decode(self.coder_dollar.encode(w)), w
             )
 
+    def test_bwt_suffix_array(self):
+        """Test abydos.compression.BWT encoding by suffix array."""
+        self.assertEqual(BWT._suffix_array('banana'), [5, 3, 1, 0, 4, 2])
+        self.assertEqual(BWT._suffix_array('a'), [0])
+        self.assertEqual(BWT._suffix_array('aaaa'), [3, 2, 1, 0])
+
+        rng = random.Random(0)
+        for _ in range(200):
+            word = ''.join(
+                rng.choice('ab|~\0Ä') for _ in range(rng.randint(1, 100))
+            )
+            self.assertEqual(
+                BWT._suffix_array(word),
+                sorted(range(len(word)), key=lambda i: word[i:]),
+            )
+
+        with open(_corpus_file('uscensus2000.csv')) as corpus:
+            text = corpus.read(5000)
+        for coder in (self.coder, self.coder_pipe):
+            code = coder.encode(text)
+            word = text + coder._terminator  # noqa: SF01
+            self.assertEqual(
+                code,
+                ''.join(
+                    rot[-1]
+                    for rot in sorted(
+                        word[i:] + word[:i] for i in range(len(word))
+                    )
+                ),
+            )
+            self.assertEqual(coder.decode(code), text)
+
+    def test_bwt_decode_invalid(self):
+        """Test abydos.compression.BWT.decode of codes of no word."""
+        # These are not the transforms of any word, but are decoded as they
+        # always have been.
+        self.assertEqual(self.coder_dollar.decode('a$b$'), '$ba')
+        self.assertEqual(self.coder_dollar.decode('ba$'), '$b')
+
 
 if __name__ == '__main__':
     unittest.main()
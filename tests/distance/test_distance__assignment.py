@@ -0,0 +1,97 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance__assignment.
+
+This module contains unit tests for abydos.distance._assignment
+"""
+
+import unittest
+from itertools import permutations
+
+import numpy as np
+
+from abydos.distance._assignment import _auction, _greedy, _hungarian
+
+
+def _optimum(weights):
+    """Return the weight of a maximum weight assignment by brute force."""
+    if weights.shape[0] > weights.shape[1]:
+        weights = weights.T
+    return max(
+        sum(weights[row, col] for row, col in enumerate(cols))
+        for cols in permutations(range(weights.shape[1]), weights.shape[0])
+    )
+
+
+class AssignmentTestCases(unittest.TestCase):
+    """Test assignment problem functions.
+
+    abydos.distance._assignment
+    """
+
+    def _matrices(self):
+        rng = np.random.RandomState(0)
+        for _ in range(100):
+            shape = tuple(rng.randint(1, 7, size=2))
+            weights = rng.random_sample(shape)
+            # Some weights are pruned, as in group linkage.
+            weights[weights < rng.random_sample()] = 0.0
+            yield weights
+        yield np.array([[1.0, 1.0], [1.0, 1.0]])
+        yield np.array([[0.0, 0.5], [0.0, 0.0]])
+
+    def _check(self, weights, pairs):
+        rows = [row for row, _ in pairs]
+        cols = [col for _, col in pairs]
+        # Every solver returns plain ints, rather than NumPy integers.
+        self.assertTrue(all(type(index) is int for index in rows + cols))
+        self.assertEqual(len(set(rows)), len(rows))
+        self.assertEqual(len(set(cols)), len(cols))
+        self.assertTrue(all(0 <= row < weights.shape[0] for row in rows))
+        self.assertTrue(all(0 <= col < weights.shape[1] for col in cols))
+        return sum(weights[row, col] for row, col in pairs)
+
+    def test_hungarian(self):
+        """Test abydos.distance._assignment._hungarian."""
+        for weights in self._matrices():
+            self.assertAlmostEqual(
+                self._check(weights, _hungarian(weights)), _optimum(weights)
+            )
+
+    def test_greedy(self):
+        """Test abydos.distance._assignment._greedy."""
+        for weights in self._matrices():
+            self.assertGreaterEqual(
+                self._check(weights, _greedy(weights)), _optimum(weights) / 2,
+            )
+        weights = np.array([[0.9, 0.8], [0.8, 0.1]])
+        self.assertEqual(_greedy(weights), [(0, 0), (1, 1)])
+
+    def test_auction(self):
+        """Test abydos.distance._assignment._auction."""
+        for epsilon in (0.5, 0.1, 0.01, 0.001):
+            for weights in self._matrices():
+                self.assertGreaterEqual(
+                    self._check(weights, _auction(weights, epsilon)),
+                    _optimum(weights) - min(weights.shape) * epsilon - 1e-12,
+                )
+        self.assertEqual(_auction(np.zeros((0, 1))), [])
+        self.assertRaises(ValueError, _auction, np.ones((2, 2)), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
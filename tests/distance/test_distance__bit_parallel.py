@@ -0,0 +1,107 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance__bit_parallel.
+
+This module contains unit tests for abydos.distance._bit_parallel
+"""
+
+import random
+import unittest
+
+from abydos.distance import LCSseq, Levenshtein
+from abydos.distance._bit_parallel import (
+    _lcsseq_len_bp,
+    _levenshtein_bp,
+    _osa_bp,
+)
+
+
+class BitParallelTestCases(unittest.TestCase):
+    """Test bit-parallel functions.
+
+    abydos.distance._bit_parallel
+    """
+
+    lev = Levenshtein()
+    osa = Levenshtein(mode='osa')
+    lcs = LCSseq()
+
+    def setUp(self):
+        """Set up the string pairs to compare."""
+        rand = random.Random(42)
+        self.pairs = [
+            ('', ''),
+            ('', 'abc'),
+            ('abc', ''),
+            ('Niall', 'Neil'),
+            ('aluminum', 'Catalan'),
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('Colin', 'Cuilen'),
+        ]
+        for length in (5, 63, 64, 65, 150):
+            for _ in range(5):
+                self.pairs.append(
+                    (
+                        ''.join(
+                            rand.choice('ACGT')
+                            for _ in range(rand.randint(0, length))
+                        ),
+                        ''.join(
+                            rand.choice('ACGT')
+                            for _ in range(rand.randint(0, length))
+                        ),
+                    )
+                )
+
+    def test_levenshtein_bp(self):
+        """Test abydos.distance._bit_parallel._levenshtein_bp."""
+        for src, tar in self.pairs:
+            self.assertEqual(
+                _levenshtein_bp(src, tar),
+                self.lev._alignment_matrix(src, tar, backtrace=False)[-1, -1],
+            )
+
+    def test_osa_bp(self):
+        """Test abydos.distance._bit_parallel._osa_bp."""
+        for src, tar in self.pairs:
+            self.assertEqual(
+                _osa_bp(src, tar),
+                self.osa._alignment_matrix(src, tar, backtrace=False)[-1, -1],
+            )
+
+    def test_bounded_bp(self):
+        """Test bit-parallel functions with a bound."""
+        for func in (_levenshtein_bp, _osa_bp):
+            for src, tar in self.pairs:
+                dist = func(src, tar)
+                for bound in (0, 2, 5, 40):
+                    if dist <= bound:
+                        self.assertEqual(func(src, tar, bound), dist)
+                    else:
+                        self.assertGreater(func(src, tar, bound), bound)
+
+    def test_lcsseq_len_bp(self):
+        """Test abydos.distance._bit_parallel._lcsseq_len_bp."""
+        for src, tar in self.pairs:
+            self.assertEqual(
+                _lcsseq_len_bp(src, tar), len(self.lcs.lcsseq(src, tar))
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
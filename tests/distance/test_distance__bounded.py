@@ -0,0 +1,73 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance__bounded.
+
+This module contains unit tests for abydos.distance._bounded
+"""
+
+import unittest
+
+from abydos.distance._bounded import (
+    _bounded_dist,
+    _diagonal_band,
+    _dist_bound,
+)
+
+
+class BoundedTestCases(unittest.TestCase):
+    """Test bounded edit distance functions.
+
+    abydos.distance._bounded
+    """
+
+    def test_diagonal_band(self):
+        """Test abydos.distance._bounded._diagonal_band."""
+        self.assertEqual(_diagonal_band(0, 0, 0, 1, 1), (0, 0))
+        self.assertEqual(_diagonal_band(5, 5, 0, 1, 1), (0, 0))
+        self.assertEqual(_diagonal_band(5, 5, 3, 1, 1), (-1, 1))
+        self.assertEqual(_diagonal_band(5, 5, 4, 1, 1), (-2, 2))
+        self.assertEqual(_diagonal_band(5, 7, 4, 1, 1), (-1, 3))
+        self.assertEqual(_diagonal_band(7, 5, 4, 1, 1), (-3, 1))
+        self.assertEqual(_diagonal_band(5, 5, 4, 2, 1), (-1, 1))
+        self.assertEqual(_diagonal_band(5, 7, 5, 2, 1), (0, 2))
+        self.assertEqual(_diagonal_band(5, 7, 7, 2, 1), (-1, 3))
+        self.assertEqual(_diagonal_band(5, 5, 100, 1, 1), (-5, 5))
+        self.assertEqual(_diagonal_band(5, 5, 1, 0, 0), (-5, 5))
+        self.assertIsNone(_diagonal_band(5, 9, 3, 1, 1))
+        self.assertIsNone(_diagonal_band(5, 7, 3, 2, 1))
+
+    def test_dist_bound(self):
+        """Test abydos.distance._bounded._dist_bound."""
+        self.assertIsNone(_dist_bound(None, None, 10))
+        self.assertEqual(_dist_bound(3, None, 10), 3)
+        self.assertAlmostEqual(_dist_bound(None, 0.8, 10), 2)
+        self.assertGreaterEqual(_dist_bound(None, 0.8, 5), 1)
+        self.assertEqual(_dist_bound(1, 0.8, 10), 1)
+        self.assertAlmostEqual(_dist_bound(None, 0.0, 10), 10)
+
+    def test_bounded_dist(self):
+        """Test abydos.distance._bounded._bounded_dist."""
+        self.assertEqual(_bounded_dist(2, None, None, 10), 0.2)
+        self.assertEqual(_bounded_dist(2, 2, None, 10), 0.2)
+        self.assertEqual(_bounded_dist(3, 2, None, 10), 1.0)
+        self.assertEqual(_bounded_dist(float('inf'), 2, None, 10), 1.0)
+        self.assertEqual(_bounded_dist(1, 1.0000001, 0.8, 5), 0.2)
+        self.assertEqual(_bounded_dist(2, 3, 0.9, 10), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,10 +19,13 @@
 This module contains unit tests for abydos.distance._Distance
 """
 
+import math
 import unittest
 
 from abydos.distance import Dice, Levenshtein
 
+NAMES = ('Niall', 'Neal', 'Neil', 'Njall', 'Nigel', '', 'Neil')
+
 
 class DistanceTestCases(unittest.TestCase):
     """Test _Distance base class.
@@ -62,6 +65,43 @@ class DistanceTestCases(unittest.TestCase):
             self.dice.dist_abs('Niall', 'Nigel'),
         )
 
+    def test_sim_matrix(self):
+        """Test abydos.distance._Distance.sim_matrix."""
+        for cmp in (self.lev, self.dice):
+            matrix = cmp.sim_matrix(NAMES, NAMES[:3])
+            self.assertEqual(matrix.shape, (len(NAMES), 3))
+            for i, src in enumerate(NAMES):
+                for j, tar in enumerate(NAMES[:3]):
+                    self.assertEqual(matrix[i, j], cmp.sim(src, tar))
+
+            matrix = cmp.sim_matrix(NAMES)
+            self.assertEqual(matrix.shape, (len(NAMES), len(NAMES)))
+            for i, src in enumerate(NAMES):
+                for j, tar in enumerate(NAMES):
+                    self.assertEqual(matrix[i, j], cmp.sim(src, tar))
+
+            matrix = cmp.sim_matrix(NAMES, upper=True)
+            for i, src in enumerate(NAMES):
+                for j, tar in enumerate(NAMES):
+                    if j > i:
+                        self.assertEqual(matrix[i, j], cmp.sim(src, tar))
+                    else:
+                        self.assertTrue(math.isnan(matrix[i, j]))
+
+        self.assertEqual(self.lev.sim_matrix([], NAMES).shape, (0, 7))
+
+    def test_dist_matrix(self):
+        """Test abydos.distance._Distance.dist_matrix."""
+        for cmp in (self.lev, self.dice):
+            matrix = cmp.dist_matrix(NAMES[2:], NAMES)
+            for i, src in enumerate(NAMES[2:]):
+                for j, tar in enumerate(NAMES):
+                    self.assertEqual(matrix[i, j], cmp.dist(src, tar))
+
+            # upper is ignored when tars are supplied
+            matrix = cmp.dist_matrix(NAMES, NAMES, upper=True)
+            self.assertFalse(any(math.isnan(_) for _ in matrix.ravel()))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,79 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance__init__.
+
+This module contains unit tests for the lazy loading of abydos.distance
+"""
+
+import os
+import subprocess  # noqa: S404
+import sys
+import unittest
+from inspect import getmembers, isclass
+
+import abydos.distance
+
+
+class DistanceLazyLoadingTestCases(unittest.TestCase):
+    """Test lazy loading of abydos.distance classes."""
+
+    # The directory from which abydos is imported
+    root = os.path.dirname(os.path.dirname(abydos.__file__))
+
+    def test_distance_lazy_import(self):
+        """Test that importing abydos.distance imports no classes."""
+        code = (
+            'import sys, abydos.distance; '
+            'print(len([mod for mod in sys.modules '
+            'if mod.startswith("abydos.distance.")]))'
+        )
+        output = subprocess.check_output(  # noqa: S603
+            [sys.executable, '-c', code], cwd=self.root
+        )
+        self.assertEqual(output.strip(), b'0')
+
+        code = (
+            'import sys; from abydos.distance import Levenshtein; '
+            'print("abydos.distance._ozbay" in sys.modules)'
+        )
+        output = subprocess.check_output(  # noqa: S603
+            [sys.executable, '-c', code], cwd=self.root
+        )
+        self.assertEqual(output.strip(), b'False')
+
+    def test_distance_lazy_attributes(self):
+        """Test that every name in abydos.distance.__all__ can be accessed."""
+        for name in abydos.distance.__all__:
+            self.assertEqual(getattr(abydos.distance, name).__name__, name)
+            self.assertIn(name, dir(abydos.distance))
+        self.assertIs(
+            abydos.distance.Ozbay, abydos.distance._ozbay.Ozbay  # noqa: SF01
+        )
+        with self.assertRaises(AttributeError):
+            abydos.distance.Levenshteins  # noqa: B018
+
+        # Only the classes of __all__ are public members of the module
+        self.assertEqual(
+            sorted(name for name, _ in getmembers(abydos.distance, isclass)),
+            sorted(abydos.distance.__all__),
+        )
+        for name in ('sys', 'import_module', 'Any', 'List'):
+            self.assertNotIn(name, dir(abydos.distance))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance__ncd.
+
+This module contains unit tests for abydos.distance._NCD
+"""
+
+import unittest
+
+import numpy as np
+
+from abydos.distance import (
+    NCDbwtrle,
+    NCDbz2,
+    NCDlzma,
+    NCDrle,
+    NCDzlib,
+    _NCD,
+)
+from abydos.util._lru_cache import CacheInfo
+
+
+class NCDTestCases(unittest.TestCase):
+    """Test _NCD functions.
+
+    abydos.distance._NCD
+    """
+
+    words = ['', 'cat', 'hat', 'Niall', 'Neil', 'Nigel', 'Niall', 'ATCG']
+
+    def test_ncd_compressed_length(self):
+        """Test abydos.distance._NCD._compressed_length."""
+        self.assertRaises(NotImplementedError, _NCD().dist, 'cat', 'hat')
+
+    def test_ncd_cache(self):
+        """Test abydos.distance._NCD.cache_info & cache_clear."""
+        cmp = NCDzlib()
+        self.assertEqual(cmp.cache_info(), CacheInfo(0, 0, 128, 0))
+        dist = cmp.dist('Niall', 'Neil')
+        self.assertEqual(
+            cmp.dist('Niall', 'Nigel'), NCDzlib().dist('Niall', 'Nigel')
+        )
+        self.assertEqual(cmp.dist('Niall', 'Neil'), dist)
+        self.assertEqual(cmp.cache_info(), CacheInfo(3, 3, 128, 3))
+        cmp.cache_clear()
+        self.assertEqual(cmp.cache_info(), CacheInfo(0, 0, 128, 0))
+
+        cmp = NCDzlib(cache_size=1)
+        cmp.dist('Niall', 'Neil')
+        self.assertEqual(cmp.cache_info(), CacheInfo(0, 2, 1, 1))
+
+        for cache_size in (0, None):
+            cmp = NCDzlib(cache_size=cache_size)
+            self.assertEqual(cmp.dist('Niall', 'Neil'), dist)
+            self.assertEqual(cmp.cache_info(), CacheInfo(0, 0, 0, 0))
+            cmp.cache_clear()
+
+    def test_ncd_matrix(self):
+        """Test abydos.distance._NCD.dist_matrix & sim_matrix."""
+        for cmp in (
+            NCDzlib(),
+            NCDzlib(prime=True),
+            NCDbz2(),
+            NCDlzma(),
+            NCDrle(),
+            NCDbwtrle(cache_size=0),
+        ):
+            dists = np.array(
+                [
+                    [cmp.dist(src, tar) for tar in self.words[2:]]
+                    for src in self.words
+                ]
+            )
+            self.assertTrue(
+                np.array_equal(
+                    cmp.dist_matrix(self.words, self.words[2:]), dists
+                )
+            )
+            sims = np.array(
+                [
+                    [cmp.sim(src, tar) for tar in self.words]
+                    for src in self.words
+                ]
+            )
+            self.assertTrue(np.array_equal(cmp.sim_matrix(self.words), sims))
+            sims[np.tril_indices(len(self.words))] = np.nan
+            self.assertTrue(
+                np.array_equal(
+                    cmp.sim_matrix(self.words, upper=True),
+                    sims,
+                    equal_nan=True,
+                )
+            )
+
+        cmp = NCDzlib()
+        self.assertTrue(
+            np.array_equal(
+                cmp._matrix(  # noqa: SF01
+                    cmp.dist_abs, self.words, None, False
+                ),
+                cmp.dist_matrix(self.words),
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
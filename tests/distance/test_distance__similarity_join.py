@@ -0,0 +1,122 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance__similarity_join.
+
+This module contains unit tests for abydos.distance._similarity_join
+"""
+
+import unittest
+from collections import Counter
+from math import sqrt
+from random import Random
+
+from abydos.distance._similarity_join import _candidate_pairs
+
+
+def _overlap(src, tar):
+    """Return the size of the multiset intersection of two Counters."""
+    return sum((src & tar).values())
+
+
+class SimilarityJoinTestCases(unittest.TestCase):
+    """Test similarity join functions.
+
+    abydos.distance._similarity_join
+    """
+
+    def test_candidate_pairs(self):
+        """Test abydos.distance._similarity_join._candidate_pairs."""
+        records = [Counter('abcd'), Counter('abce'), Counter('wxyz')]
+        self.assertEqual(
+            _candidate_pairs(records, None, lambda x, y: 3), {(0, 1)}
+        )
+        self.assertEqual(
+            _candidate_pairs(records, None, lambda x, y: 1), {(0, 1)}
+        )
+        self.assertEqual(
+            _candidate_pairs(records, None, lambda x, y: 4), set()
+        )
+        self.assertEqual(
+            _candidate_pairs(records, records, lambda x, y: 4),
+            {(0, 0), (1, 1), (2, 2)},
+        )
+        # An unattainable overlap excludes every pair
+        self.assertEqual(
+            _candidate_pairs(records, records, lambda x, y: float('inf')),
+            set(),
+        )
+        # Empty multisets are never candidates
+        self.assertEqual(
+            _candidate_pairs([Counter(), Counter()], None, lambda x, y: 0),
+            set(),
+        )
+        self.assertEqual(_candidate_pairs([], None, lambda x, y: 1), set())
+
+        # Repeated tokens count as often as they occur
+        records = [Counter('aab'), Counter('aac'), Counter('abc')]
+        self.assertEqual(
+            _candidate_pairs(records, None, lambda x, y: 2),
+            {(0, 1), (0, 2), (1, 2)},
+        )
+        self.assertEqual(
+            _candidate_pairs(records[:2], records[2:], lambda x, y: 2),
+            {(0, 0), (1, 0)},
+        )
+
+    def test_candidate_pairs_complete(self):
+        """Test that _candidate_pairs includes every qualifying pair."""
+        rng = Random(1234)
+        bounds = (
+            lambda x, y: 0.6 * (x + y) / 1.6,
+            lambda x, y: 0.8 * sqrt(x * y),
+            lambda x, y: 0.5 * min(x, y),
+        )
+        for _ in range(50):
+            left = [
+                Counter(
+                    rng.choice('abcdefgh') for _ in range(rng.randint(0, 8))
+                )
+                for _ in range(rng.randint(0, 20))
+            ]
+            right = [
+                Counter(
+                    rng.choice('abcdefgh') for _ in range(rng.randint(0, 8))
+                )
+                for _ in range(rng.randint(0, 20))
+            ]
+            for bound in bounds:
+                candidates = _candidate_pairs(left, None, bound)
+                for i in range(len(left)):
+                    for j in range(i + 1, len(left)):
+                        size_i = sum(left[i].values())
+                        size_j = sum(left[j].values())
+                        overlap = _overlap(left[i], left[j])
+                        if overlap and overlap >= bound(size_i, size_j):
+                            self.assertIn((i, j), candidates)
+
+                candidates = _candidate_pairs(left, right, bound)
+                for i in range(len(left)):
+                    for j in range(len(right)):
+                        size_i = sum(left[i].values())
+                        size_j = sum(right[j].values())
+                        overlap = _overlap(left[i], right[j])
+                        if overlap and overlap >= bound(size_i, size_j):
+                            self.assertIn((i, j), candidates)
+
+
+if __name__ == '__main__':
+    unittest.main()
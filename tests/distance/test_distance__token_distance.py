@@ -21,20 +21,32 @@ This module contains unit tests for abydos.distance._TokenDistance
 
 import unittest
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from abydos.distance import (
     AverageLinkage,
+    Cosine,
     DamerauLevenshtein,
+    Dice,
     Jaccard,
     JaroWinkler,
+    KulczynskiII,
+    Overlap,
     SokalMichener,
+    TullossT,
+    Tversky,
 )
 from abydos.stats import ConfusionTable
 from abydos.tokenizer import (
     CharacterTokenizer,
+    QGrams,
     QSkipgrams,
+    TokenIds,
+    TokenProfile,
+    Vocabulary,
     WhitespaceTokenizer,
 )
+from abydos.util._lru_cache import CacheInfo
 
 
 class TokenDistanceTestCases(unittest.TestCase):
@@ -173,6 +185,67 @@ class TokenDistanceTestCases(unittest.TestCase):
             0.6,
         )
 
+        for solver in ('greedy', 'auction'):
+            cmp = Jaccard(intersection_type='linkage', linkage_solver=solver)
+            self.assertEqual(cmp.sim('', ''), 1.0)
+            self.assertEqual(cmp.sim('abc', ''), 0.0)
+            self.assertEqual(cmp.sim('abc', 'abc'), 1.0)
+            self.assertAlmostEqual(cmp.sim('Nigel', 'Niall'), 0.5)
+            self.assertAlmostEqual(cmp.sim('Colin', 'Coiln'), 0.6)
+            self.assertAlmostEqual(cmp.sim('ATCAACGAGT', 'AACGATTAG'), 0.68)
+        # The greedy solver may link the most similar pair at the expense of
+        # two others.
+        self.assertAlmostEqual(
+            Jaccard(
+                intersection_type='linkage', tokenizer=WhitespaceTokenizer(),
+            ).sim('aaba babb', 'aabb abaa'),
+            0.6,
+        )
+        self.assertAlmostEqual(
+            Jaccard(
+                intersection_type='linkage',
+                tokenizer=WhitespaceTokenizer(),
+                linkage_solver='greedy',
+            ).sim('aaba babb', 'aabb abaa'),
+            1 / 3,
+        )
+        self.assertRaises(
+            ValueError,
+            Jaccard,
+            intersection_type='linkage',
+            linkage_solver='simplex',
+        )
+
+        # Pairs of the optimal linkage below the threshold are dropped, so a
+        # pair of tokens with nothing in common has no linkage.
+        self.assertEqual(
+            Jaccard(
+                intersection_type='linkage',
+                tokenizer=WhitespaceTokenizer(),
+                threshold=0.5,
+            ).sim('abcd efgh', 'ijkl mnop'),
+            0.0,
+        )
+        # The Hungarian solver finds the optimal linkage over every pair, and
+        # only then drops pairs below the threshold, as in 0.5.0.
+        self.assertEqual(
+            Cosine(
+                intersection_type='linkage',
+                metric=JaroWinkler(),
+                threshold=0.7,
+                tokenizer=WhitespaceTokenizer(),
+            ).sim('phillips garza aguilar holland', 'andrews guzman'),
+            0.0,
+        )
+        self.assertAlmostEqual(
+            Dice(
+                intersection_type='linkage',
+                tokenizer=WhitespaceTokenizer(),
+                threshold=0.3,
+            ).sim('hunter howard mitchell newman', 'wright patel'),
+            1 / 9,
+        )
+
     def test_token_distance(self):
         """Test abydos.distance._TokenDistance members."""
         self.assertAlmostEqual(
@@ -433,6 +506,310 @@ class TokenDistanceTestCases(unittest.TestCase):
             Counter({'#': 0.5, 'e#': -1, 'e': -0.5}),
         )
 
+    def test_token_distance_matrix(self):
+        """Test abydos.distance._TokenDistance.sim_matrix."""
+        names = ['Niall', 'Neal', 'Neil', 'Nigel', 'Neil']
+        for cmp in (self.cmp_j_crisp, self.cmp_j_soft, self.cmp_j_linkage):
+            matrix = cmp.sim_matrix(names)
+            for i, src in enumerate(names):
+                for j, tar in enumerate(names):
+                    self.assertEqual(matrix[i, j], cmp.sim(src, tar))
+
+        # Batch tokens are discarded after the batch
+        self.cmp_j_crisp.dist_matrix(names, ['Njall'])
+        self.assertEqual(self.cmp_j_crisp._batch_tokens, {})
+
+    def test_token_distance_cache(self):
+        """Test abydos.distance._TokenDistance token cache."""
+        names = ['Niall', 'Neal', 'Neil', 'Nigel', 'Neil']
+        self.assertEqual(self.cmp_j_crisp.cache_info(), CacheInfo(0, 0, 0, 0))
+        self.cmp_j_crisp.cache_clear()
+
+        cmp = Jaccard(cache_size=3)
+        for src in names:
+            for tar in names:
+                self.assertEqual(
+                    cmp.sim(src, tar), self.cmp_j_crisp.sim(src, tar)
+                )
+        # Identical strings are compared without tokenization
+        info = cmp.cache_info()
+        self.assertEqual(
+            info.hits + info.misses,
+            2 * sum(src != tar for src in names for tar in names),
+        )
+        self.assertEqual(info.maxsize, 3)
+        self.assertEqual(info.currsize, 3)
+
+        cmp.cache_clear()
+        self.assertEqual(cmp.cache_info(), CacheInfo(0, 0, 3, 0))
+        cmp.sim('Niall', 'Neil')
+        cmp.sim('Neil', 'Niall')
+        self.assertEqual(cmp.cache_info(), CacheInfo(2, 2, 3, 2))
+
+        # Tokens are keyed on the tokenizer configuration too
+        cmp.params['tokenizer'] = QGrams(qval=3)
+        self.assertEqual(
+            cmp.sim('Niall', 'Neil'),
+            Jaccard(tokenizer=QGrams(qval=3)).sim('Niall', 'Neil'),
+        )
+        self.assertEqual(cmp.cache_info(), CacheInfo(2, 4, 3, 3))
+
+        # Cached tokens are used by matrices too
+        cmp = Jaccard(cache_size=100)
+        cmp.sim_matrix(names)
+        cmp.sim_matrix(names)
+        self.assertEqual(cmp.cache_info(), CacheInfo(4, 4, 100, 4))
+
+    def test_token_distance_profile(self):
+        """Test abydos.distance._TokenDistance with TokenProfiles."""
+        names = ['', 'Niall', 'Neal', 'Neil', 'Nigel', 'Neill', 'Njall']
+        profiles = [QGrams().tokenize(name).get_profile() for name in names]
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_fuzzy,
+            Dice(),
+            Cosine(),
+            Tversky(alpha=0.8, beta=0.4),
+            SokalMichener(alphabet=None),
+            SokalMichener(normalizer='proportional'),
+        ):
+            for src, src_profile in zip(names, profiles):
+                for tar, tar_profile in zip(names, profiles):
+                    self.assertAlmostEqual(
+                        cmp.sim(src_profile, tar_profile), cmp.sim(src, tar)
+                    )
+                    cards = [
+                        getattr(cmp._tokenize(src, tar), card)()
+                        for card in (
+                            '_union_card',
+                            '_symmetric_difference_card',
+                            '_total_complement_card',
+                        )
+                    ]
+                    cmp._tokenize(src_profile, tar_profile)
+                    self.assertEqual(cmp._union_card(), cards[0])
+                    self.assertEqual(
+                        cmp._symmetric_difference_card(), cards[1]
+                    )
+                    self.assertEqual(cmp._total_complement_card(), cards[2])
+
+        # Profiles with non-integral counts are compared as Counters
+        cmp = Jaccard()
+        cmp._tokenize(TokenProfile({'a': 0.5, 'b': 1}), TokenProfile('ab'))
+        self.assertFalse(cmp._exact_profiles)
+        self.assertEqual(cmp._intersection_card(), 1.5)
+
+    def test_token_distance_vocabulary(self):
+        """Test abydos.distance._TokenDistance with TokenIds."""
+        names = ['', 'Niall', 'Neal', 'Neil', 'Nigel', 'Neill', 'Njall']
+        vocab = Vocabulary()
+        token_ids = [QGrams().tokenize(name).get_ids(vocab) for name in names]
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            Dice(),
+            Cosine(),
+            Tversky(alpha=0.8, beta=0.4),
+            SokalMichener(normalizer='proportional'),
+        ):
+            for src, src_ids in zip(names, token_ids):
+                for tar, tar_ids in zip(names, token_ids):
+                    self.assertAlmostEqual(
+                        cmp.sim(src_ids, tar_ids), cmp.sim(src, tar)
+                    )
+
+        # TokenIds are only decoded when a measure needs a Counter
+        cmp = Jaccard()
+        cmp.sim(token_ids[1], token_ids[3])
+        self.assertTrue(cmp._exact_profiles)
+        self.assertIsNone(cmp._src_counter)
+        self.assertEqual(
+            cmp._src_tokens, QGrams().tokenize('Niall').get_counter()
+        )
+
+        # TokenIds from different vocabularies are compared as Counters
+        other_ids = QGrams().tokenize('Neil').get_ids(Vocabulary())
+        self.assertEqual(
+            cmp.sim(token_ids[1], other_ids), cmp.sim('Niall', 'Neil')
+        )
+        self.assertFalse(cmp._exact_profiles)
+
+        # Stored tokens are kept as TokenIds
+        cmp = Jaccard(cache_size=10, vocabulary=vocab)
+        self.assertEqual(
+            cmp.sim('Niall', 'Neil'), Jaccard().sim('Niall', 'Neil')
+        )
+        self.assertIsInstance(cmp._src_profile, TokenIds)
+        cmp = Jaccard(vocabulary=vocab)
+        matrix = cmp.sim_matrix(names)
+        for i, src in enumerate(names):
+            for j, tar in enumerate(names):
+                self.assertEqual(matrix[i, j], Jaccard().sim(src, tar))
+
+    def test_token_distance_compare(self):
+        """Test abydos.distance._TokenDistance.compare."""
+        names = ['', 'Niall', 'Neal', 'Neil', 'Nigel', 'Neill', 'Njall']
+        pairs = [(src, tar) for src in names for tar in names]
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            self.cmp_j_fuzzy,
+            self.cmp_j_linkage,
+            Jaccard(cache_size=16),
+            Tversky(alpha=0.8, beta=0.4),
+            SokalMichener(normalizer='proportional'),
+        ):
+            for method in ('sim', 'dist', 'sim_score', 'dist_abs'):
+                if not hasattr(cmp, method):
+                    continue
+                expected = [
+                    getattr(cmp, method)(src, tar) for src, tar in pairs
+                ]
+                self.assertEqual(
+                    [cmp.compare(src, tar, method) for src, tar in pairs],
+                    expected,
+                )
+
+            # Comparisons leave the instance unchanged
+            cmp.sim('Niall', 'Neil')
+            tokens = cmp._get_tokens()
+            cmp.compare('Nigel', 'Njall')
+            self.assertEqual(cmp._get_tokens(), tokens)
+
+            # A single instance may serve several threads
+            with ThreadPoolExecutor(4) as executor:
+                results = list(
+                    executor.map(lambda pair: cmp.compare(*pair), pairs * 4)
+                )
+            self.assertEqual(
+                results, [cmp.sim(src, tar) for src, tar in pairs] * 4
+            )
+
+        # Measures holding other measures are isolated too
+        cmp = TullossT()
+        self.assertEqual(
+            cmp.compare('Niall', 'Neil'), TullossT().sim('Niall', 'Neil')
+        )
+        self.assertEqual(cmp._r._src_tokens, Counter())
+
+        with self.assertRaises(ValueError):
+            Jaccard().compare('Niall', 'Neil', method='sim_matrix')
+
+    def test_token_distance_compare_crisp(self):
+        """Test abydos.distance._TokenDistance.compare without copying."""
+        names = ['', 'Niall', 'Neal', 'Neil', 'Nigel', 'Neill', 'Njall']
+        pairs = [(src, tar) for src in names for tar in names]
+
+        def _fail():
+            raise AssertionError('The measure or its tokenizer was copied')
+
+        # Crisp set-based measures compare strings without copying the
+        # instance or its tokenizer.
+        for cmp in (
+            Jaccard(),
+            Dice(cache_size=16),
+            Cosine(vocabulary=Vocabulary(), cache_size=16),
+            Tversky(alpha=0.8, beta=0.4, bias=0.2),
+            Overlap(tokenizer=WhitespaceTokenizer()),
+            KulczynskiII(tokenizer=CharacterTokenizer(scaler='length')),
+        ):
+            expected = {
+                method: [getattr(cmp, method)(src, tar) for src, tar in pairs]
+                for method in ('sim', 'dist', 'dist_abs')
+            }
+            tokens = cmp._get_tokens()
+            cmp._isolated = _fail
+            cmp.params['tokenizer']._copy = _fail
+            for method in ('sim', 'dist', 'dist_abs'):
+                self.assertEqual(
+                    [cmp.compare(src, tar, method) for src, tar in pairs],
+                    expected[method],
+                )
+            self.assertEqual(cmp._get_tokens(), tokens)
+        self.assertEqual(
+            Jaccard().compare(Counter('abc'), TokenProfile('abd')), 0.5
+        )
+
+    def test_token_distance_join(self):
+        """Test abydos.distance._TokenDistance.all_pairs_above & .join."""
+        names = [
+            '',
+            ' ',
+            ' ',
+            'Niall',
+            'Neal',
+            'Neil',
+            'Nigel',
+            'Neill',
+            'Njall',
+            'Niall',
+            'Nil',
+            'Colin',
+            'Collin',
+            'Cullen',
+            'Nilan',
+            'Lin',
+        ]
+        left, right = names[::2], names[1::2]
+        for cmp in (
+            Jaccard(),
+            Dice(),
+            Cosine(),
+            Overlap(),
+            Tversky(alpha=0.8, beta=0.2),
+            Tversky(alpha=0.5, beta=0.5, bias=0.5),
+            Jaccard(tokenizer=QGrams(qval=1)),
+            Jaccard(tokenizer=QGrams(qval=2, scaler='set')),
+            Jaccard(tokenizer=QGrams(qval=2, scaler='SSK')),
+            Cosine(tokenizer=WhitespaceTokenizer()),
+            Overlap(tokenizer=QSkipgrams(qval=2)),
+            self.cmp_j_soft,
+            SokalMichener(normalizer='proportional'),
+            KulczynskiII(),
+        ):
+            for threshold in (-1.0, 0.0, 0.2, 0.4, 0.6, 0.8, 1.0, 1.5):
+                self.assertEqual(
+                    cmp.all_pairs_above(names, threshold),
+                    [
+                        (i, j, cmp.sim(names[i], names[j]))
+                        for i in range(len(names))
+                        for j in range(i + 1, len(names))
+                        if cmp.sim(names[i], names[j]) >= threshold
+                    ],
+                )
+                self.assertEqual(
+                    cmp.join(left, right, threshold),
+                    [
+                        (i, j, cmp.sim(left[i], right[j]))
+                        for i in range(len(left))
+                        for j in range(len(right))
+                        if cmp.sim(left[i], right[j]) >= threshold
+                    ],
+                )
+
+        self.assertEqual(Jaccard().all_pairs_above([], 0.5), [])
+        self.assertEqual(Jaccard().join(names, [], 0.5), [])
+        self.assertEqual(
+            Jaccard().all_pairs_above(('Niall', 'Niall', 'Neil'), 1.0),
+            [(0, 1, 1.0)],
+        )
+        # Identical strings without tokens match
+        self.assertEqual(
+            Jaccard(tokenizer=WhitespaceTokenizer()).join([' '], [' '], 1.0),
+            [(0, 0, 1.0)],
+        )
+
+        # Filtering leaves fewer pairs to compare than every pair
+        cmp = Jaccard(cache_size=1000)
+        compared = []
+        sim = cmp.sim
+        cmp.sim = lambda src, tar: compared.append((src, tar)) or sim(src, tar)
+        cmp.all_pairs_above(names, 0.6)
+        self.assertLess(len(compared), len(names) * (len(names) - 1) // 4)
+        # Each distinct string is tokenized once for the batch.
+        self.assertEqual(cmp.cache_info().misses, len(set(names)))
+        self.assertEqual(cmp._batch_tokens, {})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.distance.DamerauLevenshtein
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import DamerauLevenshtein
 
 
@@ -78,6 +80,119 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp55105.dist('cab', 'cba'), 1 / 3)
         self.assertRaises(ValueError, self.cmp1010105.dist, 'ab', 'ba')
 
+    def test_damerau_bounded(self):
+        """Test abydos.distance.DamerauLevenshtein with max_dist & min_sim."""
+        words = (
+            '',
+            'cat',
+            'hat',
+            'Niall',
+            'Neil',
+            'Nigel',
+            'Colin',
+            'Cuilen',
+            'ATCG',
+            'TAGC',
+            'ACTG',
+            'aluminum',
+            'Catalan',
+            'Nicholas',
+            'Nikolaus',
+        )
+        for kwargs in (
+            {},
+            {'cost': (5, 7, 10, 10)},
+            {'cost': (10, 10, 5, 10)},
+        ):
+            cmp = DamerauLevenshtein(**kwargs)
+            for max_dist in (0, 5, 10, 17.5, 30):
+                cmp_bounded = DamerauLevenshtein(max_dist=max_dist, **kwargs)
+                for src in words:
+                    for tar in words:
+                        dist = cmp.dist_abs(src, tar)
+                        if dist <= max_dist:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), dist
+                            )
+                            self.assertAlmostEqual(
+                                cmp_bounded.dist(src, tar), cmp.dist(src, tar),
+                            )
+                        else:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), float('inf')
+                            )
+                            self.assertEqual(cmp_bounded.dist(src, tar), 1.0)
+            for min_sim in (0.0, 0.25, 0.5, 0.8):
+                cmp_bounded = DamerauLevenshtein(min_sim=min_sim, **kwargs)
+                for src in words:
+                    for tar in words:
+                        sim = cmp.sim(src, tar)
+                        if sim >= min_sim:
+                            self.assertAlmostEqual(
+                                cmp_bounded.sim(src, tar), sim
+                            )
+                        else:
+                            self.assertEqual(cmp_bounded.sim(src, tar), 0.0)
+
+    def test_damerau_matrix(self):
+        """Test abydos.distance.DamerauLevenshtein.dist_matrix & sim_matrix."""
+        words = [
+            '',
+            'cat',
+            'hat',
+            'Niall',
+            'Neil',
+            'Nigel',
+            'Colin',
+            'Cuilen',
+            'ATCG',
+            'TAGC',
+            'ACTG',
+            'CA',
+            'ABC',
+            'abcdefg',
+            'bacdfeg',
+            'aluminum',
+            'Catalan',
+        ]
+        for kwargs in (
+            {},
+            {'cost': (5, 7, 10, 10)},
+            {'cost': (10, 10, 5, 10)},
+            {'cost': (5, 5, 10, 5)},
+            {'cost': (1, 1, 1, 1.5)},
+            {'normalizer': sum},
+            {'max_dist': 3},
+        ):
+            cmp = DamerauLevenshtein(**kwargs)
+            dists = np.array(
+                [[cmp.dist(src, tar) for tar in words[3:]] for src in words]
+            )
+            self.assertTrue(
+                np.array_equal(cmp.dist_matrix(words, words[3:]), dists)
+            )
+            sims = np.array(
+                [[cmp.sim(src, tar) for tar in words] for src in words]
+            )
+            sims[np.tril_indices(len(words))] = np.nan
+            self.assertTrue(
+                np.array_equal(
+                    cmp.sim_matrix(words, upper=True), sims, equal_nan=True
+                )
+            )
+
+        # Only a few rows at a time
+        cmp = DamerauLevenshtein()
+        cmp._numpy_cells = 100  # noqa: SF01
+        dists = np.array(
+            [[cmp.dist(src, tar) for tar in words] for src in words]
+        )
+        self.assertTrue(np.array_equal(cmp.dist_matrix(words), dists))
+
+        self.assertRaises(
+            ValueError, self.cmp1010105.dist_matrix, ['ab', 'cd'], ['ba', 'a']
+        )
+
     def test_damerau_sim(self):
         """Test abydos.distance.DamerauLevenshtein.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
@@ -117,6 +117,62 @@ class DiscountedLevenshteinTestCases(unittest.TestCase):
             self.cmp.dist_abs('ATCAACGAGT', 'AACGATTAG'), 3.480037325627888
         )
 
+    def test_discounted_levenshtein_bounded(self):
+        """Test abydos.distance.DiscountedLevenshtein max_dist & min_sim."""
+        words = (
+            '',
+            'cat',
+            'hat',
+            'Niall',
+            'Neil',
+            'Nigel',
+            'Colin',
+            'Cuilen',
+            'ATCG',
+            'TAGC',
+            'ACTG',
+            'aluminum',
+            'Catalan',
+            'Nicholas',
+            'Nikolaus',
+        )
+        for kwargs in (
+            {},
+            {'mode': 'osa'},
+            {'discount_from': 'coda', 'discount_func': 'exp'},
+        ):
+            cmp = DiscountedLevenshtein(**kwargs)
+            for max_dist in (0, 1, 2, 3.5, 6):
+                cmp_bounded = DiscountedLevenshtein(
+                    max_dist=max_dist, **kwargs
+                )
+                for src in words:
+                    for tar in words:
+                        dist = cmp.dist_abs(src, tar)
+                        if dist <= max_dist:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), dist
+                            )
+                            self.assertAlmostEqual(
+                                cmp_bounded.dist(src, tar), cmp.dist(src, tar),
+                            )
+                        else:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), float('inf')
+                            )
+                            self.assertEqual(cmp_bounded.dist(src, tar), 1.0)
+            for min_sim in (0.0, 0.25, 0.5, 0.8):
+                cmp_bounded = DiscountedLevenshtein(min_sim=min_sim, **kwargs)
+                for src in words:
+                    for tar in words:
+                        sim = cmp.sim(src, tar)
+                        if sim >= min_sim:
+                            self.assertAlmostEqual(
+                                cmp_bounded.sim(src, tar), sim
+                            )
+                        else:
+                            self.assertEqual(cmp_bounded.sim(src, tar), 0.0)
+
     def test_discounted_levenshtein_dist(self):
         """Test abydos.distance.DiscountedLevenshtein.dist."""
         # Base cases
@@ -21,8 +21,12 @@ This module contains unit tests for abydos.distance.JaroWinkler
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import JaroWinkler
 
+from .. import NIALL
+
 
 class JaroWinklerTestCases(unittest.TestCase):
     """Test Jaro(-Winkler) functions.
@@ -133,6 +137,69 @@ class JaroWinklerTestCases(unittest.TestCase):
 
         self.assertAlmostEqual(self.jaro_winkler.dist('ABCD', 'EFGH'), 1.0)
 
+    def test_sim_jaro_winkler_long(self):
+        """Test abydos.distance.JaroWinkler.sim with long strings."""
+        src = 'The quick brown fox jumped over the lazy dog. ' * 3
+        tar = 'The quick brown dog jumped over the lazy fox. ' * 3
+        self.assertAlmostEqual(self.jaro.sim(src, tar), 0.98540146)
+        self.assertAlmostEqual(self.jaro_winkler.sim(src, tar), 0.99124088)
+        self.assertAlmostEqual(JaroWinkler(qval=2).sim(src, tar), 0.96897233)
+
+    def test_sim_many_jaro_winkler(self):
+        """Test abydos.distance.JaroWinkler.sim_many."""
+        for cmp in (
+            self.jaro,
+            self.jaro_winkler,
+            JaroWinkler(qval=2, long_strings=True),
+        ):
+            for src in NIALL:
+                self.assertEqual(
+                    cmp.sim_many(src, NIALL),
+                    [cmp.sim(src, tar) for tar in NIALL],
+                )
+        self.assertEqual(self.jaro.sim_many('Niall', []), [])
+        self.assertRaises(
+            ValueError, JaroWinkler(boost_threshold=2).sim_many, 'abcd', []
+        )
+
+    def test_sim_jaro_winkler_min_sim(self):
+        """Test abydos.distance.JaroWinkler with min_sim."""
+        for kwargs in ({'mode': 'jaro'}, {}, {'long_strings': True}):
+            cmp = JaroWinkler(**kwargs)
+            for min_sim in (0.5, 0.75, 0.9):
+                cmp_min = JaroWinkler(min_sim=min_sim, **kwargs)
+                for src in NIALL:
+                    sims = [cmp.sim(src, tar) for tar in NIALL]
+                    self.assertEqual(
+                        cmp_min.sim_many(src, NIALL),
+                        [sim if sim >= min_sim else 0.0 for sim in sims],
+                    )
+        cmp_min = JaroWinkler(min_sim=0.9)
+        self.assertEqual(cmp_min.sim('MARTHA', 'MARHTA'), 0.9611111111111111)
+        self.assertEqual(cmp_min.sim('DWAYNE', 'DUANE'), 0.0)
+        self.assertEqual(cmp_min.dist('DWAYNE', 'DUANE'), 1.0)
+        self.assertEqual(cmp_min.sim('MARTHA', 'MARTHA'), 1.0)
+        self.assertEqual(cmp_min.sim('MARTHA', ''), 0.0)
+
+    def test_jaro_winkler_matrix(self):
+        """Test abydos.distance.JaroWinkler.sim_matrix & .dist_matrix."""
+        names = NIALL[:8]
+        sims = np.array(
+            [
+                [self.jaro_winkler.sim(src, tar) for tar in names]
+                for src in names
+            ]
+        )
+        np.testing.assert_array_equal(
+            self.jaro_winkler.sim_matrix(names), sims
+        )
+        np.testing.assert_array_equal(
+            self.jaro_winkler.dist_matrix(names[:3], names), 1.0 - sims[:3]
+        )
+        upper = self.jaro_winkler.sim_matrix(names, upper=True)
+        self.assertTrue(np.isnan(upper[1, 0]))
+        self.assertEqual(upper[0, 1], sims[0, 1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -167,6 +167,35 @@ class LevenshteinTestCases(unittest.TestCase):
             7.499999999999999,
         )
 
+    def test_levenshtein_bit_parallel(self):
+        """Test abydos.distance.Levenshtein._bit_parallel."""
+        self.assertIsNotNone(self.cmp._bit_parallel())
+        self.assertIsNone(self.cmp_taper._bit_parallel())
+        self.assertIsNotNone(Levenshtein(mode='osa')._bit_parallel())
+        self.assertIsNotNone(Levenshtein(cost=(1, 1, 1, 2))._bit_parallel())
+        self.assertIsNone(
+            Levenshtein(mode='osa', cost=(1, 1, 1, 2))._bit_parallel()
+        )
+        self.assertIsNone(Levenshtein(cost=(2, 1, 1, 1))._bit_parallel())
+        self.assertIsNone(Levenshtein(cost=(1, 1, 1.5, 1))._bit_parallel())
+        self.assertIsNone(Levenshtein(mode='xyz')._bit_parallel())
+
+        src = 'The quick brown fox jumped over the lazy dog. ' * 3
+        tar = 'The quack brawn fix jumbled over a lazy dog! ' * 3
+        for cmp in (
+            Levenshtein(),
+            Levenshtein(mode='osa'),
+            Levenshtein(cost=(1, 1, 2, 1)),
+        ):
+            self.assertEqual(
+                cmp.dist_abs(src, tar),
+                cmp._alignment_matrix(src, tar, backtrace=False)[-1, -1],
+            )
+            self.assertEqual(
+                cmp.dist_abs(tar, src),
+                cmp._alignment_matrix(tar, src, backtrace=False)[-1, -1],
+            )
+
     def test_levenshtein_dist(self):
         """Test abydos.distance.Levenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
@@ -192,6 +221,63 @@ class LevenshteinTestCases(unittest.TestCase):
             self.cmp_taper.dist('abbc', 'abc'), 0.19230769230769232
         )
 
+    def test_levenshtein_bounded(self):
+        """Test abydos.distance.Levenshtein with max_dist & min_sim."""
+        words = (
+            '',
+            'cat',
+            'hat',
+            'Niall',
+            'Neil',
+            'Nigel',
+            'Colin',
+            'Cuilen',
+            'ATCG',
+            'TAGC',
+            'ACTG',
+            'aluminum',
+            'Catalan',
+            'Nicholas',
+            'Nikolaus',
+        )
+        for kwargs in (
+            {},
+            {'mode': 'osa'},
+            {'cost': (1, 1, 2, 1)},
+            {'cost': (2, 1, 1.5, 1)},
+            {'mode': 'osa', 'cost': (1, 2, 1, 0.5)},
+            {'taper': True},
+        ):
+            cmp = Levenshtein(**kwargs)
+            for max_dist in (0, 1, 2, 3.5, 6):
+                cmp_bounded = Levenshtein(max_dist=max_dist, **kwargs)
+                for src in words:
+                    for tar in words:
+                        dist = cmp.dist_abs(src, tar)
+                        if dist <= max_dist:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), dist
+                            )
+                            self.assertAlmostEqual(
+                                cmp_bounded.dist(src, tar), cmp.dist(src, tar),
+                            )
+                        else:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), float('inf')
+                            )
+                            self.assertEqual(cmp_bounded.dist(src, tar), 1.0)
+            for min_sim in (0.0, 0.25, 0.5, 0.8):
+                cmp_bounded = Levenshtein(min_sim=min_sim, **kwargs)
+                for src in words:
+                    for tar in words:
+                        sim = cmp.sim(src, tar)
+                        if sim >= min_sim:
+                            self.assertAlmostEqual(
+                                cmp_bounded.sim(src, tar), sim
+                            )
+                        else:
+                            self.assertEqual(cmp_bounded.sim(src, tar), 0.0)
+
     def test_levenshtein_sim(self):
         """Test abydos.distance.Levenshtein.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
@@ -0,0 +1,111 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_lsh_index.
+
+This module contains unit tests for abydos.distance.LSHIndex
+"""
+
+import unittest
+from itertools import combinations
+
+from abydos.distance import Jaccard, LSHIndex, MinHash
+
+from .. import _corpus_file
+
+
+class LSHIndexTestCases(unittest.TestCase):
+    """Test LSHIndex functions.
+
+    abydos.distance.LSHIndex
+    """
+
+    names = ['Niall', 'Nigel', 'Neal', 'Neil', 'Njall', 'Catalan']
+
+    def test_lsh_index(self):
+        """Test abydos.distance.LSHIndex."""
+        index = LSHIndex()
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.query('Niall'), [])
+        self.assertEqual(list(index.candidate_pairs()), [])
+
+        with self.assertRaises(ValueError):
+            LSHIndex(bands=4, rows=4, minhash=MinHash(k=32))
+        index = LSHIndex(bands=4, rows=8, minhash=MinHash(k=32, qval=3))
+        index.insert('Niall')
+        self.assertIn('Niall', index)
+        with self.assertRaises(KeyError):
+            index.insert('Niall')
+        with self.assertRaises(ValueError):
+            index.insert(index.signature('Neil'))
+        with self.assertRaises(ValueError):
+            index.insert(MinHash(k=16).signature('Neil'), key='Neil')
+
+        # Signatures & keys may be supplied instead of strings
+        index.insert(index.signature('Niall'), key=1)
+        self.assertEqual(index.query(index.signature('Niall')), ['Niall', 1])
+        self.assertEqual(list(index.candidate_pairs()), [('Niall', 1)])
+
+    def test_lsh_index_candidates(self):
+        """Test abydos.distance.LSHIndex candidates."""
+        index = LSHIndex(bands=32, rows=2)
+        for name in self.names:
+            index.insert(name)
+
+        pairs = list(index.candidate_pairs())
+        self.assertEqual(len(pairs), len(set(pairs)))
+        for src, tar in pairs:
+            self.assertLess(self.names.index(src), self.names.index(tar))
+            self.assertIn(tar, index.query(src))
+        self.assertIn(('Niall', 'Njall'), pairs)
+        self.assertNotIn(('Nigel', 'Catalan'), pairs)
+
+        # The threshold filters by estimated similarity
+        cmp = MinHash(k=64)
+        index = LSHIndex(bands=32, rows=2, threshold=0.3)
+        for name in self.names:
+            index.insert(name)
+        for src, tar in index.candidate_pairs():
+            self.assertGreaterEqual(cmp.sim(src, tar), 0.3)
+        unfiltered = LSHIndex(bands=32, rows=2)
+        for name in self.names:
+            unfiltered.insert(name)
+        self.assertLess(
+            set(index.candidate_pairs()), set(unfiltered.candidate_pairs())
+        )
+
+    def test_lsh_index_recall(self):
+        """Test abydos.distance.LSHIndex recall on a corpus."""
+        with open(_corpus_file('uscensus2000.csv')) as corpus:
+            names = [line.split(',')[0] for line in corpus.readlines()[1:301]]
+        cmp = Jaccard(cache_size=len(names))
+        similar = {
+            (src, tar)
+            for src, tar in combinations(names, 2)
+            if cmp.sim(src, tar) >= 0.6
+        }
+
+        index = LSHIndex(bands=20, rows=3)
+        for name in names:
+            index.insert(name)
+        pairs = set(index.candidate_pairs())
+
+        self.assertGreaterEqual(len(similar & pairs), 0.95 * len(similar))
+        self.assertLess(len(pairs), len(names) * (len(names) - 1) // 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,9 @@ This module contains unit tests for abydos.distance.MinHash
 
 import unittest
 
-from abydos.distance import MinHash
+import numpy as np
+
+from abydos.distance import Jaccard, MinHash
 
 
 class MinHashTestCases(unittest.TestCase):
@@ -36,35 +38,106 @@ class MinHashTestCases(unittest.TestCase):
         """Test abydos.distance.MinHash.sim."""
         # Base cases
         self.assertEqual(self.cmp.sim('', ''), 1.0)
-        self.assertEqual(self.cmp.sim('a', ''), 0.5)
-        self.assertEqual(self.cmp.sim('', 'a'), 0.5)
-        self.assertEqual(self.cmp.sim('abc', ''), 0.75)
-        self.assertEqual(self.cmp.sim('', 'abc'), 0.75)
+        self.assertEqual(self.cmp.sim('a', ''), 0.0)
+        self.assertEqual(self.cmp.sim('', 'a'), 0.0)
+        self.assertEqual(self.cmp.sim('abc', ''), 0.0)
+        self.assertEqual(self.cmp.sim('', 'abc'), 0.0)
         self.assertEqual(self.cmp.sim('abc', 'abc'), 1.0)
-        self.assertEqual(self.cmp.sim('abcd', 'efgh'), 0.6)
+        self.assertEqual(self.cmp.sim('abcd', 'efgh'), 0.0)
+
+        self.assertAlmostEqual(self.cmp.sim('Nigel', 'Niall'), 1 / 3)
+        self.assertAlmostEqual(self.cmp.sim('Niall', 'Nigel'), 1 / 3)
+        self.assertAlmostEqual(self.cmp.sim('Colin', 'Coiln'), 1 / 3)
+        self.assertAlmostEqual(self.cmp.sim('Coiln', 'Colin'), 1 / 3)
+        self.assertAlmostEqual(self.cmp.sim('ATCAACGAGT', 'AACGATTAG'), 5 / 11)
 
-        self.assertAlmostEqual(self.cmp.sim('Nigel', 'Niall'), 1.0)
-        self.assertAlmostEqual(self.cmp.sim('Niall', 'Nigel'), 1.0)
-        self.assertAlmostEqual(self.cmp.sim('Colin', 'Coiln'), 0.5)
-        self.assertAlmostEqual(self.cmp.sim('Coiln', 'Colin'), 0.5)
-        self.assertAlmostEqual(self.cmp.sim('ATCAACGAGT', 'AACGATTAG'), 1.0)
+        # Tokenizers yielding no tokens
+        self.assertEqual(MinHash(qval=0).sim(' ', '  '), 1.0)
 
     def test_minhash_dist(self):
         """Test abydos.distance.MinHash.dist."""
         # Base cases
         self.assertEqual(self.cmp.dist('', ''), 0.0)
-        self.assertEqual(self.cmp.dist('a', ''), 0.5)
-        self.assertEqual(self.cmp.dist('', 'a'), 0.5)
-        self.assertEqual(self.cmp.dist('abc', ''), 0.25)
-        self.assertEqual(self.cmp.dist('', 'abc'), 0.25)
+        self.assertEqual(self.cmp.dist('a', ''), 1.0)
+        self.assertEqual(self.cmp.dist('', 'a'), 1.0)
+        self.assertEqual(self.cmp.dist('abc', ''), 1.0)
+        self.assertEqual(self.cmp.dist('', 'abc'), 1.0)
         self.assertEqual(self.cmp.dist('abc', 'abc'), 0.0)
-        self.assertEqual(self.cmp.dist('abcd', 'efgh'), 0.4)
+        self.assertEqual(self.cmp.dist('abcd', 'efgh'), 1.0)
+
+        self.assertAlmostEqual(self.cmp.dist('Nigel', 'Niall'), 2 / 3)
+        self.assertAlmostEqual(self.cmp.dist('Niall', 'Nigel'), 2 / 3)
+        self.assertAlmostEqual(self.cmp.dist('Colin', 'Coiln'), 2 / 3)
+        self.assertAlmostEqual(self.cmp.dist('Coiln', 'Colin'), 2 / 3)
+        self.assertAlmostEqual(
+            self.cmp.dist('ATCAACGAGT', 'AACGATTAG'), 6 / 11
+        )
+
+    def test_minhash_signature(self):
+        """Test abydos.distance.MinHash.signature."""
+        with self.assertRaises(ValueError):
+            self.cmp.signature('Niall')
+
+        cmp = MinHash(k=256)
+        sig = cmp.signature('Niall')
+        self.assertEqual(sig.dtype, np.int64)
+        self.assertEqual(len(sig), 256)
+        self.assertTrue((sig == cmp.signature('Niall')).all())
+        self.assertTrue((sig == MinHash(k=256).signature('Niall')).all())
+        self.assertFalse(
+            (sig == MinHash(k=256, seed=1).signature('Niall')).all()
+        )
+
+        for src, tar in (
+            ('Niall', 'Neil'),
+            ('Nigel', 'Niall'),
+            ('ATCAACGAGT', 'AACGATTAG'),
+            ('', 'Niall'),
+            ('', ''),
+        ):
+            self.assertEqual(
+                cmp.sim(cmp.signature(src), cmp.signature(tar)),
+                cmp.sim(src, tar),
+            )
+        with self.assertRaises(ValueError):
+            cmp.sim(sig, MinHash(k=8).signature('Niall'))
+        self.assertEqual(cmp.sim(sig[:0], sig[:0]), 1.0)
+
+        # A signature may be compared with a string
+        for src, tar in (('Niall', 'Neil'), ('Niall', ''), ('', '')):
+            self.assertEqual(
+                cmp.sim(cmp.signature(src), tar), cmp.sim(src, tar)
+            )
+            self.assertEqual(
+                cmp.sim(src, cmp.signature(tar)), cmp.sim(src, tar)
+            )
+            self.assertEqual(
+                cmp.dist(cmp.signature(src), tar), cmp.dist(src, tar)
+            )
+        with self.assertRaises(ValueError):
+            cmp.sim(MinHash(k=8).signature('Niall'), 'Neil')
+        with self.assertRaises(ValueError):
+            self.cmp.sim(sig, 'Neil')
+
+        # A large k gives estimates close to the Jaccard similarity
+        cmp = MinHash(k=4096)
+        for src, tar in (
+            ('Nigel', 'Niall'),
+            ('Niall', 'Neil'),
+            ('Christopher', 'Kristofer'),
+            ('ATCAACGAGT', 'AACGATTAG'),
+        ):
+            self.assertAlmostEqual(
+                cmp.sim(src, tar), Jaccard().sim(src, tar), delta=0.03
+            )
 
-        self.assertAlmostEqual(self.cmp.dist('Nigel', 'Niall'), 0.0)
-        self.assertAlmostEqual(self.cmp.dist('Niall', 'Nigel'), 0.0)
-        self.assertAlmostEqual(self.cmp.dist('Colin', 'Coiln'), 0.5)
-        self.assertAlmostEqual(self.cmp.dist('Coiln', 'Colin'), 0.5)
-        self.assertAlmostEqual(self.cmp.dist('ATCAACGAGT', 'AACGATTAG'), 0.0)
+        # The hashes of a batch's tokens are discarded afterward
+        names = ['Niall', 'Neil', 'Nigel']
+        matrix = self.cmp.sim_matrix(names)
+        for i, src in enumerate(names):
+            for j, tar in enumerate(names):
+                self.assertEqual(matrix[i, j], self.cmp.sim(src, tar))
+        self.assertEqual(self.cmp._batch_hashes, {})
 
 
 if __name__ == '__main__':
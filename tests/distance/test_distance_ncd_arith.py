@@ -87,6 +87,30 @@ class NCDarithTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.sim('Njáll', 'Njall'), 0.25)
         self.assertAlmostEqual(self.cmp.sim('Njall', 'Njáll'), 0.25)
 
+    def test_ncd_arith_precision(self):
+        """Test abydos.distance.NCDarith with integer coding."""
+        cmp_int = NCDarith(precision=32)
+        cmp_int_probs = NCDarith(self.arith.get_probs(), precision=32)
+        self.assertEqual(cmp_int.dist('', ''), 0)
+        self.assertAlmostEqual(cmp_int.dist('Niall', 'Neil'), 0.75)
+        self.assertAlmostEqual(
+            cmp_int_probs.dist('Niall', 'Neil'), 0.5909090909090909
+        )
+        self.assertAlmostEqual(
+            cmp_int_probs.dist('Niall', 'Neil'),
+            cmp_int_probs.dist('Neil', 'Niall'),
+        )
+
+    def test_ncd_arith_matrix(self):
+        """Test abydos.distance.NCDarith.dist_matrix."""
+        for cmp in (self.cmp, self.cmp_probs):
+            matrix = cmp.dist_matrix(NIALL[:6], NIALL[3:])
+            for i, src in enumerate(NIALL[:6]):
+                for j, tar in enumerate(NIALL[3:]):
+                    self.assertAlmostEqual(matrix[i, j], cmp.dist(src, tar))
+        self.assertGreater(self.cmp_probs.cache_info().hits, 0)
+        self.assertEqual(self.cmp.cache_info().maxsize, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,8 @@
 This module contains unit tests for abydos.distance.compression
 """
 
+import pickle
+import random
 import unittest
 
 from abydos.distance import NCDzlib
@@ -44,6 +46,27 @@ class CompressionTestCases(unittest.TestCase):
         self.assertLess(self.cmp.sim('a', ''), 1)
         self.assertAlmostEqual(self.cmp.sim('abcdefg', 'fg'), 0.46153846153846)
 
+    def test_ncd_zlib_prime(self):
+        """Test abydos.distance.NCDzlib with prime."""
+        rng = random.Random(0)
+        texts = [
+            ''.join(rng.choice('abcde ') for _ in range(length))
+            for length in (0, 1, 5, 50, 500, 5000, 20000)
+        ]
+        for level in (-1, 0, 1, 9):
+            cmp = NCDzlib(level=level)
+            cmp_prime = NCDzlib(level=level, prime=True)
+            for src in texts:
+                for tar in texts:
+                    self.assertEqual(
+                        cmp_prime.dist(src, tar), cmp.dist(src, tar)
+                    )
+
+        cmp = pickle.loads(pickle.dumps(cmp_prime))
+        self.assertEqual(
+            cmp.dist(texts[3], texts[4]), cmp_prime.dist(texts[3], texts[4])
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,125 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_tf_idf_index.
+
+This module contains unit tests for abydos.distance.TFIDFIndex
+"""
+
+import unittest
+
+import numpy as np
+
+from abydos.corpus import UnigramCorpus
+from abydos.distance import TFIDF, TFIDFIndex
+from abydos.tokenizer import QGrams
+
+from .. import NIALL
+
+
+class TFIDFIndexTestCases(unittest.TestCase):
+    """Test TFIDFIndex functions.
+
+    abydos.distance.TFIDFIndex
+    """
+
+    names = ['Niall', 'Nigel', 'Neal', 'Neil', 'Njall', 'Catalan']
+
+    def test_tf_idf_index(self):
+        """Test abydos.distance.TFIDFIndex."""
+        index = TFIDFIndex()
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.query('Niall'), [])
+        for name in self.names:
+            index.insert(name)
+        index.insert('Neil', key=7)
+        self.assertEqual(len(index), 7)
+        self.assertIn('Njall', index)
+        self.assertIn(7, index)
+        self.assertNotIn('Nial', index)
+        self.assertRaises(KeyError, index.insert, 'Neil')
+        self.assertRaises(KeyError, index.insert, 'Nigel', 7)
+
+        self.assertEqual(
+            [key for key, _ in index.query('Neil', k=3)], ['Neil', 7, 'Neal']
+        )
+        self.assertEqual(index.query('Neil', k=1)[0][0], 'Neil')
+        self.assertAlmostEqual(index.query('Neil', k=1)[0][1], 1.0)
+        self.assertEqual(index.query('Neil', k=0), [])
+        sims = index.query('Neil', k=None)
+        self.assertEqual(
+            sims, sorted(sims, key=lambda pair: pair[1], reverse=True)
+        )
+        self.assertTrue(all(0 < sim <= 1 + 1e-12 for _, sim in sims))
+        self.assertEqual(
+            index.query('Neil', k=None, min_sim=0.3),
+            [(key, sim) for key, sim in sims if sim >= 0.3],
+        )
+        self.assertEqual(index.query('xyz'), [])
+
+        # The IDFs change as records are added.
+        before = dict(index.query('Neil', k=None))
+        index.insert('Neilson')
+        after = dict(index.query('Neil', k=None))
+        self.assertIn('Neilson', after)
+        self.assertNotEqual(before['Neal'], after['Neal'])
+
+    def test_tf_idf_index_tf_idf(self):
+        """Test abydos.distance.TFIDFIndex against TFIDF."""
+        # Names of one word, so that every q-gram of each is in the corpus
+        names = [name for name in dict.fromkeys(NIALL) if ' ' not in name]
+        corpus = UnigramCorpus(word_tokenizer=QGrams(qval=2))
+        for name in names:
+            corpus.add_document(name)
+        tfidf = TFIDF(corpus=corpus)
+        index = TFIDFIndex(tfidf)
+        for name in names:
+            index.insert(name)
+        for query in names:
+            sims = dict(index.query(query, k=None))
+            for name in names:
+                self.assertAlmostEqual(
+                    sims.get(name, 0.0), tfidf.sim(query, name)
+                )
+
+        # Tokens absent from the corpus are ignored.
+        tfidf = TFIDF(corpus=UnigramCorpus('Niall Neil'))
+        index = TFIDFIndex(tfidf)
+        index.insert('Niall')
+        self.assertEqual(index.query('Nigel'), [])
+
+    def test_tf_idf_index_matrix(self):
+        """Test abydos.distance.TFIDFIndex.matrix."""
+        index = TFIDFIndex()
+        for name in self.names:
+            index.insert(name)
+        data, indices, indptr = index.matrix()
+        self.assertEqual(len(indptr), len(self.names) + 1)
+        self.assertEqual(indptr[-1], len(data))
+        self.assertEqual(len(indices), len(data))
+        vocabulary = index.vocabulary()
+        for row, name in enumerate(self.names):
+            start, end = indptr[row], indptr[row + 1]
+            self.assertAlmostEqual(float(np.sum(data[start:end] ** 2)), 1.0)
+            self.assertTrue(np.all(np.diff(indices[start:end]) > 0))
+            self.assertEqual(
+                {vocabulary.token(col) for col in indices[start:end]},
+                set(QGrams(qval=2).tokenize(name).get_counter()),
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
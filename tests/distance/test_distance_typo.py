@@ -91,6 +91,60 @@ class TypoTestCases(unittest.TestCase):
             1 - (0.54930615 / 4),
         )
 
+    def test_typo_bounded(self):
+        """Test abydos.distance.Typo with max_dist & min_sim."""
+        words = (
+            '',
+            'cat',
+            'hat',
+            'Niall',
+            'Neil',
+            'Nigel',
+            'Colin',
+            'Cuilen',
+            'ATCG',
+            'TAGC',
+            'ACTG',
+            'aluminum',
+            'Catalan',
+            'Nicholas',
+            'Nikolaus',
+        )
+        for kwargs in (
+            {},
+            {'metric': 'manhattan', 'cost': (1, 2, 0.5, 0.5)},
+            {'layout': 'auto', 'failsafe': True},
+        ):
+            cmp = Typo(**kwargs)
+            for max_dist in (0, 1, 2, 3.5, 6):
+                cmp_bounded = Typo(max_dist=max_dist, **kwargs)
+                for src in words:
+                    for tar in words:
+                        dist = cmp.dist_abs(src, tar)
+                        if dist <= max_dist:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), dist
+                            )
+                            self.assertAlmostEqual(
+                                cmp_bounded.dist(src, tar), cmp.dist(src, tar),
+                            )
+                        else:
+                            self.assertEqual(
+                                cmp_bounded.dist_abs(src, tar), float('inf')
+                            )
+                            self.assertEqual(cmp_bounded.dist(src, tar), 1.0)
+            for min_sim in (0.0, 0.25, 0.5, 0.8):
+                cmp_bounded = Typo(min_sim=min_sim, **kwargs)
+                for src in words:
+                    for tar in words:
+                        sim = cmp.sim(src, tar)
+                        if sim >= min_sim:
+                            self.assertAlmostEqual(
+                                cmp_bounded.sim(src, tar), sim
+                            )
+                        else:
+                            self.assertEqual(cmp_bounded.sim(src, tar), 0.0)
+
     def test_typo_dist(self):
         """Test abydos.distance.Typo.dist."""
         # Base cases
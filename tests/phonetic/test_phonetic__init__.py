@@ -0,0 +1,80 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.phonetic.test_phonetic__init__.
+
+This module contains unit tests for the lazy loading of abydos.phonetic
+"""
+
+import os
+import subprocess  # noqa: S404
+import sys
+import unittest
+from inspect import getmembers, isclass
+
+import abydos.phonetic
+
+
+class PhoneticLazyLoadingTestCases(unittest.TestCase):
+    """Test lazy loading of abydos.phonetic classes."""
+
+    # The directory from which abydos is imported
+    root = os.path.dirname(os.path.dirname(abydos.__file__))
+
+    def test_phonetic_lazy_import(self):
+        """Test that importing abydos.phonetic imports no classes."""
+        code = (
+            'import sys, abydos.phonetic; '
+            'print(len([mod for mod in sys.modules '
+            'if mod.startswith("abydos.phonetic.")]))'
+        )
+        output = subprocess.check_output(  # noqa: S603
+            [sys.executable, '-c', code], cwd=self.root
+        )
+        self.assertEqual(output.strip(), b'0')
+
+        code = (
+            'import sys; from abydos.phonetic import BeiderMorse; '
+            'print("abydos.phonetic._soundex" in sys.modules)'
+        )
+        output = subprocess.check_output(  # noqa: S603
+            [sys.executable, '-c', code], cwd=self.root
+        )
+        self.assertEqual(output.strip(), b'False')
+
+    def test_phonetic_lazy_attributes(self):
+        """Test that every name in abydos.phonetic.__all__ can be accessed."""
+        for name in abydos.phonetic.__all__:
+            self.assertEqual(getattr(abydos.phonetic, name).__name__, name)
+            self.assertIn(name, dir(abydos.phonetic))
+        self.assertIs(
+            abydos.phonetic.Soundex,
+            abydos.phonetic._soundex.Soundex,  # noqa: SF01
+        )
+        with self.assertRaises(AttributeError):
+            abydos.phonetic.BeiderMorses  # noqa: B018
+
+        # Only the classes of __all__ are public members of the module
+        self.assertEqual(
+            sorted(name for name, _ in getmembers(abydos.phonetic, isclass)),
+            sorted(abydos.phonetic.__all__),
+        )
+        for name in ('sys', 'import_module', 'Any', 'List'):
+            self.assertNotIn(name, dir(abydos.phonetic))
+
+
+if __name__ == '__main__':
+    unittest.main()
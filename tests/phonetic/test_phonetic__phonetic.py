@@ -19,9 +19,13 @@
 This module contains unit tests for abydos.phonetic._Phonetic
 """
 
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
 
-from abydos.phonetic import Davidson
+from abydos.phonetic import BeiderMorse, Davidson, MetaSoundex, Soundex
 
 # noinspection PyProtectedMember
 from abydos.phonetic._phonetic import _Phonetic
@@ -62,6 +66,93 @@ class PhoneticTestCases(unittest.TestCase):
             self.dav.encode_alpha('word'), self.dav.encode('word')
         )
 
+    def test_phonetic_encode_many(self):
+        """Test abydos.phonetic._Phonetic.encode_many."""
+        self.assertEqual(self.pa.encode_many([]), [])
+        names = ['Niall', 'Colin', 'Neil', 'Niall']
+        sdx = Soundex()
+        self.assertEqual(
+            sdx.encode_many(iter(names)), [sdx.encode(_) for _ in names]
+        )
+
+        # Each distinct word is encoded once
+        sdx.enable_cache()
+        sdx.encode_many(names)
+        self.assertEqual(sdx.cache_info().misses, 3)
+        self.assertEqual(sdx.cache_info().hits, 0)
+
+    def test_phonetic_cache(self):
+        """Test abydos.phonetic._Phonetic.enable_cache."""
+        sdx = Soundex()
+        self.assertEqual(sdx.cache_info(), (0, 0, 0, 0))
+        sdx.cache_clear()
+        sdx.disable_cache()
+
+        sdx.enable_cache(2)
+        for name in ['Niall', 'Neil', 'Niall', 'Colin', 'Neil']:
+            self.assertEqual(sdx.encode(name), Soundex().encode(name))
+        self.assertEqual(sdx.cache_info(), (1, 4, 2, 2))
+        # Calls that can't be cached are passed through
+        self.assertEqual(
+            Davidson().encode('Gough', 'Ian'), 'G   I',
+        )
+        dav = Davidson()
+        dav.enable_cache()
+        self.assertEqual(dav.encode('Gough', 'Ian'), 'G   I')
+        self.assertEqual(dav.encode('Gough'), 'G   .')
+        self.assertEqual(dav.cache_info().currsize, 1)
+
+        # Encoders configured differently have different keys
+        self.assertNotEqual(
+            Soundex()._config_key(),  # noqa: SF01
+            Soundex(max_length=6)._config_key(),  # noqa: SF01
+        )
+        self.assertIn(
+            'Soundex(', MetaSoundex()._config_key(),  # noqa: SF01
+        )
+
+        # Pickling drops the cache
+        sdx = pickle.loads(pickle.dumps(sdx))
+        self.assertEqual(sdx.cache_info(), (0, 0, 0, 0))
+        self.assertEqual(sdx.encode('Niall'), 'N400')
+
+        sdx.enable_cache()
+        sdx.encode('Niall')
+        sdx.cache_clear()
+        self.assertEqual(sdx.cache_info(), (0, 0, 1024, 0))
+        sdx.disable_cache()
+        self.assertNotIn('encode', vars(sdx))
+
+    def test_phonetic_cache_path(self):
+        """Test abydos.phonetic._Phonetic.enable_cache with a path."""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'encodings')
+            bmpm = BeiderMorse()
+            bmpm.enable_cache(path=path)
+            code = bmpm.encode('Schwarzenegger')
+            bmpm.disable_cache()
+            sdx = Soundex()
+            sdx.enable_cache(path=path)
+            self.assertEqual(sdx.encode('Schwarzenegger'), 'S625')
+            sdx.disable_cache()
+
+            # Encodings persist in the file
+            bmpm = BeiderMorse()
+            bmpm.enable_cache(path=path)
+            self.assertEqual(bmpm.encode('Schwarzenegger'), code)
+            self.assertEqual(bmpm.cache_info().hits, 1)
+            bmpm.disable_cache()
+
+            # ...but only for the same configuration
+            bmpm = BeiderMorse(match_mode='exact')
+            bmpm.enable_cache(path=path)
+            self.assertNotEqual(bmpm.encode('Schwarzenegger'), code)
+            self.assertEqual(bmpm.cache_info().hits, 0)
+            bmpm.disable_cache()
+        finally:
+            shutil.rmtree(tmpdir)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -24,8 +24,12 @@ import unittest
 
 from abydos.phonetic import BeiderMorse
 
+# noinspection PyProtectedMember
+from abydos.phonetic._beider_morse import _compile_rules
+
 # noinspection PyProtectedMember
 from abydos.phonetic._beider_morse_data import (
+    BMDATA,
     L_ANY,
     L_CYRILLIC,
     L_CZECH,
@@ -851,6 +855,31 @@ class BeiderMorseTestCases(unittest.TestCase):
             self.pa._remove_dupes('bb|aa|bb|aa|bb'), 'bb|aa'  # noqa: SF01
         )
 
+    def test_beider_morse_compile_rules(self):
+        """Test abydos.phonetic._beider_morse._compile_rules."""
+        rules = BMDATA['gen']['rules'][L_GERMAN]
+        compiled = _compile_rules(rules)
+        # Each rule set is compiled once
+        self.assertIs(_compile_rules(rules), compiled)
+        self.assertEqual(sum(len(_) for _ in compiled.values()), len(rules))
+
+        # Rules are bucketed by their first letters, in their original order
+        self.assertEqual(
+            [rule[0] for rule in compiled['s']],
+            [rule[0] for rule in rules if rule[0].startswith('s')],
+        )
+        for rule in compiled['s']:
+            self.assertEqual(rule[1], len(rule[0]))
+        pattern, _, left, right, target = compiled['s'][0]
+        rule = next(rule for rule in rules if rule[0].startswith('s'))
+        self.assertEqual((pattern, target), (rule[0], rule[3]))
+        self.assertEqual(
+            left.pattern if left else '', rule[1] + '$' * bool(rule[1])
+        )
+        self.assertEqual(right.pattern if right else '', rule[2])
+
+        self.assertEqual(_compile_rules(()), {})
+
     def test_beider_morse_normalize_lang_attrs(self):
         """Test abydos.phonetic.BeiderMorse._normalize_language_attributes."""
         self.assertEqual(
@@ -129,6 +129,43 @@ class PhonetTestCases(unittest.TestCase):
                         self.assertEqual(self.pa_1.encode(term), ph1)
                         self.assertEqual(self.pa_2.encode(term), ph2)
 
+    def test_phonet_encode_many(self):
+        """Test abydos.phonetic.Phonet.encode_many."""
+        self.assertEqual(self.pa.encode_many([]), [])
+        self.assertEqual(
+            self.pa_1none.encode_many(['Schönberg', 'Bremerhaven']),
+            ['SCHOENBERG', 'BREMERHAVEN'],
+        )
+
+        terms, ph1s, ph2s = [], [], []
+        with codecs.open(
+            _corpus_file('nachnamen.csv'), encoding='utf-8'
+        ) as nachnamen_testset:
+            for nn_line in nachnamen_testset:
+                if nn_line[0] != '#':
+                    nn_line = nn_line.strip().split(',')
+                    if len(nn_line) >= 3:
+                        terms.append(nn_line[0])
+                        ph1s.append(nn_line[1])
+                        ph2s.append(nn_line[2])
+        self.assertEqual(self.pa_1.encode_many(terms), ph1s)
+        self.assertEqual(self.pa_2.encode_many(terms), ph2s)
+
+        # With the encode cache enabled, words are encoded through it
+        pa = Phonet()
+        pa.enable_cache()
+        self.assertEqual(pa.encode_many(terms[:10] * 2), ph1s[:10] * 2)
+        self.assertEqual(pa.cache_info().misses, 10)
+
+        # Rule indexes are shared by instances with the same rules
+        self.assertIs(
+            Phonet(1)._rule_index(), Phonet(2)._rule_index()  # noqa: SF01
+        )
+        self.assertIsNot(
+            Phonet()._rule_index(),  # noqa: SF01
+            Phonet(lang='none')._rule_index(),  # noqa: SF01
+        )
+
     def test_phonet_ngerman(self):
         """Test abydos.phonetic.Phonet (ngerman set)."""
         if not ALLOW_RANDOM:
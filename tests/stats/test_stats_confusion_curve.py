@@ -0,0 +1,181 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.stats.test_stats_confusion_curve.
+
+This module contains unit tests for abydos.stats.ConfusionCurve
+"""
+
+import unittest
+from math import isnan
+
+import numpy as np
+
+from abydos.stats import ConfusionCurve, ConfusionTable
+
+STATISTICS = [
+    name
+    for name in dir(ConfusionTable)
+    if not name.startswith('_')
+    and name not in {'to_tuple', 'to_dict'}
+    and callable(getattr(ConfusionTable, name))
+]
+
+SCORES = [0.9, 0.8, 0.7, 0.6, 0.5]
+LABELS = [1, 1, 0, 1, 0]
+
+
+class ConfusionCurveTestCases(unittest.TestCase):
+    """Test abydos.stats.ConfusionCurve."""
+
+    def test_confusion_curve_init(self):
+        """Test abydos.stats.ConfusionCurve.__init__."""
+        curve = ConfusionCurve(SCORES, LABELS)
+        self.assertEqual(len(curve), 5)
+        self.assertEqual(curve.thresholds().tolist(), SCORES)
+        self.assertEqual(curve[0], ConfusionTable(1, 2, 0, 2))
+        self.assertEqual(curve[4], ConfusionTable(3, 0, 2, 0))
+
+        # Tied scores share a threshold, and order doesn't matter
+        curve = ConfusionCurve([0.2, 0.5, 0.5, 0.9, 0.2], [0, 1, 0, 1, 1])
+        self.assertEqual(curve.thresholds().tolist(), [0.9, 0.5, 0.2])
+        self.assertEqual(curve.true_pos().tolist(), [1, 2, 3])
+        self.assertEqual(curve.false_pos().tolist(), [0, 1, 2])
+        self.assertEqual(curve.true_neg().tolist(), [2, 1, 0])
+        self.assertEqual(curve.false_neg().tolist(), [2, 1, 0])
+        self.assertEqual(curve.population().tolist(), [5, 5, 5])
+
+        curve = ConfusionCurve([], [])
+        self.assertEqual(len(curve), 0)
+        self.assertEqual(curve.f1_score().tolist(), [])
+
+        self.assertRaises(ValueError, ConfusionCurve, [0.1, 0.2], [1])
+        self.assertRaises(ValueError, ConfusionCurve, [[0.1]], [[1]])
+        self.assertRaises(ValueError, ConfusionCurve, [0.1, np.nan], [1, 0])
+
+    def test_confusion_curve_statistics(self):
+        """Test abydos.stats.ConfusionCurve statistics."""
+        rng = np.random.RandomState(1234)
+        for _ in range(100):
+            size = rng.randint(1, 20)
+            scores = np.round(rng.rand(size), 1)
+            labels = rng.rand(size) < rng.rand()
+            curve = ConfusionCurve(scores, labels)
+            tables = [curve[i] for i in range(len(curve))]
+            for name in STATISTICS:
+                values = getattr(curve, name)()
+                self.assertEqual(len(values), len(tables))
+                for table, value in zip(tables, values):
+                    try:
+                        expected = float(getattr(table, name)())
+                    except (ValueError, ZeroDivisionError):
+                        expected = float('nan')
+                    self.assertTrue(
+                        np.isclose(value, expected, equal_nan=True),
+                        '{} of {}: {} != {}'.format(
+                            name, table, value, expected
+                        ),
+                    )
+
+        curve = ConfusionCurve(SCORES, LABELS)
+        for exp in (0, 0.5, 3):
+            for name in ('pr_lehmer_mean', 'pr_hoelder_mean'):
+                for i, value in enumerate(getattr(curve, name)(exp)):
+                    self.assertAlmostEqual(value, getattr(curve[i], name)(exp))
+        for beta in (0.25, 3):
+            for i, value in enumerate(curve.fbeta_score(beta)):
+                self.assertAlmostEqual(value, curve[i].fbeta_score(beta))
+            for i, value in enumerate(curve.e_score(beta)):
+                self.assertAlmostEqual(value, curve[i].e_score(beta))
+        self.assertRaises(AttributeError, curve.fbeta_score, 0)
+
+    def test_confusion_curve_curves(self):
+        """Test abydos.stats.ConfusionCurve.roc_curve & .pr_curve."""
+        curve = ConfusionCurve(SCORES, LABELS)
+        fpr, tpr, thresholds = curve.roc_curve()
+        self.assertEqual(fpr.tolist(), [0.0, 0.0, 0.0, 0.5, 0.5, 1.0])
+        np.testing.assert_allclose(tpr, [0, 1 / 3, 2 / 3, 2 / 3, 1, 1])
+        self.assertEqual(thresholds.tolist(), [np.inf] + SCORES)
+
+        precision, recall, thresholds = curve.pr_curve()
+        np.testing.assert_allclose(precision, [1, 1, 2 / 3, 3 / 4, 3 / 5])
+        np.testing.assert_allclose(recall, [1 / 3, 2 / 3, 2 / 3, 1, 1])
+        self.assertEqual(thresholds.tolist(), SCORES)
+
+    def test_confusion_curve_roc_auc(self):
+        """Test abydos.stats.ConfusionCurve.roc_auc."""
+        self.assertAlmostEqual(ConfusionCurve(SCORES, LABELS).roc_auc(), 5 / 6)
+        # A tie between a positive & a negative counts as half
+        self.assertAlmostEqual(
+            ConfusionCurve([0.5, 0.5], [1, 0]).roc_auc(), 0.5
+        )
+        self.assertEqual(ConfusionCurve([0.9, 0.1], [1, 0]).roc_auc(), 1.0)
+        self.assertEqual(ConfusionCurve([0.1, 0.9], [1, 0]).roc_auc(), 0.0)
+
+        # The probability that a positive outscores a negative
+        rng = np.random.RandomState(5678)
+        scores = np.round(rng.rand(200), 2)
+        labels = rng.rand(200) < 0.3
+        pos = scores[labels]
+        neg = scores[~labels]
+        expected = (
+            (pos[:, None] > neg[None, :]).sum()
+            + (pos[:, None] == neg[None, :]).sum() / 2
+        ) / (len(pos) * len(neg))
+        self.assertAlmostEqual(
+            ConfusionCurve(scores, labels).roc_auc(), expected
+        )
+
+        self.assertTrue(isnan(ConfusionCurve([0.5, 0.6], [1, 1]).roc_auc()))
+        self.assertTrue(isnan(ConfusionCurve([0.5, 0.6], [0, 0]).roc_auc()))
+        self.assertTrue(isnan(ConfusionCurve([], []).roc_auc()))
+
+    def test_confusion_curve_average_precision(self):
+        """Test abydos.stats.ConfusionCurve.average_precision."""
+        self.assertAlmostEqual(
+            ConfusionCurve(SCORES, LABELS).average_precision(),
+            (1 + 1 + 3 / 4) / 3,
+        )
+        self.assertEqual(
+            ConfusionCurve([0.9, 0.1], [1, 0]).average_precision(), 1.0
+        )
+        self.assertTrue(
+            isnan(ConfusionCurve([0.5, 0.6], [0, 0]).average_precision())
+        )
+
+    def test_confusion_curve_best_threshold(self):
+        """Test abydos.stats.ConfusionCurve.best_threshold."""
+        curve = ConfusionCurve(SCORES, LABELS)
+        self.assertEqual(curve.best_threshold()[0], 0.6)
+        self.assertAlmostEqual(curve.best_threshold()[1], 6 / 7)
+        self.assertEqual(curve.best_threshold('precision'), (0.9, 1.0))
+        self.assertEqual(curve.best_threshold('recall'), (0.6, 1.0))
+        self.assertEqual(curve.best_threshold('fbeta_score', 0.5)[0], 0.8)
+        self.assertEqual(curve.best_threshold('fbeta_score', beta=0.5)[0], 0.8)
+
+        self.assertRaises(ValueError, curve.best_threshold, 'to_dict')
+        self.assertRaises(ValueError, curve.best_threshold, '_tp')
+        self.assertRaises(ValueError, curve.best_threshold, 'thresholds')
+        self.assertRaises(ValueError, curve.best_threshold, 'roc_auc')
+        self.assertRaises(
+            ValueError,
+            ConfusionCurve([0.5, 0.6], [0, 0]).best_threshold,
+            'recall',
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
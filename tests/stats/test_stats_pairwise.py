@@ -21,11 +21,12 @@ This module contains unit tests for abydos.stats pairwise functions
 
 import unittest
 
-from abydos.distance import Jaccard, JaroWinkler
+from abydos.distance import Jaccard, JaroWinkler, Levenshtein
 from abydos.stats import (
     amean,
     gmean,
     hmean,
+    iter_pairwise_similarity_statistics,
     mean_pairwise_similarity,
     pairwise_similarity_statistics,
 )
@@ -121,6 +122,46 @@ class MPSTestCases(unittest.TestCase):
             mean_pairwise_similarity(' '.join(NIALL_1WORD), mean_func=amean),
         )
 
+        self.assertAlmostEqual(
+            mean_pairwise_similarity(
+                NIALL,
+                metric=lambda src, tar: Jaccard().sim(src, tar),
+                mean_func=amean,
+                symmetric=True,
+            ),
+            mean_pairwise_similarity(
+                NIALL, metric=Jaccard().sim, mean_func=amean
+            ),
+        )
+
+        # Test blocks & worker processes
+        for symmetric in (False, True):
+            self.assertEqual(
+                mean_pairwise_similarity(
+                    NIALL, symmetric=symmetric, block_size=3
+                ),
+                mean_pairwise_similarity(NIALL, symmetric=symmetric),
+            )
+            self.assertEqual(
+                mean_pairwise_similarity(
+                    NIALL,
+                    metric=Jaccard().sim,
+                    mean_func=amean,
+                    symmetric=symmetric,
+                    workers=2,
+                ),
+                mean_pairwise_similarity(
+                    NIALL,
+                    metric=Jaccard().sim,
+                    mean_func=amean,
+                    symmetric=symmetric,
+                ),
+            )
+        self.assertEqual(
+            mean_pairwise_similarity(NIALL, workers=None, block_size=100),
+            mean_pairwise_similarity(NIALL),
+        )
+
         self.assertRaises(ValueError, mean_pairwise_similarity, ['a b c'])
         self.assertRaises(ValueError, mean_pairwise_similarity, 'abc')
         self.assertRaises(ValueError, mean_pairwise_similarity, 0)
@@ -224,6 +265,15 @@ class PSSTestCases(unittest.TestCase):
         self.assertAlmostEqual(pw_mean, 0.3352660334967324)
         self.assertAlmostEqual(pw_std, 0.18394505847524578)
 
+        # Test with a plain function metric
+        (pw_max, pw_min, pw_mean, pw_std) = pairwise_similarity_statistics(
+            NIALL, NIALL, metric=lambda src, tar: JaroWinkler().dist(src, tar)
+        )
+        self.assertAlmostEqual(pw_max, 1.0)
+        self.assertAlmostEqual(pw_min, 0.0)
+        self.assertAlmostEqual(pw_mean, 0.3352660334967324)
+        self.assertAlmostEqual(pw_std, 0.18394505847524578)
+
         # Test using hmean'
         (pw_max, pw_min, pw_mean, pw_std) = pairwise_similarity_statistics(
             NIALL, NIALL, mean_func=hmean
@@ -233,6 +283,32 @@ class PSSTestCases(unittest.TestCase):
         self.assertAlmostEqual(pw_mean, 0.30718771249150056)
         self.assertAlmostEqual(pw_std, 0.25253182790044676)
 
+        # Test blocks & worker processes
+        for symmetric in (False, True):
+            self.assertEqual(
+                pairwise_similarity_statistics(
+                    NIALL, NIALL[::2], symmetric=symmetric, block_size=5
+                ),
+                pairwise_similarity_statistics(
+                    NIALL, NIALL[::2], symmetric=symmetric
+                ),
+            )
+            self.assertEqual(
+                pairwise_similarity_statistics(
+                    NIALL,
+                    NIALL[::2],
+                    metric=Levenshtein(mode='osa').sim,
+                    symmetric=symmetric,
+                    workers=3,
+                ),
+                pairwise_similarity_statistics(
+                    NIALL,
+                    NIALL[::2],
+                    metric=Levenshtein(mode='osa').sim,
+                    symmetric=symmetric,
+                ),
+            )
+
         # Test exceptions
         self.assertRaises(
             ValueError,
@@ -252,5 +328,79 @@ class PSSTestCases(unittest.TestCase):
         self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL, 5)
 
 
+class IPSSTestCases(unittest.TestCase):
+    """Test iterated pairwise similarity statistics functions.
+
+    abydos.stats.iter_pairwise_similarity_statistics
+    """
+
+    def test_iter_pairwise_similarity_statistics(self):
+        """Test abydos.stats.iter_pairwise_similarity_statistics."""
+        blocks = list(
+            iter_pairwise_similarity_statistics(NIALL, NIALL, block_size=5)
+        )
+        self.assertEqual(len(blocks), 4)
+        for i, block in enumerate(blocks):
+            self.assertEqual(
+                block,
+                pairwise_similarity_statistics(
+                    NIALL[i * 5 : (i + 1) * 5], NIALL
+                ),
+            )
+
+        self.assertEqual(
+            list(
+                iter_pairwise_similarity_statistics(
+                    NIALL,
+                    ('Kneal',),
+                    metric=Jaccard().sim,
+                    symmetric=True,
+                    workers=2,
+                    block_size=3,
+                )
+            ),
+            list(
+                iter_pairwise_similarity_statistics(
+                    NIALL,
+                    ('Kneal',),
+                    metric=Jaccard().sim,
+                    symmetric=True,
+                    block_size=3,
+                )
+            ),
+        )
+
+        self.assertEqual(
+            list(
+                iter_pairwise_similarity_statistics(
+                    'The quick brown fox', 'jumped over the lazy dog.'
+                )
+            ),
+            [
+                pairwise_similarity_statistics(
+                    'The quick brown fox', 'jumped over the lazy dog.'
+                )
+            ],
+        )
+
+        # Test exceptions
+        self.assertRaises(
+            ValueError,
+            list,
+            iter_pairwise_similarity_statistics(NIALL, NIALL, mean_func=0),
+        )
+        self.assertRaises(
+            ValueError,
+            list,
+            iter_pairwise_similarity_statistics(NIALL, NIALL, metric=0),
+        )
+        self.assertRaises(
+            ValueError, list, iter_pairwise_similarity_statistics(5, NIALL)
+        )
+        self.assertRaises(
+            ValueError, list, iter_pairwise_similarity_statistics(NIALL, 5)
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -19,10 +19,14 @@
 This module contains unit tests for abydos.stemmer._Stemmer
 """
 
+import pickle
 import unittest
 
+from abydos.stemmer import Lovins, PaiceHusk, Porter, UEALite
+
 # noinspection PyProtectedMember
 from abydos.stemmer._stemmer import _Stemmer
+from abydos.util._lru_cache import CacheInfo
 
 
 class SnowballTestCases(unittest.TestCase):
@@ -39,6 +43,37 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr.stem(''), '')
         self.assertEqual(self.stmr.stem('word'), 'word')
 
+    def test__stemmer_stem_many(self):
+        """Test abydos.stemmer._Stemmer.stem_many."""
+        words = ['reading', 'readings', 'fancies', 'reading', '', 'torment']
+        for stmr in (_Stemmer(), Porter(), Lovins(), PaiceHusk(), UEALite()):
+            self.assertEqual(stmr.cache_info(), CacheInfo(0, 0, 0, 0))
+            expected = [stmr.stem(word) for word in words]
+            self.assertEqual(stmr.stem_many(words), expected)
+            self.assertEqual(stmr.stem_many(iter(words)), expected)
+            self.assertEqual(stmr.stem_many([]), [])
+
+        # Each distinct word is stemmed once & then looked up
+        stmr = Porter()
+        stmr.stem_many(words)
+        self.assertEqual(stmr.cache_info(), CacheInfo(0, 5, 4096, 5))
+        stmr.stem_many(words[:2])
+        self.assertEqual(stmr.cache_info(), CacheInfo(2, 5, 4096, 5))
+        stmr.cache_clear()
+        self.assertEqual(stmr.cache_info(), CacheInfo(0, 0, 4096, 0))
+
+        # The cache is bounded
+        stmr = Porter()
+        stmr._stem_cache_size = 2
+        self.assertEqual(
+            stmr.stem_many(words), [Porter().stem(word) for word in words]
+        )
+        self.assertEqual(stmr.cache_info().currsize, 2)
+
+        # Stemmers with caches can be pickled
+        stmr = pickle.loads(pickle.dumps(stmr))
+        self.assertEqual(stmr.stem_many(['trusted']), ['trust'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,68 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.stemmer.test_stemmer__suffix_trie.
+
+This module contains unit tests for abydos.stemmer._suffix_trie
+"""
+
+import unittest
+
+# noinspection PyProtectedMember
+from abydos.stemmer._suffix_trie import _SuffixTrie
+
+
+class SuffixTrieTestCases(unittest.TestCase):
+    """Test _SuffixTrie class.
+
+    abydos.stemmer._suffix_trie._SuffixTrie
+    """
+
+    def test_suffix_trie(self):
+        """Test abydos.stemmer._suffix_trie._SuffixTrie."""
+        trie = _SuffixTrie()
+        self.assertEqual(len(trie), 0)
+        self.assertEqual(trie.matches('word'), [])
+
+        trie = _SuffixTrie([('s', 1), ('es', 2), ('ies', 3), ('ness', 4)])
+        self.assertEqual(len(trie), 4)
+        self.assertEqual(trie.matches('flies'), [(1, 1), (2, 2), (3, 3)])
+        self.assertEqual(
+            trie.matches('flies', min_stem=2), [(1, 1), (2, 2), (3, 3)]
+        )
+        self.assertEqual(trie.matches('flies', min_stem=3), [(1, 1), (2, 2)])
+        self.assertEqual(trie.matches('flies', min_stem=5), [])
+        self.assertEqual(trie.matches('ies'), [(1, 1), (2, 2), (3, 3)])
+        self.assertEqual(trie.matches('kindness'), [(1, 1), (4, 4)])
+        self.assertEqual(trie.matches('kind'), [])
+        self.assertEqual(trie.matches(''), [])
+
+        # Inserting a suffix again replaces its value
+        trie.insert('es', 5)
+        self.assertEqual(len(trie), 4)
+        self.assertEqual(trie.matches('goes'), [(1, 1), (2, 5)])
+
+        # Suffixes of suffixes are only matched if inserted
+        trie = _SuffixTrie({'ing': 'ING'})
+        self.assertEqual(trie.matches('reading'), [(3, 'ING')])
+        self.assertEqual(trie.matches('reng'), [])
+
+        with self.assertRaises(ValueError):
+            trie.insert('', 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,7 +24,18 @@ import unittest
 from collections import Counter
 from math import log1p
 
-from abydos.tokenizer import QGrams, QSkipgrams, _Tokenizer
+from abydos.tokenizer import (
+    COrVClusterTokenizer,
+    CVClusterTokenizer,
+    CharacterTokenizer,
+    QGrams,
+    QSkipgrams,
+    RegexpTokenizer,
+    VCClusterTokenizer,
+    WhitespaceTokenizer,
+    WordpunctTokenizer,
+    _Tokenizer,
+)
 
 
 class TokenizerTestCases(unittest.TestCase):
@@ -180,6 +191,52 @@ class TokenizerTestCases(unittest.TestCase):
         nelson_entropy = QSkipgrams(scaler='entropy').tokenize('NELSON')
         self.assertAlmostEqual(nelson_entropy.count(), 4.6644977792)
 
+    def test__tokenizer_tokens(self):
+        """Test abydos.tokenizer._Tokenizer.tokens & .profile."""
+        for make_tok in (
+            _Tokenizer,
+            QGrams,
+            lambda: QSkipgrams(qval=(2, 3)),
+        ):
+            tok = make_tok().tokenize('NELSON')
+            before = tok.get_counter()
+            for word in ('', 'Niall', 'NEILSEN'):
+                self.assertEqual(
+                    tok.tokens(word), make_tok().tokenize(word).get_counter()
+                )
+                self.assertEqual(tok.profile(word), tok.tokens(word))
+                self.assertEqual(tok.get_counter(), before)
+                self.assertEqual(tok._string, 'NELSON')
+        self.assertEqual(
+            QGrams(qval=2).profile('ab'), Counter({'$a': 1, 'ab': 1, 'b#': 1}),
+        )
+
+        # Tokenizers that generate their tokens count them without copying
+        # themselves, whatever their scaler.
+        for tok_class in (
+            CharacterTokenizer,
+            RegexpTokenizer,
+            WhitespaceTokenizer,
+            WordpunctTokenizer,
+            COrVClusterTokenizer,
+            CVClusterTokenizer,
+            VCClusterTokenizer,
+            QGrams,
+        ):
+            for scaler in (None, 'set', 'length', 'length-log', 'entropy'):
+                tok = tok_class(scaler=scaler)
+                tok._copy = None
+                for word in ('', 'seven-twelfths', "Can't stop, naïve Æsir"):
+                    self.assertEqual(
+                        list(tok.tokens(word).items()),
+                        list(
+                            tok_class(scaler=scaler)
+                            .tokenize(word)
+                            .get_counter()
+                            .items()
+                        ),
+                    )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -378,6 +378,49 @@ class QGramsTestCases(unittest.TestCase):
             ),
         )
 
+    def test_qgrams_tokens(self):
+        """Test abydos.tokenizer.QGrams.tokens & .hashes."""
+        words = ('', 'a', 'ab', 'AATTATAT', 'interdisciplinarian', 'Noígíall')
+        for kwargs in (
+            {},
+            {'qval': 1},
+            {'qval': range(1, 4)},
+            {'start_stop': '', 'skip': [0, 1]},
+            {'qval': 3, 'skip': 2},
+            {'qval': 4, 'skip': 3, 'start_stop': '^'},
+        ):
+            for scaler in (None, 'set', 'entropy', log1p):
+                tok = QGrams(scaler=scaler, **kwargs)
+                for word in words:
+                    tokenized = QGrams(scaler=scaler, **kwargs).tokenize(word)
+                    self.assertEqual(tok.tokens(word), tokenized.get_counter())
+                    self.assertEqual(
+                        tok.hashes(word),
+                        tok._scale_counts(
+                            Counter(
+                                QGrams.hash_code(gram)
+                                for gram in tokenized.get_list()
+                            )
+                        ),
+                    )
+
+        # Hash codes depend on the characters & length of each q-gram
+        self.assertEqual(QGrams.hash_code(''), 0)
+        self.assertNotEqual(QGrams.hash_code('a'), QGrams.hash_code('\x00a'))
+        self.assertNotEqual(QGrams.hash_code('ab'), QGrams.hash_code('ba'))
+        self.assertLess(QGrams.hash_code('z' * 100), 2 ** 64)
+
+        # Scalers depending on the q-grams themselves are applied by
+        # tokenizing, & cannot be applied to hash codes
+        tok = QGrams(scaler='length')
+        self.assertEqual(
+            tok.tokens('NELSON'),
+            QGrams(scaler='length').tokenize('NELSON').get_counter(),
+        )
+        self.assertEqual(tok.get_counter(), Counter())
+        with self.assertRaises(ValueError):
+            tok.hashes('NELSON')
+
 
 if __name__ == '__main__':
     unittest.main()
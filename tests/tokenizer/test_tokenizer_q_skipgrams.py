@@ -616,6 +616,20 @@ class QSkipgramsTestCases(unittest.TestCase):
         for key in gold_counter.keys():
             self.assertAlmostEqual(gold_counter[key], test_counter[key])
 
+    def test_qskipgrams_tokens(self):
+        """Test abydos.tokenizer.QSkipgrams.tokens."""
+        for kwargs in ({}, {'qval': 1}, {'qval': range(1, 4)}, {'qval': 3}):
+            for scaler in (None, 'set', 'SSK'):
+                tok = QSkipgrams(scaler=scaler, **kwargs)
+                for word in ('', 'a', 'AATTAT', 'Colin', 'AACTAGAAC'):
+                    self.assertEqual(
+                        tok.tokens(word),
+                        QSkipgrams(scaler=scaler, **kwargs)
+                        .tokenize(word)
+                        .get_counter(),
+                    )
+                self.assertEqual(tok.get_counter(), Counter())
+
 
 if __name__ == '__main__':
     unittest.main()
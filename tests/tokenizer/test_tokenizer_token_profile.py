@@ -0,0 +1,85 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer_token_profile.
+
+This module contains unit tests for abydos.tokenizer.TokenProfile
+"""
+
+import copy
+import pickle
+import unittest
+from collections import Counter
+
+from abydos.tokenizer import QGrams, TokenProfile
+
+
+class TokenProfileTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.TokenProfile."""
+
+    def test_token_profile(self):
+        """Test abydos.tokenizer.TokenProfile."""
+        profile = TokenProfile()
+        self.assertEqual(profile.cardinality, 0)
+        self.assertEqual(profile.squared_norm, 0)
+        self.assertEqual(profile.ids, ())
+        self.assertTrue(profile.exact)
+
+        profile = QGrams().tokenize('NELSON').get_profile()
+        self.assertIsInstance(profile, TokenProfile)
+        self.assertEqual(profile, QGrams().tokenize('NELSON').get_counter())
+        self.assertEqual(profile.cardinality, 7)
+        self.assertEqual(profile.squared_norm, 7)
+        self.assertEqual(
+            profile.ids, ('$N', 'EL', 'LS', 'N#', 'NE', 'ON', 'SO')
+        )
+        self.assertTrue(profile.exact)
+
+        profile = TokenProfile({'a': 2, 'b': -1.5})
+        self.assertEqual(profile.cardinality, 3.5)
+        self.assertEqual(profile.squared_norm, 6.25)
+        self.assertFalse(profile.exact)
+
+        # Operations produce plain Counters
+        profile = TokenProfile('aab')
+        self.assertIs(type(profile & profile), Counter)
+        self.assertIs(type(profile + profile), Counter)
+
+        # Copies & pickles are profiles too
+        for other in (
+            copy.copy(profile),
+            pickle.loads(pickle.dumps(profile)),  # noqa: S301
+        ):
+            self.assertIsInstance(other, TokenProfile)
+            self.assertEqual(other, profile)
+            self.assertEqual(other.cardinality, 3)
+            self.assertEqual(other.ids, ('a', 'b'))
+
+    def test_token_profile_overlap(self):
+        """Test abydos.tokenizer.TokenProfile.overlap."""
+        nelson = QGrams().tokenize('NELSON').get_profile()
+        neilsen = QGrams().tokenize('NEILSEN').get_profile()
+        self.assertEqual(
+            nelson.overlap(neilsen),
+            (sum((nelson & neilsen).values()), len(nelson & neilsen)),
+        )
+        self.assertEqual(nelson.overlap(neilsen), neilsen.overlap(nelson))
+        self.assertEqual(nelson.overlap(TokenProfile()), (0, 0))
+        self.assertEqual(TokenProfile('aaab').overlap(Counter('aacc')), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
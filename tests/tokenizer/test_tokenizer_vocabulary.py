@@ -0,0 +1,144 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer_vocabulary.
+
+This module contains unit tests for abydos.tokenizer.Vocabulary
+"""
+
+import pickle
+import unittest
+from array import array
+from collections import Counter
+
+from abydos.tokenizer import QGrams, QSkipgrams, TokenIds, Vocabulary
+
+
+class VocabularyTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.Vocabulary."""
+
+    def test_vocabulary(self):
+        """Test abydos.tokenizer.Vocabulary."""
+        vocab = Vocabulary()
+        self.assertEqual(len(vocab), 0)
+        self.assertNotIn('NE', vocab)
+
+        self.assertEqual(vocab.intern('NE'), 0)
+        self.assertEqual(vocab.intern('EL'), 1)
+        self.assertEqual(vocab.intern('NE'), 0)
+        self.assertIn('NE', vocab)
+        self.assertEqual(len(vocab), 2)
+        self.assertEqual(list(vocab), ['NE', 'EL'])
+        self.assertEqual(vocab.token(1), 'EL')
+        with self.assertRaises(IndexError):
+            vocab.token(2)
+
+        vocab = Vocabulary(['c', 'b', 'a'])
+        self.assertEqual(list(vocab), ['c', 'b', 'a'])
+        self.assertEqual(vocab.intern('a'), 2)
+
+    def test_vocabulary_encode_decode(self):
+        """Test abydos.tokenizer.Vocabulary.encode & decode."""
+        vocab = Vocabulary()
+        for tokenizer in (
+            QGrams(),
+            QGrams(qval=3, scaler='SSK'),
+            QSkipgrams(),
+        ):
+            for word in ('', 'NELSON', 'NEILSEN', 'aaaaaa'):
+                counter = tokenizer.tokenize(word).get_counter()
+                tids = vocab.encode(counter)
+                self.assertEqual(list(tids.ids), sorted(tids.ids))
+                self.assertEqual(len(tids), len(counter))
+                self.assertEqual(vocab.decode(tids), counter)
+                self.assertEqual(tids.to_counter(), counter)
+                self.assertEqual(tokenizer.tokenize(word).get_ids(vocab), tids)
+
+        tids = vocab.encode(Counter({'a': 2, 'b': 0}))
+        self.assertEqual(tids.counts.typecode, 'I')
+        self.assertFalse(tids.exact)
+        tids = vocab.encode(Counter({'a': 2, 'b': -1}))
+        self.assertEqual(tids.counts.typecode, 'd')
+        self.assertEqual(tids.cardinality, 3)
+        self.assertFalse(tids.exact)
+
+        # Vocabularies & their TokenIds survive pickling together
+        tids = QGrams().tokenize('NELSON').get_ids(vocab)
+        vocab2, tids2 = pickle.loads(pickle.dumps((vocab, tids)))  # noqa: S301
+        self.assertEqual(tids2.to_counter(), tids.to_counter())
+        self.assertIs(tids2.vocabulary, vocab2)
+        self.assertEqual(len(vocab2), len(vocab))
+
+
+class TokenIdsTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.TokenIds."""
+
+    def test_token_ids(self):
+        """Test abydos.tokenizer.TokenIds."""
+        tids = TokenIds(array('I'), array('I'), None)
+        self.assertEqual(len(tids), 0)
+        self.assertEqual(tids.cardinality, 0)
+        self.assertTrue(tids.exact)
+        with self.assertRaises(ValueError):
+            tids.to_counter()
+
+        self.assertEqual(
+            repr(TokenIds(array('I', [1, 4]), array('I', [1, 2]), None)),
+            "TokenIds(array('I', [1, 4]), array('I', [1, 2]))",
+        )
+        self.assertNotEqual(tids, Counter())
+
+    def test_token_ids_overlap(self):
+        """Test abydos.tokenizer.TokenIds.overlap."""
+        vocab = Vocabulary()
+        words = (
+            '',
+            'NELSON',
+            'NEILSEN',
+            'aaaaab',
+            'aab',
+            'The quick brown fox jumped over the lazy dog.',
+            'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
+        )
+        for tokenizer in (QGrams(), QGrams(qval=1), QSkipgrams()):
+            for src in words:
+                for tar in words:
+                    src_counter = tokenizer.tokenize(src).get_counter()
+                    tar_counter = tokenizer.tokenize(tar).get_counter()
+                    self.assertEqual(
+                        vocab.encode(src_counter).overlap(
+                            vocab.encode(tar_counter)
+                        ),
+                        (
+                            sum((src_counter & tar_counter).values()),
+                            len(src_counter & tar_counter),
+                        ),
+                    )
+
+        # Non-integral counts, through each of the overlap computations
+        for length in (2, 100):
+            src = vocab.encode(
+                Counter({str(i): 0.5 * i for i in range(length)})
+            )
+            tar = vocab.encode(Counter({str(i): 1 for i in range(length)}))
+            self.assertEqual(
+                src.overlap(tar),
+                (sum(min(0.5 * i, 1) for i in range(length)), length - 1),
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright 2014-2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_lru_cache.
+
+This module contains unit tests for abydos.util._lru_cache
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from abydos.util._lru_cache import CacheInfo, _DBMCache, _LRUCache
+
+
+class LRUCacheTestCases(unittest.TestCase):
+    """Test cases for abydos.util._lru_cache."""
+
+    def test_lru_cache(self):
+        """Test abydos.util._lru_cache._LRUCache."""
+        cache = _LRUCache(3)
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 0), 0)
+        self.assertEqual(cache.info(), CacheInfo(0, 2, 3, 0))
+
+        for i, key in enumerate('abc'):
+            cache.set(key, i)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get('a'), 0)
+
+        # 'b' is now the least recently used
+        cache.set('d', 3)
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 0)
+        self.assertEqual(cache.get('c'), 2)
+        self.assertEqual(cache.get('d'), 3)
+        self.assertEqual(cache.info(), CacheInfo(4, 3, 3, 3))
+
+        # Resetting a value makes it the most recently used
+        cache.set('a', 10)
+        cache.set('e', 4)
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(cache.get('a'), 10)
+
+        # The cache survives pickling
+        cache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(cache.get('e'), 4)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 3, 0))
+
+        # An unbounded cache
+        cache = _LRUCache(None)
+        for i in range(1000):
+            cache.set(i, i)
+        self.assertEqual(cache.info(), CacheInfo(0, 0, None, 1000))
+
+    def test_dbm_cache(self):
+        """Test abydos.util._lru_cache._DBMCache."""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'cache')
+            cache = _DBMCache(path, 2)
+            self.assertIsNone(cache.get('a'))
+            for key in 'abc':
+                cache.set(key, key.upper())
+            self.assertEqual(len(cache), 2)
+            # 'a' is no longer in memory, but is in the database
+            self.assertEqual(cache.get('a'), 'A')
+            self.assertEqual(cache.info(), CacheInfo(1, 1, 2, 2))
+
+            # The cache survives pickling
+            pickled = pickle.dumps(cache)
+            cache.close()
+            cache = pickle.loads(pickled)
+            self.assertEqual(cache.get('c'), 'C')
+            cache.close()
+
+            # ...and closing
+            cache = _DBMCache(path, None)
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.get('b'), 'B')
+            self.assertEqual(cache.get('é', 'x'), 'x')
+            cache.set('é', 'É')
+            self.assertEqual(cache.get('é'), 'É')
+            cache.close()
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()